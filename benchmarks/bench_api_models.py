@@ -0,0 +1,63 @@
+"""对比 seerapi_models_api 与 SQLModel API 模型的导入耗时与单实例内存占用
+
+用法：python benchmarks/bench_api_models.py [实例数量] [重复次数]
+"""
+
+import statistics
+import subprocess
+import sys
+
+IMPORTS = {
+    'SQLModel 模型': 'from seerapi_models import Pet',
+    'seerapi_models_api': 'from seerapi_models_api import Pet',
+}
+
+TIMER = 'import time; _t = time.perf_counter(); {code}; print(time.perf_counter() - _t)'
+
+MEMORY = """
+import tracemalloc
+{code}
+
+def ref(resource_name, id):
+    return {{'id': id, 'resource_name': resource_name, 'url': ''}}
+
+stats = {{k: 10 for k in ('atk', 'def', 'sp_atk', 'sp_def', 'spd', 'hp')}}
+data = {{
+    'id': 0, 'name': '测试精灵', 'yielding_exp': 1, 'catch_rate': 1,
+    'releaseable': True, 'fusion_master': False, 'fusion_sub': False,
+    'has_resistance': True,
+    'resource_id': 1, 'type': ref('element_type_combination', 1),
+    'gender': ref('pet_gender', 1), 'base_stats': stats,
+    'evolution_chain_index': 0, 'yielding_ev': stats,
+    'skill': [{{'skill': ref('skill', i), 'learning_level': i}} for i in range(10)],
+}}
+Pet.model_validate(data)
+tracemalloc.start()
+before = tracemalloc.get_traced_memory()[0]
+pets = [Pet.model_validate({{**data, 'id': i}}) for i in range({count})]
+print((tracemalloc.get_traced_memory()[0] - before) / {count})
+"""
+
+
+def run(code: str) -> float:
+    output = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-c', code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(f'{"模型":<24}{"导入耗时(ms)":>14}{"单实例内存(B)":>16}')
+    for label, code in IMPORTS.items():
+        elapsed = statistics.median(run(TIMER.format(code=code)) for _ in range(repeat))
+        memory = run(MEMORY.format(code=code, count=count))
+        print(f'{label:<24}{elapsed * 1000:>14.1f}{memory:>16.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""对比 SixAttributes 逐个运算与 SixAttributesBatch 批量运算的耗时
+
+用法：python benchmarks/bench_attributes_batch.py [组合数量]
+
+模拟配队计算：种族值 + 学习力 + 性格（百分比） + 刻印。
+"""
+
+import random
+import sys
+import time
+
+from seerapi_models.attributes_batch import (
+    Backend,
+    SixAttributesBatch,
+    default_backend,
+)
+from seerapi_models.common import SixAttributes
+
+
+def random_models(rng: random.Random, count: int, *, percent: bool = False) -> list:
+    return [
+        SixAttributes.from_list(
+            [
+                rng.randint(-10, 10) if percent else rng.randint(0, 200)
+                for _ in range(6)
+            ],
+            percent=percent,
+        )
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    base = random_models(rng, count)
+    ev = random_models(rng, count)
+    nature = random_models(rng, count, percent=True)
+    mintmark = random_models(rng, count)
+    print(f'{count} 组属性，默认后端：{default_backend()}')
+
+    start = time.perf_counter()
+    for row in zip(base, ev, nature, mintmark):
+        row[0] + row[1] + row[2] + row[3]
+    scalar = time.perf_counter() - start
+    print(f'{"SixAttributes 逐个运算":<28}{scalar * 1000:>10.1f} ms')
+
+    backends: list[Backend] = (
+        ['array'] if default_backend() == 'array' else ['numpy', 'array']
+    )
+    for backend in backends:
+        batches = [
+            SixAttributesBatch.from_models(models, backend=backend)
+            for models in (base, ev, nature, mintmark)
+        ]
+        start = time.perf_counter()
+        batches[0] + batches[1] + batches[2] + batches[3]
+        elapsed = time.perf_counter() - start
+        print(
+            f'{"SixAttributesBatch(" + backend + ")":<28}{elapsed * 1000:>10.1f} ms'
+            f'（{scalar / elapsed:.1f}x）'
+        )
+
+
+if __name__ == '__main__':
+    main()
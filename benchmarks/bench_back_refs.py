@@ -0,0 +1,60 @@
+"""测试 ResourceRegistry.fill_back_refs 填充反向引用列表的耗时
+
+用法：python benchmarks/bench_back_refs.py [技能数量] [分类数量]
+
+对比对每个分类扫描全部技能的嵌套循环与 fill_back_refs 一次遍历，
+两者得到的 SkillCategory.skill 列表中的ID相同。
+"""
+
+import sys
+import time
+
+
+def measure(func, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    from seerapi_models import Skill, SkillCategory
+    from seerapi_models.common import ResourceRef
+    from seerapi_models.registry import ResourceRegistry
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    # 只用到ID与引用字段，模型不经过校验直接构造
+    categories = [SkillCategory.model_construct(id=i) for i in range(1, size + 1)]
+    skills = [
+        Skill.model_construct(
+            id=i, category=ResourceRef.from_res_name(i % size + 1, 'skill_category')
+        )
+        for i in range(1, count + 1)
+    ]
+    registry = ResourceRegistry([*categories, *skills])
+
+    def nested() -> None:
+        for category in categories:
+            category.skill = [
+                ResourceRef.from_res_name(skill.id, 'skill')
+                for skill in skills
+                if skill.category.id == category.id
+            ]
+
+    nested_time = measure(nested, repeat=1)
+    expected = [[ref.id for ref in category.skill] for category in categories]
+    fill_time = measure(registry.fill_back_refs)
+    assert [[ref.id for ref in category.skill] for category in categories] == expected
+
+    print(f'{count} 个技能，{size} 个分类')
+    print(f'{"方式":<20}{"耗时(ms)":>10}')
+    print(f'{"嵌套循环":<20}{nested_time * 1000:>10.1f}')
+    print(f'{"fill_back_refs":<20}{fill_time * 1000:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
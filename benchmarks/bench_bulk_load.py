@@ -0,0 +1,131 @@
+"""对比批量写入与逐个 session.add(model.to_orm()) 的耗时，以及效果行去重前后的行数
+
+用法：python benchmarks/bench_bulk_load.py [精灵数量] [技能数量]
+"""
+
+import random
+import sys
+import tempfile
+import time
+import warnings
+
+from sqlalchemy.exc import SAWarning
+from sqlmodel import Session, SQLModel, create_engine, func, select
+
+from seerapi_models import Pet, Skill
+from seerapi_models.bulk import INTERNED_MODELS, bulk_load
+from seerapi_models.common import (
+    ResourceRef,
+    SixAttributes,
+    SkillEffectInUse,
+    SkillEffectInUseORM,
+)
+
+
+def build_dataset(pet_count: int, skill_count: int) -> list:
+    rng = random.Random(0)
+    ref = ResourceRef.from_res_name
+    stats = SixAttributes(atk=100, def_=90, sp_atk=80, sp_def=70, spd=60, hp=110)
+    skills = [
+        Skill(
+            id=i,
+            name=f'技能{i}',
+            power=rng.randint(0, 150),
+            max_pp=rng.randint(5, 35),
+            accuracy=100,
+            crit_rate=5,
+            priority=0,
+            must_hit=False,
+            category=ref(rng.randint(1, 4), 'skill_category'),
+            type=ref(rng.randint(1, 30), 'element_type_combination'),
+            # 实际数据中大量技能共用相同的效果与参数
+            skill_effect=[
+                SkillEffectInUse(
+                    effect=ref(effect_id, 'skill_effect_type'),
+                    args=[arg],
+                    info=f'效果{effect_id}：{arg}',
+                    analyze_info=f'效果{effect_id}：{arg}',
+                )
+                for effect_id, arg in (
+                    (rng.randint(1, 200), rng.choice((10, 20, 30, 50, 100)))
+                    for _ in range(2)
+                )
+            ],
+        )
+        for i in range(1, skill_count + 1)
+    ]
+    pets = [
+        Pet.model_validate(
+            {
+                'id': i,
+                'name': f'精灵{i}',
+                'yielding_exp': 100,
+                'catch_rate': 50,
+                'releaseable': True,
+                'fusion_master': False,
+                'fusion_sub': False,
+                'has_resistance': True,
+                'resource_id': i,
+                'type': ref(rng.randint(1, 30), 'element_type_combination'),
+                'gender': ref(1, 'pet_gender'),
+                'base_stats': stats,
+                'evolution_chain_index': 0,
+                'yielding_ev': stats,
+                'skill': [
+                    {'skill': ref(skill_id, 'skill'), 'learning_level': level}
+                    for level, skill_id in enumerate(
+                        rng.sample(range(1, skill_count + 1), 10), 1
+                    )
+                ],
+            }
+        )
+        for i in range(1, pet_count + 1)
+    ]
+    return [*skills, *pets]
+
+
+def run(models: list, *, bulk: bool, interned: bool = True) -> tuple[float, int]:
+    """返回写入耗时与 skill_effect_in_use 表的行数"""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f'sqlite:///{directory}/bench.db')
+        SQLModel.metadata.create_all(engine)
+        start = time.perf_counter()
+        with Session(engine) as session:
+            if bulk:
+                # 逐个 add 不会填充全文搜索索引，对比时同样跳过
+                bulk_load(
+                    session,
+                    models,
+                    interned_models=INTERNED_MODELS if interned else (),
+                    search_index=False,
+                )
+            else:
+                for model in models:
+                    session.add(model.to_orm())
+            session.commit()
+            elapsed = time.perf_counter() - start
+            effect_rows = session.exec(
+                select(func.count()).select_from(SkillEffectInUseORM)
+            ).one()
+        engine.dispose()
+    return elapsed, effect_rows
+
+
+def main() -> None:
+    pet_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    skill_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    warnings.simplefilter('ignore', SAWarning)
+    models = build_dataset(pet_count, skill_count)
+    print(f'数据集：{pet_count} 个精灵，{skill_count} 个技能')
+    naive, naive_rows = run(models, bulk=False)
+    plain, plain_rows = run(models, bulk=True, interned=False)
+    bulk, bulk_rows = run(models, bulk=True)
+    print(f'session.add 逐个写入：{naive:.2f}s，效果 {naive_rows} 行')
+    print(
+        f'bulk_load 不去重：{plain:.2f}s（{naive / plain:.2f}x），效果 {plain_rows} 行'
+    )
+    print(f'bulk_load 去重：{bulk:.2f}s（{naive / bulk:.2f}x），效果 {bulk_rows} 行')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""测试通过闭包表查询宝石整条等级链的耗时
+
+用法：python benchmarks/bench_closure.py [等级链数量] [每条链的等级数]
+
+对每个宝石取出其所在等级链的全部宝石ID：
+
+- 延迟加载：由 GemORM.prev_level_gem 走到链首，再沿 next_level_gem 走到链尾，
+  每一步一次查询
+- 闭包表：GemLevelClosure.select_chain 一次查询
+
+另外给出由宝石表重建闭包表（rebuild_closure_tables）的耗时。
+"""
+
+import sys
+import time
+
+from sqlmodel import Session, SQLModel, create_engine
+
+
+def measure(func, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    from seerapi_models import GemORM
+    from seerapi_models.bulk import rebuild_closure_tables
+    from seerapi_models.items.mintmark_gem import GemLevelClosure
+
+    chains = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    levels = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    count = chains * levels
+
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            GemORM(
+                id=i,
+                name=f'gem-{i}',
+                level=(i - 1) % levels + 1,
+                generation_id=1,
+                category_id=1,
+                next_level_gem_id=i + 1 if i % levels else None,
+            )
+            for i in range(1, count + 1)
+        )
+        session.flush()
+        rebuild = measure(lambda: rebuild_closure_tables(session, [GemLevelClosure]))
+        session.commit()
+
+    def lazy() -> None:
+        with Session(engine) as session:
+            for i in range(1, count + 1):
+                gem = session.get(GemORM, i)
+                assert gem is not None
+                while gem.prev_level_gem is not None:
+                    gem = gem.prev_level_gem
+                chain = [gem.id]
+                while gem.next_level_gem is not None:
+                    gem = gem.next_level_gem
+                    chain.append(gem.id)
+
+    def closure() -> None:
+        with Session(engine) as session:
+            for i in range(1, count + 1):
+                session.exec(GemLevelClosure.select_chain(i)).all()
+
+    print(f'{chains} 条等级链，每条 {levels} 级，共 {count} 个宝石')
+    print(f'{"方式":<12}{"耗时(ms)":>10}')
+    print(f'{"延迟加载":<12}{measure(lazy) * 1000:>10.1f}')
+    print(f'{"闭包表":<12}{measure(closure) * 1000:>10.1f}')
+    print(f'{"重建闭包表":<12}{rebuild * 1000:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
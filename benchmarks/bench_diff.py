@@ -0,0 +1,116 @@
+"""对比增量更新与重新构建整个数据库的耗时
+
+用法：python benchmarks/bench_diff.py [精灵数量] [技能数量] [改动数量]
+
+数据集同 bench_bulk_load.py。新数据集在旧数据集的基础上修改、删除并新增少量技能与精灵，
+增量更新为 diff_datasets 与 apply_diff（在旧数据库的副本上执行），
+重新构建为由新数据集创建数据库并 bulk_load。
+"""
+
+from datetime import datetime, timezone
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+
+from bench_bulk_load import build_dataset
+from sqlalchemy.exc import SAWarning
+from sqlmodel import Session, SQLModel, create_engine
+
+from seerapi_models import Pet, Skill
+from seerapi_models.bulk import bulk_load
+from seerapi_models.diff import apply_diff, diff_datasets
+from seerapi_models.metadata import ApiMetadata
+
+
+def measure(func, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def metadata(version: str) -> ApiMetadata:
+    return ApiMetadata(
+        api_url='https://example.com',
+        api_version='v1',
+        generator_name='bench',
+        generator_version='1',
+        generate_time=datetime.now(timezone.utc),
+        data_version=version,
+    )
+
+
+def patch(models: list, count: int) -> list:
+    """修改前 count 个技能与精灵的名称，删除并新增 count // 10 个精灵"""
+    skills = [model for model in models if isinstance(model, Skill)]
+    pets = [model for model in models if isinstance(model, Pet)]
+    removed = max(count // 10, 1)
+    renamed = [
+        model.model_copy(update={'name': f'{model.name}（新）'})
+        for model in (*skills[:count], *pets[:count])
+    ]
+    added = [
+        pet.model_copy(update={'id': pet.id + len(pets)}) for pet in pets[-removed:]
+    ]
+    return [
+        *renamed,
+        *skills[count:],
+        *pets[count:-removed],
+        *added,
+    ]
+
+
+def main() -> None:
+    pet_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    skill_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    warnings.simplefilter('ignore', SAWarning)
+    old = build_dataset(pet_count, skill_count)
+    new = patch(old, count)
+
+    with tempfile.TemporaryDirectory() as directory:
+        base = f'{directory}/old.db'
+        engine = create_engine(f'sqlite:///{base}')
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            bulk_load(session, [*old, metadata('1')])
+            session.commit()
+        engine.dispose()
+
+        def rebuild() -> None:
+            engine = create_engine(f'sqlite:///{directory}/full.db')
+            SQLModel.metadata.drop_all(engine)
+            SQLModel.metadata.create_all(engine)
+            with Session(engine) as session:
+                bulk_load(session, [*new, metadata('2')])
+                session.commit()
+            engine.dispose()
+
+        changes: dict = {}
+
+        def incremental() -> None:
+            shutil.copy(base, f'{directory}/incremental.db')
+            engine = create_engine(f'sqlite:///{directory}/incremental.db')
+            with Session(engine) as session:
+                diff = diff_datasets(old, new)
+                changes.update(
+                    apply_diff(session, diff, metadata('2'), from_version='1')
+                )
+                session.commit()
+            engine.dispose()
+
+        print(f'{pet_count} 个精灵、{skill_count} 个技能，改动 {count * 2} 个资源')
+        print(f'重新构建  {measure(rebuild) * 1000:>10.1f}ms')
+        print(f'增量更新  {measure(incremental) * 1000:>10.1f}ms')
+        for table, (inserted, updated, deleted) in sorted(changes.items()):
+            print(
+                f'  {table:<24}写入 {inserted:>5} 替换 {updated:>5} 删除 {deleted:>5}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""测试查询精灵进化链的耗时
+
+用法：python benchmarks/bench_evolution.py [精灵数量]
+
+每 3 个精灵为一条进化链，对每个精灵取出整条进化链的精灵ID：
+
+- 注册表：resolve(pet.pet_class) 后再用 resolve_many 解析 evolution_chain
+- ORM：在新的 Session 中通过 PetORM.pet_class.evolution_chain 延迟加载
+- 索引：EvolutionChainIndex.from_session 一次查询构建索引后逐个查找（含构建耗时）
+- 仅查找索引：索引已构建好时逐个查找
+"""
+
+import sys
+import time
+
+from sqlmodel import Session, SQLModel, create_engine
+
+
+def measure(func, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    from seerapi_models import Pet, PetClass, PetClassORM, PetORM
+    from seerapi_models.common import ResourceRef
+    from seerapi_models.evolution import EvolutionChainIndex
+    from seerapi_models.registry import ResourceRegistry
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 6_000
+    ids = range(1, count + 1)
+
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(PetClassORM(id=i) for i in range(1, count + 1, 3))
+        session.add_all(
+            PetORM(
+                id=i,
+                name=f'pet-{i}',
+                yielding_exp=0,
+                catch_rate=0,
+                releaseable=True,
+                fusion_master=False,
+                fusion_sub=False,
+                has_resistance=False,
+                resource_id=i,
+                type_id=1,
+                gender_id=1,
+                base_stats_id=i,
+                yielding_ev_id=i,
+                pet_class_id=(i - 1) // 3 * 3 + 1,
+                evolution_chain_index=(i - 1) % 3,
+            )
+            for i in ids
+        )
+        session.commit()
+
+    # 注册表只用到ID与引用字段，模型不经过校验直接构造
+    registry = ResourceRegistry(
+        [
+            *(
+                PetClass.model_construct(
+                    id=i,
+                    evolution_chain=[
+                        ResourceRef.from_res_name(j, 'pet') for j in range(i, i + 3)
+                    ],
+                )
+                for i in range(1, count + 1, 3)
+            ),
+            *(
+                Pet.model_construct(
+                    id=i,
+                    pet_class=ResourceRef.from_res_name(
+                        (i - 1) // 3 * 3 + 1, 'pet_class'
+                    ),
+                )
+                for i in ids
+            ),
+        ]
+    )
+    pets = registry.models(Pet)
+
+    def resolved() -> None:
+        for pet in pets:
+            assert pet.pet_class is not None
+            pet_class = registry.resolve(pet.pet_class)
+            [item.id for item in registry.resolve_many(pet_class.evolution_chain)]
+
+    def orm() -> None:
+        with Session(engine) as session:
+            for i in ids:
+                pet = session.get(PetORM, i)
+                assert pet is not None
+                assert pet.pet_class is not None
+                [item.id for item in pet.pet_class.evolution_chain]
+
+    def indexed() -> None:
+        with Session(engine) as session:
+            index = EvolutionChainIndex.from_session(session)
+        for i in ids:
+            index.chain(i)
+
+    with Session(engine) as session:
+        index = EvolutionChainIndex.from_session(session)
+    print(f'{count} 个精灵，{len(index.chains)} 条进化链')
+    print(f'{"方式":<12}{"耗时(ms)":>10}')
+    for label, elapsed in (
+        ('注册表解析', measure(resolved)),
+        ('ORM 延迟加载', measure(orm, repeat=3)),
+        ('索引', measure(indexed)),
+        ('仅查找索引', measure(lambda: [index.chain(i) for i in ids])),
+    ):
+        print(f'{label:<12}{elapsed * 1000:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
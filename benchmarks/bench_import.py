@@ -0,0 +1,50 @@
+"""对比立即导入与按需导入模式下的冷启动耗时
+
+用法：python benchmarks/bench_import.py [重复次数]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+SNIPPETS = {
+    'import seerapi_models': 'import seerapi_models',
+    'Nature': 'from seerapi_models import Nature',
+    'Item': 'from seerapi_models import Item',
+    'Pet': 'from seerapi_models import Pet',
+    'PetORM': 'from seerapi_models import PetORM',
+}
+
+TIMER = 'import time; _t = time.perf_counter(); {code}; print(time.perf_counter() - _t)'
+
+
+def measure(code: str, *, lazy: bool, repeat: int) -> float:
+    env = dict(os.environ)
+    env['SEERAPI_MODELS_LAZY_IMPORT'] = '1' if lazy else '0'
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-W', 'ignore', '-c', TIMER.format(code=code)],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f'{"场景":<24}{"立即导入(ms)":>14}{"按需导入(ms)":>14}{"加速比":>8}')
+    for label, code in SNIPPETS.items():
+        eager = measure(code, lazy=False, repeat=repeat)
+        lazy = measure(code, lazy=True, repeat=repeat)
+        print(
+            f'{label:<24}{eager * 1000:>14.1f}{lazy * 1000:>14.1f}{eager / lazy:>8.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""对比逐个延迟加载关系与使用预加载选项还原全部精灵的耗时与查询数量
+
+用法：python benchmarks/bench_loading.py [精灵数量] [技能数量]
+
+数据集同 bench_bulk_load.py。延迟加载为查询全部 PetORM 后逐个调用 from_orm，
+每只精灵的每个关系各触发一次查询；预加载为 load_models。
+"""
+
+import sys
+import tempfile
+import time
+import warnings
+
+from bench_bulk_load import build_dataset
+from sqlalchemy import event
+from sqlalchemy.exc import SAWarning
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from seerapi_models import Pet, PetORM
+from seerapi_models.bulk import bulk_load
+from seerapi_models.loading import from_orm, load_models
+
+
+def measure(func, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    pet_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    skill_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    warnings.simplefilter('ignore', SAWarning)
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f'sqlite:///{directory}/data.db')
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            bulk_load(session, build_dataset(pet_count, skill_count))
+            session.commit()
+
+        queries = 0
+
+        def count(*args) -> None:
+            nonlocal queries
+            queries += 1
+
+        event.listen(engine, 'before_cursor_execute', count)
+
+        def lazy() -> list:
+            with Session(engine) as session:
+                return [from_orm(row) for row in session.exec(select(PetORM))]
+
+        def preloaded() -> list:
+            with Session(engine) as session:
+                return load_models(session, Pet)
+
+        print(f'还原 {pet_count} 个精灵（{skill_count} 个技能）')
+        print(f'{"方式":<10}{"耗时(ms)":>12}{"查询数":>10}')
+        for label, func in (('延迟加载', lazy), ('预加载', preloaded)):
+            queries = 0
+            func()
+            executed = queries
+            elapsed = measure(func)
+            print(f'{label:<10}{elapsed * 1000:>12.1f}{executed:>10}')
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""测试搜索最佳刻印组合的耗时
+
+用法：python benchmarks/bench_mintmark_search.py [刻印数量]
+
+随机生成全能刻印目录（约 10% 为精灵专属刻印），
+搜索速度与攻击之和最高的 10 套三刻印组合，对比：
+
+- 逐个枚举：对可以安装的刻印枚举全部组合，取得分最高的 k 个（组合数量为 C(n, 3)，
+  只在前 150 个刻印上运行）
+- MintmarkSearch：预先展开属性数组，按得分排序后分支限界
+"""
+
+import heapq
+from itertools import combinations
+import random
+import sys
+import time
+
+
+def measure(func, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    from seerapi_models import UniversalMintmark
+    from seerapi_models.common import ResourceRef, SixAttributes
+    from seerapi_models.mintmark_search import MintmarkSearch
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+    rng = random.Random(0)
+    pet_id = 1
+
+    def attributes() -> SixAttributes:
+        return SixAttributes.from_list([rng.randint(0, 40) for _ in range(6)])
+
+    # 只用到属性与精灵限制字段，模型不经过校验直接构造
+    catalog = [
+        UniversalMintmark.model_construct(
+            id=id,
+            max_attr_value=attributes(),
+            extra_attr_value=attributes() if rng.random() < 0.3 else None,
+            mintmark_class=None,
+            pet=[ResourceRef.from_res_name(rng.randint(1, 50), 'pet')]
+            if rng.random() < 0.1
+            else None,
+        )
+        for id in range(1, count + 1)
+    ]
+    weights = {'spd': 1, 'atk': 1}
+
+    def brute_force(mintmarks: list[UniversalMintmark]) -> list[float]:
+        def score(mintmark: UniversalMintmark) -> float:
+            extra = mintmark.extra_attr_value
+            return sum(
+                (
+                    getattr(mintmark.max_attr_value, field)
+                    + (getattr(extra, field) if extra else 0)
+                )
+                * weight
+                for field, weight in weights.items()
+            )
+
+        eligible = [
+            mintmark
+            for mintmark in mintmarks
+            if mintmark.pet is None or pet_id in {ref.id for ref in mintmark.pet}
+        ]
+        return heapq.nlargest(
+            10,
+            (score(a) + score(b) + score(c) for a, b, c in combinations(eligible, 3)),
+        )
+
+    small = catalog[:150]
+    small_search = MintmarkSearch(small)
+    search = MintmarkSearch(catalog)
+
+    def top_k(target: MintmarkSearch) -> list[float]:
+        return [build.score for build in target.top_k(weights, pet_id=pet_id, k=10)]
+
+    assert top_k(small_search) == brute_force(small)
+
+    print(f'{"方式":<24}{"刻印数量":>8}{"耗时(ms)":>12}')
+    for label, size, elapsed in (
+        ('逐个枚举', len(small), measure(lambda: brute_force(small), repeat=1)),
+        ('MintmarkSearch', len(small), measure(lambda: top_k(small_search))),
+        ('MintmarkSearch', count, measure(lambda: top_k(search))),
+        ('构建 MintmarkSearch', count, measure(lambda: MintmarkSearch(catalog))),
+    ):
+        print(f'{label:<24}{size:>8}{elapsed * 1000:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
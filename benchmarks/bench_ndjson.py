@@ -0,0 +1,121 @@
+"""对比 NamedData 整体导出/导入与 NDJSON 逐行导出/导入的内存峰值与耗时
+
+用法：python benchmarks/bench_ndjson.py [精灵数量]
+
+精灵由生成器逐个创建。每种方式在独立的子进程中运行，
+统计运行前后的最大常驻内存（ru_maxrss）之差：
+
+- NamedData：收集为 NamedData[Pet] 后整体序列化写入文件，导入时按相同结构整体读取并校验
+- NDJSON：export_ndjson 逐行写入，import_ndjson 逐行读取并校验
+"""
+
+from collections.abc import Iterator
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+MODES = ('named_export', 'ndjson_export', 'named_import', 'ndjson_import')
+
+
+def iter_pets(count: int) -> Iterator:
+    from seerapi_models import Pet
+    from seerapi_models.common import ResourceRef, SixAttributes
+
+    rng = random.Random(0)
+    ref = ResourceRef.from_res_name
+    stats = SixAttributes(atk=100, def_=90, sp_atk=80, sp_def=70, spd=60, hp=110)
+    for i in range(1, count + 1):
+        yield Pet.model_validate(
+            {
+                'id': i,
+                'name': f'精灵{i}',
+                'yielding_exp': 100,
+                'catch_rate': 50,
+                'releaseable': True,
+                'fusion_master': False,
+                'fusion_sub': False,
+                'has_resistance': True,
+                'resource_id': i,
+                'type': ref(rng.randint(1, 30), 'element_type_combination'),
+                'gender': ref(rng.randint(1, 3), 'pet_gender'),
+                'base_stats': stats,
+                'evolution_chain_index': 0,
+                'yielding_ev': stats,
+                'skill': [
+                    {'skill': ref(rng.randint(1, 5000), 'skill'), 'learning_level': n}
+                    for n in range(1, 41)
+                ],
+            }
+        )
+
+
+def child(mode: str, count: int, directory: str) -> None:
+    from pathlib import Path
+
+    from pydantic import TypeAdapter
+
+    from seerapi_models import Pet
+    from seerapi_models.common import NamedData
+    from seerapi_models.ndjson import export_ndjson, import_ndjson
+
+    named_path = Path(directory) / 'pet.json'
+    # 先完成导入与首次校验，避免计入模块本身的内存
+    list(iter_pets(1))
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == 'named_export':
+        named = NamedData[Pet](data={pet.id: pet for pet in iter_pets(count)})
+        named_path.write_bytes(named.model_dump_json(by_alias=True).encode())
+    elif mode == 'ndjson_export':
+        export_ndjson(directory, iter_pets(count))
+    elif mode == 'named_import':
+        # NamedData[Pet] 的类型参数在 SQLModel 中无法用于校验，按相同结构校验
+        adapter = TypeAdapter(dict[str, dict[int, Pet]])
+        named = adapter.validate_json(named_path.read_bytes())
+        assert len(named['data']) == count
+    else:
+        assert sum(1 for _ in import_ndjson(directory, [Pet])) == count
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+    print(peak * 1024, elapsed)
+
+
+def run(mode: str, count: int, directory: str) -> tuple[int, float]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            '-W',
+            'ignore',
+            __file__,
+            '--child',
+            mode,
+            str(count),
+            directory,
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    peak, elapsed = output.strip().splitlines()[-1].split()
+    return int(peak), float(elapsed)
+
+
+def main() -> None:
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f'{count} 个精灵')
+    print(f'{"方式":<16}{"内存峰值增量(MB)":>18}{"耗时(s)":>10}')
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in MODES:
+            peak, elapsed = run(mode, count, directory)
+            print(f'{mode:<16}{peak / 1024 / 1024:>18.1f}{elapsed:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
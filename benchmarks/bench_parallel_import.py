@@ -0,0 +1,108 @@
+"""对比单进程与并行导入在不同工作进程数下的耗时
+
+用法：python benchmarks/bench_parallel_import.py [精灵数量] [最大工作进程数]
+
+先用 export_ndjson 导出精灵数据，再分别测量：
+
+- 校验：import_ndjson 与 1、2、4、8 个工作进程的 iter_ndjson_parallel
+- 写入：bulk_load(import_ndjson(...)) 与同样进程数的 import_ndjson_parallel，
+  写入内存中的 SQLite 数据库
+
+每种方式取三次中的最短耗时。主进程 CPU 时间不包括工作进程，
+单进程耗时与它之比是核数足够时加速比的理论上限，实际加速比以多核机器上的耗时为准。
+工作进程数超过 CPU 核数时不会再有加速。
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from bench_ndjson import iter_pets
+
+
+def measure(func, repeat: int = 3) -> tuple[float, float]:
+    """返回最短的耗时与主进程 CPU 时间"""
+    best = (float('inf'), float('inf'))
+    for _ in range(repeat):
+        start, cpu = time.perf_counter(), time.process_time()
+        func()
+        best = min(best, (time.perf_counter() - start, time.process_time() - cpu))
+    return best
+
+
+def report(title: str, serial, parallel, max_workers: int) -> None:
+    """serial 与 parallel(workers) 都是无参数的测量函数"""
+    elapsed, _ = measure(serial)
+    print(title)
+    print(f'{"方式":<16}{"耗时(s)":>10}{"主进程CPU(s)":>14}{"加速比":>10}')
+    print(f'{"单进程":<16}{elapsed:>10.2f}{elapsed:>14.2f}{1:>10.2f}')
+    workers = 1
+    while workers <= max_workers:
+        parallel_elapsed, cpu = measure(parallel(workers))
+        label = f'{workers} 进程'
+        speedup = elapsed / parallel_elapsed
+        print(f'{label:<16}{parallel_elapsed:>10.2f}{cpu:>14.2f}{speedup:>10.2f}')
+        workers *= 2
+
+
+def main() -> None:
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from seerapi_models import Pet
+    from seerapi_models.bulk import bulk_load
+    from seerapi_models.ndjson import (
+        export_ndjson,
+        import_ndjson,
+        import_ndjson_parallel,
+        iter_ndjson_parallel,
+    )
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    def load(func) -> None:
+        engine = create_engine('sqlite://')
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            func(session)
+            session.commit()
+
+    with tempfile.TemporaryDirectory() as directory:
+        export_ndjson(directory, iter_pets(count))
+        print(f'{count} 个精灵，CPU 核数 {os.cpu_count()}')
+        report(
+            '校验',
+            lambda: sum(1 for _ in import_ndjson(directory, [Pet])),
+            lambda workers: (
+                lambda: sum(
+                    1
+                    for _ in iter_ndjson_parallel(directory, [Pet], max_workers=workers)
+                )
+            ),
+            max_workers,
+        )
+        report(
+            '写入数据库',
+            lambda: load(
+                lambda session: bulk_load(
+                    session, import_ndjson(directory, [Pet]), search_index=False
+                )
+            ),
+            lambda workers: (
+                lambda: load(
+                    lambda session: import_ndjson_parallel(
+                        session,
+                        directory,
+                        [Pet],
+                        max_workers=workers,
+                        search_index=False,
+                    )
+                )
+            ),
+            max_workers,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""对比 ResourceRef 完整格式与紧凑编码导出大量精灵数据的大小与耗时
+
+用法：python benchmarks/bench_ref_encoding.py [精灵数量]
+
+紧凑编码通过 ref_encoding_context 创建的 context 选择，
+同一批数据依次以完整格式、'id' 与 'pair' 编码导出，每种编码测量三轮并取最好的结果。
+"""
+
+import gc
+import sys
+import time
+
+from bench_resource_ref import BASE_DATA_URL, build_pets
+from pydantic import TypeAdapter
+
+from seerapi_models import Pet
+from seerapi_models.common import RefEncoding, ResourceRef, ref_encoding_context
+
+ENCODINGS: dict[str, RefEncoding | None] = {'完整': None, 'id': 'id', 'pair': 'pair'}
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with ResourceRef.bind_base_data_url(BASE_DATA_URL):
+        pets = build_pets(count)
+    gc.collect()
+    gc.freeze()
+
+    print(f'{count} 个精灵')
+    print(f'{"编码":<8}{"导出(s)":>10}{"大小(MB)":>10}')
+    adapter = TypeAdapter(list[Pet])
+    for label, encoding in ENCODINGS.items():
+        context = None if encoding is None else ref_encoding_context(encoding)
+        best = float('inf')
+        data = b''
+        for _ in range(3):
+            start = time.perf_counter()
+            data = adapter.dump_json(pets, by_alias=True, context=context)
+            best = min(best, time.perf_counter() - start)
+        print(f'{label:<8}{best:>10.2f}{len(data) / 1024 / 1024:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
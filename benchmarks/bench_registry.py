@@ -0,0 +1,70 @@
+"""测试 ResourceRegistry 解析精灵中全部引用的耗时与注册表的内存占用
+
+用法：python benchmarks/bench_registry.py [精灵数量] [注册表资源数量]
+
+- 解析：精灵由 bench_ndjson.iter_pets 生成，引用属性组合、性别与技能，
+  对比逐个调用 resolve 与一次 resolve_many 解析全部精灵的全部引用
+- 内存：向注册表加入指定数量的技能，统计注册表本身（不含模型）占用的内存
+"""
+
+import sys
+import time
+import tracemalloc
+
+from bench_ndjson import iter_pets
+
+
+def measure(func, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    from seerapi_models import PetGenderCategory, Skill, TypeCombination
+    from seerapi_models.registry import ResourceRegistry, collect_refs
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+
+    # 解析只用到资源名称与ID，目标资源不经过校验直接构造
+    registry = ResourceRegistry(
+        [
+            *(TypeCombination.model_construct(id=i) for i in range(1, 31)),
+            *(PetGenderCategory.model_construct(id=i) for i in range(1, 4)),
+            *(Skill.model_construct(id=i) for i in range(1, 5001)),
+        ]
+    )
+    pets = list(iter_pets(count))
+    refs = [ref for pet in pets for ref in collect_refs(pet)]
+    resolve = registry.resolve
+    one_by_one = measure(lambda: [resolve(ref) for ref in refs])
+    batched = measure(lambda: registry.resolve_many(refs))
+    per_pet = measure(
+        lambda: [registry.resolve_many(collect_refs(pet)) for pet in pets]
+    )
+    print(f'{count} 个精灵，{len(refs)} 个引用')
+    print(f'{"方式":<28}{"耗时(ms)":>10}{"每个引用(ns)":>14}')
+    for label, elapsed in (
+        ('逐个 resolve', one_by_one),
+        ('resolve_many 全部引用', batched),
+        ('每个精灵 collect_refs + resolve_many', per_pet),
+    ):
+        print(f'{label:<28}{elapsed * 1000:>10.1f}{elapsed / len(refs) * 1e9:>14.0f}')
+
+    skills = [Skill.model_construct(id=i) for i in range(1, size + 1)]
+    tracemalloc.start()
+    registry = ResourceRegistry(skills)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f'{len(registry)} 个资源，注册表占用 {used / 1024 / 1024:.1f}MB，'
+        f'每个资源 {used / len(registry):.0f} 字节'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""对比 ResourceRef 不同用法下构造与导出大量精灵数据的耗时
+
+用法：python benchmarks/bench_resource_ref.py [精灵数量]
+
+模拟数据导出流程：用 ResourceRef.from_res_name 构造精灵数据中的引用并校验，
+再把全部精灵序列化为 JSON。对比三种情况：
+
+- 无缓存：关闭实例缓存，以占位地址创建 URL，导出前修改 base_data_url，序列化时替换
+- 缓存：同上，但开启实例缓存
+- 绑定地址：在 bind_base_data_url 的上下文中创建并导出，URL 原样输出
+"""
+
+from contextlib import nullcontext
+import gc
+import random
+import sys
+import time
+
+from pydantic import TypeAdapter
+
+from seerapi_models import Pet, common
+from seerapi_models.common import ResourceRef, SixAttributes
+
+
+def build_pets(count: int) -> list[Pet]:
+    rng = random.Random(0)
+    ref = ResourceRef.from_res_name
+    stats = SixAttributes(atk=100, def_=90, sp_atk=80, sp_def=70, spd=60, hp=110)
+    return [
+        Pet.model_validate(
+            {
+                'id': i,
+                'name': f'精灵{i}',
+                'yielding_exp': 100,
+                'catch_rate': 50,
+                'releaseable': True,
+                'fusion_master': False,
+                'fusion_sub': False,
+                'has_resistance': True,
+                'resource_id': i,
+                'type': ref(rng.randint(1, 30), 'element_type_combination'),
+                'gender': ref(rng.randint(1, 3), 'pet_gender'),
+                'base_stats': stats,
+                'evolution_chain_index': 0,
+                'yielding_ev': stats,
+                'skill': [
+                    {'skill': ref(rng.randint(1, 5000), 'skill'), 'learning_level': n}
+                    for n in range(1, 41)
+                ],
+            }
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+BASE_DATA_URL = 'https://api.example.com/v1'
+
+
+def run(count: int, *, bind: bool = False) -> tuple[float, float, bytes]:
+    ResourceRef.base_data_url = common.BASE_DATA_URL
+    with ResourceRef.bind_base_data_url(BASE_DATA_URL) if bind else nullcontext():
+        start = time.perf_counter()
+        pets = build_pets(count)
+        built = time.perf_counter() - start
+
+        if not bind:
+            ResourceRef.base_data_url = BASE_DATA_URL
+        # 已创建的大量对象会让循环垃圾回收的耗时掩盖序列化本身的差异
+        gc.collect()
+        gc.freeze()
+        adapter = TypeAdapter(list[Pet])
+        start = time.perf_counter()
+        data = adapter.dump_json(pets, by_alias=True)
+        dumped = time.perf_counter() - start
+        gc.unfreeze()
+    return built, dumped, data
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    cached_ref = common._cached_ref
+    try:
+        # 关闭缓存：每次都重新创建实例
+        common._cached_ref = cached_ref.__wrapped__  # type: ignore[assignment]
+        uncached = run(count)
+    finally:
+        common._cached_ref = cached_ref
+    ResourceRef.clear_cache()
+    cached = run(count)
+    bound = run(count, bind=True)
+    assert cached[2] == uncached[2] == bound[2]
+
+    print(f'{count} 个精灵，导出 {len(cached[2]) / 1024 / 1024:.1f} MB JSON')
+    print(f'{"":<12}{"构造(s)":>10}{"导出(s)":>10}')
+    for label, (built, dumped, _) in (
+        ('无缓存', uncached),
+        ('缓存', cached),
+        ('绑定地址', bound),
+    ):
+        print(f'{label:<12}{built:>10.2f}{dumped:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""整表往返（API 模型 -> 数据库 -> API 模型）的吞吐量
+
+用法：python benchmarks/bench_round_trip.py [精灵数量] [技能数量]
+
+数据集同 bench_bulk_load.py。写入为 bulk_load，读取为 load_models，
+还原为对已预加载关系的 ORM 行逐个调用 to_model，不含查询耗时。
+"""
+
+import sys
+import tempfile
+import time
+import warnings
+
+from bench_bulk_load import build_dataset
+from sqlalchemy.exc import SAWarning
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from seerapi_models import Pet, Skill
+from seerapi_models.bulk import bulk_load
+from seerapi_models.loading import load_models, loader_options
+
+
+def measure(func, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    pet_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    skill_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    warnings.simplefilter('ignore', SAWarning)
+    models = build_dataset(pet_count, skill_count)
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f'sqlite:///{directory}/data.db')
+        SQLModel.metadata.create_all(engine)
+
+        start = time.perf_counter()
+        with Session(engine) as session:
+            bulk_load(session, models)
+            session.commit()
+        write = time.perf_counter() - start
+        print(f'写入 {len(models)} 个资源：{write * 1000:.1f}ms')
+
+        print(
+            f'{"资源":<8}{"数量":>8}{"读取(ms)":>12}{"还原(ms)":>12}{"还原(行/秒)":>14}'
+        )
+        for model, count in ((Skill, skill_count), (Pet, pet_count)):
+
+            def read() -> list:
+                with Session(engine) as session:
+                    return load_models(session, model)
+
+            with Session(engine) as session:
+                statement = select(model.get_orm_model())
+                rows = session.exec(statement.options(*loader_options(model))).all()
+                convert = measure(lambda: [row.to_model() for row in rows])
+
+            loaded = read()
+            assert len(loaded) == count
+            elapsed = measure(read)
+            print(
+                f'{model.__name__:<8}{count:>8}{elapsed * 1000:>12.1f}'
+                f'{convert * 1000:>12.1f}{count / convert:>14.0f}'
+            )
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
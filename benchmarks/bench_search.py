@@ -0,0 +1,117 @@
+"""对比全文搜索与 LIKE 逐行匹配的耗时
+
+用法：python benchmarks/bench_search.py [精灵数量] [技能数量] [查询次数]
+
+数据集同 bench_bulk_load.py，名称与描述替换为随机中文文本，
+查询为从已有描述中截取的 3～4 个字。对比：
+
+- LIKE：在各资源表的名称与描述列上执行 LIKE '%…%'
+- FTS5：search 在 trigram 虚拟表中匹配并按 bm25 排序
+- SearchIndex：内存中的三字组倒排索引
+"""
+
+from collections.abc import Sequence
+import random
+import sys
+import time
+import warnings
+
+from bench_bulk_load import build_dataset
+from sqlalchemy import Row, or_, select, union_all
+from sqlalchemy.exc import SAWarning
+from sqlmodel import Session, SQLModel, create_engine
+
+from seerapi_models.bulk import bulk_load
+from seerapi_models.search import (
+    SEARCH_SOURCES,
+    SearchIndex,
+    rebuild_search_index,
+    search,
+)
+
+CHARS = (
+    '火焰水流草木光暗电龙神圣冰雪风地岩石飞行虫毒格斗超能幽灵机械'
+    '恢复体力伤害攻击防御速度'
+)
+
+
+def measure(func, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    pet_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    skill_count = int(sys.argv[2]) if len(sys.argv) > 2 else 30_000
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    warnings.simplefilter('ignore', SAWarning)
+    rng = random.Random(0)
+
+    def text(low: int, high: int) -> str:
+        return ''.join(rng.choice(CHARS) for _ in range(rng.randint(low, high)))
+
+    models = build_dataset(pet_count, skill_count)
+    for model in models:
+        model.name = text(2, 6)
+        if hasattr(model, 'info'):
+            model.info = text(10, 40)
+    infos = [model.info for model in models if hasattr(model, 'info')]
+    queries = []
+    for _ in range(count):
+        info = rng.choice(infos)
+        start = rng.randrange(len(info) - 4)
+        queries.append(info[start : start + rng.randint(3, 4)])
+
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        bulk_load(session, models, search_index=False)
+        start = time.perf_counter()
+        rebuild_search_index(session)
+        print(f'填充 FTS5 虚拟表：{(time.perf_counter() - start) * 1000:.0f}ms')
+        start = time.perf_counter()
+        index = SearchIndex.from_session(session)
+        print(f'构建 SearchIndex：{(time.perf_counter() - start) * 1000:.0f}ms')
+
+        tables = [
+            (source, SQLModel.metadata.tables[source.model.resource_name()])
+            for source in SEARCH_SOURCES
+        ]
+
+        def like(query: str) -> Sequence[Row]:
+            pattern = f'%{query}%'
+            statement = union_all(
+                *(
+                    select(table.c.id).where(
+                        or_(
+                            *(
+                                table.c[name].like(pattern)
+                                for name in (source.name, source.text)
+                                if name
+                            )
+                        )
+                    )
+                    for source, table in tables
+                )
+            )
+            return session.execute(statement).all()
+
+        print(f'{len(index)} 个资源，{count} 次查询，每次最多返回 20 个结果')
+        print(f'{"方式":<14}{"耗时(ms)":>10}{"每次(ms)":>10}')
+        for label, elapsed in (
+            ('LIKE', measure(lambda: [like(query) for query in queries], repeat=1)),
+            ('FTS5', measure(lambda: [search(session, query) for query in queries])),
+            (
+                'SearchIndex',
+                measure(lambda: [index.search(query) for query in queries]),
+            ),
+        ):
+            print(f'{label:<14}{elapsed * 1000:>10.1f}{elapsed / count * 1000:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
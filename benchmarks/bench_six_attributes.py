@@ -0,0 +1,66 @@
+"""对比 SixAttributes 与 CompactSixAttributes 大量实例的常驻内存（RSS）
+
+用法：python benchmarks/bench_six_attributes.py [实例数量]
+
+每种表示在独立的子进程中创建，统计创建前后 RSS 的差值（需要 Linux 的 /proc）。
+"""
+
+import resource
+import subprocess
+import sys
+
+TYPES = ('SixAttributes', 'CompactSixAttributes')
+
+CODE = """
+import random
+import time
+
+from pydantic import TypeAdapter
+
+from seerapi_models.common import CompactSixAttributes, SixAttributes
+
+
+def rss() -> int:
+    with open('/proc/self/statm') as file:
+        return int(file.read().split()[1]) * {page_size}
+
+
+rng = random.Random(0)
+keys = ('atk', 'def', 'sp_atk', 'sp_def', 'spd', 'hp')
+data = [{{key: rng.randint(0, 300) for key in keys}} for _ in range({count})]
+adapter = TypeAdapter(list[{type}])
+adapter.validate_python(data[:10])
+before = rss()
+start = time.perf_counter()
+values = adapter.validate_python(data)
+elapsed = time.perf_counter() - start
+print(rss() - before, elapsed)
+"""
+
+
+def run(type_: str, count: int) -> tuple[int, float]:
+    code = CODE.format(type=type_, count=count, page_size=resource.getpagesize())
+    output = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-c', code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    memory, elapsed = output.strip().splitlines()[-1].split()
+    return int(memory), float(elapsed)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f'{count} 个实例')
+    print(f'{"类型":<24}{"RSS 增量(MB)":>14}{"单实例(B)":>12}{"校验耗时(ms)":>14}')
+    for type_ in TYPES:
+        memory, elapsed = run(type_, count)
+        print(
+            f'{type_:<24}{memory / 1024 / 1024:>14.1f}'
+            f'{memory / count:>12.0f}{elapsed * 1000:>14.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
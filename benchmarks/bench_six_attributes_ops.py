@@ -0,0 +1,58 @@
+"""对比 SixAttributes 运算结果强制校验与跳过校验时的每秒运算次数
+
+用法：python benchmarks/bench_six_attributes_ops.py [每轮次数]
+
+两种实现交替测量三轮并取最好的结果，减少机器负载波动的影响。
+"""
+
+import sys
+import timeit
+
+from seerapi_models.common import SixAttributes
+
+
+def ops_per_second(func, number: int) -> float:
+    return number / min(timeit.repeat(func, number=number, repeat=3))
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    left = SixAttributes(atk=95, def_=88, sp_atk=120, sp_def=75, spd=102, hp=105)
+    right = SixAttributes(
+        atk=10, def_=0, sp_atk=-10, sp_def=0, spd=0, hp=0, percent=True
+    )
+    operations = {
+        'add': lambda: left + right,
+        'sub': lambda: left - right,
+        'round': lambda: left.round(1),
+    }
+
+    trusted = SixAttributes.__dict__['_from_values']
+    validated = classmethod(
+        lambda cls, values, percent=None, *, validate=False: trusted.__func__(
+            cls, values, percent, validate=True
+        )
+    )
+    before: dict[str, float] = {}
+    after: dict[str, float] = {}
+    try:
+        for _ in range(3):
+            for from_values, result in ((trusted, after), (validated, before)):
+                SixAttributes._from_values = from_values  # type: ignore[method-assign]
+                for name, func in operations.items():
+                    result[name] = max(
+                        result.get(name, 0), ops_per_second(func, number)
+                    )
+    finally:
+        SixAttributes._from_values = trusted  # type: ignore[method-assign]
+
+    print(f'{"运算":<8}{"校验(ops/s)":>14}{"跳过校验(ops/s)":>18}{"加速":>8}')
+    for name in operations:
+        print(
+            f'{name:<8}{before[name]:>14.0f}{after[name]:>18.0f}'
+            f'{after[name] / before[name]:>7.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
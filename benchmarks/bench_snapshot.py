@@ -0,0 +1,158 @@
+"""对比 SQLite 快照与未建索引的数据库中常用查询的耗时
+
+用法：python benchmarks/bench_snapshot.py [精灵数量] [技能数量] [每种查询的次数]
+
+数据集同 bench_bulk_load.py，另外加入宝石、刻印与精灵类别。
+未建索引的数据库由 create_all 与 bulk_load 写入；快照由 build_snapshot 构建。
+"""
+
+import random
+import sys
+import tempfile
+import time
+import warnings
+
+from bench_bulk_load import build_dataset
+from sqlalchemy.exc import SAWarning
+from sqlmodel import Session, SQLModel, col, create_engine, select
+
+from seerapi_models import GemORM, MintmarkORM, PetORM, SkillInPetORM, SkillORM
+from seerapi_models.bulk import bulk_load
+from seerapi_models.common import ResourceRef
+from seerapi_models.snapshot import build_snapshot, open_snapshot
+
+
+def measure(func, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    pet_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    skill_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    warnings.simplefilter('ignore', SAWarning)
+    rng = random.Random(1)
+
+    models: list = build_dataset(pet_count, skill_count)
+    # build_dataset 返回的列表中技能在前，精灵在后
+    for pet in models[skill_count:]:
+        pet.pet_class = ResourceRef.from_res_name(pet.id // 3 + 1, 'pet_class')
+        pet.evolution_chain_index = pet.id % 3
+    models += [
+        GemORM(
+            id=i,
+            name=f'宝石{i}',
+            level=i % 10 + 1,
+            generation_id=1,
+            category_id=rng.randint(1, 50),
+        )
+        for i in range(1, 5001)
+    ]
+    models += [
+        MintmarkORM(
+            id=i,
+            name=f'刻印{i}',
+            desc='',
+            type_id=rng.choice((0, 1, 3)),
+            rarity_id=rng.randint(1, 5),
+        )
+        for i in range(1, 5001)
+    ]
+
+    # (说明, 查询, 参数的取值范围)
+    queries = [
+        (
+            '学习某技能的精灵',
+            lambda x: select(SkillInPetORM.pet_id).where(SkillInPetORM.skill_id == x),
+            skill_count,
+        ),
+        (
+            '精灵可学习的技能',
+            lambda x: (
+                select(SkillInPetORM.skill_id)
+                .where(SkillInPetORM.pet_id == x)
+                .order_by(col(SkillInPetORM.learning_level))
+            ),
+            pet_count,
+        ),
+        (
+            '某属性的技能',
+            lambda x: select(SkillORM.id).where(SkillORM.type_id == x),
+            30,
+        ),
+        (
+            '某分类的技能',
+            lambda x: select(SkillORM.id).where(SkillORM.category_id == x),
+            4,
+        ),
+        ('某属性的精灵', lambda x: select(PetORM.id).where(PetORM.type_id == x), 30),
+        (
+            '按名称查找精灵',
+            lambda x: select(PetORM).where(PetORM.name == f'精灵{x}'),
+            pet_count,
+        ),
+        (
+            '按名称查找技能',
+            lambda x: select(SkillORM).where(SkillORM.name == f'技能{x}'),
+            skill_count,
+        ),
+        (
+            '精灵类别的进化链',
+            lambda x: (
+                select(PetORM.id)
+                .where(PetORM.pet_class_id == x)
+                .order_by(col(PetORM.evolution_chain_index))
+            ),
+            pet_count // 3,
+        ),
+        (
+            '某分类的宝石',
+            lambda x: select(GemORM.id).where(GemORM.category_id == x),
+            50,
+        ),
+        (
+            '某稀有度的刻印',
+            lambda x: select(MintmarkORM.id).where(MintmarkORM.rarity_id == x),
+            5,
+        ),
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        plain = create_engine(f'sqlite:///{directory}/plain.db')
+        SQLModel.metadata.create_all(plain)
+        with Session(plain) as session:
+            bulk_load(session, models)
+            session.commit()
+        start = time.perf_counter()
+        build_snapshot(f'{directory}/snapshot.db', models)
+        print(f'构建快照：{time.perf_counter() - start:.2f}s')
+        snapshot = open_snapshot(f'{directory}/snapshot.db')
+
+        print(f'{pet_count} 个精灵，{skill_count} 个技能，每种查询 {count} 次')
+        print(f'{"查询":<12}{"无索引(ms)":>12}{"快照(ms)":>12}{"倍数":>8}')
+        for label, query, upper in queries:
+            params = [rng.randint(1, upper) for _ in range(count)]
+            timings = []
+            for engine in (plain, snapshot):
+                with Session(engine) as session:
+
+                    def run(session=session) -> list:
+                        return [session.exec(query(x)).all() for x in params]
+
+                    timings.append(measure(run))
+            before, after = timings
+            print(
+                f'{label:<12}{before * 1000:>12.1f}{after * 1000:>12.1f}'
+                f'{before / after:>8.1f}'
+            )
+        plain.dispose()
+        snapshot.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""测试计算精灵最终能力值的耗时
+
+用法：python benchmarks/bench_stats.py [组合数量]
+
+随机生成 200 组种族值、25 个性格与 20 套培养方案（学习力与三项加成），对比：
+
+- SixAttributes 串联：level_stats 后转换为模型，依次与性格及各项加成相加
+- calc_stats：逐个计算
+- calc_stats_many：批量计算，相同的输入只解析一次
+"""
+
+import random
+import sys
+import time
+
+
+def measure(func, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    from seerapi_models.common import CompactSixAttributes, SixAttributes
+    from seerapi_models.stats import StatBuild, calc_stats, calc_stats_many, level_stats
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = random.Random(0)
+
+    def attributes(low: int, high: int, percent: bool = False) -> SixAttributes:
+        values = [rng.randint(low, high) for _ in range(6)]
+        return SixAttributes.from_list(values, percent=percent)
+
+    bases = [attributes(50, 150) for _ in range(200)]
+    natures = [attributes(-10, 10, percent=True) for _ in range(25)]
+    builds = [
+        StatBuild(
+            level=100,
+            ev=attributes(0, 255),
+            bonuses=(
+                attributes(0, 40),
+                attributes(0, 10, percent=True),
+                attributes(0, 20),
+            ),
+        )
+        for _ in range(20)
+    ]
+    combinations = [
+        (rng.choice(bases), rng.choice(natures), rng.choice(builds))
+        for _ in range(count)
+    ]
+
+    def chained() -> list[CompactSixAttributes]:
+        results = []
+        for base, nature, build in combinations:
+            stats = level_stats(base, level=build.level, iv=build.iv, ev=build.ev)
+            value = stats.to_model() + nature
+            for bonus in build.bonuses:
+                value = value + bonus
+            results.append(CompactSixAttributes.from_model(value))
+        return results
+
+    def single() -> list[CompactSixAttributes]:
+        return [calc_stats(*item) for item in combinations]
+
+    expected = chained()
+    assert single() == expected
+    assert calc_stats_many(combinations) == expected
+
+    print(f'{count} 个组合')
+    print(f'{"方式":<18}{"耗时(ms)":>10}{"每秒(万次)":>12}')
+    for label, elapsed in (
+        ('SixAttributes 串联', measure(chained, repeat=3)),
+        ('calc_stats', measure(single)),
+        ('calc_stats_many', measure(lambda: calc_stats_many(combinations))),
+    ):
+        print(f'{label:<18}{elapsed * 1000:>10.1f}{count / elapsed / 1e4:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""测试查询属性组合之间克制系数的耗时
+
+用法：python benchmarks/bench_type_chart.py [查询次数]
+
+随机生成 26 个单属性与 300 个双属性组合的克制关系，对比：
+
+- 逐次推导：每次由第一、第二属性与单属性克制表计算双属性系数
+- multiplier：TypeEffectivenessMatrix 逐次查询
+- multipliers：TypeEffectivenessMatrix 批量查询
+"""
+
+from itertools import combinations
+import random
+import sys
+import time
+
+
+def measure(func, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    from seerapi_models import TypeCombination
+    from seerapi_models.common import ResourceRef
+    from seerapi_models.type_chart import TypeEffectivenessMatrix, combine_multipliers
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    chart = {
+        (attacker, defender): rng.choice((0.0, 0.5, 2.0))
+        for attacker in range(1, 27)
+        for defender in range(1, 27)
+        if rng.random() < 0.3
+    }
+    parts = [(i,) for i in range(1, 27)] + list(combinations(range(1, 27), 2))[:300]
+    # 只用到ID与引用字段，模型不经过校验直接构造
+    combos = [
+        TypeCombination.model_construct(
+            id=id,
+            primary=ResourceRef.from_res_name(part[0], 'element_type'),
+            secondary=ResourceRef.from_res_name(part[1], 'element_type')
+            if len(part) == 2
+            else None,
+        )
+        for id, part in enumerate(parts, 1)
+    ]
+    matrix = TypeEffectivenessMatrix.from_chart(combos, chart)
+    by_id = {combo.id: combo for combo in combos}
+    attackers = [rng.randrange(1, len(parts) + 1) for _ in range(count)]
+    defenders = [rng.randrange(1, len(parts) + 1) for _ in range(count)]
+
+    def component_ids(combo: TypeCombination) -> list[int]:
+        return [ref.id for ref in (combo.primary, combo.secondary) if ref is not None]
+
+    def derive() -> list[float]:
+        results = []
+        for attacker_id, defender_id in zip(attackers, defenders):
+            defender = component_ids(by_id[defender_id])
+            values = []
+            for attacker in component_ids(by_id[attacker_id]):
+                single = [chart.get((attacker, part), 1.0) for part in defender]
+                values.append(
+                    combine_multipliers(*single) if len(single) == 2 else single[0]
+                )
+            results.append(
+                combine_multipliers(*values) if len(values) == 2 else values[0]
+            )
+        return results
+
+    multiplier = matrix.multiplier
+    expected = derive()
+    assert matrix.multipliers(attackers, defenders) == expected
+
+    print(f'{len(matrix)} 个属性组合，{count} 次查询')
+    print(f'{"方式":<16}{"耗时(ms)":>10}{"每次(ns)":>10}')
+    for label, elapsed in (
+        ('逐次推导', measure(derive, repeat=3)),
+        (
+            'multiplier',
+            measure(lambda: [multiplier(a, d) for a, d in zip(attackers, defenders)]),
+        ),
+        ('multipliers', measure(lambda: matrix.multipliers(attackers, defenders))),
+    ):
+        print(f'{label:<16}{elapsed * 1000:>10.1f}{elapsed / count * 1e9:>10.0f}')
+    print(f'矩阵占用 {len(matrix) ** 2 * 8 / 1024:.0f}KB')
+
+
+if __name__ == '__main__':
+    main()
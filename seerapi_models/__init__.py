@@ -1,180 +1,231 @@
-from .achievement import (
-    Achievement,
-    AchievementBranch,
-    AchievementBranchORM,
-    AchievementCategory,
-    AchievementORM,
-    AchievementType,
-    AchievementTypeORM,
-    Title,
-    TitleAttrBonusORM,
-    TitlePartORM,
-)
-from .battle_effect import (
-    BattleEffect,
-    BattleEffectCategory,
-    BattleEffectCategoryORM,
-    BattleEffectORM,
-)
-from .common import EidEffect, SkillEffectInUse
-from .decoration import (
-    AvatarFrame,
-    AvatarFrameORM,
-    AvatarHead,
-    AvatarHeadORM,
-    Emoji,
-    EmojiORM,
-    HomepageBackground,
-    HomepageBackgroundORM,
-    NamecardBackground,
-    NamecardBackgroundORM,
-    NicknameBackground,
-    NicknameBackgroundORM,
-)
-from .effect import (
-    PetEffect,
-    PetEffectGroup,
-    PetEffectGroupORM,
-    PetEffectORM,
-    VariationEffect,
-    VariationEffectORM,
-)
-from .element_type import (
-    ElementType,
-    ElementTypeORM,
-    TypeCombination,
-    TypeCombinationORM,
-)
-from .error_code import ErrorCode, ErrorCodeORM
-from .glossary import GlossaryEntry, GlossaryEntryORM
-from .items import (
-    EnergyBead,
-    EnergyBeadBuffAttrORM,
-    EnergyBeadORM,
-    Equip,
-    EquipBonus,
-    EquipBonusAttrORM,
-    EquipBonusORM,
-    EquipEffectiveOccasion,
-    EquipEffectiveOccasionORM,
-    EquipORM,
-    EquipType,
-    EquipTypeORM,
-    Gem,
-    GemCategory,
-    GemCategoryORM,
-    GemGen1,
-    GemGen1PartORM,
-    GemGen2,
-    GemGen2PartORM,
-    GemGenCategory,
-    GemGenCategoryORM,
-    GemORM,
-    Item,
-    ItemCategory,
-    ItemCategoryORM,
-    ItemORM,
-    SkillActivationItem,
-    SkillActivationItemORM,
-    SkillStone,
-    SkillStoneCategory,
-    SkillStoneCategoryORM,
-    SkillStoneEffect,
-    SkillStoneEffectORM,
-    SkillStoneORM,
-    Suit,
-    SuitBonus,
-    SuitBonusAttrORM,
-    SuitBonusORM,
-    SuitORM,
-)
-from .metadata import ApiMetadata, ApiMetadataORM
-from .mintmark import (
-    AbilityMintmark,
-    AbilityPartORM,
-    Mintmark,
-    MintmarkBaseAttrORM,
-    MintmarkClassCategory,
-    MintmarkClassCategoryORM,
-    MintmarkExtraAttrORM,
-    MintmarkMaxAttrORM,
-    MintmarkORM,
-    MintmarkRarityCategory,
-    MintmarkRarityCategoryORM,
-    MintmarkTypeCategory,
-    MintmarkTypeCategoryORM,
-    SkillMintmark,
-    SkillMintmarkEffect,
-    SkillPartORM,
-    UniversalMintmark,
-    UniversalPartORM,
-)
-from .nature import Nature, NatureAttrORM, NatureORM
-from .peak import PeakSeason, PeakSeasonORM
-from .peak_pool import (
-    PeakExpertPool,
-    PeakExpertPoolORM,
-    PeakPool,
-    PeakPoolORM,
-    PeakPoolVote,
-    PeakPoolVoteORM,
-)
-from .pet import (
-    BaseStatORM,
-    DiyStatsRangeORM,
-    Pet,
-    PetAdvance,
-    PetAdvanceORM,
-    PetArchiveStoryBook,
-    PetArchiveStoryBookORM,
-    PetArchiveStoryEntry,
-    PetArchiveStoryEntryORM,
-    PetClass,
-    PetClassORM,
-    PetEncyclopediaEntry,
-    PetEncyclopediaEntryORM,
-    PetGenderCategory,
-    PetGenderORM,
-    PetMountTypeCategory,
-    PetMountTypeORM,
-    PetORM,
-    PetSkin,
-    PetSkinCategory,
-    PetSkinCategoryORM,
-    PetSkinORM,
-    PetVipBuffCategory,
-    PetVipBuffORM,
-    SkillInPet,
-    SkillInPetORM,
-    Soulmark,
-    SoulmarkORM,
-    SoulmarkTagCategory,
-    SoulmarkTagORM,
-    YieldingEvORM,
-)
-from .skill import (
-    Skill,
-    SkillCategory,
-    SkillCategoryORM,
-    SkillEffectParam,
-    SkillEffectParamInType,
-    SkillEffectParamInTypeORM,
-    SkillEffectParamORM,
-    SkillEffectType,
-    SkillEffectTypeORM,
-    SkillEffectTypeTag,
-    SkillEffectTypeTagORM,
-    SkillHideEffect,
-    SkillHideEffectORM,
-    SkillORM,
-)
+from typing import TYPE_CHECKING
 
-SkillEffectInUse.model_rebuild(
-    force=True,
-    _parent_namespace_depth=2,
-    _types_namespace={'SkillEffectType': SkillEffectType},
+from ._lazy import (
+    LAZY_IMPORT,
+    import_exports,
+    lazy_exports,
+    load_all,
 )
-Skill.model_rebuild()
+
+if TYPE_CHECKING:
+    # 仅供类型检查器解析名称，运行时按下方的映射表导入
+    from .achievement import *  # noqa: F403
+    from .battle_effect import *  # noqa: F403
+    from .common import *  # noqa: F403
+    from .decoration import *  # noqa: F403
+    from .effect import *  # noqa: F403
+    from .element_type import *  # noqa: F403
+    from .error_code import *  # noqa: F403
+    from .glossary import *  # noqa: F403
+    from .items import *  # noqa: F403
+    from .metadata import *  # noqa: F403
+    from .mintmark import *  # noqa: F403
+    from .nature import *  # noqa: F403
+    from .peak import *  # noqa: F403
+    from .peak_pool import *  # noqa: F403
+    from .pet import *  # noqa: F403
+    from .skill import *  # noqa: F403
+
+# 名称到其所在子模块的映射，按需导入与立即导入都据此导入，须与 __all__ 保持一致
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    '.achievement': (
+        'Achievement',
+        'AchievementBranch',
+        'AchievementBranchORM',
+        'AchievementCategory',
+        'AchievementORM',
+        'AchievementType',
+        'AchievementTypeORM',
+        'Title',
+        'TitleAttrBonusORM',
+        'TitlePartORM',
+    ),
+    '.battle_effect': (
+        'BattleEffect',
+        'BattleEffectCategory',
+        'BattleEffectCategoryORM',
+        'BattleEffectORM',
+    ),
+    '.common': (
+        'EidEffect',
+        'SkillEffectInUse',
+    ),
+    '.decoration': (
+        'AvatarFrame',
+        'AvatarFrameORM',
+        'AvatarHead',
+        'AvatarHeadORM',
+        'Emoji',
+        'EmojiORM',
+        'HomepageBackground',
+        'HomepageBackgroundORM',
+        'NamecardBackground',
+        'NamecardBackgroundORM',
+        'NicknameBackground',
+        'NicknameBackgroundORM',
+    ),
+    '.effect': (
+        'PetEffect',
+        'PetEffectGroup',
+        'PetEffectGroupORM',
+        'PetEffectORM',
+        'VariationEffect',
+        'VariationEffectORM',
+    ),
+    '.element_type': (
+        'ElementType',
+        'ElementTypeORM',
+        'TypeCombination',
+        'TypeCombinationORM',
+        'TypeEffectiveness',
+        'TypeEffectivenessORM',
+    ),
+    '.error_code': (
+        'ErrorCode',
+        'ErrorCodeORM',
+    ),
+    '.glossary': (
+        'GlossaryEntry',
+        'GlossaryEntryORM',
+    ),
+    '.items': (
+        'EnergyBead',
+        'EnergyBeadBuffAttrORM',
+        'EnergyBeadORM',
+        'Equip',
+        'EquipBonus',
+        'EquipBonusAttrORM',
+        'EquipBonusORM',
+        'EquipEffectiveOccasion',
+        'EquipEffectiveOccasionORM',
+        'EquipORM',
+        'EquipType',
+        'EquipTypeORM',
+        'Gem',
+        'GemCategory',
+        'GemCategoryORM',
+        'GemGen1',
+        'GemGen1PartORM',
+        'GemGen2',
+        'GemGen2PartORM',
+        'GemGenCategory',
+        'GemGenCategoryORM',
+        'GemORM',
+        'Item',
+        'ItemCategory',
+        'ItemCategoryORM',
+        'ItemORM',
+        'SkillActivationItem',
+        'SkillActivationItemORM',
+        'SkillStone',
+        'SkillStoneCategory',
+        'SkillStoneCategoryORM',
+        'SkillStoneEffect',
+        'SkillStoneEffectORM',
+        'SkillStoneORM',
+        'Suit',
+        'SuitBonus',
+        'SuitBonusAttrORM',
+        'SuitBonusORM',
+        'SuitORM',
+    ),
+    '.metadata': (
+        'ApiMetadata',
+        'ApiMetadataORM',
+    ),
+    '.mintmark': (
+        'AbilityMintmark',
+        'AbilityPartORM',
+        'Mintmark',
+        'MintmarkBaseAttrORM',
+        'MintmarkClassCategory',
+        'MintmarkClassCategoryORM',
+        'MintmarkExtraAttrORM',
+        'MintmarkMaxAttrORM',
+        'MintmarkORM',
+        'MintmarkRarityCategory',
+        'MintmarkRarityCategoryORM',
+        'MintmarkTypeCategory',
+        'MintmarkTypeCategoryORM',
+        'SkillMintmark',
+        'SkillMintmarkEffect',
+        'SkillPartORM',
+        'UniversalMintmark',
+        'UniversalPartORM',
+    ),
+    '.nature': (
+        'Nature',
+        'NatureAttrORM',
+        'NatureORM',
+    ),
+    '.peak': (
+        'PeakSeason',
+        'PeakSeasonORM',
+    ),
+    '.peak_pool': (
+        'PeakExpertPool',
+        'PeakExpertPoolORM',
+        'PeakPool',
+        'PeakPoolORM',
+        'PeakPoolVote',
+        'PeakPoolVoteORM',
+    ),
+    '.pet': (
+        'BaseStatORM',
+        'DiyStatsRangeORM',
+        'Pet',
+        'PetAdvance',
+        'PetAdvanceORM',
+        'PetArchiveStoryBook',
+        'PetArchiveStoryBookORM',
+        'PetArchiveStoryEntry',
+        'PetArchiveStoryEntryORM',
+        'PetClass',
+        'PetClassORM',
+        'PetEncyclopediaEntry',
+        'PetEncyclopediaEntryORM',
+        'PetGenderCategory',
+        'PetGenderORM',
+        'PetMountTypeCategory',
+        'PetMountTypeORM',
+        'PetORM',
+        'PetSkin',
+        'PetSkinCategory',
+        'PetSkinCategoryORM',
+        'PetSkinORM',
+        'PetVipBuffCategory',
+        'PetVipBuffORM',
+        'SkillInPet',
+        'SkillInPetORM',
+        'Soulmark',
+        'SoulmarkORM',
+        'SoulmarkTagCategory',
+        'SoulmarkTagORM',
+        'YieldingEvORM',
+    ),
+    '.skill': (
+        'Skill',
+        'SkillCategory',
+        'SkillCategoryORM',
+        'SkillEffectParam',
+        'SkillEffectParamInType',
+        'SkillEffectParamInTypeORM',
+        'SkillEffectParamORM',
+        'SkillEffectType',
+        'SkillEffectTypeORM',
+        'SkillEffectTypeTag',
+        'SkillEffectTypeTagORM',
+        'SkillHideEffect',
+        'SkillHideEffectORM',
+        'SkillORM',
+    ),
+}
+
+if not TYPE_CHECKING:
+    if LAZY_IMPORT:
+        __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, load_all_for_orm=True)
+    else:
+        import_exports(__name__, _EXPORTS)
 
 __all__ = [
     'AbilityMintmark',
@@ -292,6 +343,7 @@ __all__ = [
     'SkillActivationItemORM',
     'SkillCategory',
     'SkillCategoryORM',
+    'SkillEffectInUse',
     'SkillEffectParam',
     'SkillEffectParamInType',
     'SkillEffectParamInTypeORM',
@@ -328,9 +380,12 @@ __all__ = [
     'TitlePartORM',
     'TypeCombination',
     'TypeCombinationORM',
+    'TypeEffectiveness',
+    'TypeEffectivenessORM',
     'UniversalMintmark',
     'UniversalPartORM',
     'VariationEffect',
     'VariationEffectORM',
     'YieldingEvORM',
+    'load_all',
 ]
@@ -0,0 +1,378 @@
+"""由 SQLModel 模型源码生成 ``seerapi_models_api`` 包。
+
+``seerapi_models_api`` 中的模型与 API 模型拥有相同的字段定义，但只依赖 Pydantic，
+不会注册 ORM 表，也不会触发 SQLAlchemy 的映射配置。
+它是独立的顶层包，导入时不会执行 ``seerapi_models/__init__.py``，
+因此无论是否开启按需导入模式都不会加载 SQLAlchemy。
+
+修改模型后请运行 ``python -m seerapi_models._api_codegen`` 重新生成。
+"""
+
+import ast
+from collections.abc import Iterator
+import copy
+import inspect
+from pathlib import Path
+
+import pydantic
+
+PACKAGE_DIR = Path(__file__).parent
+OUTPUT_PATH = PACKAGE_DIR.parent / 'seerapi_models_api' / '__init__.py'
+
+# 按依赖顺序排列，基类必须先于子类生成
+SOURCE_MODULES = [
+    'common',
+    'achievement',
+    'battle_effect',
+    'decoration',
+    'effect',
+    'element_type',
+    'error_code',
+    'glossary',
+    'items/_common',
+    'items/enegry_bead',
+    'items/equip',
+    'items/mintmark_gem',
+    'items/skill_activation_item',
+    'items/skill_stone',
+    'metadata',
+    'mintmark',
+    'nature',
+    'peak',
+    'peak_pool',
+    'pet/pet',
+    'pet/pet_advance',
+    'pet/pet_skin',
+    'pet/petbook',
+    'pet/soulmark',
+    'skill',
+]
+
+# 不依赖 SQLAlchemy 的内部模块，用到的函数会被复制到生成的代码中，
+# 以免导入 seerapi_models 包
+SHARED_MODULES = {'seerapi_models._utils': '_utils'}
+
+# 仅用于 ORM 的方法
+ORM_METHODS = {'to_orm', 'to_orm_links', 'get_orm_model'}
+
+# SQLModel.Field 中仅对 ORM 有意义的参数
+ORM_FIELD_KWARGS = {
+    'foreign_key',
+    'index',
+    'nullable',
+    'ondelete',
+    'primary_key',
+    'sa_column',
+    'sa_column_args',
+    'sa_column_kwargs',
+    'sa_type',
+    'unique',
+}
+
+PYDANTIC_FIELD_PARAMS = set(inspect.signature(pydantic.Field).parameters)
+
+HEADER = '''\
+"""不依赖 SQLAlchemy 的 API 模型
+
+本包由 seerapi_models/_api_codegen.py 自动生成，请勿手动修改。
+
+模型的字段定义与 seerapi_models 中对应的 API 模型相同，
+但基于 pydantic.BaseModel，不注册 ORM 表，也不会触发映射配置，
+适用于只需要校验和序列化数据的场景。
+
+本包不依赖 seerapi_models 包，导入时不会加载 ORM 模型与 SQLAlchemy。
+"""
+'''
+
+BASE_MODELS = '''\
+_TModel = TypeVar('_TModel')
+
+
+class ApiModel(BaseModel):
+    """对应 SQLModel 的基类"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BaseResModel(ApiModel, ABC):
+    """资源模型抽象基类"""
+
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {}
+
+    id: int = Field(description='资源ID')
+
+    @classmethod
+    @abstractmethod
+    def resource_name(cls) -> str:
+        pass
+
+
+class BaseResModelWithOptionalId(ApiModel, ABC):
+    """资源模型抽象基类"""
+
+    id: int | None = Field(default=None, exclude=True)
+
+    @classmethod
+    @abstractmethod
+    def resource_name(cls) -> str:
+        pass
+
+
+class BaseGeneralModel(ApiModel, ABC):
+    @classmethod
+    @abstractmethod
+    def schema_path(cls) -> str:
+        pass
+
+
+class BaseCategoryModel(BaseResModel, ABC, Generic[_TModel]): ...
+'''
+
+BASE_MODEL_NAMES = {
+    '_TModel',
+    'ApiModel',
+    'BaseCategoryModel',
+    'BaseGeneralModel',
+    'BaseResModel',
+    'BaseResModelWithOptionalId',
+}
+
+# 生成的代码可能用到的名称及其来源
+KNOWN_IMPORTS = {
+    'ABC': 'abc',
+    'abstractmethod': 'abc',
+    'BaseModel': 'pydantic',
+    'ConfigDict': 'pydantic',
+    'Field': 'pydantic',
+    'Generic': 'typing',
+    'TypeVar': 'typing',
+}
+
+
+def _is_excluded_class(node: ast.ClassDef) -> bool:
+    if node.name.endswith(('ORM', 'ORMBase')):
+        return True
+    return any(
+        keyword.arg == 'table'
+        and isinstance(keyword.value, ast.Constant)
+        and keyword.value.value is True
+        for keyword in node.keywords
+    )
+
+
+def _is_type_checking_block(node: ast.stmt) -> bool:
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Name)
+        and node.test.id == 'TYPE_CHECKING'
+    )
+
+
+def _convert_base(base: ast.expr) -> ast.expr | None:
+    if isinstance(base, ast.Subscript) and isinstance(base.value, ast.Name):
+        if base.value.id == 'ConvertToORM':
+            return None
+    if isinstance(base, ast.Name) and base.id == 'SQLModel':
+        return ast.Name(id='ApiModel', ctx=ast.Load())
+    return base
+
+
+def _convert_field_call(call: ast.Call) -> ast.Call:
+    if call.args:
+        # 位置参数是默认值，字段说明误写为位置参数时会成为默认值，要求一律使用关键字参数
+        raise ValueError(
+            f'第 {call.lineno} 行的 Field 使用了位置参数，请改为关键字参数'
+        )
+    keywords: list[ast.keyword] = []
+    json_schema_extra: list[tuple[ast.expr, ast.expr]] = []
+    for keyword in call.keywords:
+        if keyword.arg in ORM_FIELD_KWARGS:
+            continue
+        if keyword.arg == 'schema_extra' and isinstance(keyword.value, ast.Dict):
+            # 与 SQLModel 的处理一致：Pydantic 支持的参数直接传入，其余放入 JSON Schema
+            for key, value in zip(keyword.value.keys, keyword.value.values):
+                assert isinstance(key, ast.Constant)
+                if key.value in PYDANTIC_FIELD_PARAMS:
+                    keywords.append(ast.keyword(arg=key.value, value=value))
+                else:
+                    json_schema_extra.append((key, value))
+            continue
+        keywords.append(keyword)
+
+    if json_schema_extra:
+        keywords.append(
+            ast.keyword(
+                arg='json_schema_extra',
+                value=ast.Dict(
+                    keys=[key for key, _ in json_schema_extra],
+                    values=[value for _, value in json_schema_extra],
+                ),
+            )
+        )
+    return ast.Call(func=call.func, args=[], keywords=keywords)
+
+
+def _convert_class(node: ast.ClassDef) -> ast.ClassDef:
+    bases = [converted for base in node.bases if (converted := _convert_base(base))]
+    keywords = [keyword for keyword in node.keywords if keyword.arg != 'table']
+
+    body: list[ast.stmt] = []
+    for statement in node.body:
+        if isinstance(statement, ast.FunctionDef) and statement.name in ORM_METHODS:
+            continue
+        if (
+            isinstance(statement, ast.AnnAssign)
+            and isinstance(statement.value, ast.Call)
+            and isinstance(statement.value.func, ast.Name)
+            and statement.value.func.id == 'Field'
+        ):
+            statement = ast.AnnAssign(
+                target=statement.target,
+                annotation=statement.annotation,
+                value=_convert_field_call(statement.value),
+                simple=statement.simple,
+            )
+        body.append(statement)
+
+    if not body:
+        body.append(ast.Expr(value=ast.Constant(value=...)))
+
+    # 复制原节点，保留不同 Python 版本中 ClassDef 的其余字段（如 3.12 起的 type_params）
+    converted = copy.copy(node)
+    converted.bases = bases
+    converted.keywords = keywords
+    converted.body = body
+    return converted
+
+
+def _iter_statements() -> Iterator[tuple[str, ast.stmt]]:
+    for module in SOURCE_MODULES:
+        tree = ast.parse((PACKAGE_DIR / f'{module}.py').read_text(encoding='utf-8'))
+        for node in tree.body:
+            yield module, node
+
+
+def _absolute_module(source: str, node: ast.ImportFrom) -> str:
+    if not node.level:
+        return node.module or ''
+    package = ['seerapi_models', *source.split('/')[:-1]]
+    package = package[: len(package) - node.level + 1]
+    return '.'.join([*package, node.module] if node.module else package)
+
+
+def _shared_functions(module: str, names: set[str]) -> list[ast.stmt]:
+    tree = ast.parse(
+        (PACKAGE_DIR / f'{SHARED_MODULES[module]}.py').read_text(encoding='utf-8')
+    )
+    return [
+        node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name in names
+    ]
+
+
+def _collect() -> tuple[list[ast.stmt], dict[str, str], list[str]]:
+    statements: list[ast.stmt] = []
+    imports: dict[str, str] = {}
+    class_names: list[str] = []
+    shared: dict[str, set[str]] = {}
+
+    for source, node in _iter_statements():
+        if isinstance(node, ast.ImportFrom):
+            module = _absolute_module(source, node)
+            if module in SHARED_MODULES:
+                shared.setdefault(module, set()).update(
+                    alias.name for alias in node.names
+                )
+                continue
+            if module.startswith(('seerapi_models', 'sql')):
+                continue
+            for alias in node.names:
+                imports.setdefault(alias.asname or alias.name, module)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.setdefault(alias.asname or alias.name, '')
+        elif _is_type_checking_block(node):
+            continue
+        elif isinstance(node, ast.ClassDef):
+            if _is_excluded_class(node):
+                continue
+            statements.append(_convert_class(node))
+            class_names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            targets = [
+                target.id for target in node.targets if isinstance(target, ast.Name)
+            ]
+            if '__all__' in targets:
+                continue
+            statements.append(node)
+        elif isinstance(node, ast.AnnAssign | ast.FunctionDef):
+            statements.append(node)
+
+    imports.update(KNOWN_IMPORTS)
+    functions = [
+        function
+        for module, names in sorted(shared.items())
+        for function in _shared_functions(module, names)
+    ]
+    return [*functions, *statements], imports, class_names
+
+
+def _render_imports(used: set[str], imports: dict[str, str]) -> str:
+    plain: set[str] = set()
+    from_imports: dict[str, set[str]] = {}
+    for name in sorted(used):
+        if name not in imports:
+            continue
+        module = imports[name]
+        if module:
+            from_imports.setdefault(module, set()).add(name)
+        else:
+            plain.add(name)
+
+    lines = [f'import {name}' for name in sorted(plain)]
+    lines.extend(
+        f'from {module} import {", ".join(sorted(names))}'
+        for module, names in sorted(from_imports.items(), key=lambda item: item[0])
+    )
+    return '\n'.join(lines)
+
+
+def render() -> str:
+    """生成 ``seerapi_models_api`` 包的源码"""
+    statements, imports, class_names = _collect()
+    base_tree = ast.parse(BASE_MODELS)
+    body = '\n\n\n'.join(ast.unparse(statement) for statement in statements)
+
+    used = {
+        node.id
+        for tree in (base_tree, *statements)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name)
+    }
+    defined = set(class_names) | BASE_MODEL_NAMES
+    used -= defined
+
+    public_names = sorted(
+        name for name in (*BASE_MODEL_NAMES, *class_names) if not name.startswith('_')
+    )
+    rebuild = (
+        '# 所有模型定义完成后统一解析前向引用\n'
+        f'for _model in ({", ".join(class_names)}):\n'
+        '    if issubclass(_model, BaseModel):\n'
+        '        _model.model_rebuild()\n'
+    )
+    exports = '__all__ = [\n' + ''.join(f"    '{name}',\n" for name in public_names)
+    return (
+        f'{HEADER}\n{_render_imports(used, imports)}\n\n{BASE_MODELS}\n\n'
+        f'{body}\n\n\n{rebuild}\n\n{exports}]\n'
+    )
+
+
+def main() -> None:
+    OUTPUT_PATH.parent.mkdir(exist_ok=True)
+    OUTPUT_PATH.write_text(render(), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""按需导入（PEP 562）支持。
+
+设置环境变量 ``SEERAPI_MODELS_LAZY_IMPORT=1`` 后，``seerapi_models`` 及其子包
+不会在导入时加载全部子模块，而是在首次访问某个名称时才导入其所在的子模块。
+映射配置前的钩子由 ``build_model`` 在导入时安装，
+因此直接导入子模块（如 ``seerapi_models.skill``）同样可以使用其中的模型。
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+import importlib
+import os
+import sys
+from typing import Any
+
+LAZY_IMPORT_ENV = 'SEERAPI_MODELS_LAZY_IMPORT'
+LAZY_IMPORT: bool = os.environ.get(LAZY_IMPORT_ENV, '').lower() in {
+    '1',
+    'true',
+    'yes',
+    'on',
+}
+
+_all_loaded = False
+_mapper_hook_installed = False
+
+
+def load_all() -> None:
+    """导入全部子模块，保证所有 ORM 表都已注册到 SQLModel.metadata 中
+
+    按需导入模式下，未访问 ORM 模型就调用 ``SQLModel.metadata.create_all``
+    前需要先调用此函数，通过 ``seerapi_models.load_all`` 公开。
+    """
+    global _all_loaded
+    if _all_loaded:
+        return
+
+    _all_loaded = True
+    try:
+        importlib.import_module('seerapi_models')
+        for name, modules in tuple(_lazy_packages.items()):
+            package = sys.modules[name]
+            for attr in modules:
+                getattr(package, attr)
+    except BaseException:
+        _all_loaded = False
+        raise
+
+
+def install_mapper_hook() -> None:
+    """即使只导入了部分子模块，在 SQLAlchemy 配置映射前也要补齐全部 ORM 模型，
+    否则关系中的字符串引用将无法解析
+
+    由 ``seerapi_models.build_model`` 在导入时调用，重复调用不会产生额外开销。
+    """
+    global _mapper_hook_installed
+    if _mapper_hook_installed:
+        return
+
+    # 在函数内导入 SQLAlchemy，使按需导入模式下只导入包本身时无需加载它
+    from sqlalchemy import event
+    from sqlalchemy.orm import Mapper
+
+    event.listen(Mapper, 'before_configured', load_all)
+    _mapper_hook_installed = True
+
+
+# 子模块（相对）路径到其提供的名称的映射
+Exports = Mapping[str, Sequence[str]]
+
+_lazy_packages: dict[str, Mapping[str, str]] = {}
+
+
+def import_exports(package: str, exports: Exports) -> None:
+    """立即导入映射表中的全部子模块，并将名称绑定到包上
+
+    Args:
+            package: 包名，通常传入 ``__name__``
+            exports: 子模块（相对）路径到其提供的名称的映射
+
+    """
+    namespace = sys.modules[package].__dict__
+    for submodule, names in exports.items():
+        module = importlib.import_module(submodule, package)
+        namespace.update((name, getattr(module, name)) for name in names)
+
+
+def lazy_exports(
+    package: str,
+    exports: Exports,
+    *,
+    load_all_for_orm: bool = False,
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """为包生成 PEP 562 的 ``__getattr__`` 与 ``__dir__``
+
+    Args:
+            package: 包名，通常传入 ``__name__``
+            exports: 子模块（相对）路径到其提供的名称的映射
+            load_all_for_orm: 访问 ORM 模型时是否加载全部子模块，
+                    仅应在不会被库内部模块导入的顶层包上启用
+
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+    _lazy_packages[package] = modules
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule = modules[name]
+        except KeyError:
+            raise AttributeError(
+                f'module {package!r} has no attribute {name!r}'
+            ) from None
+
+        # ORM 模型的关系需要所有相关表都已定义，因此访问 ORM 模型时加载全部子模块
+        if load_all_for_orm and name.endswith('ORM'):
+            load_all()
+
+        value = getattr(importlib.import_module(submodule, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(sys.modules[package].__dict__) | set(modules))
+
+    return __getattr__, __dir__
+
+
+__all__ = [
+    'LAZY_IMPORT',
+    'LAZY_IMPORT_ENV',
+    'Exports',
+    'import_exports',
+    'install_mapper_hook',
+    'lazy_exports',
+    'load_all',
+]
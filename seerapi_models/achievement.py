@@ -1,9 +1,15 @@
 from enum import Enum
-from typing import Optional, cast
+from typing import ClassVar, Optional, cast
 
 from sqlmodel import Field, Relationship, SQLModel
 
-from seerapi_models.build_model import BaseCategoryModel, BaseResModel, ConvertToORM
+from seerapi_models.build_model import (
+    BaseCategoryModel,
+    BaseClosureModel,
+    BaseResModel,
+    ConvertToModel,
+    ConvertToORM,
+)
 from seerapi_models.common import ResourceRef, SixAttributes, SixAttributesORMBase
 
 
@@ -114,6 +120,8 @@ class Achievement(
             point=self.point,
             desc=self.desc,
             is_hide=self.is_hide,
+            is_ability_bonus=self.is_ability_bonus,
+            ability_desc=self.ability_desc,
             type_id=self.type.id,
             branch_id=self.branch.id,
             next_level_achievement_id=self.next_level_achievement.id
@@ -142,7 +150,23 @@ class Achievement(
         )
 
 
-class AchievementORM(BaseAchievement, table=True):
+class AchievementLevelClosure(BaseClosureModel, table=True):
+    """成就等级链的闭包表，ancestor 为等级较低的成就"""
+
+    __closure_of__: ClassVar[tuple[str, str]] = (
+        'achievement',
+        'next_level_achievement_id',
+    )
+
+    ancestor_id: int = Field(primary_key=True, foreign_key='achievement.id')
+    descendant_id: int = Field(
+        primary_key=True, foreign_key='achievement.id', index=True
+    )
+
+
+class AchievementORM(
+    BaseAchievement, AbilityBonusMixin, ConvertToModel['Achievement'], table=True
+):
     type_id: int = Field(foreign_key='achievement_type.id')
     type: 'AchievementTypeORM' = Relationship(
         back_populates='achievement',
@@ -187,7 +211,7 @@ class AchievementORM(BaseAchievement, table=True):
 
 class BaseTitle(BaseAchievement, AbilityBonusMixin):
     id: int = Field(description='称号ID')
-    achievement_id: int = Field('成就ID，由 SeerAPI 生成，游戏内不存在该ID')
+    achievement_id: int = Field(description='成就ID，由 SeerAPI 生成，游戏内不存在该ID')
     achievement_name: str = Field(description='成就名称')
     name: str = Field(description='称号名称')
     original_name: str = Field(description='称号原始名称，包含分隔符')
@@ -236,6 +260,11 @@ class BaseAchievementType(BaseCategoryModel):
 class AchievementType(BaseAchievementType, ConvertToORM['AchievementTypeORM']):
     """成就类型资源"""
 
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'achievement': ('achievement', 'type'),
+        'branch': ('achievement_branch', 'type'),
+    }
+
     achievement: list[ResourceRef['Achievement']] = Field(
         default_factory=list, description='该类型下的成就'
     )
@@ -255,7 +284,9 @@ class AchievementType(BaseAchievementType, ConvertToORM['AchievementTypeORM']):
         )
 
 
-class AchievementTypeORM(BaseAchievementType, table=True):
+class AchievementTypeORM(
+    BaseAchievementType, ConvertToModel['AchievementType'], table=True
+):
     achievement: list['AchievementORM'] = Relationship(
         back_populates='type',
     )
@@ -279,6 +310,10 @@ class BaseAchievementBranch(BaseCategoryModel):
 class AchievementBranch(BaseAchievementBranch, ConvertToORM['AchievementBranchORM']):
     """成就分支资源，当is_series为True时，分支存放同一个系列的成就，反之仅作为分类使用"""
 
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'achievement': ('achievement', 'branch')
+    }
+
     achievement: list[ResourceRef['Achievement']] = Field(
         default_factory=list, description='该分支下的成就'
     )
@@ -298,7 +333,9 @@ class AchievementBranch(BaseAchievementBranch, ConvertToORM['AchievementBranchOR
         )
 
 
-class AchievementBranchORM(BaseAchievementBranch, table=True):
+class AchievementBranchORM(
+    BaseAchievementBranch, ConvertToModel['AchievementBranch'], table=True
+):
     achievement: list['AchievementORM'] = Relationship(
         back_populates='branch',
     )
@@ -0,0 +1,363 @@
+"""六维属性的批量运算
+
+``SixAttributes`` 的每次 ``+``/``-`` 都要逐属性计算并创建一个经过校验的模型，
+在配队等需要计算大量属性组合的场景中开销明显。
+``SixAttributesBatch`` 以 N×6 的数组保存 N 组属性，一次完成整批的加减运算，
+计算规则与 ``SixAttributes.__add__``/``__sub__`` 完全一致（包括百分比加成）。
+
+安装了 NumPy 时使用 ``numpy.ndarray`` 保存与计算，否则使用标准库的 ``array``。
+
+用法::
+
+    base = SixAttributesBatch.from_models(pet.base_stats for pet in pets)
+    result = (base + nature.attributes).to_models()
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Literal
+
+from .common import (
+    CompactSixAttributes,
+    SixAttributes,
+    SixAttributesBase,
+    _get_six_attributes,
+)
+
+try:
+    import numpy as np  # pyright: ignore[reportMissingImports]
+except ImportError:  # NumPy 是可选依赖
+    np = None
+
+Backend = Literal['numpy', 'array']
+_Operator = Literal['add', 'sub']
+# 一行的属性值、是否为百分比加成、percent 是否计入 model_fields_set
+_Row = tuple[tuple[int | float, ...], bool, bool]
+
+
+def default_backend() -> Backend:
+    """已安装 NumPy 时为 'numpy'，否则为 'array'"""
+    return 'numpy' if np is not None else 'array'
+
+
+def _is_int(value: object) -> bool:
+    return type(value) is int
+
+
+def _restore_ints(row: Sequence[float], ints: Sequence[Any]) -> tuple[int | float, ...]:
+    """将原本为整数的值还原为 int"""
+    return tuple(int(value) if is_int else value for value, is_int in zip(row, ints))
+
+
+def _flags(value: bool | Iterable[bool], count: int, name: str) -> array:
+    flags = array('b', [value] * count if isinstance(value, bool) else value)
+    if len(flags) != count:
+        raise ValueError(f'{name} 的长度应为 {count}，实际为 {len(flags)}')
+    return flags
+
+
+class SixAttributesBatch:
+    """N 组六维属性及其百分比标记
+
+    两个批量对象逐行运算，长度需要相同，长度为 1 的一方会与另一方的每一行运算；
+    也可以直接与单个 SixAttributes 或 CompactSixAttributes 运算。
+    属性值以浮点数保存，同时记录每个值是否为整数，
+    转换回模型时数值、int/float 类型与 percent 是否计入 model_fields_set
+    都与逐个使用 SixAttributes 运算的结果相同。
+    """
+
+    __slots__ = ('_ints', '_percent', '_percent_set', '_values', 'backend')
+
+    # 具体类型取决于 backend，见 values 与 percent 属性
+    _values: Any
+    _ints: Any
+    _percent: Any
+    _percent_set: Any
+
+    def __init__(
+        self,
+        values: Iterable[Sequence[float]],
+        percent: bool | Iterable[bool] | None = None,
+        *,
+        backend: Backend | None = None,
+    ) -> None:
+        """
+        Args:
+                values: N×6 的属性值，每行依次为 atk、def、sp_atk、sp_def、spd、hp
+                percent: 各行是否为百分比加成，传入单个布尔值时应用于全部行；
+                        为 None 时均不是百分比加成，且与 SixAttributes 一样不计入
+                        model_fields_set
+                backend: 'numpy' 或 'array'，默认在安装了 NumPy 时使用 'numpy'
+
+        """
+        self._setup(
+            values,
+            False if percent is None else percent,
+            percent is not None,
+            backend,
+        )
+
+    def _setup(
+        self,
+        values: Iterable[Sequence[float]],
+        percent: bool | Iterable[bool],
+        percent_set: bool | Iterable[bool],
+        backend: Backend | None,
+    ) -> None:
+        self.backend: Backend = backend or default_backend()
+        if self.backend == 'numpy':
+            if np is None:
+                raise ModuleNotFoundError('numpy 后端需要安装 NumPy')
+            if isinstance(values, np.ndarray):
+                matrix = values.astype(np.float64)
+                ints = np.full(matrix.shape, np.issubdtype(values.dtype, np.integer))
+            else:
+                rows = [tuple(row) for row in values]
+                matrix = np.array(rows, dtype=np.float64)
+                ints = np.array([[_is_int(value) for value in row] for row in rows])
+            if matrix.size == 0:
+                matrix = matrix.reshape(0, 6)
+                ints = np.zeros((0, 6), dtype=bool)
+            if matrix.ndim != 2 or matrix.shape[1] != 6:
+                raise ValueError(f'属性值的形状应为 N×6，实际为 {matrix.shape}')
+            count = len(matrix)
+            self._values = matrix
+            self._ints = ints.astype(bool)
+            self._percent = np.broadcast_to(
+                np.asarray(percent, dtype=bool), (count,)
+            ).copy()
+            self._percent_set = np.broadcast_to(
+                np.asarray(percent_set, dtype=bool), (count,)
+            ).copy()
+            return
+
+        flat = array('d')
+        ints = array('b')
+        for row in values:
+            if len(row) != 6:
+                raise ValueError(f'每行应包含 6 个属性值，实际为 {len(row)} 个')
+            flat.extend(row)
+            ints.extend(map(_is_int, row))
+        count = len(flat) // 6
+        self._values = flat
+        self._ints = ints
+        self._percent = _flags(percent, count, 'percent')
+        self._percent_set = _flags(percent_set, count, 'percent_set')
+
+    @classmethod
+    def _from_rows(
+        cls, rows: Iterable[_Row], backend: Backend | None
+    ) -> 'SixAttributesBatch':
+        values: list[Sequence[float]] = []
+        percent: list[bool] = []
+        percent_set: list[bool] = []
+        for row, row_percent, row_percent_set in rows:
+            values.append(row)
+            percent.append(row_percent)
+            percent_set.append(row_percent_set)
+        batch = cls.__new__(cls)
+        batch._setup(values, percent, percent_set, backend)
+        return batch
+
+    @classmethod
+    def from_models(
+        cls,
+        models: Iterable[SixAttributesBase | CompactSixAttributes],
+        *,
+        backend: Backend | None = None,
+    ) -> 'SixAttributesBatch':
+        return cls._from_rows(
+            (
+                (model[:6], model.percent, True)
+                # 与 CompactSixAttributes.to_model 一致，percent 总是计入字段集合
+                if isinstance(model, CompactSixAttributes)
+                else (
+                    _get_six_attributes(model),
+                    model.percent,
+                    'percent' in model.model_fields_set,
+                )
+                for model in models
+            ),
+            backend,
+        )
+
+    @classmethod
+    def _create(
+        cls, values: Any, ints: Any, percent: Any, percent_set: Any, backend: Backend
+    ) -> 'SixAttributesBatch':
+        batch = cls.__new__(cls)
+        batch.backend = backend
+        batch._values = values
+        batch._ints = ints
+        batch._percent = percent
+        batch._percent_set = percent_set
+        return batch
+
+    @property
+    def values(self) -> Any:
+        """属性值（均为浮点数）
+
+        numpy 后端为 N×6 的 ndarray，array 后端为按行展开的 array('d')
+        """
+        return self._values
+
+    @property
+    def percent(self) -> Any:
+        """各行的百分比标记，numpy 后端为布尔 ndarray，array 后端为 array('b')"""
+        return self._percent
+
+    def __len__(self) -> int:
+        return len(self._percent)
+
+    def _rows(self) -> Iterator[_Row]:
+        if self.backend == 'numpy':
+            yield from zip(
+                map(_restore_ints, self._values.tolist(), self._ints.tolist()),
+                self._percent.tolist(),
+                self._percent_set.tolist(),
+            )
+            return
+        values = self._values
+        ints = self._ints
+        for index, (percent, percent_set) in enumerate(
+            zip(self._percent, self._percent_set)
+        ):
+            start = index * 6
+            yield (
+                _restore_ints(values[start : start + 6], ints[start : start + 6]),
+                bool(percent),
+                bool(percent_set),
+            )
+
+    def rows(self) -> Iterator[tuple[tuple[int | float, ...], bool]]:
+        """逐行返回 (属性值, 是否为百分比加成)，原本为整数的值为 int"""
+        for row, percent, _ in self._rows():
+            yield row, percent
+
+    def to_models(self) -> list[SixAttributes]:
+        # 批量运算的结果都是 int 或 float，无需再次校验
+        return [
+            SixAttributes._from_values(row, percent if percent or percent_set else None)
+            for row, percent, percent_set in self._rows()
+        ]
+
+    def to_compact(self) -> list[CompactSixAttributes]:
+        return [
+            CompactSixAttributes._make((*row, percent)) for row, percent in self.rows()
+        ]
+
+    def _coerce(self, other: object) -> 'SixAttributesBatch | None':
+        if isinstance(other, SixAttributesBase | CompactSixAttributes):
+            return self.from_models([other], backend=self.backend)
+        if not isinstance(other, SixAttributesBatch):
+            return None
+        if other.backend != self.backend:
+            return self._from_rows(other._rows(), self.backend)
+        return other
+
+    def _calc(self, other: object, operator: _Operator) -> 'SixAttributesBatch':
+        batch = self._coerce(other)
+        if batch is None:
+            return NotImplemented
+        if len(self) != len(batch) and 1 not in (len(self), len(batch)):
+            raise ValueError(f'批量长度不一致：{len(self)} 与 {len(batch)}')
+        calc = _calc_numpy if self.backend == 'numpy' else _calc_array
+        return self._create(
+            *calc(
+                (self._values, self._ints, self._percent),
+                (batch._values, batch._ints, batch._percent),
+                operator,
+            ),
+            self.backend,
+        )
+
+    def __add__(self, other: object) -> 'SixAttributesBatch':
+        """逐行相加，规则同 SixAttributes.__add__"""
+        return self._calc(other, 'add')
+
+    def __sub__(self, other: object) -> 'SixAttributesBatch':
+        """逐行相减，规则同 SixAttributes.__sub__"""
+        return self._calc(other, 'sub')
+
+
+# 运算结果依次为属性值、各值是否为整数、百分比标记与 percent 是否计入字段集合。
+# 与 SixAttributes 相同：只有两个整数直接相加减时结果为整数，
+# 任意一方为百分比加成时结果的 percent 计入字段集合
+
+
+def _calc_numpy(
+    left: tuple[Any, Any, Any], right: tuple[Any, Any, Any], operator: _Operator
+) -> tuple[Any, Any, Any, Any]:
+    assert np is not None
+    left_values, left_ints, left_percent = left
+    right_values, right_ints, right_percent = right
+    left_flag = left_percent[:, None]
+    same = left_flag == right_percent[:, None]
+    # 只有一方为百分比加成时，以非百分比的一方为基数
+    base = np.where(left_flag, right_values, left_values)
+    bonus = np.where(left_flag, left_values, right_values)
+    if operator == 'add':
+        values = np.where(same, left_values + right_values, base * (1 + bonus / 100))
+    else:
+        values = np.where(same, left_values - right_values, base * (1 - bonus / 100))
+    return (
+        values,
+        same & left_ints & right_ints,
+        left_percent & right_percent,
+        left_percent | right_percent,
+    )
+
+
+def _calc_array(
+    left: tuple[array, array, array],
+    right: tuple[array, array, array],
+    operator: _Operator,
+) -> tuple[array, array, array, array]:
+    left_values, left_ints, left_percent = left
+    right_values, right_ints, right_percent = right
+    count = len(right_percent) if len(left_percent) == 1 else len(left_percent)
+    # 长度为 1 的一方每次都使用第一行
+    left_step = 1 if len(left_percent) > 1 else 0
+    right_step = 1 if len(right_percent) > 1 else 0
+    values = array('d', bytes(count * 6 * array('d').itemsize))
+    ints = array('b', bytes(count * 6))
+    percent = array('b', bytes(count))
+    percent_set = array('b', bytes(count))
+    add = operator == 'add'
+    for index in range(count):
+        left_flag = left_percent[index * left_step]
+        right_flag = right_percent[index * right_step]
+        left_start = index * left_step * 6
+        right_start = index * right_step * 6
+        out = index * 6
+        percent_set[index] = left_flag or right_flag
+        if left_flag == right_flag:
+            percent[index] = left_flag
+            for offset in range(6):
+                a = left_values[left_start + offset]
+                b = right_values[right_start + offset]
+                values[out + offset] = a + b if add else a - b
+                ints[out + offset] = (
+                    left_ints[left_start + offset] and right_ints[right_start + offset]
+                )
+            continue
+        # 只有一方为百分比加成时，以非百分比的一方为基数
+        if left_flag:
+            base, base_start = right_values, right_start
+            bonus, bonus_start = left_values, left_start
+        else:
+            base, base_start = left_values, left_start
+            bonus, bonus_start = right_values, right_start
+        for offset in range(6):
+            ratio = bonus[bonus_start + offset] / 100
+            values[out + offset] = base[base_start + offset] * (
+                1 + ratio if add else 1 - ratio
+            )
+    return values, ints, percent, percent_set
+
+
+__all__ = [
+    'Backend',
+    'SixAttributesBatch',
+    'default_backend',
+]
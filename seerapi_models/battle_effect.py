@@ -1,6 +1,13 @@
+from typing import ClassVar
+
 from sqlmodel import Field, Relationship, SQLModel
 
-from seerapi_models.build_model import BaseCategoryModel, BaseResModel, ConvertToORM
+from seerapi_models.build_model import (
+    BaseCategoryModel,
+    BaseResModel,
+    ConvertToModel,
+    ConvertToORM,
+)
 from seerapi_models.common import ResourceRef
 
 
@@ -39,8 +46,14 @@ class BattleEffect(BattleEffectBase, ConvertToORM['BattleEffectORM']):
             desc=self.desc,
         )
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return [
+            BattleEffectCategoryLink(battle_effect_id=self.id, type_id=type_.id)
+            for type_ in self.type
+        ]
+
 
-class BattleEffectORM(BattleEffectBase, table=True):
+class BattleEffectORM(BattleEffectBase, ConvertToModel['BattleEffect'], table=True):
     type: list['BattleEffectCategoryORM'] = Relationship(
         back_populates='effect', link_model=BattleEffectCategoryLink
     )
@@ -57,6 +70,10 @@ class BattleEffectCategoryBase(BaseCategoryModel):
 class BattleEffectCategory(
     BattleEffectCategoryBase, ConvertToORM['BattleEffectCategoryORM']
 ):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'effect': ('battle_effect', 'type')
+    }
+
     effect: list[ResourceRef['BattleEffect']] = Field(
         default_factory=list, description='异常状态列表'
     )
@@ -71,8 +88,16 @@ class BattleEffectCategory(
             name=self.name,
         )
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return [
+            BattleEffectCategoryLink(battle_effect_id=effect.id, type_id=self.id)
+            for effect in self.effect
+        ]
 
-class BattleEffectCategoryORM(BattleEffectCategoryBase, table=True):
+
+class BattleEffectCategoryORM(
+    BattleEffectCategoryBase, ConvertToModel['BattleEffectCategory'], table=True
+):
     effect: list['BattleEffectORM'] = Relationship(
         back_populates='type', link_model=BattleEffectCategoryLink
     )
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import ClassVar, Generic, TypeVar, cast
 
+from pydantic import BaseModel
 from sqlalchemy.orm import declared_attr
-from sqlmodel import Field, SQLModel
+from sqlmodel import Field, SQLModel, col, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from .._lazy import install_mapper_hook
 
 _TModel = TypeVar('_TModel', bound=SQLModel)
+_TApiModel = TypeVar('_TApiModel', bound=BaseModel)
 
 
 class ResModelMixin(SQLModel, ABC):
@@ -21,6 +26,10 @@ class ResModelMixin(SQLModel, ABC):
 class BaseResModel(ResModelMixin, ABC):
     """资源模型抽象基类"""
 
+    # 由其他资源的正向引用生成的反向引用列表，{列表字段: (正向资源名称, 正向字段)}，
+    # 见 seerapi_models.registry.ResourceRegistry.fill_back_refs
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {}
+
     id: int = Field(description='资源ID', primary_key=True)
 
     # @classmethod
@@ -52,6 +61,28 @@ class ConvertToORM(ABC, Generic[_TModel]):
         """将Pydantic模型转为SQLModel ORM模型"""
         pass
 
+    def to_orm_links(self) -> list[SQLModel]:
+        """与其他资源之间的多对多链接表行
+
+        这些行引用的是其他资源，无法在 to_orm 中通过关系属性表达，
+        需要与 to_orm 的结果一起写入数据库（见 seerapi_models.bulk）。
+        """
+        return []
+
+
+class ConvertToModel(Generic[_TApiModel]):
+    """ORM 模型还原为 API 模型，与 ConvertToORM 相对"""
+
+    def to_model(self) -> _TApiModel:
+        """将 ORM 模型还原为对应的 API 模型
+
+        未预加载的关系会在访问时逐个加载，批量还原时应使用
+        seerapi_models.loading.load_models 或 loader_options。
+        """
+        from ..loading import from_orm
+
+        return cast(_TApiModel, from_orm(cast(SQLModel, self)))
+
 
 class BaseGeneralModel(SQLModel, ABC):
     @classmethod
@@ -63,10 +94,69 @@ class BaseGeneralModel(SQLModel, ABC):
 class BaseCategoryModel(BaseResModel, ABC, Generic[_TModel]): ...
 
 
+class BaseClosureModel(SQLModel):
+    """自引用链（如宝石等级）的闭包表基类
+
+    每一行表示 ancestor 沿链向后经过 depth 步到达 descendant，
+    每个资源还有一行 depth 为 0 的自身行，查询整条链只需一次带索引的查询。
+    子类需要定义 ancestor_id 与 descendant_id 两个主键列，
+    并在 __closure_of__ 中给出 (源表名, 指向链中下一项的外键列)。
+    表中的数据由源表推导而来，见 seerapi_models.bulk.rebuild_closure_tables。
+    """
+
+    __closure_of__: ClassVar[tuple[str, str]]
+
+    ancestor_id: int
+    descendant_id: int
+    depth: int = Field(description='由 ancestor 到 descendant 经过的步数')
+
+    @classmethod
+    def select_ancestors(cls, id: int) -> SelectOfScalar[int]:
+        """资源及其全部上游资源的ID，由近到远排列"""
+        return (
+            select(col(cls.ancestor_id))
+            .where(col(cls.descendant_id) == id)
+            .order_by(col(cls.depth))
+        )
+
+    @classmethod
+    def select_descendants(cls, id: int) -> SelectOfScalar[int]:
+        """资源及其全部下游资源的ID，由近到远排列"""
+        return (
+            select(col(cls.descendant_id))
+            .where(col(cls.ancestor_id) == id)
+            .order_by(col(cls.depth))
+        )
+
+    @classmethod
+    def select_chain(cls, id: int) -> SelectOfScalar[int]:
+        """资源所在的整条链的ID，从链首到链尾排列
+
+        多个资源指向同一个下游资源时，以其中一个作为链首。
+        """
+        root = (
+            select(col(cls.ancestor_id))
+            .where(col(cls.descendant_id) == id)
+            .order_by(col(cls.depth).desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        return (
+            select(col(cls.descendant_id))
+            .where(col(cls.ancestor_id) == root)
+            .order_by(col(cls.depth))
+        )
+
+
+# 按需导入模式下可能只导入了部分子模块，配置映射前补齐全部 ORM 模型
+install_mapper_hook()
+
 __all__ = [
     'BaseCategoryModel',
+    'BaseClosureModel',
     'BaseGeneralModel',
     'BaseResModel',
     'BaseResModelWithOptionalId',
+    'ConvertToModel',
     'ConvertToORM',
 ]
@@ -0,0 +1,670 @@
+"""批量将 API 模型写入数据库
+
+逐个调用 ``session.add(model.to_orm())`` 时，每个对象图都要经过 ORM 的工作单元处理，
+导入完整数据时非常缓慢。本模块复用各模型的 ``to_orm``，但不把 ORM 对象交给 Session，
+而是沿着映射关系把对象图展开为按表分组的行（包括链接表中的行），
+其中 ``SkillEffectInUseORM`` 与 ``EidEffectInUseORM`` 按内容去重，
+被大量技能、宝石、魂印等共用的同一条效果只写入一行（同一技能中重复出现的效果仍各占一行）。
+最后按照 ``SQLModel.metadata.sorted_tables`` 的外键依赖顺序，以 ``insert()`` 分批写入。
+同一张表的每一批只编译一次语句，由驱动以 executemany 执行。
+宝石等级等自引用链的闭包表（``BaseClosureModel`` 的子类）由源表推导而来，
+源表写入后以一条递归查询重建，见 ``rebuild_closure_tables``。
+在 SQLite 中写入了参与全文搜索的资源时，``bulk_load`` 默认随后重新填充
+全文搜索的 FTS5 虚拟表，见 ``search.rebuild_search_index``。
+
+用法::
+
+    with Session(engine) as session:
+        bulk_load(session, [*pets, *skills])
+        session.commit()
+"""
+
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from itertools import islice
+from typing import Protocol, TypeVar, cast
+import warnings
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    MetaData,
+    Select,
+    Table,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+)
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.orm import Mapper, RelationshipDirection, Session
+from sqlmodel import SQLModel
+
+from .build_model import BaseClosureModel
+from .common import EidEffectInUseORM, SkillEffectInUseORM
+from .search import SEARCH_SOURCES, rebuild_search_index
+
+# 每次 executemany 提交的行数
+DEFAULT_BATCH_SIZE = 10000
+
+# 默认按内容去重的模型，这些行只被其他资源通过链接表或资源一侧的外键引用
+INTERNED_MODELS: tuple[type[SQLModel], ...] = (
+    SkillEffectInUseORM,
+    EidEffectInUseORM,
+)
+
+_Row = dict[str, object]
+_T = TypeVar('_T')
+
+
+class SupportsToORM(Protocol):
+    """带有 to_orm 方法的模型，包括 ConvertToORM 的子类与 ApiMetadata"""
+
+    def to_orm(self) -> SQLModel: ...
+
+
+@dataclass(frozen=True)
+class Relation:
+    """ORM 关系两端的表与同步的列"""
+
+    key: str
+    direction: RelationshipDirection
+    # 关系另一端的表
+    target: Table
+    # (被引用列名, 外键列名)，与 SQLAlchemy 的 synchronize_pairs 含义一致
+    sync: tuple[tuple[str, str], ...]
+    secondary: Table | None = None
+    secondary_sync: tuple[tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class TableInfo:
+    """ORM 模型对应的表、列与需要沿之展开的关系"""
+
+    table: Table
+    # (列名, 属性名)
+    columns: tuple[tuple[str, str], ...]
+    primary_key: tuple[str, ...]
+    autoincrement: str | None
+    # 除自增主键外的全部列，用于按内容去重
+    content: tuple[str, ...]
+    many_to_one: tuple[Relation, ...]
+    one_to_many: tuple[Relation, ...]
+    many_to_many: tuple[Relation, ...]
+
+
+_table_info_cache: dict[type, TableInfo] = {}
+
+
+def _column_pairs(
+    pairs: Iterable[tuple[ColumnElement, ColumnElement]] | None,
+) -> tuple[tuple[str, str], ...]:
+    return tuple(
+        (cast(str, source.key), cast(str, dest.key)) for source, dest in pairs or ()
+    )
+
+
+def get_table_info(cls: type) -> TableInfo:
+    """ORM 模型的 TableInfo，结果按模型缓存"""
+    try:
+        return _table_info_cache[cls]
+    except KeyError:
+        pass
+
+    mapper: Mapper = inspect(cls)
+    table = mapper.local_table
+    assert isinstance(table, Table)
+    relations: dict[RelationshipDirection, list[Relation]] = {
+        direction: [] for direction in RelationshipDirection
+    }
+    for relationship in mapper.relationships:
+        if relationship.viewonly:
+            continue
+        relations[relationship.direction].append(
+            Relation(
+                key=relationship.key,
+                direction=relationship.direction,
+                target=cast(Table, relationship.mapper.local_table),
+                sync=_column_pairs(relationship.synchronize_pairs),
+                secondary=relationship.secondary,  # type: ignore[arg-type]
+                secondary_sync=_column_pairs(relationship.secondary_synchronize_pairs),
+            )
+        )
+
+    primary_key = tuple(column.key for column in table.primary_key)
+    autoincrement = table.autoincrement_column
+    info = TableInfo(
+        table=table,
+        columns=tuple(
+            (column.key, mapper.get_property_by_column(column).key)
+            for column in table.columns
+            # 生成列由数据库计算，不能写入
+            if column.computed is None
+        ),
+        primary_key=primary_key,
+        autoincrement=autoincrement.key if autoincrement is not None else None,
+        content=tuple(
+            column.key
+            for column in table.columns
+            if column is not autoincrement and column.computed is None
+        ),
+        many_to_one=tuple(relations[RelationshipDirection.MANYTOONE]),
+        one_to_many=tuple(relations[RelationshipDirection.ONETOMANY]),
+        many_to_many=tuple(relations[RelationshipDirection.MANYTOMANY]),
+    )
+    _table_info_cache[cls] = info
+    return info
+
+
+def _check_internable(model: type[SQLModel]) -> None:
+    """一对一关系的另一端只对应一行，去重后多个资源共用一行时无法由 ORM 加载"""
+    for relationship in inspect(model).relationships:
+        if (
+            not relationship.uselist
+            and relationship.direction is not RelationshipDirection.MANYTOONE
+        ):
+            raise ValueError(
+                f'{model.__name__}.{relationship.key} 是一对一关系，'
+                '按内容去重会使多个资源共用同一行'
+            )
+
+
+# (MetaData, 其中的表名, 排序结果)，表名有变化或替换了 MetaData 时重新排序
+_sorted_tables: tuple[MetaData, frozenset[str], list[Table]] | None = None
+
+
+def sorted_tables() -> list[Table]:
+    """按外键依赖顺序排列的全部表
+
+    pet 与 pet_base_stats 等表之间存在外键循环，SQLAlchemy 会给出警告并以
+    pet 表优先的顺序排列。SQLite 默认不检查外键，因此不影响写入。
+    """
+    global _sorted_tables
+    metadata = SQLModel.metadata
+    cached = _sorted_tables
+    if (
+        cached is None
+        or cached[0] is not metadata
+        or cached[1] != metadata.tables.keys()
+    ):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', SAWarning)
+            cached = (metadata, frozenset(metadata.tables), metadata.sorted_tables)
+        _sorted_tables = cached
+    return cached[2]
+
+
+def _freeze(value: object) -> object:
+    """将 JSON 列中的列表与字典转换为可哈希的值"""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def batched(rows: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    """将 rows 按 size 个一组分批，最后一批可能不足 size 个"""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class BulkLoader:
+    """将 API 模型展开为按表分组的行，并批量写入数据库
+
+    同一张表中主键相同的行只会写入一次（以先添加的为准），
+    因此多个模型引用同一个链接行或子对象时不会产生重复数据。
+    主键为空的自增行（如 SkillEffectInUseORM）由加载器按数据库中已有的最大值继续分配。
+
+    interned_models 中的模型按除主键外的全部列去重：
+    内容相同的行只写入一次，引用它们的外键与链接行都指向这一行。
+    去重只影响写入的行，不改变 ORM 映射，因此被一对一关系引用的模型不能去重。
+    同一个集合中重复出现的效果（如技能中两条相同的效果）按出现的次序各对应一行，
+    第 n 次出现的效果在所有集合之间共用，因此重复的元素不会因链接行相同而丢失。
+    默认去重只在同一个加载器内有效；reuse_interned=True 时先读取数据库中已有的行，
+    内容相同的行直接引用已有的行而不再写入，适用于向已有数据库追加数据。
+
+    bind 为 None 时加载器只展开行，自增主键从 1 开始分配，不能写入数据库，
+    可以在其他进程中展开模型，再通过 take_rows 取出行交给另一个加载器的 merge。
+    """
+
+    def __init__(
+        self,
+        bind: Session | Connection | None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        interned_models: Collection[type[SQLModel]] = INTERNED_MODELS,
+        reuse_interned: bool = False,
+    ) -> None:
+        """
+        Args:
+                bind: 写入使用的 Session 或 Connection，为 None 时只展开行
+                batch_size: 每批写入的最大行数
+                interned_models: 按内容去重的 ORM 模型，传入空元组可关闭去重
+                reuse_interned: 是否复用数据库中已有的去重行
+
+        Raises:
+                ValueError: interned_models 中的模型被一对一关系引用，
+                        或 bind 为 None 时 reuse_interned 为 True
+
+        """
+        for model in interned_models:
+            _check_internable(model)
+        if bind is None and reuse_interned:
+            raise ValueError('未绑定数据库的加载器不能复用已有的去重行')
+        self._bind = bind.connection() if isinstance(bind, Session) else bind
+        self.batch_size = batch_size
+        self._rows: dict[Table, dict[tuple, _Row]] = {}
+        self._next_ids: dict[Table, int] = {}
+        self._interned_info = {
+            info.table: info for info in map(get_table_info, interned_models)
+        }
+        # 表 -> 行内容 -> 按出现次序已分配的行
+        self._interned: dict[Table, dict[tuple, list[_Row]]] = {
+            table: {} for table in self._interned_info
+        }
+        # 由加载器分配了自增主键的表，不包括去重的表
+        self.generated_tables: set[Table] = set()
+        if reuse_interned:
+            for model in interned_models:
+                self._load_interned(get_table_info(model))
+
+    @property
+    def _connection(self) -> Connection:
+        if self._bind is None:
+            raise ValueError('未绑定数据库的加载器只能通过 take_rows 取出行')
+        return self._bind
+
+    def _load_interned(self, info: TableInfo) -> None:
+        interned = self._interned[info.table]
+        statement = select(info.table).order_by(*info.table.primary_key)
+        for row in self._connection.execute(statement).mappings():
+            content = tuple(_freeze(row[column]) for column in info.content)
+            interned.setdefault(content, []).append(dict(row))
+
+    def add(self, model: SupportsToORM | SQLModel) -> None:
+        """添加一个 API 模型或 ORM 模型实例
+
+        API 模型的 to_orm_links 返回的链接行会与 to_orm 的结果一起写入。
+        链接关系通常在两端的模型中都有记录，重复的链接行只会写入一次。
+        """
+        # ORM 模型继承自 API 模型，同样带有 to_orm 方法，需要先判断
+        if isinstance(model, SQLModel) and hasattr(type(model), '__table__'):
+            self._visit(model, {}, {})
+            return
+
+        memo: dict[int, tuple[SQLModel, _Row]] = {}
+        self._visit(cast(SupportsToORM, model).to_orm(), {}, memo)
+        # ApiMetadata 等非 ConvertToORM 模型没有链接行
+        for link in getattr(model, 'to_orm_links', list)():
+            self._visit(link, {}, memo)
+
+    def add_all(self, models: Iterable[SupportsToORM | SQLModel]) -> None:
+        for model in models:
+            self.add(model)
+
+    def take_rows(self) -> dict[Table, dict[tuple, _Row]]:
+        """取出已添加但尚未写入的行并清空缓冲区
+
+        Returns:
+                {表: {主键: 行}}
+
+        """
+        rows, self._rows = self._rows, {}
+        return rows
+
+    def flush(self) -> dict[str, int]:
+        """写入已添加的全部行并清空缓冲区
+
+        Returns:
+                各表写入的行数
+
+        """
+        counts: dict[str, int] = {}
+        pending = self.take_rows()
+        for table in sorted_tables():
+            rows = pending.get(table)
+            if not rows:
+                continue
+            statement = insert(table)
+            for batch in batched(rows.values(), self.batch_size):
+                self._connection.execute(statement, batch)
+            counts[table.name] = len(rows)
+        stale = [
+            model for model in closure_models() if model.__closure_of__[0] in counts
+        ]
+        if stale:
+            counts.update(rebuild_closure_tables(self._connection, stale))
+        return counts
+
+    def merge(
+        self,
+        rows: Mapping[Table, Iterable[_Row]],
+        generated: Collection[Table] = (),
+    ) -> None:
+        """合并另一个加载器展开的行，通常来自其他进程中未绑定数据库的加载器
+
+        去重表与 generated 中的表的自增主键由对方独立分配，合并时由本加载器重新分配，
+        引用这些行的外键列随之改写。去重表中的行按内容与在对方中出现的次序
+        对应到本加载器中的行，因此按顺序合并各部分的结果与依次添加全部模型相同。
+        合并后 rows 中的行归本加载器所有，不要再修改。
+
+        Args:
+                rows: {表: 行}，如另一个加载器 take_rows 的结果中各表的 values()
+                generated: 由对方分配了自增主键的表，如其 generated_tables
+
+        """
+        # 表 -> {对方分配的主键: 本加载器分配的主键}
+        ids: dict[Table, dict[object, object]] = {}
+        for table in sorted_tables():
+            if (table_rows := rows.get(table)) is None:
+                continue
+            table_rows = list(table_rows)
+            _remap_foreign_keys(table, table_rows, ids)
+            column = table.autoincrement_column
+            if column is not None and (
+                table in self._interned_info or table in generated
+            ):
+                ids[table] = mapping = {}
+                table_rows = self._reassign_ids(table, column.key, table_rows, mapping)
+                # 指向同一张表中其他行的外键
+                _remap_foreign_keys(table, table_rows, {table: mapping})
+            for row in table_rows:
+                self._emit(table, _primary_key(table, row), row)
+
+    def _reassign_ids(
+        self, table: Table, column: str, rows: list[_Row], mapping: dict
+    ) -> list[_Row]:
+        """重新分配自增主键，返回需要写入的行，去重表中已有的行不再写入"""
+        info = self._interned_info.get(table)
+        if info is None:
+            for row in rows:
+                mapping[row[column]] = row[column] = self._next_id(table, column)
+            return rows
+
+        interned = self._interned[table]
+        # 对方每种内容已出现的次数
+        occurrences: dict[tuple, int] = {}
+        new_rows: list[_Row] = []
+        for row in rows:
+            content = tuple(_freeze(row[key]) for key in info.content)
+            occurrence = occurrences.get(content, 0)
+            occurrences[content] = occurrence + 1
+            existing = interned.setdefault(content, [])
+            if occurrence < len(existing):
+                mapping[row[column]] = existing[occurrence][column]
+                continue
+            mapping[row[column]] = row[column] = self._next_id(table, column)
+            existing.append(row)
+            new_rows.append(row)
+        return new_rows
+
+    def _next_id(self, table: Table, column: str) -> int:
+        if table not in self._next_ids:
+            current = (
+                self._bind.execute(select(func.max(table.c[column]))).scalar()
+                if self._bind is not None
+                else None
+            )
+            self._next_ids[table] = current or 0
+        self._next_ids[table] += 1
+        return self._next_ids[table]
+
+    def _emit(self, table: Table, key: tuple, row: _Row) -> bool:
+        rows = self._rows.setdefault(table, {})
+        if key in rows:
+            return False
+        rows[key] = row
+        return True
+
+    def _visit(
+        self,
+        obj: SQLModel,
+        fixed: _Row,
+        memo: dict[int, tuple[SQLModel, _Row]],
+    ) -> _Row:
+        """展开一个 ORM 对象，返回其对应的行
+
+        Args:
+                obj: ORM 对象
+                fixed: 由父对象确定的外键列取值
+                memo: 本次展开中已访问的对象，用于处理关系中的回环
+
+        """
+        if (visited := memo.get(id(obj))) is not None:
+            visited[1].update(fixed)
+            return visited[1]
+
+        info = get_table_info(type(obj))
+        row: _Row = {column: getattr(obj, attr) for column, attr in info.columns}
+        row.update(fixed)
+        memo[id(obj)] = (obj, row)
+        # 只处理已赋值的关系，避免触发延迟加载
+        loaded = obj.__dict__
+
+        for relation in info.many_to_one:
+            if (related := loaded.get(relation.key)) is None:
+                continue
+            related_row = self._visit(related, {}, memo)
+            for source, dest in relation.sync:
+                row[dest] = related_row[source]
+
+        if (interned := self._interned.get(info.table)) is not None:
+            content = tuple(_freeze(row[column]) for column in info.content)
+            if (existing := interned.get(content)) is not None:
+                memo[id(obj)] = (obj, existing[0])
+                return existing[0]
+            interned[content] = [row]
+
+        if info.autoincrement is not None and row[info.autoincrement] is None:
+            row[info.autoincrement] = self._next_id(info.table, info.autoincrement)
+            if interned is None:
+                self.generated_tables.add(info.table)
+        if not self._emit(
+            info.table, tuple(row[column] for column in info.primary_key), row
+        ):
+            return row
+
+        for relation in info.one_to_many:
+            for child in _iter_related(loaded.get(relation.key)):
+                self._visit(
+                    child,
+                    {dest: row[source] for source, dest in relation.sync},
+                    memo,
+                )
+
+        for relation in info.many_to_many:
+            assert relation.secondary is not None
+            interned = self._interned.get(relation.target)
+            # 本集合中各去重行已出现的次数
+            occurrences: dict[int, int] = {}
+            for child in _iter_related(loaded.get(relation.key)):
+                child_row = self._visit(child, {}, memo)
+                if interned is not None:
+                    occurrence = occurrences.get(id(child_row), 0)
+                    occurrences[id(child_row)] = occurrence + 1
+                    if occurrence:
+                        child_row = self._intern_occurrence(
+                            relation.target, child_row, occurrence
+                        )
+                link = {dest: row[source] for source, dest in relation.sync}
+                link.update(
+                    (dest, child_row[source])
+                    for source, dest in relation.secondary_sync
+                )
+                self._emit(
+                    relation.secondary, _primary_key(relation.secondary, link), link
+                )
+
+        return row
+
+    def _intern_occurrence(self, table: Table, first: _Row, occurrence: int) -> _Row:
+        """内容与 first 相同、在同一集合中第 occurrence 次（从 0 开始）出现的行"""
+        info = self._interned_info[table]
+        content = tuple(_freeze(first[column]) for column in info.content)
+        rows = self._interned[table][content]
+        while len(rows) <= occurrence:
+            assert info.autoincrement is not None
+            row = {column: first[column] for column, _ in info.columns}
+            row[info.autoincrement] = self._next_id(table, info.autoincrement)
+            self._emit(table, tuple(row[column] for column in info.primary_key), row)
+            rows.append(row)
+        return rows[occurrence]
+
+
+def _primary_key(table: Table, row: _Row) -> tuple:
+    return tuple(row[column.key] for column in table.primary_key)
+
+
+def _remap_foreign_keys(
+    table: Table, rows: list[_Row], ids: Mapping[Table, Mapping[object, object]]
+) -> None:
+    """将指向 ids 中各表的外键列改写为新的主键，不在映射中的值保持不变"""
+    columns = [
+        (key.parent.key, ids[key.column.table])
+        for key in table.foreign_keys
+        if key.column.table in ids
+    ]
+    if not columns:
+        return
+    for row in rows:
+        for column, mapping in columns:
+            value = row.get(column)
+            if value is not None:
+                row[column] = mapping.get(value, value)
+
+
+def _iter_related(value: object) -> Iterable[SQLModel]:
+    if value is None:
+        return ()
+    if isinstance(value, SQLModel):
+        return (value,)
+    return value  # type: ignore[return-value]
+
+
+def closure_models() -> list[type[BaseClosureModel]]:
+    """全部闭包表模型"""
+    return [
+        model
+        for model in BaseClosureModel.__subclasses__()
+        if hasattr(model, '__table__')
+    ]
+
+
+def _closure_select(model: type[BaseClosureModel]) -> Select:
+    """由源表计算闭包表全部行的递归查询"""
+    source_name, next_column = model.__closure_of__
+    source = SQLModel.metadata.tables[source_name]
+    target = source.alias('target')
+    next_id = source.c[next_column]
+    closure = select(
+        source.c.id.label('ancestor_id'),
+        source.c.id.label('descendant_id'),
+        literal(0).label('depth'),
+    ).cte('closure', recursive=True)
+    # 链中不重复的路径短于源表的行数，源表中存在环时以此终止递归，
+    # 环上重复到达的资源只保留最短的距离
+    max_depth = select(func.count()).select_from(source).scalar_subquery()
+    closure = closure.union_all(
+        select(closure.c.ancestor_id, next_id, closure.c.depth + 1)
+        .join_from(closure, source, source.c.id == closure.c.descendant_id)
+        .join(target, target.c.id == next_id)
+        .where(closure.c.depth < max_depth)
+    )
+    return select(
+        closure.c.ancestor_id, closure.c.descendant_id, func.min(closure.c.depth)
+    ).group_by(closure.c.ancestor_id, closure.c.descendant_id)
+
+
+def rebuild_closure_tables(
+    bind: Session | Connection,
+    models: Iterable[type[BaseClosureModel]] | None = None,
+) -> dict[str, int]:
+    """清空并由源表重新计算闭包表，每张表只执行一条 INSERT ... SELECT
+
+    bulk_load 写入源表后会自动调用；通过 Session 逐个写入模型时，
+    需要在源表写入后手动调用。指向不存在的资源的引用不会写入闭包表。
+
+    Args:
+                bind: 使用的 Session 或 Connection
+                models: 要重建的闭包表模型，默认为全部
+
+    Returns:
+            各表写入的行数
+
+    """
+    connection = bind.connection() if isinstance(bind, Session) else bind
+    counts: dict[str, int] = {}
+    for model in closure_models() if models is None else models:
+        table = cast(Table, model.__table__)  # type: ignore[attr-defined]
+        connection.execute(delete(table))
+        connection.execute(
+            insert(table).from_select(
+                ['ancestor_id', 'descendant_id', 'depth'], _closure_select(model)
+            )
+        )
+        # 以 WITH 开头的语句在部分驱动（如 sqlite3）中没有 rowcount
+        counts[table.name] = connection.execute(
+            select(func.count()).select_from(table)
+        ).scalar_one()
+    return counts
+
+
+def refresh_search_index(bind: Session | Connection, counts: dict[str, int]) -> None:
+    """在 SQLite 中写入了参与全文搜索的资源时重新填充全文搜索索引
+
+    Args:
+                bind: 写入数据的 Session 或连接
+                counts: 各表写入的行数，如 BulkLoader.flush 的返回值
+
+    """
+    connection = bind.connection() if isinstance(bind, Session) else bind
+    searched = {source.model.resource_name() for source in SEARCH_SOURCES}
+    if connection.dialect.name == 'sqlite' and not searched.isdisjoint(counts):
+        rebuild_search_index(connection)
+
+
+def bulk_load(
+    bind: Session | Connection,
+    models: Iterable[SupportsToORM | SQLModel],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    interned_models: Collection[type[SQLModel]] = INTERNED_MODELS,
+    search_index: bool = True,
+) -> dict[str, int]:
+    """将模型批量写入数据库，不会提交事务，其余参数含义见 BulkLoader
+
+    Args:
+                search_index: 在 SQLite 中写入了参与全文搜索的资源时，
+                        是否随后调用 rebuild_search_index 重新填充全文搜索索引，
+                        其他数据库不支持该索引，会忽略此参数
+
+    Returns:
+            各表写入的行数
+
+    """
+    loader = BulkLoader(bind, batch_size=batch_size, interned_models=interned_models)
+    loader.add_all(models)
+    counts = loader.flush()
+    if search_index:
+        refresh_search_index(bind, counts)
+    return counts
+
+
+__all__ = [
+    'DEFAULT_BATCH_SIZE',
+    'INTERNED_MODELS',
+    'BulkLoader',
+    'Relation',
+    'TableInfo',
+    'batched',
+    'bulk_load',
+    'closure_models',
+    'get_table_info',
+    'rebuild_closure_tables',
+    'refresh_search_index',
+    'sorted_tables',
+]
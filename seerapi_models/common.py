@@ -1,24 +1,37 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache, lru_cache
 import inspect
+from operator import attrgetter
+import sys
 from typing import (
     TYPE_CHECKING,
     Annotated,
+    Any,
     ClassVar,
     Generic,
     Literal,
+    NamedTuple,
     TypeVar,
     cast,
     overload,
 )
 from typing_extensions import Self
+from urllib.parse import urlsplit
 
 from pydantic import (
     AliasChoices,
     ConfigDict,
+    GetCoreSchemaHandler,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
     WithJsonSchema,
     computed_field,
-    field_serializer,
+    model_serializer,
+    model_validator,
 )
+from pydantic_core import CoreSchema, core_schema
 from sqlalchemy.orm import column_property, declared_attr
 from sqlmodel import JSON, Column, Computed, Field, Numeric, Relationship
 
@@ -27,6 +40,7 @@ from .build_model import (
     BaseGeneralModel,
     BaseResModel,
     BaseResModelWithOptionalId,
+    ConvertToModel,
     ConvertToORM,
 )
 
@@ -44,13 +58,108 @@ if TYPE_CHECKING:
 
 BASE_DATA_URL = 'you_should_set_this_url.example.com'
 
+# ResourceRef 实例缓存的最大条目数
+_REF_CACHE_SIZE = 1 << 16
+
+# 通过 ResourceRef.bind_base_data_url 绑定的地址，优先于 ResourceRef.base_data_url
+_bound_base_data_url: ContextVar[str | None] = ContextVar(
+    'seerapi_models_base_data_url', default=None
+)
+
 
 TResModel = TypeVar('TResModel', bound=BaseResModel)
 _TResModelArg = TypeVar('_TResModelArg', bound=BaseResModel)
 
 
+@lru_cache(maxsize=_REF_CACHE_SIZE)
+def _cached_ref(
+    cls: 'type[ResourceRef]', base_data_url: str, *args: Any
+) -> 'ResourceRef':
+    # base_data_url 只作为缓存键的一部分，修改后不会再命中旧的实例
+    return cls._create(*args)
+
+
+# URL 到紧凑编码的缓存，序列化时每个引用都要查询，比 lru_cache 更快
+_ref_pairs: dict[str, tuple[Any, ...]] = {}
+
+
+def _remember_ref_pair(url: str, pair: tuple[Any, ...]) -> None:
+    if len(_ref_pairs) >= _REF_CACHE_SIZE:
+        _ref_pairs.clear()
+    _ref_pairs[url] = pair
+
+
+def _ref_pair(url: str, id: int) -> tuple[Any, ...]:
+    pair = _ref_pairs.get(url)
+    if pair is None:
+        pair = _parse_ref_pair(url, id)
+        _remember_ref_pair(url, pair)
+    return pair
+
+
+def _parse_ref_pair(url: str, id: int) -> tuple[Any, ...]:
+    """从 URL 中解析引用的紧凑编码 (resource_name, id[, sub_path])
+
+    通过 from_res_name 创建的引用在创建时已记录了编码，这里只处理校验得到的引用，
+    URL 形如 {base_data_url}/{resource_name}/{id}[/{sub_path}]。
+    """
+    for base_data_url in (ResourceRef.current_base_data_url(), BASE_DATA_URL):
+        prefix = base_data_url.removesuffix('/') + '/'
+        if url.startswith(prefix):
+            name, _, rest = url[len(prefix) :].partition('/')
+            id_part, _, sub_path = rest.partition('/')
+            if name and id_part == str(id):
+                return (name, id, sub_path) if sub_path else (name, id)
+
+    # 未知的服务地址中可能含有 /，只能假定 ID 是最后一段
+    segments = [part for part in urlsplit(url).path.split('/') if part]
+    if len(segments) >= 2 and segments[-1] == str(id):
+        return segments[-2], id
+    raise ValueError(f'无法从 URL {url!r} 中解析资源名称与ID')
+
+
+# 参数化的 ResourceRef 类与 (原始类, 类型参数) 的双向映射。
+# ResourceRef[X] 与 ResourceRef['X'] 是同名的不同类，无法按名称从模块中找到，
+# pickle 时记录原始类与类型参数，还原时查表得到同一个类
+_ref_params: dict[type, tuple[type, Any]] = {}
+_ref_classes: dict[tuple[type, Any], 'type[ResourceRef]'] = {}
+
+
+def _restore_ref(origin: 'type[ResourceRef]', params: Any, state: Any) -> 'ResourceRef':
+    """从 pickle 中还原参数化的 ResourceRef 实例"""
+    cls = _ref_classes.get((origin, params))
+    if cls is None:
+        # 子进程中可能尚未创建该类，参数化后会记录到映射中
+        cls = cast(Any, origin)[params]
+    obj = cls.__new__(cls)
+    obj.__setstate__(state)
+    return obj
+
+
 class ResourceRef(BaseGeneralModel, Generic[TResModel]):
-    """API资源类"""
+    """API资源类
+
+    URL 中的服务地址由 current_base_data_url 决定：
+    在 bind_base_data_url 的上下文中为绑定的地址，否则为类属性 base_data_url。
+    以占位地址 BASE_DATA_URL 开头的 URL 会在序列化时替换为当前地址，
+    在绑定的上下文中创建的 URL 已是最终地址，序列化时原样输出。
+
+    from_res_name 与 from_model 按 (类型, 服务地址, 参数) 缓存创建的实例，
+    相同参数返回同一个实例，因此实例是不可变的，修改字段会抛出 ValidationError，
+    需要不同的值时请用 model_copy(update=...) 创建新的实例。
+    修改服务地址后旧的缓存不会再被使用，
+    也可以通过 set_base_data_url 修改并清空缓存。
+
+    默认序列化为完整格式，序列化时的 context 中带有 ref_encoding 时输出紧凑编码，
+    见 ref_encoding_context。校验时也接受紧凑编码的输入，
+    'id' 编码的资源名称由类型参数确定，见 expand_ref。
+    NamedResourceRef 的 name 无法用紧凑编码表示，始终输出完整格式。
+
+    参数化的 ResourceRef 可以 pickle，还原后仍是原来的类。
+    """
+
+    # 缓存的实例被所有调用方共用，不允许修改
+    model_config = ConfigDict(frozen=True)  # type: ignore
 
     base_data_url: ClassVar[str] = BASE_DATA_URL
 
@@ -60,16 +169,102 @@ class ResourceRef(BaseGeneralModel, Generic[TResModel]):
         schema_extra={'format': 'uri'},
     )
 
-    @field_serializer('url', mode='plain')
-    def _serialize_url(self, url: str) -> str:
-        return url.replace(BASE_DATA_URL, self.base_data_url.removesuffix('/'))
+    @model_serializer(mode='wrap')
+    def _serialize(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ):
+        context = info.context
+        if isinstance(context, dict):
+            encoding = context.get(REF_ENCODING_CONTEXT_KEY)
+            if encoding is not None:
+                return _REF_ENCODERS[encoding](self)
+        if info.include is not None or info.exclude is not None:
+            return self._replace_base_data_url(handler(self))
+        # 直接构造输出比交给 Pydantic 逐字段序列化更快；
+        # 字段都是必填且不为 None，exclude_none 等选项不影响输出
+        data = dict(self.__dict__)
+        url: str = data['url']
+        if url.startswith(BASE_DATA_URL):
+            base_data_url = self.current_base_data_url()
+            if base_data_url != BASE_DATA_URL:
+                data['url'] = (
+                    base_data_url.removesuffix('/') + url[len(BASE_DATA_URL) :]
+                )
+        return data
+
+    def _replace_base_data_url(self, data: dict[str, Any]) -> dict[str, Any]:
+        # 只有以占位地址创建的 URL 需要替换，在绑定的上下文中创建的 URL 已是最终地址
+        url: str | None = data.get('url')
+        if url is None or not url.startswith(BASE_DATA_URL):
+            return data
+        base_data_url = self.current_base_data_url()
+        # 未设置服务地址时无需替换
+        if base_data_url != BASE_DATA_URL:
+            data['url'] = base_data_url.removesuffix('/') + url[len(BASE_DATA_URL) :]
+        return data
+
+    @model_validator(mode='before')
+    @classmethod
+    def _expand_compact(cls, data: Any) -> Any:
+        if isinstance(data, int | list | tuple) and not isinstance(data, bool):
+            return expand_ref(data, ref_type=cls)
+        return data
+
+    def __class_getitem__(cls, params: Any) -> Any:
+        sub: Any = super().__class_getitem__(params)
+        if sub is not cls and sub not in _ref_params:
+            _ref_params[sub] = (cls, params)
+            _ref_classes[cls, params] = sub
+        return sub
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # 参数化的类无法按名称从模块中找到，需要通过原始类重新参数化
+        origin = _ref_params.get(type(self))
+        if origin is None:
+            return super().__reduce_ex__(protocol)
+        return _restore_ref, (*origin, self.__getstate__())
 
     @classmethod
     def schema_path(cls) -> str:
         return 'common/resource_ref/'
 
     @classmethod
-    def from_res_name(
+    def current_base_data_url(cls) -> str:
+        """当前生效的服务地址"""
+        bound = _bound_base_data_url.get()
+        return cls.base_data_url if bound is None else bound
+
+    @classmethod
+    def set_base_data_url(cls, url: str) -> None:
+        """修改 base_data_url 并清空缓存"""
+        cls.base_data_url = url
+        cls.clear_cache()
+
+    @staticmethod
+    @contextmanager
+    def bind_base_data_url(url: str) -> Iterator[None]:
+        """在上下文中绑定服务地址，适用于同一进程中按不同镜像导出数据
+
+        绑定基于 contextvars，只对当前线程或异步任务生效，可以嵌套使用。
+        绑定空字符串时，以占位地址创建的 URL 序列化为不含服务地址的资源路径。
+
+        Args:
+                url: 服务地址，末尾的 / 会被去除
+
+        """
+        token = _bound_base_data_url.set(url.removesuffix('/'))
+        try:
+            yield
+        finally:
+            _bound_base_data_url.reset(token)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """清空所有 ResourceRef 实例的缓存"""
+        _cached_ref.cache_clear()
+
+    @classmethod
+    def _create(
         cls,
         id: int,
         resource_name: str,
@@ -78,13 +273,30 @@ class ResourceRef(BaseGeneralModel, Generic[TResModel]):
         path_parts = filter(
             bool,
             [
-                cls.base_data_url,
+                cls.current_base_data_url(),
                 resource_name,
                 str(id),
                 sub_path,
             ],
         )
-        return cls(id=id, url='/'.join(cast(Iterable[str], path_parts)))
+        url = '/'.join(cast(Iterable[str], path_parts))
+        _remember_ref_pair(
+            url, (resource_name, id, sub_path) if sub_path else (resource_name, id)
+        )
+        return cls(id=id, url=url)
+
+    @classmethod
+    def from_res_name(
+        cls,
+        id: int,
+        resource_name: str,
+        sub_path: str | None = None,
+    ) -> Self:
+        base_data_url = cls.current_base_data_url()
+        return cast(
+            Self,
+            _cached_ref(cls, base_data_url, id, resource_name, sub_path),  # type: ignore[arg-type]
+        )
 
     @overload
     @classmethod
@@ -121,21 +333,27 @@ class ResourceRef(BaseGeneralModel, Generic[TResModel]):
 class NamedResourceRef(ResourceRef[TResModel]):
     name: str | None = Field(default=None, description='资源名称')
 
+    @model_serializer(mode='wrap')
+    def _serialize(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ):
+        # name 无法用紧凑编码表示，始终输出完整格式，exclude_none 等选项由 Pydantic 处理
+        return self._replace_base_data_url(handler(self))
+
     @classmethod
     def schema_path(cls) -> str:
         return 'common/named_resource_ref/'
 
     @classmethod
-    def from_res_name(
+    def _create(
         cls,
         id: int,
         resource_name: str,
         sub_path: str | None = None,
-        *,
         name: str | None = None,
     ) -> Self:
         path_parts: list[str] = [
-            cls.base_data_url,
+            cls.current_base_data_url(),
             resource_name,
             str(id),
         ]
@@ -143,6 +361,21 @@ class NamedResourceRef(ResourceRef[TResModel]):
             path_parts.append(sub_path)
         return cls(id=id, url='/'.join(path_parts), name=name)
 
+    @classmethod
+    def from_res_name(
+        cls,
+        id: int,
+        resource_name: str,
+        sub_path: str | None = None,
+        *,
+        name: str | None = None,
+    ) -> Self:
+        base_data_url = cls.current_base_data_url()
+        return cast(
+            Self,
+            _cached_ref(cls, base_data_url, id, resource_name, sub_path, name),  # type: ignore[arg-type]
+        )
+
     @overload
     @classmethod
     def from_model(
@@ -182,6 +415,138 @@ class NamedResourceRef(ResourceRef[TResModel]):
         return cast(NamedResourceRef[_TResModelArg], obj)
 
 
+@cache
+def _ref_model_name(ref_type: type[ResourceRef]) -> str | None:
+    """参数化的引用类型所引用的模型类名，未参数化时返回 None
+
+    类型参数可能是模型类，也可能是前向引用的类名字符串。
+    """
+    origin = _ref_params.get(ref_type)
+    if origin is None:
+        return None
+    param = origin[1]
+    if isinstance(param, str):
+        return param
+    return param.__name__ if isinstance(param, type) else None
+
+
+def _find_res_model(name: str) -> type[BaseResModel] | None:
+    pending: list[type[BaseResModel]] = [BaseResModel]
+    while pending:
+        cls = pending.pop()
+        if cls.__name__ == name:
+            return cls
+        pending.extend(cls.__subclasses__())
+    # 按需导入模式下模型所在的模块可能尚未导入，由包的 __getattr__ 导入
+    found = getattr(sys.modules.get(__package__ or ''), name, None)
+    if isinstance(found, type) and issubclass(found, BaseResModel):
+        return found
+    return None
+
+
+@cache
+def ref_resource_name(ref_type: type[ResourceRef]) -> str | None:
+    """参数化的引用类型（如 ResourceRef['Skill']）所引用的资源名称
+
+    未参数化或类型参数不是资源模型时返回 None。
+    """
+    name = _ref_model_name(ref_type)
+    model = _find_res_model(name) if name is not None else None
+    return model.resource_name() if model is not None else None
+
+
+_TResourceRef = TypeVar('_TResourceRef', bound=ResourceRef)
+
+
+@overload
+def expand_ref(
+    value: int | Sequence[Any], resource_name: str | None = None
+) -> ResourceRef: ...
+
+
+@overload
+def expand_ref(
+    value: int | Sequence[Any],
+    resource_name: str | None = None,
+    *,
+    ref_type: type[_TResourceRef],
+) -> _TResourceRef: ...
+
+
+def expand_ref(
+    value: int | Sequence[Any],
+    resource_name: str | None = None,
+    *,
+    ref_type: type[ResourceRef] = ResourceRef,
+) -> ResourceRef:
+    """将紧凑编码的引用还原为 ResourceRef
+
+    'id' 编码不包含资源名称，未传入 resource_name 时由 ref_type 的类型参数确定，
+    因此 ResourceRef['Skill'] 等字段可以直接校验 'id' 编码的输入。
+
+    Args:
+                value: 'id' 编码的资源ID，或 'pair' 编码的元组
+                resource_name: 资源名称，默认由 ref_type 的类型参数确定
+                ref_type: 创建的引用类型
+
+    Raises:
+            ValueError: 还原 'id' 编码时无法确定资源名称
+
+    """
+    if isinstance(value, int):
+        if resource_name is None:
+            resource_name = ref_resource_name(ref_type)
+        if resource_name is None:
+            raise ValueError(
+                f'{ref_type.__name__} 未指定资源类型，还原 id 编码的引用需要提供 '
+                'resource_name'
+            )
+        return ref_type.from_res_name(value, resource_name)
+    name, id, *sub_path = value
+    return ref_type.from_res_name(id, name, *sub_path)
+
+
+RefEncoding = Literal['id', 'pair']
+
+# 序列化时 context 中指定引用编码的键
+REF_ENCODING_CONTEXT_KEY = 'ref_encoding'
+
+
+def _encode_ref_id(ref: ResourceRef) -> int:
+    return ref.id
+
+
+def _encode_ref_pair(ref: ResourceRef) -> tuple[Any, ...]:
+    return _ref_pair(ref.url, ref.id)
+
+
+_REF_ENCODERS = {'id': _encode_ref_id, 'pair': _encode_ref_pair}
+
+
+def ref_encoding_context(
+    encoding: RefEncoding, context: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """序列化时以紧凑编码输出 ResourceRef 的 context
+
+    'id' 只输出资源ID，'pair' 输出 (resource_name, id) 元组，
+    NamedResourceRef 的 name 无法用紧凑编码表示，仍输出完整格式。
+    未指定编码时输出完整格式，默认的序列化不会为紧凑编码付出额外开销::
+
+        pet.model_dump_json(context=ref_encoding_context('id'))
+
+    Args:
+                encoding: 引用的编码，'id' 或 'pair'
+                context: 需要一起传给序列化器的其他 context
+
+    Raises:
+            ValueError: 未知的编码
+
+    """
+    if encoding not in _REF_ENCODERS:
+        raise ValueError(f'未知的引用编码：{encoding}')
+    return {**(context or {}), REF_ENCODING_CONTEXT_KEY: encoding}
+
+
 class ApiResourceList(BaseGeneralModel, Generic[TResModel]):
     """API资源列表，兼容RFC 5988的Link标准"""
 
@@ -230,7 +595,7 @@ class EidEffect(BaseResModel, BaseGeneralModel, ConvertToORM['EidEffectORM']):
         return EidEffectORM(id=self.id, args_num=self.args_num)
 
 
-class EidEffectORM(EidEffect, table=True):
+class EidEffectORM(EidEffect, ConvertToModel['EidEffect'], table=True):
     in_use: list['EidEffectInUseORM'] = Relationship(back_populates='effect')
 
 
@@ -267,23 +632,68 @@ class EidEffectInUse(
         )
 
 
-class EidEffectInUseORM(EidEffectInUseBase, table=True):
+class EidEffectInUseORM(
+    EidEffectInUseBase, ConvertToModel['EidEffectInUse'], table=True
+):
     eid: int = Field(foreign_key='eid_effect.id')
     effect: 'EidEffectORM' = Relationship(back_populates='in_use')
     # 特性，魂印，装备效果，etc...
-    energy_bead: 'EnergyBeadORM' = Relationship(back_populates='effect_in_use')
-    soulmark: 'SoulmarkORM' = Relationship(back_populates='effect_in_use')
-    pet_effect: 'PetEffectORM' = Relationship(back_populates='effect_in_use')
-    variation_effect: 'VariationEffectORM' = Relationship(
+    # 外键在资源一侧，内容相同的效果可以被多个资源共用，见 bulk.INTERNED_MODELS
+    energy_bead: list['EnergyBeadORM'] = Relationship(back_populates='effect_in_use')
+    soulmark: list['SoulmarkORM'] = Relationship(back_populates='effect_in_use')
+    pet_effect: list['PetEffectORM'] = Relationship(back_populates='effect_in_use')
+    variation_effect: list['VariationEffectORM'] = Relationship(
         back_populates='effect_in_use'
     )
-    equip_bonus: 'EquipBonusORM' = Relationship(back_populates='effect_in_use')
-    suit_bonus: 'SuitBonusORM' = Relationship(back_populates='effect_in_use')
+    equip_bonus: list['EquipBonusORM'] = Relationship(back_populates='effect_in_use')
+    suit_bonus: list['SuitBonusORM'] = Relationship(back_populates='effect_in_use')
 
 
 AttrValue = Annotated[int | float, WithJsonSchema({'type': 'number'})]
 
 
+_SIX_ATTRIBUTES_KEYS = ('atk', 'def_', 'sp_atk', 'sp_def', 'spd', 'hp')
+# 按顺序取出六项属性值，比逐个 getattr 更快
+_get_six_attributes = attrgetter(*_SIX_ATTRIBUTES_KEYS)
+
+_SixAttributesOperator = Literal['add', 'sub', 'percent_mul', 'percent_div']
+
+
+def _percent_rule(
+    left_percent: bool, right_percent: bool, *, subtract: bool
+) -> tuple[_SixAttributesOperator, bool, bool | None]:
+    """六维属性加减法中百分比加成的处理规则
+
+    两者都是百分比时直接相加减，其中一方是百分比时将另一方按百分比放大或缩小。
+
+    Returns:
+            (逐属性运算, 是否交换左右两侧, 结果的 percent，为 None 时保持默认值)
+
+    """
+    if left_percent and right_percent:
+        return ('sub' if subtract else 'add'), False, True
+    if left_percent:
+        return ('percent_div' if subtract else 'percent_mul'), True, False
+    if right_percent:
+        return ('percent_div' if subtract else 'percent_mul'), False, False
+    return ('sub' if subtract else 'add'), False, None
+
+
+def _calc_values(
+    left: Iterable[int | float],
+    right: Iterable[int | float],
+    operator: _SixAttributesOperator,
+) -> list[int | float]:
+    """逐属性计算两组按相同顺序排列的属性值"""
+    if operator == 'add':
+        return [a + b for a, b in zip(left, right)]
+    if operator == 'sub':
+        return [a - b for a, b in zip(left, right)]
+    if operator == 'percent_mul':
+        return [a * (1 + b / 100) for a, b in zip(left, right)]
+    return [a * (1 - b / 100) for a, b in zip(left, right)]
+
+
 class SixAttributesBase(BaseResModelWithOptionalId, BaseGeneralModel):
     """六维属性类"""
 
@@ -352,40 +762,65 @@ class SixAttributes(SixAttributesBase, BaseGeneralModel):
     def resource_name(cls) -> str:
         return 'six_attributes'
 
+    @classmethod
+    def _from_values(
+        cls,
+        values: Iterable[int | float],
+        percent: bool | None = None,
+        *,
+        validate: bool = False,
+    ) -> Self:
+        """根据按 atk、def、sp_atk、sp_def、spd、hp 顺序排列的属性值创建实例
+
+        由已校验的实例计算得到的值一定是 int 或 float，默认跳过校验
+        （包括 def/def_ 别名解析）直接构造，结果与校验后创建的实例完全相同。
+        子类可能定义了额外的字段或校验器，总是会进行校验。
+
+        Args:
+                values: 六项属性值
+                percent: 为 None 时保持默认值，且不计入 model_fields_set
+                validate: 是否强制校验
+
+        """
+        data: dict[str, Any] = dict(zip(_SIX_ATTRIBUTES_KEYS, values))
+        if percent is not None:
+            data['percent'] = percent
+        if validate or cls is not SixAttributes:
+            return cls(**data)
+
+        # model_construct 逐字段处理别名与默认值，比校验还慢，因此直接设置实例的状态；
+        # Pydantic 的 BaseModel 增加新的实例属性时由 TestTrustedConstruction 发现
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, '__pydantic_fields_set__', set(data))
+        object.__setattr__(obj, '__pydantic_extra__', None)
+        object.__setattr__(obj, '__pydantic_private__', None)
+        object.__setattr__(
+            obj, '__dict__', {'id': None, **data, 'percent': bool(percent)}
+        )
+        return obj
+
     def _calc_number(
         self,
         other: 'SixAttributesBase',
         *,
-        operator: Literal['add', 'sub', 'percent_mul', 'percent_div'],
+        operator: _SixAttributesOperator,
         swap: bool = False,
+        percent: bool | None = None,
     ) -> Self:
-        """逐属性计算，swap=True 时交换 self 和 other 的运算位置"""
-        keys = ['atk', 'def_', 'sp_atk', 'sp_def', 'spd', 'hp']
-        values: list[int | float] = []
-        for key in keys:
-            if swap:
-                left, right = getattr(other, key), getattr(self, key)
-            else:
-                left, right = getattr(self, key), getattr(other, key)
-
-            if operator == 'add':
-                val = left + right
-            elif operator == 'sub':
-                val = left - right
-            elif operator == 'percent_mul':
-                val = left * (1 + right / 100)
-            elif operator == 'percent_div':
-                val = left * (1 - right / 100)
-
-            values.append(val)
-
-        return type(self)(
-            atk=values[0],
-            def_=values[1],
-            sp_atk=values[2],
-            sp_def=values[3],
-            spd=values[4],
-            hp=values[5],
+        """逐属性计算，swap=True 时交换 self 和 other 的运算位置
+
+        percent 不为 None 时同时设置结果的 percent 字段。
+        """
+        left = _get_six_attributes(self)
+        right = _get_six_attributes(other)
+        if swap:
+            left, right = right, left
+        values = _calc_values(left, right, operator)
+
+        # 其他 SixAttributesBase（如从数据库读取的 ORM 对象）的值可能是 Decimal，
+        # 需要经过校验
+        return self._from_values(
+            values, percent, validate=not isinstance(other, SixAttributes)
         )
 
     def __add__(self, other) -> Self:
@@ -393,48 +828,25 @@ class SixAttributes(SixAttributesBase, BaseGeneralModel):
         if not isinstance(other, SixAttributesBase):
             raise TypeError(f'Cannot add {type(self)} and {type(other)}')
 
-        if self.percent and other.percent:
-            obj = self._calc_number(other, operator='add')
-            obj.percent = True
-            return obj
-        elif self.percent or other.percent:
-            if self.percent:
-                obj = self._calc_number(other, operator='percent_mul', swap=True)
-            else:
-                obj = self._calc_number(other, operator='percent_mul')
-            obj.percent = False
-            return obj
-        else:
-            return self._calc_number(other, operator='add')
+        operator, swap, percent = _percent_rule(
+            self.percent, other.percent, subtract=False
+        )
+        return self._calc_number(other, operator=operator, swap=swap, percent=percent)
 
     def __sub__(self, other) -> Self:
         """两个六维属性相减"""
         if not isinstance(other, SixAttributesBase):
             raise TypeError(f'Cannot sub {type(self)} and {type(other)}')
 
-        if self.percent and other.percent:
-            obj = self._calc_number(other, operator='sub')
-            obj.percent = True
-            return obj
-        elif self.percent or other.percent:
-            if self.percent:
-                obj = self._calc_number(other, operator='percent_div', swap=True)
-            else:
-                obj = self._calc_number(other, operator='percent_div')
-            obj.percent = False
-            return obj
-        else:
-            return self._calc_number(other, operator='sub')
+        operator, swap, percent = _percent_rule(
+            self.percent, other.percent, subtract=True
+        )
+        return self._calc_number(other, operator=operator, swap=swap, percent=percent)
 
     def round(self, ndigits: int | None = None) -> Self:
-        return type(self)(
-            atk=round(self.atk, ndigits),
-            def_=round(self.def_, ndigits),
-            sp_atk=round(self.sp_atk, ndigits),
-            sp_def=round(self.sp_def, ndigits),
-            spd=round(self.spd, ndigits),
-            hp=round(self.hp, ndigits),
-            percent=self.percent,
+        return self._from_values(
+            [round(value, ndigits) for value in _get_six_attributes(self)],
+            self.percent,
         )
 
 
@@ -463,6 +875,105 @@ class SixAttributesORMBase(SixAttributesBase):
         )
 
 
+class CompactSixAttributes(NamedTuple):
+    """六维属性的紧凑表示
+
+    SixAttributes 的每个实例都带有 __dict__、字段集合等 Pydantic 模型的额外开销，
+    在内存中缓存大量精灵、刻印等数据时占用明显。
+    本类型是只保存六项属性与 percent 的元组，数值保留原本的 int/float 类型，
+    与 SixAttributes 之间可以无损互相转换。
+
+    可以直接作为 Pydantic 字段类型使用：
+    校验时接受本类型、SixAttributes 或相同结构的数据，
+    序列化结果与 JSON Schema 均与 SixAttributes 一致。
+    """
+
+    atk: int | float
+    def_: int | float
+    sp_atk: int | float
+    sp_def: int | float
+    spd: int | float
+    hp: int | float
+    percent: bool = False
+
+    @property
+    def total(self) -> int | float:
+        """总属性值"""
+        return self.atk + self.def_ + self.sp_atk + self.sp_def + self.spd + self.hp
+
+    @classmethod
+    def from_model(cls, model: SixAttributesBase) -> 'CompactSixAttributes':
+        return cls(
+            model.atk,
+            model.def_,
+            model.sp_atk,
+            model.sp_def,
+            model.spd,
+            model.hp,
+            model.percent,
+        )
+
+    def to_model(self) -> SixAttributes:
+        return SixAttributes(
+            atk=self.atk,
+            def_=self.def_,
+            sp_atk=self.sp_atk,
+            sp_def=self.sp_def,
+            spd=self.spd,
+            hp=self.hp,
+            percent=self.percent,
+        )
+
+    def _calc(self, other: Any, *, subtract: bool) -> 'CompactSixAttributes':
+        """直接在元组上按与 SixAttributes 相同的规则逐属性加减"""
+        if isinstance(other, CompactSixAttributes):
+            right, right_percent = other[:6], other.percent
+        elif isinstance(other, SixAttributesBase):
+            # 其他 SixAttributesBase（如从数据库读取的 ORM 对象）的值可能是 Decimal，
+            # 需要经过校验
+            if not isinstance(other, SixAttributes):
+                other = SixAttributes.model_validate(other, from_attributes=True)
+            right, right_percent = _get_six_attributes(other), other.percent
+        else:
+            action = 'sub' if subtract else 'add'
+            raise TypeError(f'Cannot {action} {type(self)} and {type(other)}')
+
+        operator, swap, percent = _percent_rule(
+            self.percent, right_percent, subtract=subtract
+        )
+        left = self[:6]
+        if swap:
+            left, right = right, left
+        return CompactSixAttributes(
+            *_calc_values(left, right, operator), percent=bool(percent)
+        )
+
+    # 元组的 + 为拼接，这里改为与 SixAttributes 相同的逐属性运算
+    def __add__(self, other: Any) -> 'CompactSixAttributes':  # type: ignore[override]
+        return self._calc(other, subtract=False)
+
+    def __sub__(self, other: Any) -> 'CompactSixAttributes':
+        return self._calc(other, subtract=True)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        model_schema = handler.generate_schema(SixAttributes)
+        from_model = core_schema.no_info_after_validator_function(
+            cls.from_model, model_schema
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_model,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_model]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls.to_model, return_schema=model_schema
+            ),
+        )
+
+
 class SkillEffectInUseBase(BaseResModelWithOptionalId):
     """描述一条“使用中的”技能效果"""
 
@@ -481,7 +992,7 @@ class SkillEffectInUseBase(BaseResModelWithOptionalId):
 class SkillEffectInUse(
     SkillEffectInUseBase, BaseGeneralModel, ConvertToORM['SkillEffectInUseORM']
 ):
-    effect: 'ResourceRef[SkillEffectType]'
+    effect: ResourceRef['SkillEffectType']
 
     @classmethod
     def schema_path(cls) -> str:
@@ -500,18 +1011,22 @@ class SkillEffectInUse(
         )
 
 
-class SkillEffectInUseORM(SkillEffectInUseBase, table=True):
+class SkillEffectInUseORM(
+    SkillEffectInUseBase, ConvertToModel['SkillEffectInUse'], table=True
+):
     effect_id: int = Field(foreign_key='skill_effect_type.id')
     effect: 'SkillEffectTypeORM' = Relationship(back_populates='in_use')
     skill: list['SkillORM'] = Relationship(
+        back_populates='skill_effect',
         sa_relationship_kwargs={
             'secondary': 'skilleffectlink',
-        }
+        },
     )
     friend_skill: list['SkillORM'] = Relationship(
+        back_populates='friend_skill_effect',
         sa_relationship_kwargs={
             'secondary': 'skillfriendskilleffectlink',
-        }
+        },
     )
     gem: list['GemORM'] = Relationship(
         back_populates='skill_effect_in_use',
@@ -528,7 +1043,9 @@ class SkillEffectInUseORM(SkillEffectInUseBase, table=True):
 
 
 __all__ = [
+    'REF_ENCODING_CONTEXT_KEY',
     'ApiResourceList',
+    'CompactSixAttributes',
     'EidEffect',
     'EidEffectInUse',
     'EidEffectInUseBase',
@@ -536,6 +1053,7 @@ __all__ = [
     'EidEffectORM',
     'NamedData',
     'NamedResourceRef',
+    'RefEncoding',
     'ResourceRef',
     'SixAttributes',
     'SixAttributesBase',
@@ -543,4 +1061,7 @@ __all__ = [
     'SkillEffectInUse',
     'SkillEffectInUseBase',
     'SkillEffectInUseORM',
+    'expand_ref',
+    'ref_encoding_context',
+    'ref_resource_name',
 ]
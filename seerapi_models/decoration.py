@@ -1,6 +1,6 @@
 from sqlmodel import Field
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 
 
 class BaseDecoration(BaseResModel):
@@ -29,7 +29,7 @@ class AvatarHead(BaseDecoration, ConvertToORM['AvatarHeadORM']):
         )
 
 
-class AvatarHeadORM(AvatarHead, table=True):
+class AvatarHeadORM(AvatarHead, ConvertToModel['AvatarHead'], table=True):
     pass
 
 
@@ -51,7 +51,7 @@ class AvatarFrame(BaseDecoration, ConvertToORM['AvatarFrameORM']):
         )
 
 
-class AvatarFrameORM(AvatarFrame, table=True):
+class AvatarFrameORM(AvatarFrame, ConvertToModel['AvatarFrame'], table=True):
     pass
 
 
@@ -73,7 +73,9 @@ class NamecardBackground(BaseDecoration, ConvertToORM['NamecardBackgroundORM']):
         )
 
 
-class NamecardBackgroundORM(NamecardBackground, table=True):
+class NamecardBackgroundORM(
+    NamecardBackground, ConvertToModel['NamecardBackground'], table=True
+):
     pass
 
 
@@ -95,7 +97,9 @@ class NicknameBackground(BaseDecoration, ConvertToORM['NicknameBackgroundORM']):
         )
 
 
-class NicknameBackgroundORM(NicknameBackground, table=True):
+class NicknameBackgroundORM(
+    NicknameBackground, ConvertToModel['NicknameBackground'], table=True
+):
     pass
 
 
@@ -117,7 +121,9 @@ class HomepageBackground(BaseDecoration, ConvertToORM['HomepageBackgroundORM']):
         )
 
 
-class HomepageBackgroundORM(HomepageBackground, table=True):
+class HomepageBackgroundORM(
+    HomepageBackground, ConvertToModel['HomepageBackground'], table=True
+):
     pass
 
 
@@ -139,5 +145,5 @@ class Emoji(BaseDecoration, ConvertToORM['EmojiORM']):
         )
 
 
-class EmojiORM(Emoji, table=True):
+class EmojiORM(Emoji, ConvertToModel['Emoji'], table=True):
     pass
@@ -0,0 +1,438 @@
+"""比较两个版本的数据集，并以增量方式更新数据库
+
+每次游戏更新通常只改动几百个资源，重新构建整个数据库需要写入全部数据。
+``diff_datasets`` 按 ``resource_name()`` 与ID对应新旧数据集中的模型，
+以内容哈希判断是否改动，得到新增、删除与改动的资源。
+``apply_diff`` 将差异写入由旧数据集构建的数据库，并追加一行 ``ApiMetadataORM``
+记录新的版本，结果与由新数据集重新构建的数据库相同（自增ID除外）。
+
+写入时复用 ``seerapi_models.bulk`` 的展开方式：旧模型与新模型分别展开为按表分组的行，
+逐表以主键比较，只删除与写入有差异的行，链接表中的行同样按差异增删。
+由加载器分配自增ID的行（如刻印的六维属性）在新旧展开中的ID不同，
+旧的行按其所属的行在数据库中的外键查找，所属的行总是整行替换。
+``SkillEffectInUseORM`` 等按内容去重的行复用数据库中已有的行，
+这些行可能被未改动的资源共用，只有被删除的行引用过、写入后不再被任何行引用的才会删除。
+数据库中已有全文搜索使用的 FTS5 虚拟表时，参与搜索的资源改动后会重新填充该表。
+
+链接行通常在两端资源中都有记录，比较时假定两个数据集各自的两端是一致的。
+
+用法::
+
+    with Session(engine) as session:
+        diff = diff_datasets(old_models, new_models)
+        apply_diff(session, diff, metadata, from_version=old_metadata.data_version)
+        session.commit()
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+import hashlib
+from typing import Any, NamedTuple, Protocol
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    Table,
+    delete,
+    insert,
+    inspect,
+    select,
+    tuple_,
+)
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel, col
+
+from .bulk import (
+    DEFAULT_BATCH_SIZE,
+    INTERNED_MODELS,
+    BulkLoader,
+    SupportsToORM,
+    TableInfo,
+    batched,
+    closure_models,
+    get_table_info,
+    rebuild_closure_tables,
+    sorted_tables,
+)
+from .common import ResourceRef
+from .metadata import ApiMetadata, ApiMetadataORM
+from .search import SEARCH_SOURCES, SEARCH_TABLE, rebuild_search_index
+
+# 按主键删除或查找时每条语句包含的行数
+_KEY_BATCH_SIZE = 500
+
+_Key = tuple
+_Row = dict[str, object]
+
+
+class SupportsDiff(SupportsToORM, Protocol):
+    """可以比较的资源模型，即带有ID的 ConvertToORM 子类"""
+
+    id: int
+
+    @classmethod
+    def resource_name(cls) -> str: ...
+
+
+@dataclass
+class ResourceDiff:
+    """一种资源在两个数据集之间的差异，各列表按ID排列"""
+
+    resource_name: str
+    added: list[Any] = field(default_factory=list)
+    removed: list[Any] = field(default_factory=list)
+    # (旧模型, 新模型)
+    changed: list[tuple[Any, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+
+class TableChanges(NamedTuple):
+    """一张表中写入、替换与删除的行数"""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+
+def content_hash(model: SupportsDiff) -> bytes:
+    """模型内容的哈希值
+
+    在绑定空服务地址的上下文中序列化，以占位地址创建的引用只以资源路径参与计算，
+    与绑定的服务地址无关，其他字段中的文本保持原样。
+    """
+    with ResourceRef.bind_base_data_url(''):
+        data = model.model_dump_json()  # type: ignore[attr-defined]
+    return hashlib.blake2b(data.encode(), digest_size=16).digest()
+
+
+def _index(
+    models: Iterable[SupportsDiff], label: str
+) -> dict[str, dict[int, SupportsDiff]]:
+    index: dict[str, dict[int, SupportsDiff]] = {}
+    for model in models:
+        name = model.resource_name()
+        resources = index.setdefault(name, {})
+        if model.id in resources:
+            raise ValueError(f'{label}数据集中 {name} 的ID {model.id} 重复')
+        resources[model.id] = model
+    return index
+
+
+def diff_datasets(
+    old: Iterable[SupportsDiff],
+    new: Iterable[SupportsDiff],
+) -> dict[str, ResourceDiff]:
+    """按资源名称与ID比较两个数据集
+
+    Args:
+                old: 旧数据集中的模型
+                new: 新数据集中的模型
+
+    Returns:
+            {资源名称: 差异}，只包含有差异的资源
+
+    Raises:
+            ValueError: 同一数据集中存在资源名称与ID都相同的模型
+
+    """
+    old_index = _index(old, '旧')
+    new_index = _index(new, '新')
+    diffs: dict[str, ResourceDiff] = {}
+    for name in sorted(old_index.keys() | new_index.keys()):
+        before = old_index.get(name, {})
+        after = new_index.get(name, {})
+        diff = ResourceDiff(name)
+        for id in sorted(before.keys() | after.keys()):
+            if id not in before:
+                diff.added.append(after[id])
+            elif id not in after:
+                diff.removed.append(before[id])
+            elif content_hash(before[id]) != content_hash(after[id]):
+                diff.changed.append((before[id], after[id]))
+        if diff:
+            diffs[name] = diff
+    return diffs
+
+
+def latest_metadata(bind: Session | Connection) -> ApiMetadata | None:
+    """数据库中最新（最后写入）的元数据"""
+    connection = bind.connection() if isinstance(bind, Session) else bind
+    statement = select(ApiMetadataORM).order_by(col(ApiMetadataORM.id).desc())
+    row = connection.execute(statement.limit(1)).mappings().first()
+    if row is None:
+        return None
+    return ApiMetadata.model_validate(dict(row))
+
+
+_table_infos: dict[Table, TableInfo] = {}
+
+
+def _table_info(table: Table) -> TableInfo:
+    if not _table_infos:
+        for mapper in SQLModel._sa_registry.mappers:
+            info = get_table_info(mapper.class_)
+            _table_infos[info.table] = info
+    return _table_infos[table]
+
+
+def _primary_key(table: Table) -> tuple[str, ...]:
+    return tuple(column.key for column in table.primary_key)
+
+
+def _key_filter(table: Table, columns: tuple[str, ...], keys: list[_Key]) -> Any:
+    if len(columns) == 1:
+        return table.c[columns[0]].in_([key[0] for key in keys])
+    return tuple_(*(table.c[column] for column in columns)).in_(keys)
+
+
+def _generated_keys(
+    connection: Connection,
+    rows: Mapping[Table, Iterable[_Key]],
+    generated: set[Table],
+) -> dict[Table, set[_Key]]:
+    """由数据库中的外键查找 rows 所属的、由加载器分配自增ID的行的主键"""
+    found: dict[Table, set[_Key]] = {}
+    pending = {table: list(keys) for table, keys in rows.items()}
+    while pending:
+        table, keys = pending.popitem()
+        info = _table_info(table)
+        targets: dict[Table, set[_Key]] = {}
+        for relation in info.many_to_one:
+            if relation.target not in generated:
+                continue
+            # 外键在本表中
+            columns = [table.c[dest] for _, dest in relation.sync]
+            for batch in batched(keys, _KEY_BATCH_SIZE):
+                statement = select(*columns).where(
+                    _key_filter(table, info.primary_key, batch)
+                )
+                targets.setdefault(relation.target, set()).update(
+                    tuple(value)
+                    for value in connection.execute(statement)
+                    if None not in value
+                )
+        for relation in info.one_to_many:
+            if relation.target not in generated:
+                continue
+            # 外键在关联的表中
+            target = _table_info(relation.target)
+            sources = tuple(source for source, _ in relation.sync)
+            positions = [info.primary_key.index(source) for source in sources]
+            values = list({tuple(key[i] for i in positions) for key in keys})
+            foreign = tuple(dest for _, dest in relation.sync)
+            for batch in batched(values, _KEY_BATCH_SIZE):
+                statement = select(
+                    *(relation.target.c[column] for column in target.primary_key)
+                ).where(_key_filter(relation.target, foreign, batch))
+                targets.setdefault(relation.target, set()).update(
+                    tuple(value) for value in connection.execute(statement)
+                )
+        for target, target_keys in targets.items():
+            new_keys = target_keys - found.setdefault(target, set())
+            if new_keys:
+                found[target] |= new_keys
+                pending.setdefault(target, []).extend(new_keys)
+    return found
+
+
+def _interned_references(
+    interned: Iterable[Table],
+) -> dict[Table, list[tuple[Table, Column]]]:
+    """去重表 -> 引用它的 (表, 外键列)"""
+    references: dict[Table, list[tuple[Table, Column]]] = {
+        table: [] for table in interned
+    }
+    for table in sorted_tables():
+        for foreign_key in table.foreign_keys:
+            target = foreign_key.column.table
+            if target in references:
+                references[target].append((table, foreign_key.parent))
+    return references
+
+
+def _referenced_ids(
+    connection: Connection,
+    references: Mapping[Table, list[tuple[Table, Column]]],
+    deletions: Mapping[Table, list[_Key]],
+) -> dict[Table, set[Any]]:
+    """即将删除的行所引用的去重行ID"""
+    found: dict[Table, set[Any]] = {}
+    for target, sources in references.items():
+        for table, column in sources:
+            keys = deletions.get(table)
+            if not keys:
+                continue
+            primary_key = _primary_key(table)
+            for batch in batched(keys, _KEY_BATCH_SIZE):
+                statement = select(column).where(
+                    _key_filter(table, primary_key, batch), column.is_not(None)
+                )
+                found.setdefault(target, set()).update(
+                    connection.execute(statement).scalars()
+                )
+    return found
+
+
+def _delete_unreferenced(
+    connection: Connection,
+    table: Table,
+    sources: list[tuple[Table, Column]],
+    ids: set[Any],
+) -> int:
+    """删除 ids 中不再被任何行引用的去重行，返回删除的行数"""
+    (id_column,) = table.primary_key
+    deleted = 0
+    for batch in batched(sorted(ids), _KEY_BATCH_SIZE):
+        unused = set(batch)
+        for source, column in sources:
+            unused.difference_update(
+                connection.execute(
+                    select(column).distinct().where(column.in_(unused))
+                ).scalars()
+            )
+            if not unused:
+                break
+        if unused:
+            connection.execute(delete(table).where(id_column.in_(unused)))
+            deleted += len(unused)
+    return deleted
+
+
+def apply_diff(
+    bind: Session | Connection,
+    diff: Mapping[str, ResourceDiff],
+    metadata: ApiMetadata,
+    *,
+    from_version: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[str, TableChanges]:
+    """将 diff_datasets 得到的差异写入数据库，并追加一行元数据，不会提交事务
+
+    Args:
+                bind: 使用的 Session 或 Connection
+                diff: diff_datasets 的结果，旧数据集需要与数据库中的数据一致
+                metadata: 新数据集的元数据
+                from_version: 数据库当前的 data_version，不为 None 时写入前检查
+                batch_size: 每批写入的最大行数
+
+    Returns:
+            各表的改动行数，只包含有改动的表，不包括重新填充的全文搜索表
+
+    Raises:
+            ValueError: 数据库当前的 data_version 与 from_version 不同
+
+    """
+    connection = bind.connection() if isinstance(bind, Session) else bind
+    if from_version is not None:
+        current = latest_metadata(connection)
+        if current is None or current.data_version != from_version:
+            version = current.data_version if current is not None else None
+            raise ValueError(
+                f'数据库的数据版本为 {version!r}，与 from_version {from_version!r} 不同'
+            )
+
+    old_loader = BulkLoader(connection, batch_size=batch_size, reuse_interned=True)
+    new_loader = BulkLoader(connection, batch_size=batch_size, reuse_interned=True)
+    for resource in diff.values():
+        old_loader.add_all(resource.removed)
+        old_loader.add_all(old for old, _ in resource.changed)
+        new_loader.add_all(resource.added)
+        new_loader.add_all(new for _, new in resource.changed)
+    new_loader.add(metadata)
+    old_rows = old_loader.take_rows()
+    new_rows = new_loader.take_rows()
+    generated = old_loader.generated_tables | new_loader.generated_tables
+    interned = {get_table_info(model).table for model in INTERNED_MODELS}
+
+    # 旧展开中自动分配的ID没有意义，改为由所属的行在数据库中查找
+    owners = {
+        table: rows.keys()
+        for table, rows in old_rows.items()
+        if table not in generated and table not in interned
+    }
+    stale = _generated_keys(connection, owners, generated)
+    references = _interned_references(interned)
+
+    changes: dict[str, TableChanges] = {}
+    deletions: dict[Table, list[_Key]] = {}
+    insertions: dict[Table, list[_Row]] = {}
+    for table in sorted_tables():
+        # 去重的行在旧展开中只会是数据库中没有的行，不需要删除
+        before = old_rows.get(table, {}) if table not in interned else {}
+        after = new_rows.get(table, {})
+        if not before and not after and table not in stale:
+            continue
+        if table in generated:
+            removed = stale.get(table, set())
+            deletions[table] = list(removed)
+            insertions[table] = list(after.values())
+            updated = 0
+        else:
+            info = _table_info(table)
+            # 引用了自动分配ID的行的外键在新旧展开中不同，总是整行替换
+            replace = any(relation.target in generated for relation in info.many_to_one)
+            changed = [
+                key
+                for key in before.keys() & after.keys()
+                if replace or before[key] != after[key]
+            ]
+            removed = before.keys() - after.keys()
+            added = after.keys() - before.keys()
+            # 新增的行同样先按主键删除，链接行可能已由未改动的另一端写入
+            deletions[table] = [*removed, *changed, *added]
+            insertions[table] = [after[key] for key in (*changed, *added)]
+            updated = len(changed)
+        if removed or insertions[table]:
+            changes[table.name] = TableChanges(
+                inserted=len(insertions[table]) - updated,
+                updated=updated,
+                deleted=len(removed),
+            )
+
+    # 删除前记录被删除的行引用的去重行，写入完成后再检查是否仍被引用
+    orphans = _referenced_ids(connection, references, deletions)
+    for table in reversed(sorted_tables()):
+        keys = deletions.get(table)
+        if not keys:
+            continue
+        primary_key = _primary_key(table)
+        for batch in batched(keys, _KEY_BATCH_SIZE):
+            connection.execute(
+                delete(table).where(_key_filter(table, primary_key, batch))
+            )
+    for table in sorted_tables():
+        rows = insertions.get(table)
+        if not rows:
+            continue
+        statement = insert(table)
+        for batch in batched(rows, batch_size):
+            connection.execute(statement, batch)
+    for table, ids in orphans.items():
+        deleted = _delete_unreferenced(connection, table, references[table], ids)
+        if deleted:
+            inserted, updated, _ = changes.get(table.name, TableChanges())
+            changes[table.name] = TableChanges(inserted, updated, deleted)
+
+    stale_closures = [
+        model for model in closure_models() if model.__closure_of__[0] in changes
+    ]
+    if stale_closures:
+        rebuild_closure_tables(connection, stale_closures)
+    # FTS5 虚拟表不会随资源表更新，只重建已经创建过的表
+    searched = {source.model.resource_name() for source in SEARCH_SOURCES}
+    if not searched.isdisjoint(changes) and inspect(connection).has_table(SEARCH_TABLE):
+        rebuild_search_index(connection)
+    return changes
+
+
+__all__ = [
+    'ResourceDiff',
+    'SupportsDiff',
+    'TableChanges',
+    'apply_diff',
+    'content_hash',
+    'diff_datasets',
+    'latest_metadata',
+]
@@ -2,7 +2,12 @@ from typing import ClassVar
 
 from sqlmodel import Field, Relationship
 
-from seerapi_models.build_model import BaseCategoryModel, BaseResModel, ConvertToORM
+from seerapi_models.build_model import (
+    BaseCategoryModel,
+    BaseResModel,
+    ConvertToModel,
+    ConvertToORM,
+)
 from seerapi_models.common import (
     EidEffectInUse,
     EidEffectInUseORM,
@@ -27,6 +32,7 @@ class EffectSeDataORM(EffectSeDataBase):
     effect_in_use_id: int | None = Field(
         default=None, foreign_key='eid_effect_in_use.id'
     )
+    effect_alias: str = Field(description='效果别名')
 
 
 class VariationEffectBase(BaseResModel):
@@ -50,10 +56,13 @@ class VariationEffect(
             name=self.name,
             desc=self.desc,
             effect_in_use=self.effect.to_orm(),
+            effect_alias=self.effect_alias,
         )
 
 
-class VariationEffectORM(VariationEffectBase, EffectSeDataORM, table=True):
+class VariationEffectORM(
+    VariationEffectBase, EffectSeDataORM, ConvertToModel['VariationEffect'], table=True
+):
     effect_in_use: 'EidEffectInUseORM' = Relationship(
         back_populates='variation_effect',
     )
@@ -82,12 +91,15 @@ class PetEffect(PetEffectBase, EffectSeData, ConvertToORM['PetEffectORM']):
             name=self.name,
             desc=self.desc,
             effect_in_use=self.effect.to_orm(),
+            effect_alias=self.effect_alias,
             star_level=self.star_level,
             effect_group_id=self.effect_group.id,
         )
 
 
-class PetEffectORM(PetEffectBase, EffectSeDataORM, table=True):
+class PetEffectORM(
+    PetEffectBase, EffectSeDataORM, ConvertToModel['PetEffect'], table=True
+):
     effect_in_use: 'EidEffectInUseORM' = Relationship(
         back_populates='pet_effect',
     )
@@ -104,6 +116,10 @@ class PetEffectGroupBase(BaseCategoryModel):
 
 
 class PetEffectGroup(PetEffectGroupBase, ConvertToORM['PetEffectGroupORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'effect': ('pet_effect', 'effect_group')
+    }
+
     effect: list[ResourceRef[PetEffect]] = Field(
         default_factory=list, description='特性列表'
     )
@@ -119,7 +135,9 @@ class PetEffectGroup(PetEffectGroupBase, ConvertToORM['PetEffectGroupORM']):
         )
 
 
-class PetEffectGroupORM(PetEffectGroupBase, table=True):
+class PetEffectGroupORM(
+    PetEffectGroupBase, ConvertToModel['PetEffectGroup'], table=True
+):
     effect: list['PetEffectORM'] = Relationship(
         back_populates='effect_group',
     )
@@ -1,9 +1,9 @@
 from typing import TYPE_CHECKING
 
 from pydantic import computed_field
-from sqlmodel import Boolean, Column, Computed, Field, Relationship
+from sqlmodel import Boolean, Column, Computed, Field, Relationship, SQLModel
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 from seerapi_models.common import ResourceRef
 
 if TYPE_CHECKING:
@@ -32,7 +32,7 @@ class ElementType(BaseResModel, ConvertToORM['ElementTypeORM']):
         )
 
 
-class ElementTypeORM(ElementType, table=True):
+class ElementTypeORM(ElementType, ConvertToModel['ElementType'], table=True):
     primary_combination: list['TypeCombinationORM'] = Relationship(
         back_populates='primary',
         sa_relationship_kwargs={
@@ -83,7 +83,9 @@ class TypeCombination(TypeCombinationBase, ConvertToORM['TypeCombinationORM']):
         )
 
 
-class TypeCombinationORM(TypeCombinationBase, table=True):
+class TypeCombinationORM(
+    TypeCombinationBase, ConvertToModel['TypeCombination'], table=True
+):
     primary_id: int = Field(foreign_key='element_type.id')
     primary: 'ElementTypeORM' = Relationship(
         back_populates='primary_combination',
@@ -116,3 +118,63 @@ class TypeCombinationORM(TypeCombinationBase, table=True):
     skill_stone_category: list['SkillStoneCategoryORM'] = Relationship(
         back_populates='type',
     )
+
+
+class TypeEffectivenessBase(BaseResModel):
+    id: int = Field(
+        primary_key=True,
+        foreign_key='element_type_combination.id',
+        description='攻击方的属性组合ID',
+    )
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'element_type_effectiveness'
+
+
+class TypeEffectiveness(TypeEffectivenessBase, ConvertToORM['TypeEffectivenessORM']):
+    """一个属性组合作为攻击方时，对各属性组合的克制系数
+
+    完整的克制矩阵见 seerapi_models.type_chart.TypeEffectivenessMatrix。
+    """
+
+    multipliers: dict[int, float] = Field(
+        default_factory=dict,
+        description='防守方属性组合ID到克制系数的映射，系数为1的组合被省略',
+    )
+
+    @classmethod
+    def get_orm_model(cls) -> type['TypeEffectivenessORM']:
+        return TypeEffectivenessORM
+
+    def to_orm(self) -> 'TypeEffectivenessORM':
+        return TypeEffectivenessORM(
+            id=self.id,
+            entry=[
+                TypeEffectivenessEntryORM(
+                    attacker_id=self.id, defender_id=defender_id, multiplier=multiplier
+                )
+                for defender_id, multiplier in self.multipliers.items()
+            ],
+        )
+
+
+class TypeEffectivenessORM(
+    TypeEffectivenessBase, ConvertToModel['TypeEffectiveness'], table=True
+):
+    entry: list['TypeEffectivenessEntryORM'] = Relationship(
+        back_populates='attacker',
+    )
+
+
+class TypeEffectivenessEntryORM(SQLModel, table=True):
+    __tablename__ = 'element_type_effectiveness_entry'  # type: ignore
+
+    attacker_id: int = Field(
+        primary_key=True, foreign_key='element_type_effectiveness.id'
+    )
+    attacker: TypeEffectivenessORM = Relationship(back_populates='entry')
+    defender_id: int = Field(
+        primary_key=True, foreign_key='element_type_combination.id'
+    )
+    multiplier: float = Field(description='克制系数')
@@ -1,6 +1,6 @@
 from sqlmodel import Field
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 
 
 class BaseErrorCode(BaseResModel):
@@ -25,5 +25,5 @@ class ErrorCode(BaseErrorCode, ConvertToORM['ErrorCodeORM']):
         )
 
 
-class ErrorCodeORM(BaseErrorCode, table=True):
+class ErrorCodeORM(BaseErrorCode, ConvertToModel['ErrorCode'], table=True):
     pass
@@ -0,0 +1,139 @@
+"""预先计算的精灵进化链索引
+
+查找一个精灵的完整进化链时，需要先找到它的 ``pet_class``，
+再取出 ``PetClass.evolution_chain`` 并逐个解析其中的引用；
+在 ORM 中则是每个精灵两次延迟加载。
+``EvolutionChainIndex`` 以 ``{pet_id: EvolutionEntry}`` 保存每个精灵所属的类别、
+在进化链中的位置与整条进化链（精灵ID元组，同一类别的精灵共用同一个元组），查询为 O(1)。
+
+索引可以由 API 模型构建，也可以由数据库通过一次查询构建，
+并可以序列化为 ``{class_id: [pet_id, ...]}`` 形式的 JSON，与其他数据一同导出。
+
+用法::
+
+    index = EvolutionChainIndex.from_pet_classes(pet_classes)
+    with Session(engine) as session:
+        index = EvolutionChainIndex.from_session(session)
+
+    entry = index[pet.id]
+    entry.chain  # (第一形态ID, ..., 最终形态ID)
+    Path('evolution_chain.json').write_bytes(index.to_json())
+"""
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import groupby
+from operator import itemgetter
+from typing import NamedTuple
+
+from pydantic import TypeAdapter
+from sqlmodel import Session, col, select
+
+from .pet import Pet, PetClass, PetORM
+
+_CHAINS_ADAPTER = TypeAdapter(dict[int, tuple[int, ...]])
+
+
+class EvolutionEntry(NamedTuple):
+    """精灵在进化链中的信息"""
+
+    class_id: int
+    """精灵类别ID"""
+    position: int
+    """在进化链中的位置，从0开始"""
+    chain: tuple[int, ...]
+    """整条进化链，从第一形态到最终形态的精灵ID"""
+
+
+class EvolutionChainIndex(Mapping[int, EvolutionEntry]):
+    """精灵ID到其进化链信息的只读映射
+
+    没有精灵类别的精灵不在索引中。
+    """
+
+    __slots__ = ('_chains', '_entries')
+
+    def __init__(self, chains: Mapping[int, Sequence[int]] | None = None) -> None:
+        """
+        Args:
+                chains: 精灵类别ID到进化链（按顺序排列的精灵ID）的映射，默认为空
+
+        """
+        self._chains: dict[int, tuple[int, ...]] = {}
+        self._entries: dict[int, EvolutionEntry] = {}
+        for class_id, pet_ids in (chains or {}).items():
+            chain = self._chains[class_id] = tuple(pet_ids)
+            for position, pet_id in enumerate(chain):
+                self._entries[pet_id] = EvolutionEntry(class_id, position, chain)
+
+    @classmethod
+    def from_pet_classes(cls, pet_classes: Iterable[PetClass]) -> 'EvolutionChainIndex':
+        """由 PetClass 模型构建，进化链的顺序与 evolution_chain 相同"""
+        return cls(
+            {
+                pet_class.id: [ref.id for ref in pet_class.evolution_chain]
+                for pet_class in pet_classes
+            }
+        )
+
+    @classmethod
+    def from_pets(cls, pets: Iterable[Pet]) -> 'EvolutionChainIndex':
+        """由 Pet 模型的 pet_class 与 evolution_chain_index 构建"""
+        return cls._from_rows(
+            (pet.id, pet.pet_class.id, pet.evolution_chain_index)
+            for pet in pets
+            if pet.pet_class is not None
+        )
+
+    @classmethod
+    def from_session(cls, session: Session) -> 'EvolutionChainIndex':
+        """由数据库中的精灵表构建，只执行一次查询，不加载 ORM 对象"""
+        statement = select(
+            PetORM.id, PetORM.pet_class_id, PetORM.evolution_chain_index
+        ).where(col(PetORM.pet_class_id).is_not(None))
+        return cls._from_rows(session.exec(statement))  # type: ignore[arg-type]
+
+    @classmethod
+    def _from_rows(cls, rows: Iterable[tuple[int, int, int]]) -> 'EvolutionChainIndex':
+        # (pet_id, class_id, evolution_chain_index)，按类别与位置排序后分组
+        rows = sorted(rows, key=itemgetter(1, 2, 0))
+        return cls(
+            {
+                class_id: [pet_id for pet_id, *_ in group]
+                for class_id, group in groupby(rows, key=itemgetter(1))
+            }
+        )
+
+    @property
+    def chains(self) -> Mapping[int, tuple[int, ...]]:
+        """精灵类别ID到进化链的映射"""
+        return self._chains
+
+    def chain(self, pet_id: int) -> tuple[int, ...]:
+        """精灵所在的进化链，不在索引中的精灵返回只包含自身的元组"""
+        entry = self._entries.get(pet_id)
+        return entry.chain if entry is not None else (pet_id,)
+
+    def to_json(self) -> bytes:
+        """序列化为 {class_id: [pet_id, ...]} 形式的 JSON"""
+        return _CHAINS_ADAPTER.dump_json(self._chains)
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> 'EvolutionChainIndex':
+        """由 to_json 的结果还原"""
+        return cls(_CHAINS_ADAPTER.validate_json(data))
+
+    def __getitem__(self, pet_id: int) -> EvolutionEntry:
+        return self._entries[pet_id]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self) -> tuple[type['EvolutionChainIndex'], tuple[dict]]:
+        # 只保存进化链，还原时重新展开，同一类别的精灵仍共用同一个元组
+        return type(self), (self._chains,)
+
+
+__all__ = ['EvolutionChainIndex', 'EvolutionEntry']
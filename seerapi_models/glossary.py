@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING
 
 from sqlmodel import Field, Relationship, SQLModel
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 from seerapi_models.common import ResourceRef
 
 if TYPE_CHECKING:
@@ -61,8 +61,20 @@ class GlossaryEntry(GlossaryEntryBase, ConvertToORM['GlossaryEntryORM']):
             kind=self.kind,
         )
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return [
+            *(
+                GlossaryEntryLink(source_id=self.id, target_id=entry.id)
+                for entry in self.link or []
+            ),
+            *(
+                PetGlossaryEntryLink(pet_id=pet.id, glossary_entry_id=self.id)
+                for pet in self.pet or []
+            ),
+        ]
 
-class GlossaryEntryORM(GlossaryEntryBase, table=True):
+
+class GlossaryEntryORM(GlossaryEntryBase, ConvertToModel['GlossaryEntry'], table=True):
     link: list['GlossaryEntryORM'] = Relationship(
         link_model=GlossaryEntryLink,
         sa_relationship_kwargs={
@@ -1,42 +1,76 @@
-from ._common import Item, ItemCategory, ItemCategoryORM, ItemORM
-from .enegry_bead import EnergyBead, EnergyBeadBuffAttrORM, EnergyBeadORM
-from .equip import (
-    Equip,
-    EquipBonus,
-    EquipBonusAttrORM,
-    EquipBonusORM,
-    EquipEffectiveOccasion,
-    EquipEffectiveOccasionORM,
-    EquipORM,
-    EquipType,
-    EquipTypeORM,
-    Suit,
-    SuitBonus,
-    SuitBonusAttrORM,
-    SuitBonusORM,
-    SuitORM,
-)
-from .mintmark_gem import (
-    Gem,
-    GemCategory,
-    GemCategoryORM,
-    GemGen1,
-    GemGen1PartORM,
-    GemGen2,
-    GemGen2PartORM,
-    GemGenCategory,
-    GemGenCategoryORM,
-    GemORM,
-)
-from .skill_activation_item import SkillActivationItem, SkillActivationItemORM
-from .skill_stone import (
-    SkillStone,
-    SkillStoneCategory,
-    SkillStoneCategoryORM,
-    SkillStoneEffect,
-    SkillStoneEffectORM,
-    SkillStoneORM,
-)
+from typing import TYPE_CHECKING
+
+from .._lazy import LAZY_IMPORT, import_exports, lazy_exports
+
+if TYPE_CHECKING:
+    # 仅供类型检查器解析名称，运行时按下方的映射表导入
+    from ._common import *  # noqa: F403
+    from .enegry_bead import *  # noqa: F403
+    from .equip import *  # noqa: F403
+    from .mintmark_gem import *  # noqa: F403
+    from .skill_activation_item import *  # noqa: F403
+    from .skill_stone import *  # noqa: F403
+
+# 名称到其所在子模块的映射，按需导入与立即导入都据此导入，须与 __all__ 保持一致
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    '._common': (
+        'Item',
+        'ItemCategory',
+        'ItemCategoryORM',
+        'ItemORM',
+    ),
+    '.enegry_bead': (
+        'EnergyBead',
+        'EnergyBeadBuffAttrORM',
+        'EnergyBeadORM',
+    ),
+    '.equip': (
+        'Equip',
+        'EquipBonus',
+        'EquipBonusAttrORM',
+        'EquipBonusORM',
+        'EquipEffectiveOccasion',
+        'EquipEffectiveOccasionORM',
+        'EquipORM',
+        'EquipType',
+        'EquipTypeORM',
+        'Suit',
+        'SuitBonus',
+        'SuitBonusAttrORM',
+        'SuitBonusORM',
+        'SuitORM',
+    ),
+    '.mintmark_gem': (
+        'Gem',
+        'GemCategory',
+        'GemCategoryORM',
+        'GemGen1',
+        'GemGen1PartORM',
+        'GemGen2',
+        'GemGen2PartORM',
+        'GemGenCategory',
+        'GemGenCategoryORM',
+        'GemORM',
+    ),
+    '.skill_activation_item': (
+        'SkillActivationItem',
+        'SkillActivationItemORM',
+    ),
+    '.skill_stone': (
+        'SkillStone',
+        'SkillStoneCategory',
+        'SkillStoneCategoryORM',
+        'SkillStoneEffect',
+        'SkillStoneEffectORM',
+        'SkillStoneORM',
+    ),
+}
+
+if not TYPE_CHECKING:
+    if LAZY_IMPORT:
+        __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+    else:
+        import_exports(__name__, _EXPORTS)
 
 __all__ = [
     'EnergyBead',
@@ -61,7 +95,6 @@ __all__ = [
     'GemGenCategory',
     'GemGenCategoryORM',
     'GemORM',
-    'GemORM',
     'Item',
     'ItemCategory',
     'ItemCategoryORM',
@@ -1,8 +1,13 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, ClassVar, Optional
 
 from sqlmodel import Field, Relationship
 
-from seerapi_models.build_model import BaseCategoryModel, BaseResModel, ConvertToORM
+from seerapi_models.build_model import (
+    BaseCategoryModel,
+    BaseResModel,
+    ConvertToModel,
+    ConvertToORM,
+)
 from seerapi_models.common import ResourceRef
 
 if TYPE_CHECKING:
@@ -42,7 +47,7 @@ class Item(ItemBase, ConvertToORM['ItemORM']):
         )
 
 
-class ItemORM(ItemBase, table=True):
+class ItemORM(ItemBase, ConvertToModel['Item'], table=True):
     skill_stone: Optional['SkillStoneORM'] = Relationship(
         back_populates='item',
     )
@@ -75,6 +80,8 @@ class ItemCategoryBase(BaseCategoryModel):
 
 
 class ItemCategory(ItemCategoryBase, ConvertToORM['ItemCategoryORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'item': ('item', 'category')}
+
     item: list[ResourceRef['Item']] = Field(
         default_factory=list, description='该分类下的所有物品'
     )
@@ -91,5 +98,5 @@ class ItemCategory(ItemCategoryBase, ConvertToORM['ItemCategoryORM']):
         )
 
 
-class ItemCategoryORM(ItemCategoryBase, table=True):
+class ItemCategoryORM(ItemCategoryBase, ConvertToModel['ItemCategory'], table=True):
     item: list['ItemORM'] = Relationship(back_populates='category')
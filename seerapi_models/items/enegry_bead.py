@@ -2,7 +2,7 @@ from typing import Optional
 
 from sqlmodel import Field, Relationship
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 from seerapi_models.common import (
     EidEffectInUse,
     EidEffectInUseORM,
@@ -53,7 +53,7 @@ class EnergyBead(EnergyBeadBase, ConvertToORM['EnergyBeadORM']):
         )
 
 
-class EnergyBeadORM(EnergyBeadBase, table=True):
+class EnergyBeadORM(EnergyBeadBase, ConvertToModel['EnergyBead'], table=True):
     effect_in_use: 'EidEffectInUseORM' = Relationship(
         back_populates='energy_bead',
         sa_relationship_kwargs={
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, ClassVar, Optional
 from typing_extensions import Self
 
 from pydantic import BaseModel
@@ -8,6 +8,7 @@ from seerapi_models.build_model import (
     BaseCategoryModel,
     BaseResModel,
     BaseResModelWithOptionalId,
+    ConvertToModel,
     ConvertToORM,
 )
 from seerapi_models.common import (
@@ -123,7 +124,7 @@ class EquipBonus(EquipBonusBase, EquipEffect, ConvertToORM['EquipBonusORM']):
         )
 
 
-class EquipBonusORM(EquipBonusBase, table=True):
+class EquipBonusORM(EquipBonusBase, ConvertToModel['EquipBonus'], table=True):
     equip: 'EquipORM' = Relationship(
         back_populates='bonus',
     )
@@ -184,8 +185,14 @@ class SuitBonus(SuitBonusBase, EquipEffect, ConvertToORM['SuitBonusORM']):
             else None,
         )
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return [
+            PetSuitLink(pet_id=pet.id, suit_id=self.id)
+            for pet in self.effective_pets or []
+        ]
 
-class SuitBonusORM(SuitBonusBase, table=True):
+
+class SuitBonusORM(SuitBonusBase, ConvertToModel['SuitBonus'], table=True):
     suit: 'SuitORM' = Relationship(
         back_populates='bonus',
     )
@@ -222,6 +229,8 @@ class SuitBase(BaseResModel):
 
 
 class Suit(SuitBase, ConvertToORM['SuitORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'equips': ('equip', 'suit')}
+
     equips: list[ResourceRef['Equip']] = Field(
         default_factory=list, description='部件列表'
     )
@@ -243,8 +252,11 @@ class Suit(SuitBase, ConvertToORM['SuitORM']):
             bonus=self.bonus.to_orm() if self.bonus else None,
         )
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return self.bonus.to_orm_links() if self.bonus else []
 
-class SuitORM(SuitBase, table=True):
+
+class SuitORM(SuitBase, ConvertToModel['Suit'], table=True):
     equips: list['EquipORM'] = Relationship(
         back_populates='suit',
     )
@@ -300,7 +312,7 @@ class Equip(EquipBase, ConvertToORM['EquipORM']):
         )
 
 
-class EquipORM(EquipBase, table=True):
+class EquipORM(EquipBase, ConvertToModel['Equip'], table=True):
     part_type_id: int = Field(foreign_key='equip_type.id')
     part_type: 'EquipTypeORM' = Relationship(
         back_populates='equip',
@@ -349,7 +361,7 @@ class EquipType(EquipTypeBase, ConvertToORM['EquipTypeORM']):
         )
 
 
-class EquipTypeORM(EquipTypeBase, table=True):
+class EquipTypeORM(EquipTypeBase, ConvertToModel['EquipType'], table=True):
     equip: list['EquipORM'] = Relationship(
         back_populates='part_type',
     )
@@ -379,5 +391,7 @@ class EquipEffectiveOccasion(
         )
 
 
-class EquipEffectiveOccasionORM(EquipEffectiveOccasionBase, table=True):
+class EquipEffectiveOccasionORM(
+    EquipEffectiveOccasionBase, ConvertToModel['EquipEffectiveOccasion'], table=True
+):
     equip: list['EquipORM'] = Relationship(back_populates='occasion')
@@ -1,8 +1,14 @@
-from typing import Optional, cast
+from typing import ClassVar, Optional, cast
 
 from sqlmodel import Field, Relationship, SQLModel
 
-from seerapi_models.build_model import BaseCategoryModel, BaseResModel, ConvertToORM
+from seerapi_models.build_model import (
+    BaseCategoryModel,
+    BaseClosureModel,
+    BaseResModel,
+    ConvertToModel,
+    ConvertToORM,
+)
 from seerapi_models.common import ResourceRef, SkillEffectInUse, SkillEffectInUseORM
 from seerapi_models.items import Item, ItemORM
 
@@ -14,6 +20,15 @@ class GemEffectLink(SQLModel, table=True):
     )
 
 
+class GemLevelClosure(BaseClosureModel, table=True):
+    """宝石等级链的闭包表，ancestor 为等级较低的宝石"""
+
+    __closure_of__: ClassVar[tuple[str, str]] = ('gem', 'next_level_gem_id')
+
+    ancestor_id: int = Field(primary_key=True, foreign_key='gem.id')
+    descendant_id: int = Field(primary_key=True, foreign_key='gem.id', index=True)
+
+
 class GemBase(BaseResModel):
     id: int = Field(primary_key=True, foreign_key='item.id', description='宝石ID')
     name: str = Field(description='宝石名称')
@@ -133,7 +148,7 @@ class GemGen2(GemBase, GemResRefs):
         return 'gem_gen2'
 
 
-class GemORM(GemBase, table=True):
+class GemORM(GemBase, ConvertToModel['Gem'], table=True):
     prev_level_gem: Optional['GemORM'] = Relationship(
         back_populates='next_level_gem',
         sa_relationship_kwargs={
@@ -249,7 +264,7 @@ class GemCategory(GemCategoryBase, ConvertToORM['GemCategoryORM']):
         )
 
 
-class GemCategoryORM(GemCategoryBase, table=True):
+class GemCategoryORM(GemCategoryBase, ConvertToModel['GemCategory'], table=True):
     gem: list['GemORM'] = Relationship(
         back_populates='category',
     )
@@ -279,13 +294,15 @@ class GemGenCategory(GemGenCategoryBase, ConvertToORM['GemGenCategoryORM']):
         )
 
 
-class GemGenCategoryORM(GemGenCategoryBase, table=True):
+class GemGenCategoryORM(
+    GemGenCategoryBase, ConvertToModel['GemGenCategory'], table=True
+):
     gem: list['GemORM'] = Relationship(
         back_populates='generation',
         sa_relationship_kwargs={
             'primaryjoin': 'GemORM.generation_id == GemGenCategoryORM.id',
         },
     )
-    category: 'GemCategoryORM' = Relationship(
+    category: list['GemCategoryORM'] = Relationship(
         back_populates='generation',
     )
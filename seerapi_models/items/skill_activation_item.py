@@ -1,6 +1,6 @@
 from sqlmodel import Field, Relationship
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 from seerapi_models.common import ResourceRef
 from seerapi_models.pet import Pet, SkillInPetORM
 from seerapi_models.skill import Skill
@@ -39,6 +39,8 @@ class SkillActivationItem(
         )
 
 
-class SkillActivationItemORM(SkillActivationItemBase, table=True):
+class SkillActivationItemORM(
+    SkillActivationItemBase, ConvertToModel['SkillActivationItem'], table=True
+):
     item: 'ItemORM' = Relationship(back_populates='skill_activation_item')
     skill_in_pet: 'SkillInPetORM' = Relationship(back_populates='skill_activation_item')
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -6,6 +6,7 @@ from seerapi_models.build_model import (
     BaseCategoryModel,
     BaseResModel,
     BaseResModelWithOptionalId,
+    ConvertToModel,
     ConvertToORM,
 )
 from seerapi_models.common import ResourceRef, SkillEffectInUse, SkillEffectInUseORM
@@ -97,7 +98,7 @@ class SkillStone(SkillStoneBase, ConvertToORM['SkillStoneORM']):
         )
 
 
-class SkillStoneORM(SkillStoneBase, table=True):
+class SkillStoneORM(SkillStoneBase, ConvertToModel['SkillStone'], table=True):
     category_id: int = Field(
         description='技能石分类ID', foreign_key='skill_stone_category.id'
     )
@@ -122,6 +123,10 @@ class SkillStoneCategoryBase(BaseCategoryModel):
 
 
 class SkillStoneCategory(SkillStoneCategoryBase, ConvertToORM['SkillStoneCategoryORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'skill_stone': ('skill_stone', 'category')
+    }
+
     skill_stone: list[ResourceRef['SkillStone']] = Field(
         default_factory=list,
         description='技能石列表',
@@ -140,7 +145,9 @@ class SkillStoneCategory(SkillStoneCategoryBase, ConvertToORM['SkillStoneCategor
         )
 
 
-class SkillStoneCategoryORM(SkillStoneCategoryBase, table=True):
+class SkillStoneCategoryORM(
+    SkillStoneCategoryBase, ConvertToModel['SkillStoneCategory'], table=True
+):
     type_id: int = Field(
         description='技能石类型ID', foreign_key='element_type_combination.id'
     )
@@ -0,0 +1,552 @@
+"""由 ORM 模型还原 API 模型，并一次性预加载需要的关系
+
+由 ``PetORM`` 还原 ``Pet`` 需要访问种族值、学习力、技能、魂印、图鉴等十余个关系，
+逐个访问时每只精灵的每个关系都会触发一次延迟加载（N+1 查询）。
+``loader_options`` 为每种资源给出预加载选项：一对一的关系以 ``joinedload``
+并入主查询，集合关系以 ``selectinload`` 按 ``IN`` 批量查询，
+查询数量只取决于资源的关系结构，与行数无关（``selectinload`` 每 500 个ID分为一批）。
+``from_orm``（即 ORM 模型的 ``to_model`` 方法）按同样的关系结构还原 API 模型，
+两者由同一份转换方案生成。
+
+转换方案在每种模型首次还原时编译为逐字段的读取函数，之后每行只需依次调用。
+``ResourceRef`` 字段由按 (引用类型, 资源名称) 预先生成的工厂创建，
+工厂以ID缓存引用实例，服务地址改变时重新生成；
+字段值已经是对应的类型，直接交给模型的校验器，不经过 SQLModel 的 ``model_validate``。
+
+转换方案由字段与 ORM 模型的列、关系按名称对应推导：
+
+* 普通字段读取同名的列；
+* ``ResourceRef`` 字段读取同名关系的外键列，无需加载关联的行；
+* ``list[ResourceRef]`` 字段读取同名集合关系中各行的ID，按ID排列；
+* ``SixAttributes`` 与嵌套模型字段由同名关系中的行转换得到。
+
+名称无法对应的字段（如 ``Mintmark`` 中分别保存在 ``ability_part``、``skill_part``、
+``universal_part`` 中的属性）在 ``_FIELDS`` 中单独给出读取方式。
+链接表不保存顺序，嵌套模型的列表按加载顺序（通常为写入顺序）排列；
+集合关系中只能加载到数据库中存在的行，引用了不存在的资源时该引用会被忽略；
+``Achievement.attr_bonus`` 只能随称号保存，没有称号的成就无法还原该字段。
+
+用法::
+
+    with Session(engine) as session:
+        pets = load_models(session, Pet)
+
+        # 或自行组合查询
+        rows = session.exec(select(PetORM).options(*loader_options(Pet)))
+        pets = [from_orm(row) for row in rows]
+"""
+
+from collections.abc import Callable, Iterable
+from functools import partial
+from operator import attrgetter
+import types
+from typing import Any, Generic, NamedTuple, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import (
+    Mapper,
+    RelationshipDirection,
+    RelationshipProperty,
+    Session,
+    joinedload,
+    selectinload,
+)
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlmodel import SQLModel, col, select
+
+from ._lazy import load_all
+from .achievement import Achievement
+from .build_model import ConvertToORM
+from .common import ResourceRef, SixAttributes
+from .effect import PetEffect, VariationEffect
+from .element_type import TypeEffectiveness
+from .items.enegry_bead import EnergyBead
+from .items.equip import Equip, EquipBonus, OtherAttribute, PkAttribute, SuitBonus
+from .items.mintmark_gem import Gem, GemGenCategory
+from .items.skill_activation_item import SkillActivationItem
+from .items.skill_stone import SkillStoneEffect, SkillStoneEffectORM
+from .mintmark import Mintmark, MintmarkClassCategory, SkillMintmarkEffect
+from .pet.pet import DiyStatsRange, DiyStatsRangeORM, Pet, SkillInPet, SkillInPetORM
+from .pet.soulmark import Soulmark
+from .skill import Skill, SkillEffectType
+
+_TModel = TypeVar('_TModel', bound=BaseModel)
+
+# (ORM 行, 字段的 ResourceRef 类型) -> 字段值
+_Convert = Callable[[Any, type[ResourceRef]], Any]
+_TRef = TypeVar('_TRef', bound=ResourceRef)
+# 需要预加载的关系，{关系名: 子关系}
+_LoadTree = dict[str, '_LoadTree']
+
+
+class _Path(NamedTuple):
+    """从以 . 分隔的关系路径末端的列或关系读取字段，路径中途为 None 时字段为 None"""
+
+    path: str
+
+
+class _RefFactory(Generic[_TRef]):
+    """按ID创建同一资源的引用
+
+    引用实例按ID缓存在字典中，比每次经过 from_res_name 的 lru_cache 更快，
+    服务地址改变时清空缓存，保证与 from_res_name 创建的实例相同。
+    """
+
+    def __init__(self, ref: type[_TRef], resource_name: str) -> None:
+        self._ref = ref
+        self._resource_name = resource_name
+        self._base_data_url = ''
+        self._refs: dict[int, _TRef] = {}
+
+    def __call__(self, id: int) -> _TRef:
+        base_data_url = self._ref.current_base_data_url()
+        if base_data_url != self._base_data_url:
+            self._base_data_url = base_data_url
+            self._refs = {}
+        ref = self._refs.get(id)
+        if ref is None:
+            ref = self._refs[id] = self._ref.from_res_name(id, self._resource_name)
+        return ref
+
+
+_ref_factories: dict[tuple[type, str], _RefFactory] = {}
+
+
+def _ref_factory(ref: type[_TRef], resource_name: str) -> _RefFactory[_TRef]:
+    factory = _ref_factories.get((ref, resource_name))
+    if factory is None:
+        factory = _ref_factories[ref, resource_name] = _RefFactory(ref, resource_name)
+    return factory
+
+
+class _Custom(NamedTuple):
+    """自定义读取方式，load 为需要预加载的关系路径"""
+
+    convert: _Convert
+    load: tuple[str, ...] = ()
+
+
+def _max_attr_value(orm: Any, _: type[ResourceRef]) -> SixAttributes | None:
+    part = orm.ability_part or orm.universal_part
+    return part.max_attr_value.to_model() if part is not None else None
+
+
+def _skill_mintmark_effect(orm: Any, _: type[ResourceRef]) -> Any:
+    part = orm.skill_part
+    if part is None:
+        return None
+    return SkillMintmarkEffect(effect=part.effect, arg=part.arg)
+
+
+def _fail_compensate_range(orm: Any, _: type[ResourceRef]) -> Any:
+    part = orm.gen1_part
+    if part is None:
+        return None
+    return (part.fail_compensate_level_start, part.fail_compensate_level_end)
+
+
+def _pk_attribute(orm: Any, _: type[ResourceRef]) -> PkAttribute | None:
+    if orm.pk_hp is None:
+        return None
+    return PkAttribute(
+        pk_hp=orm.pk_hp, pk_atk=orm.pk_atk, pk_fire_range=orm.pk_fire_range
+    )
+
+
+def _other_attribute(orm: Any, _: type[ResourceRef]) -> OtherAttribute | None:
+    if orm.hit_rate is None:
+        return None
+    return OtherAttribute(
+        hit_rate=orm.hit_rate, dodge_rate=orm.dodge_rate, crit_rate=orm.crit_rate
+    )
+
+
+def _diy_stats(suffix: str) -> _Convert:
+    def convert(orm: Any, _: type[ResourceRef]) -> SixAttributes:
+        return SixAttributes(
+            atk=getattr(orm, f'atk_{suffix}'),
+            def_=getattr(orm, f'def_{suffix}'),
+            sp_atk=getattr(orm, f'sp_atk_{suffix}'),
+            sp_def=getattr(orm, f'sp_def_{suffix}'),
+            spd=getattr(orm, f'spd_{suffix}'),
+            hp=getattr(orm, f'hp_{suffix}'),
+        )
+
+    return convert
+
+
+def _learned_by_pet(orm: Any, ref: type[ResourceRef]) -> list[ResourceRef]:
+    ids = sorted({link.pet_id for link in orm.pet_links})
+    return list(map(_ref_factory(ref, 'pet'), ids))
+
+
+def _effect_type_skill(orm: Any, ref: type[ResourceRef]) -> list[ResourceRef]:
+    ids = sorted({skill.id for effect in orm.in_use for skill in effect.skill})
+    return list(map(_ref_factory(ref, 'skill'), ids))
+
+
+def _class_mintmark(orm: Any, ref: type[ResourceRef]) -> list[ResourceRef]:
+    ids = sorted(part.mintmark_id for part in orm.mintmark)
+    return list(map(_ref_factory(ref, 'universal_mintmark'), ids))
+
+
+def _multipliers(orm: Any, _: type[ResourceRef]) -> dict[int, float]:
+    return {entry.defender_id: entry.multiplier for entry in orm.entry}
+
+
+# 无法按名称对应到列或关系的字段
+_FIELDS: dict[type[BaseModel], dict[str, _Path | _Custom]] = {
+    Achievement: {
+        'title_id': _Path('title_part.id'),
+        'title': _Path('title_part.name'),
+        'original_title': _Path('title_part.original_name'),
+        'attr_bonus': _Path('title_part.attr_bonus'),
+    },
+    DiyStatsRange: {
+        'min': _Custom(_diy_stats('min')),
+        'max': _Custom(_diy_stats('max')),
+    },
+    EnergyBead: {'effect': _Path('effect_in_use')},
+    Equip: {'pk_attribute': _Custom(_pk_attribute)},
+    EquipBonus: {
+        'eid_effect': _Path('effect_in_use'),
+        'other_attribute': _Custom(_other_attribute),
+    },
+    Gem: {
+        'effect': _Path('skill_effect_in_use'),
+        'inlay_rate': _Path('gen1_part.inlay_rate'),
+        'equivalent_level1_count': _Path('gen1_part.equivalent_level1_count'),
+        'fail_compensate_range': _Custom(_fail_compensate_range, ('gen1_part',)),
+        'upgrade_cost': _Path('gen2_part.upgrade_cost'),
+    },
+    GemGenCategory: {'gem_category': _Path('category')},
+    Mintmark: {
+        'effect': _Custom(_skill_mintmark_effect, ('skill_part',)),
+        'mintmark_class': _Path('universal_part.mintmark_class'),
+        'base_attr_value': _Path('universal_part.base_attr_value'),
+        'max_attr_value': _Custom(
+            _max_attr_value,
+            ('ability_part.max_attr_value', 'universal_part.max_attr_value'),
+        ),
+        'extra_attr_value': _Path('universal_part.extra_attr_value'),
+    },
+    MintmarkClassCategory: {'mintmark': _Custom(_class_mintmark, ('mintmark',))},
+    Pet: {
+        'skill': _Path('skill_links'),
+        'encyclopedia_entry': _Path('encyclopedia'),
+        'archive_story_entry': _Path('archive_story'),
+    },
+    PetEffect: {'effect': _Path('effect_in_use')},
+    Skill: {'learned_by_pet': _Custom(_learned_by_pet, ('pet_links',))},
+    SkillActivationItem: {
+        'skill': _Path('skill_in_pet.skill'),
+        'pet': _Path('skill_in_pet.pet'),
+    },
+    SkillEffectType: {'skill': _Custom(_effect_type_skill, ('in_use.skill',))},
+    Soulmark: {'effect': _Path('effect_in_use')},
+    SuitBonus: {'eid_effect': _Path('effect_in_use')},
+    TypeEffectiveness: {'multipliers': _Custom(_multipliers, ('entry',))},
+    VariationEffect: {'effect': _Path('effect_in_use')},
+}
+
+# 不是 ConvertToORM 子类、只作为其他资源字段出现的嵌套模型
+_NESTED_MODELS: dict[type[SQLModel], type[BaseModel]] = {
+    DiyStatsRangeORM: DiyStatsRange,
+    SkillInPetORM: SkillInPet,
+    SkillStoneEffectORM: SkillStoneEffect,
+}
+
+
+class _Plan(NamedTuple):
+    """一种 API 模型由 ORM 行还原的方案"""
+
+    convert: Callable[[Any], Any]
+    load: _LoadTree
+
+
+# {ORM 模型: API 模型} 与 {(API 模型, ORM 模型): 还原方案}，首次使用时生成
+_api_models: dict[type, type[BaseModel]] = {}
+_plans: dict[tuple[type, type], _Plan] = {}
+
+
+def _unwrap(annotation: Any) -> tuple[Any, bool, bool]:
+    """拆出注解中的类型，返回 (类型, 是否可以为 None, 是否为列表)"""
+    optional = False
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        optional = len(args) < len(get_args(annotation))
+        annotation = args[0]
+    if get_origin(annotation) is list:
+        return get_args(annotation)[0], optional, True
+    return annotation, optional, False
+
+
+def _merge(tree: _LoadTree, other: _LoadTree) -> None:
+    for name, children in other.items():
+        _merge(tree.setdefault(name, {}), children)
+
+
+def _path_tree(path: str) -> _LoadTree:
+    tree: _LoadTree = {}
+    node = tree
+    for name in path.split('.'):
+        node = node.setdefault(name, {})
+    return tree
+
+
+def api_model_of(orm_model: type[SQLModel]) -> type[BaseModel]:
+    """ORM 模型对应的 API 模型
+
+    Raises:
+            KeyError: 没有 API 模型转换为该 ORM 模型
+
+    """
+    if not _api_models:
+        load_all()
+        pending: list[type] = [ConvertToORM]
+        while pending:
+            for subclass in pending.pop().__subclasses__():
+                pending.append(subclass)
+                # ORM 模型继承自 API 模型，需要排除
+                if not hasattr(subclass, '__table__'):
+                    _api_models[subclass.get_orm_model()] = subclass
+        _api_models.update(_NESTED_MODELS)
+    model = _api_models.get(orm_model)
+    if model is None:
+        raise KeyError(f'没有转换为 {orm_model.__name__} 的 API 模型')
+    return model
+
+
+def _relationship_value(
+    relationship: RelationshipProperty,
+    kind: Any,
+    optional: bool,
+    many: bool,
+) -> tuple[Callable[[Any], Any], _LoadTree]:
+    """读取关系的字段，返回 (由拥有该关系的行取值的函数, 需要预加载的关系)"""
+    key = relationship.key
+    target: type[SQLModel] = relationship.mapper.class_
+    if isinstance(kind, type) and issubclass(kind, ResourceRef):
+        ref = _ref_factory(kind, target.resource_name())  # type: ignore[attr-defined]
+        if many:
+
+            def refs(orm: Any) -> list[ResourceRef] | None:
+                ids = sorted(row.id for row in getattr(orm, key))
+                if not ids and optional:
+                    return None
+                return list(map(ref, ids))
+
+            return refs, {key: {}}
+        columns = list(relationship.local_columns)
+        if (
+            relationship.direction is RelationshipDirection.MANYTOONE
+            and len(columns) == 1
+        ):
+            # 多对一关系的ID就是本表的外键列，无需加载关联的行
+            id_key = relationship.parent.get_property_by_column(columns[0]).key
+
+            def ref_by_column(orm: Any) -> ResourceRef | None:
+                id = getattr(orm, id_key)
+                return ref(id) if id is not None else None
+
+            return ref_by_column, {}
+
+        def ref_by_row(orm: Any) -> ResourceRef | None:
+            row = getattr(orm, key)
+            return ref(row.id) if row is not None else None
+
+        return ref_by_row, {key: {}}
+
+    if isinstance(kind, type) and issubclass(kind, SixAttributes):
+
+        def attributes(orm: Any) -> SixAttributes | None:
+            row = getattr(orm, key)
+            return row.to_model() if row is not None else None
+
+        return attributes, {key: {}}
+
+    if not isinstance(kind, type):
+        # 未解析的前向引用，如 list['SkillInPet']
+        kind = api_model_of(target)
+    plan = _plan(kind, target)
+    convert = plan.convert
+    if many:
+
+        def models(orm: Any) -> list[BaseModel] | None:
+            rows = getattr(orm, key)
+            if not rows and optional:
+                return None
+            return [convert(row) for row in rows]
+
+        return models, {key: plan.load}
+
+    def model(orm: Any) -> BaseModel | None:
+        row = getattr(orm, key)
+        return convert(row) if row is not None else None
+
+    return model, {key: plan.load}
+
+
+def _path_value(
+    mapper: Mapper, path: str, annotation: Any
+) -> tuple[Callable[[Any], Any], _LoadTree]:
+    """读取以 . 分隔的路径末端的列或关系"""
+    *parents, last = path.split('.')
+    for name in parents:
+        mapper = mapper.relationships[name].mapper
+    kind, optional, many = _unwrap(annotation)
+    read: Callable[[Any], Any] = attrgetter(last)
+    tree: _LoadTree = {}
+    if last in mapper.relationships:
+        read, tree = _relationship_value(
+            mapper.relationships[last], kind, optional, many
+        )
+    if not parents:
+        return read, tree
+
+    def follow(orm: Any) -> Any:
+        for name in parents:
+            orm = getattr(orm, name)
+            if orm is None:
+                return None
+        return read(orm)
+
+    load = _path_tree('.'.join(parents))
+    node = load
+    for name in parents:
+        node = node[name]
+    node.update(tree)
+    return follow, load
+
+
+def _ref_type(annotation: Any) -> type[ResourceRef]:
+    kind, _, _ = _unwrap(annotation)
+    if isinstance(kind, type) and issubclass(kind, ResourceRef):
+        return kind
+    return ResourceRef
+
+
+def _plan(model: type[BaseModel], orm_model: type[SQLModel]) -> _Plan:
+    plan = _plans.get((model, orm_model))
+    if plan is not None:
+        return plan
+    mapper: Mapper = inspect(orm_model)
+    overrides = _FIELDS.get(model, {})
+    fields: list[tuple[str, Callable[[Any], Any]]] = []
+    load: _LoadTree = {}
+    for name, field in model.model_fields.items():
+        override = overrides.get(name)
+        read: Callable[[Any], Any]
+        if isinstance(override, _Custom):
+            read = partial(_call_custom, override.convert, _ref_type(field.annotation))
+            for path in override.load:
+                _merge(load, _path_tree(path))
+        elif override is not None or name in mapper.attrs:
+            path = override.path if override is not None else name
+            read, tree = _path_value(mapper, path, field.annotation)
+            _merge(load, tree)
+        else:
+            raise KeyError(
+                f'{model.__name__}.{name} 在 {orm_model.__name__} 中没有对应的列或关系'
+            )
+        fields.append((name, read))
+
+    # 与 SQLModel.model_validate 对非表模型的处理相同，
+    # 省去其中为兼容表模型所做的复制 __dict__ 等额外处理，
+    # 也避免校验器经由 SQLModel.__init__ 再校验一次
+    validate = model.__pydantic_validator__.validate_python
+
+    def convert(orm: Any) -> BaseModel:
+        instance = model.__new__(model)
+        validate({name: read(orm) for name, read in fields}, self_instance=instance)
+        return instance
+
+    plan = _plans[model, orm_model] = _Plan(convert, load)
+    return plan
+
+
+def _call_custom(convert: _Convert, ref: type[ResourceRef], orm: Any) -> Any:
+    return convert(orm, ref)
+
+
+def _options(mapper: Mapper, tree: _LoadTree) -> list[Any]:
+    options: list[Any] = []
+    for name, children in tree.items():
+        relationship = mapper.relationships[name]
+        attribute = getattr(mapper.class_, name)
+        # 一对一关系并入主查询，集合关系按 IN 批量查询
+        option = (
+            selectinload(attribute) if relationship.uselist else joinedload(attribute)
+        )
+        if children:
+            option = option.options(*_options(relationship.mapper, children))
+        options.append(option)
+    return options
+
+
+def _orm_model(model: type[BaseModel]) -> type[SQLModel]:
+    if issubclass(model, ConvertToORM):
+        return model.get_orm_model()
+    for orm_model, nested in _NESTED_MODELS.items():
+        if nested is model:
+            return orm_model
+    raise TypeError(f'{model.__name__} 不能由 ORM 模型还原')
+
+
+def loader_options(model: type[BaseModel]) -> list[LoaderOption]:
+    """由 ORM 模型还原 model 时需要的预加载选项，用于 ``select(...).options()``
+
+    Raises:
+            TypeError: model 不能由 ORM 模型还原
+
+    """
+    orm_model = _orm_model(model)
+    return _options(inspect(orm_model), _plan(model, orm_model).load)
+
+
+def from_orm(orm: SQLModel) -> Any:
+    """将 ORM 行还原为对应的 API 模型
+
+    未通过 loader_options 预加载的关系会在访问时逐个加载。
+
+    Raises:
+            KeyError: 没有 API 模型转换为该 ORM 模型
+
+    """
+    orm_model = type(orm)
+    return _plan(api_model_of(orm_model), orm_model).convert(orm)
+
+
+def load_models(
+    session: Session,
+    model: type[_TModel],
+    ids: Iterable[int] | None = None,
+) -> list[_TModel]:
+    """从数据库加载资源并还原为 API 模型，按ID排列
+
+    查询数量只取决于 model 的关系结构，与加载的行数无关。
+
+    Args:
+                session: 数据库会话
+                model: API 模型，需要是 ConvertToORM 的子类
+                ids: 资源ID，为 None 时加载全部资源
+
+    Raises:
+            TypeError: model 不能由 ORM 模型还原
+
+    """
+    orm_model = _orm_model(model)
+    plan = _plan(model, orm_model)
+    primary_key = getattr(orm_model, 'id')
+    statement = (
+        select(orm_model)
+        .options(*_options(inspect(orm_model), plan.load))
+        .order_by(col(primary_key))
+    )
+    if ids is not None:
+        statement = statement.where(col(primary_key).in_(list(ids)))
+    return [plan.convert(row) for row in session.scalars(statement)]
+
+
+__all__ = ['api_model_of', 'from_orm', 'load_models', 'loader_options']
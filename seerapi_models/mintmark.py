@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, ClassVar, Optional, cast
 
 from pydantic import BaseModel
 from sqlmodel import Field, Relationship, SQLModel
@@ -7,6 +7,7 @@ from seerapi_models.build_model import (
     BaseCategoryModel,
     BaseResModel,
     BaseResModelWithOptionalId,
+    ConvertToModel,
     ConvertToORM,
 )
 from seerapi_models.common import ResourceRef, SixAttributes, SixAttributesORMBase
@@ -274,6 +275,18 @@ class Mintmark(MintmarkBase, MintmarkResRefs, ConvertToORM['MintmarkORM']):
             **part_kwargs,
         )
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return [
+            *(
+                PetMintmarkLink(pet_id=pet.id, mintmark_id=self.id)
+                for pet in self.pet or []
+            ),
+            *(
+                SkillMintmarkLink(skill_id=skill.id, mintmark_id=self.id)
+                for skill in self.skill or []
+            ),
+        ]
+
     def to_detailed(self) -> 'AbilityMintmark | SkillMintmark | UniversalMintmark':
         general_args = {
             'id': self.id,
@@ -309,7 +322,7 @@ class Mintmark(MintmarkBase, MintmarkResRefs, ConvertToORM['MintmarkORM']):
         raise ValueError(f'Invalid mintmark type: {self.type.id}')
 
 
-class MintmarkORM(MintmarkBase, table=True):
+class MintmarkORM(MintmarkBase, ConvertToModel['Mintmark'], table=True):
     type_id: int = Field(foreign_key='mintmark_type.id')
     type: 'MintmarkTypeCategoryORM' = Relationship(
         back_populates='mintmark',
@@ -359,6 +372,10 @@ class MintmarkRarityBase(BaseCategoryModel):
 class MintmarkRarityCategory(
     MintmarkRarityBase, ConvertToORM['MintmarkRarityCategoryORM']
 ):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'mintmark': ('mintmark', 'rarity')
+    }
+
     mintmark: list[ResourceRef['Mintmark']] = Field(
         default_factory=list, description='刻印列表'
     )
@@ -371,7 +388,9 @@ class MintmarkRarityCategory(
         return MintmarkRarityCategoryORM(id=self.id)
 
 
-class MintmarkRarityCategoryORM(MintmarkRarityBase, table=True):
+class MintmarkRarityCategoryORM(
+    MintmarkRarityBase, ConvertToModel['MintmarkRarityCategory'], table=True
+):
     mintmark: list['MintmarkORM'] = Relationship(
         back_populates='rarity',
     )
@@ -386,6 +405,10 @@ class MintmarkTypeBase(BaseCategoryModel):
 
 
 class MintmarkTypeCategory(MintmarkTypeBase, ConvertToORM['MintmarkTypeCategoryORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'mintmark': ('mintmark', 'type')
+    }
+
     mintmark: list[ResourceRef['Mintmark']] = Field(
         default_factory=list, description='刻印列表'
     )
@@ -401,7 +424,9 @@ class MintmarkTypeCategory(MintmarkTypeBase, ConvertToORM['MintmarkTypeCategoryO
         )
 
 
-class MintmarkTypeCategoryORM(MintmarkTypeBase, table=True):
+class MintmarkTypeCategoryORM(
+    MintmarkTypeBase, ConvertToModel['MintmarkTypeCategory'], table=True
+):
     mintmark: list['MintmarkORM'] = Relationship(
         back_populates='type',
     )
@@ -418,6 +443,10 @@ class MintmarkClassBase(BaseCategoryModel):
 class MintmarkClassCategory(
     MintmarkClassBase, ConvertToORM['MintmarkClassCategoryORM']
 ):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'mintmark': ('universal_mintmark', 'mintmark_class')
+    }
+
     mintmark: list[ResourceRef['UniversalMintmark']] = Field(
         default_factory=list, description='刻印列表'
     )
@@ -433,7 +462,9 @@ class MintmarkClassCategory(
         )
 
 
-class MintmarkClassCategoryORM(MintmarkClassBase, table=True):
+class MintmarkClassCategoryORM(
+    MintmarkClassBase, ConvertToModel['MintmarkClassCategory'], table=True
+):
     mintmark: list['UniversalPartORM'] = Relationship(
         back_populates='mintmark_class',
     )
@@ -0,0 +1,191 @@
+"""为指定精灵搜索属性加成最高的刻印组合
+
+逐个枚举全部刻印组合时，组合数量随刻印数量的立方增长。
+``MintmarkSearch`` 在构建时把每个刻印的六项属性展开为按属性排列的 ``array('d')``，
+并按 ``MintmarkResRefs.pet`` 预先分出无精灵限制的刻印与各精灵的专属刻印；
+搜索时只对可以安装的刻印计算加权得分，按得分从高到低排序后分支限界：
+剩余槽位以排在后面的最高得分估计上界，上界不超过当前第 k 名时剪去整个分支。
+
+用法::
+
+    search = MintmarkSearch(mintmarks)
+    # 速度与攻击之和最高的 10 套三刻印组合
+    for build in search.top_k({'spd': 1, 'atk': 1}, pet_id=pet.id, k=10):
+        build.score, build.mintmark_ids, build.attributes
+"""
+
+from array import array
+from collections.abc import Iterable, Mapping
+import heapq
+from typing import NamedTuple
+
+from .common import CompactSixAttributes
+from .mintmark import AbilityMintmark, Mintmark, SkillMintmark, UniversalMintmark
+
+_AnyMintmark = Mintmark | AbilityMintmark | SkillMintmark | UniversalMintmark
+
+_FIELDS = CompactSixAttributes._fields[:6]
+
+
+class MintmarkBuild(NamedTuple):
+    """一套刻印组合"""
+
+    score: float
+    """按权重计算的得分"""
+    mintmark_ids: tuple[int, ...]
+    """刻印ID，按得分从高到低排列"""
+    attributes: CompactSixAttributes
+    """各刻印属性值之和"""
+
+
+class MintmarkSearch:
+    """刻印组合搜索
+
+    只收录带有满级属性值的刻印（能力刻印与全能刻印），技能刻印会被忽略。
+    """
+
+    __slots__ = ('_classes', '_columns', '_general', '_ids', '_restricted')
+
+    def __init__(self, mintmarks: Iterable[_AnyMintmark] = (), *, extra: bool = True):
+        """
+        Args:
+                mintmarks: 刻印，Mintmark 与各类型的刻印模型均可
+                extra: 是否计入全能刻印的隐藏属性值
+
+        """
+        self._ids: list[int] = []
+        self._classes: list[int | None] = []
+        self._columns = tuple(array('d') for _ in _FIELDS)
+        # 无精灵限制的刻印与 {精灵ID: 专属刻印} 在 _ids 中的位置
+        self._general: list[int] = []
+        self._restricted: dict[int, list[int]] = {}
+        for mintmark in mintmarks:
+            max_value = getattr(mintmark, 'max_attr_value', None)
+            if max_value is None:
+                continue
+            index = len(self._ids)
+            self._ids.append(mintmark.id)
+            mintmark_class = getattr(mintmark, 'mintmark_class', None)
+            self._classes.append(
+                mintmark_class.id if mintmark_class is not None else None
+            )
+            extra_value = getattr(mintmark, 'extra_attr_value', None) if extra else None
+            for column, field in zip(self._columns, _FIELDS):
+                value = getattr(max_value, field)
+                if extra_value is not None:
+                    value += getattr(extra_value, field)
+                column.append(value)
+            if mintmark.pet is None:
+                self._general.append(index)
+            else:
+                for ref in mintmark.pet:
+                    self._restricted.setdefault(ref.id, []).append(index)
+
+    def eligible(self, pet_id: int | None = None) -> list[int]:
+        """可以安装在精灵上的刻印ID，pet_id 为 None 时只包含无精灵限制的刻印"""
+        return [self._ids[i] for i in self._eligible(pet_id)]
+
+    def _eligible(self, pet_id: int | None) -> list[int]:
+        if pet_id is None:
+            return self._general
+        return self._general + self._restricted.get(pet_id, [])
+
+    def top_k(
+        self,
+        weights: Mapping[str, float],
+        *,
+        pet_id: int | None = None,
+        k: int = 10,
+        slots: int = 3,
+        unique_class: bool = False,
+    ) -> list[MintmarkBuild]:
+        """搜索得分最高的 k 套刻印组合
+
+        得分为组合中各刻印属性值之和按 weights 加权求和，
+        同一组合中的刻印互不相同，得分相同时优先包含得分更高（其次ID更小）的刻印。
+
+        Args:
+                weights: {属性名: 权重}，属性名与 SixAttributes 的字段相同，如 spd、atk
+                pet_id: 精灵ID，为 None 时只使用无精灵限制的刻印
+                k: 返回的组合数量
+                slots: 每套组合的刻印数量
+                unique_class: 同一系列的刻印是否最多选择一个
+
+        Returns:
+            按得分从高到低排列的组合，可以安装的刻印少于 slots 个时为空列表
+
+        Raises:
+            ValueError: 属性名无效
+
+        """
+        factors: list[tuple[array, float]] = []
+        for name, weight in weights.items():
+            if name not in _FIELDS:
+                raise ValueError(f'无效的属性名：{name}')
+            factors.append((self._columns[_FIELDS.index(name)], weight))
+
+        ids = self._ids
+        candidates: list[tuple[float, int]] = []
+        for i in self._eligible(pet_id):
+            score = 0.0
+            for column, weight in factors:
+                score += column[i] * weight
+            candidates.append((score, i))
+        candidates.sort(key=lambda item: (-item[0], ids[item[1]]))
+        scores = [score for score, _ in candidates]
+        classes = [self._classes[i] for _, i in candidates]
+        count = len(candidates)
+        if k <= 0 or slots <= 0 or count < slots:
+            return []
+
+        # 最小堆，堆顶为当前第 k 名；位置取负，得分相同时位置靠后的组合先被替换
+        heap: list[tuple[float, tuple[int, ...]]] = []
+        chosen: list[int] = []
+        used: set[int] = set()
+
+        def search(start: int, remaining: int, total: float) -> None:
+            for i in range(start, count - remaining + 1):
+                # 按字典序枚举，之后找到的同分组合总是更差，上界等于第 k 名时也可以剪枝
+                bound = total
+                for score in scores[i : i + remaining]:
+                    bound += score
+                if len(heap) == k and bound <= heap[0][0]:
+                    break
+                class_id = classes[i]
+                if unique_class and class_id is not None and class_id in used:
+                    continue
+                chosen.append(i)
+                if remaining == 1:
+                    item = (bound, tuple(-p for p in chosen))
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    else:
+                        heapq.heapreplace(heap, item)
+                else:
+                    if class_id is not None:
+                        used.add(class_id)
+                    search(i + 1, remaining - 1, total + scores[i])
+                    if class_id is not None:
+                        used.discard(class_id)
+                chosen.pop()
+
+        search(0, slots, 0.0)
+
+        builds: list[MintmarkBuild] = []
+        for score, positions in sorted(heap, reverse=True):
+            indices = [candidates[-p][1] for p in positions]
+            attributes = [sum(column[i] for i in indices) for column in self._columns]
+            builds.append(
+                MintmarkBuild(
+                    score,
+                    tuple(ids[i] for i in indices),
+                    CompactSixAttributes._make((*attributes, False)),
+                )
+            )
+        return builds
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+__all__ = ['MintmarkBuild', 'MintmarkSearch']
@@ -1,6 +1,6 @@
 from sqlmodel import Field, Relationship
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 from seerapi_models.common import SixAttributes, SixAttributesORMBase
 
 
@@ -49,5 +49,5 @@ class Nature(BaseNature, ConvertToORM['NatureORM']):
         )
 
 
-class NatureORM(BaseNature, table=True):
+class NatureORM(BaseNature, ConvertToModel['Nature'], table=True):
     attributes: NatureAttrORM = Relationship(back_populates='nature')
@@ -0,0 +1,410 @@
+"""按资源逐行导出与导入 NDJSON 数据
+
+以 ``NamedData[T]`` 导出完整数据时需要先把全部模型放入一个 dict，再整体序列化，
+内存峰值为全部模型加上整个 JSON 字符串。本模块每次只序列化一个模型并写入一行，
+按 ``resource_name()`` 写入不同的文件；导入时同样逐行读取并用 ``TypeAdapter`` 校验，
+由生成器驱动，内存占用与数据量无关。导入得到的模型可以直接交给 ``bulk_load``。
+
+校验是 CPU 密集的，``iter_ndjson_parallel`` 与 ``import_ndjson_parallel`` 将文件
+按字节范围切分为若干分片，在 ``ProcessPoolExecutor`` 中并行校验，按分片顺序取回结果。
+前者传回校验后的 JSON 兼容数据，后者在工作进程中进一步展开为按表分组的行
+（见 ``bulk.BulkLoader``），由主进程合并后写入，结果与 ``bulk_load`` 逐个写入相同。
+
+用法::
+
+    export_ndjson('data', iter_all_models())
+
+    with Session(engine) as session:
+        bulk_load(session, import_ndjson('data', [Pet, Skill]))
+        session.commit()
+"""
+
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import cache
+import gc
+import os
+from os import PathLike
+from pathlib import Path
+import pickle
+from typing import IO, Any, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import Connection
+from sqlalchemy.orm import Session, configure_mappers
+from sqlmodel import SQLModel
+
+from .build_model import BaseResModel
+from .bulk import (
+    DEFAULT_BATCH_SIZE,
+    INTERNED_MODELS,
+    BulkLoader,
+    refresh_search_index,
+)
+from .common import RefEncoding, ref_encoding_context
+
+# NDJSON 文件的扩展名，文件名为 {resource_name}.ndjson
+SUFFIX = '.ndjson'
+
+# 并行导入时每个分片的默认字节数，约为一千个精灵
+SHARD_SIZE = 1 << 22
+
+_TModel = TypeVar('_TModel', bound=BaseModel)
+_TResModel = TypeVar('_TResModel', bound=BaseResModel)
+
+
+def ndjson_path(directory: str | PathLike[str], model: type[BaseResModel]) -> Path:
+    """资源类型对应的 NDJSON 文件路径"""
+    return Path(directory) / f'{model.resource_name()}{SUFFIX}'
+
+
+def write_ndjson(
+    file: IO[bytes],
+    models: Iterable[BaseModel],
+    *,
+    ref_encoding: RefEncoding | None = None,
+    context: Any | None = None,
+) -> int:
+    """将模型逐个序列化为一行 JSON 写入文件
+
+    Args:
+                file: 以二进制模式打开的文件
+                models: 要写入的模型，可以是生成器
+                ref_encoding: 引用的紧凑编码，见 ref_encoding_context，默认输出完整格式
+                context: 传给序列化器的 context
+
+    Returns:
+            写入的行数
+
+    """
+    if ref_encoding is not None:
+        context = ref_encoding_context(ref_encoding, context)
+    count = 0
+    for model in models:
+        file.write(
+            model.__pydantic_serializer__.to_json(model, by_alias=True, context=context)
+        )
+        file.write(b'\n')
+        count += 1
+    return count
+
+
+def iter_ndjson(file: IO[bytes], model: type[_TModel]) -> Iterator[_TModel]:
+    """逐行读取并校验 NDJSON 文件，空行会被跳过
+
+    Args:
+                file: 以二进制模式打开的文件
+                model: 每一行对应的模型类型
+
+    Raises:
+            ValueError: 某一行校验失败，错误信息中包含行号
+
+    """
+    adapter = TypeAdapter(model)
+    for lineno, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            yield adapter.validate_json(line)
+        except ValidationError as exc:
+            name = getattr(file, 'name', '<stream>')
+            raise ValueError(f'{name} 第 {lineno} 行校验失败：\n{exc}') from exc
+
+
+def export_ndjson(
+    directory: str | PathLike[str],
+    models: Iterable[BaseResModel],
+    *,
+    ref_encoding: RefEncoding | None = None,
+    context: Any | None = None,
+) -> dict[str, int]:
+    """按 resource_name() 将模型分别写入 {directory}/{resource_name}.ndjson
+
+    各资源类型的文件在首次遇到该类型时创建，已存在的同名文件会被覆盖。
+
+    Args:
+                directory: 输出目录，不存在时会被创建
+                models: 要导出的模型，可以是多种资源类型混合的生成器
+                ref_encoding: 引用的紧凑编码，默认输出完整格式
+                context: 传给序列化器的 context
+
+    Returns:
+            各资源写入的行数
+
+    """
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+    counts: dict[str, int] = {}
+    with ExitStack() as stack:
+        files: dict[str, IO[bytes]] = {}
+        for model in models:
+            name = model.resource_name()
+            file = files.get(name)
+            if file is None:
+                file = files[name] = stack.enter_context(
+                    ndjson_path(root, type(model)).open('wb')
+                )
+                counts[name] = 0
+            write_ndjson(file, (model,), ref_encoding=ref_encoding, context=context)
+            counts[name] += 1
+    return counts
+
+
+def import_ndjson(
+    directory: str | PathLike[str],
+    models: Iterable[type[_TResModel]],
+) -> Iterator[_TResModel]:
+    """按给出的顺序逐行读取各资源类型的 NDJSON 文件，不存在的文件会被跳过
+
+    返回的生成器可以直接传给 bulk_load 或 BulkLoader.add_all。
+
+    Args:
+                directory: export_ndjson 的输出目录
+                models: 要导入的资源类型
+
+    """
+    for model in models:
+        path = ndjson_path(directory, model)
+        if not path.exists():
+            continue
+        with path.open('rb') as file:
+            yield from iter_ndjson(file, model)
+
+
+@cache
+def _adapter(model: type[_TModel]) -> TypeAdapter[_TModel]:
+    # 每个工作进程对每种类型只构建一次
+    return TypeAdapter(model)
+
+
+def _line_number(path: Path, offset: int) -> int:
+    """文件中位于 offset 处的字节所在的行号"""
+    with path.open('rb') as file:
+        return file.read(offset).count(b'\n') + 1
+
+
+def _shards(path: Path, shard_size: int) -> Iterator[tuple[int, int]]:
+    """将文件按字节数切分为 [start, end) 范围，实际的行边界由工作进程对齐"""
+    size = path.stat().st_size
+    for start in range(0, size, shard_size):
+        yield start, min(start + shard_size, size)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """在上下文中暂停循环垃圾回收，退出时恢复原来的状态"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _validate_shard(
+    path: Path, model: type[_TModel], start: int, end: int
+) -> Iterator[_TModel]:
+    """逐个校验起始字节位于 [start, end) 内的所有行"""
+    adapter = _adapter(model)
+    with path.open('rb') as file:
+        if start:
+            # 跳过上一个分片中开始的行，start 恰为行首时只读取前一个换行符
+            file.seek(start - 1)
+            file.readline()
+        offset = file.tell()
+        while offset < end:
+            line = file.readline()
+            if not line:
+                break
+            if line.strip():
+                try:
+                    yield adapter.validate_json(line)
+                except ValidationError as exc:
+                    lineno = _line_number(path, offset)
+                    raise ValueError(f'{path} 第 {lineno} 行校验失败：\n{exc}') from exc
+            offset += len(line)
+
+
+def _run_shards(
+    directory: str | PathLike[str],
+    models: Iterable[type[_TResModel]],
+    task: Callable[..., bytes],
+    args: tuple[Any, ...],
+    max_workers: int | None,
+    shard_size: int,
+) -> Iterator[tuple[type[_TResModel], Any]]:
+    """在工作进程中对每个分片执行 task(path, model, start, end, *args)，
+    按分片顺序产出 (资源类型, 反序列化后的结果)
+
+    同时执行的分片数不超过工作进程数的两倍，尚未取出的结果不会无限堆积。
+    """
+    workers = max_workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(workers)
+    pending: deque[tuple[type[_TResModel], Future[bytes]]] = deque()
+
+    def take() -> tuple[type[_TResModel], Any]:
+        model, future = pending.popleft()
+        # 还原时一次性创建整个分片的对象，会频繁触发垃圾回收却回收不到任何对象
+        with _gc_paused():
+            return model, pickle.loads(future.result())
+
+    try:
+        for model in models:
+            path = ndjson_path(directory, model)
+            if not path.exists():
+                continue
+            for start, end in _shards(path, shard_size):
+                future = executor.submit(task, path, model, start, end, *args)
+                pending.append((model, future))
+                if len(pending) >= workers * 2:
+                    yield take()
+        while pending:
+            yield take()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _dump_shard(path: Path, model: type[BaseModel], start: int, end: int) -> bytes:
+    """校验分片中的所有行，返回序列化后的 JSON 兼容数据列表"""
+    # 分片内的模型在返回前都不会被释放，校验期间关闭循环垃圾回收，
+    # 避免模型增多时反复扫描带来的开销，结束后恢复，不影响工作进程中的其他代码
+    with _gc_paused():
+        data = [
+            item.model_dump(mode='json', by_alias=True)
+            for item in _validate_shard(path, model, start, end)
+        ]
+        return pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+
+def iter_ndjson_parallel(
+    directory: str | PathLike[str],
+    models: Iterable[type[_TResModel]],
+    *,
+    max_workers: int | None = None,
+    shard_size: int = SHARD_SIZE,
+) -> Iterator[tuple[type[_TResModel], dict[str, Any]]]:
+    """在多个进程中并行校验，按与 import_ndjson 相同的顺序产出校验后的数据
+
+    工作进程校验每一行后只传回 ``model_dump(mode='json', by_alias=True)`` 的结果，
+    其中只有字符串、数字等基本类型，主进程中还原的开销远小于还原模型。
+    需要模型时可以对数据调用 ``model_validate``，或只取用其中需要的字段。
+
+    Args:
+                directory: export_ndjson 的输出目录
+                models: 要导入的资源类型
+                max_workers: 工作进程数，默认为 CPU 核数
+                shard_size: 每个分片的字节数
+
+    Returns:
+            (资源类型, 数据) 的生成器
+
+    Raises:
+            ValueError: 某一行校验失败，错误信息中包含文件路径与行号
+
+    """
+    for model, data in _run_shards(
+        directory, models, _dump_shard, (), max_workers, shard_size
+    ):
+        for item in data:
+            yield model, item
+
+
+def _load_shard(
+    path: Path,
+    model: type[BaseResModel],
+    start: int,
+    end: int,
+    interned_models: Collection[type[SQLModel]],
+) -> bytes:
+    """校验分片中的所有行并展开为按表分组的行
+
+    Returns:
+            序列化后的 (分配了自增主键的表名, [(表名, 列名, 各行的值)])
+
+    """
+    with _gc_paused():
+        loader = BulkLoader(None, interned_models=interned_models)
+        loader.add_all(_validate_shard(path, model, start, end))
+        shard = []
+        for table, rows in loader.take_rows().items():
+            columns = tuple(next(iter(rows.values())))
+            values = [tuple(row[column] for column in columns) for row in rows.values()]
+            shard.append((table.name, columns, values))
+        # 去重表的主键总是在合并时重新分配
+        generated = [table.name for table in loader.generated_tables]
+        return pickle.dumps((generated, shard), pickle.HIGHEST_PROTOCOL)
+
+
+def import_ndjson_parallel(
+    bind: Session | Connection,
+    directory: str | PathLike[str],
+    models: Iterable[type[BaseResModel]],
+    *,
+    max_workers: int | None = None,
+    shard_size: int = SHARD_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    interned_models: Collection[type[SQLModel]] = INTERNED_MODELS,
+    search_index: bool = True,
+) -> dict[str, int]:
+    """在多个进程中并行校验并展开 NDJSON 文件，再批量写入数据库，不会提交事务
+
+    写入的内容与 ``bulk_load(bind, import_ndjson(directory, models))`` 相同。
+    与 iter_ndjson_parallel 使用相同的分片方式，工作进程完成校验、to_orm 与展开，
+    只把按表分组的行以元组传回，主进程只需合并各分片的行并写入，不再还原模型。
+
+    Args:
+                bind: 写入使用的 Session 或 Connection
+                directory: export_ndjson 的输出目录
+                models: 要导入的资源类型
+                max_workers: 工作进程数，默认为 CPU 核数
+                shard_size: 每个分片的字节数
+                batch_size interned_models search_index: 含义见 bulk_load
+
+    Returns:
+            各表写入的行数
+
+    Raises:
+            ValueError: 某一行校验失败，错误信息中包含文件路径与行号
+
+    """
+    # 合并时按表名查找表，需要先加载全部 ORM 模型
+    configure_mappers()
+    tables = SQLModel.metadata.tables
+    loader = BulkLoader(bind, batch_size=batch_size, interned_models=interned_models)
+    shards = _run_shards(
+        directory,
+        models,
+        _load_shard,
+        (tuple(interned_models),),
+        max_workers,
+        shard_size,
+    )
+    for _, (generated, shard) in shards:
+        with _gc_paused():
+            loader.merge(
+                {
+                    tables[name]: [dict(zip(columns, values)) for values in rows]
+                    for name, columns, rows in shard
+                },
+                [tables[name] for name in generated],
+            )
+    counts = loader.flush()
+    if search_index:
+        refresh_search_index(bind, counts)
+    return counts
+
+
+__all__ = [
+    'SHARD_SIZE',
+    'SUFFIX',
+    'export_ndjson',
+    'import_ndjson',
+    'import_ndjson_parallel',
+    'iter_ndjson',
+    'iter_ndjson_parallel',
+    'ndjson_path',
+    'write_ndjson',
+]
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from sqlmodel import Field
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 
 
 class BasePeakSeason(BaseResModel):
@@ -31,5 +31,5 @@ class PeakSeason(BasePeakSeason, ConvertToORM['PeakSeasonORM']):
         )
 
 
-class PeakSeasonORM(BasePeakSeason, table=True):
+class PeakSeasonORM(BasePeakSeason, ConvertToModel['PeakSeason'], table=True):
     pass
@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from sqlmodel import Field, Relationship
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 from seerapi_models.common import ResourceRef
 
 if TYPE_CHECKING:
@@ -23,6 +23,8 @@ class BasePeakPool(BaseResModel):
 
 
 class PeakPool(BasePeakPool, ConvertToORM['PeakPoolORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'peak_pool')}
+
     pet: list[ResourceRef['Pet']] = Field(
         default_factory=list, description='该池内的精灵'
     )
@@ -40,7 +42,7 @@ class PeakPool(BasePeakPool, ConvertToORM['PeakPoolORM']):
         )
 
 
-class PeakPoolORM(BasePeakPool, table=True):
+class PeakPoolORM(BasePeakPool, ConvertToModel['PeakPool'], table=True):
     pet: list['PetORM'] = Relationship(back_populates='peak_pool')
 
 
@@ -57,6 +59,10 @@ class BasePeakExpertPool(BaseResModel):
 
 
 class PeakExpertPool(BasePeakExpertPool, ConvertToORM['PeakExpertPoolORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'pet': ('pet', 'peak_expert_pool')
+    }
+
     pet: list[ResourceRef['Pet']] = Field(
         default_factory=list, description='该池内的精灵'
     )
@@ -74,7 +80,9 @@ class PeakExpertPool(BasePeakExpertPool, ConvertToORM['PeakExpertPoolORM']):
         )
 
 
-class PeakExpertPoolORM(BasePeakExpertPool, table=True):
+class PeakExpertPoolORM(
+    BasePeakExpertPool, ConvertToModel['PeakExpertPool'], table=True
+):
     pet: list['PetORM'] = Relationship(back_populates='peak_expert_pool')
 
 
@@ -108,5 +116,5 @@ class PeakPoolVote(BasePeakPoolVote, ConvertToORM['PeakPoolVoteORM']):
         )
 
 
-class PeakPoolVoteORM(BasePeakPoolVote, table=True):
+class PeakPoolVoteORM(BasePeakPoolVote, ConvertToModel['PeakPoolVote'], table=True):
     pet: list['PetORM'] = Relationship(back_populates='peak_pool_vote')
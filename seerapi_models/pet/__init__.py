@@ -1,31 +1,65 @@
-from .pet import (
-    BaseStatORM,
-    DiyStatsRangeORM,
-    Pet,
-    PetClass,
-    PetClassORM,
-    PetGenderCategory,
-    PetGenderORM,
-    PetMountTypeCategory,
-    PetMountTypeORM,
-    PetORM,
-    PetVipBuffCategory,
-    PetVipBuffORM,
-    SkillInPet,
-    SkillInPetORM,
-    YieldingEvORM,
-)
-from .pet_advance import PetAdvance, PetAdvanceORM
-from .pet_skin import PetSkin, PetSkinCategory, PetSkinCategoryORM, PetSkinORM
-from .petbook import (
-    PetArchiveStoryBook,
-    PetArchiveStoryBookORM,
-    PetArchiveStoryEntry,
-    PetArchiveStoryEntryORM,
-    PetEncyclopediaEntry,
-    PetEncyclopediaEntryORM,
-)
-from .soulmark import Soulmark, SoulmarkORM, SoulmarkTagCategory, SoulmarkTagORM
+from typing import TYPE_CHECKING
+
+from .._lazy import LAZY_IMPORT, import_exports, lazy_exports
+
+if TYPE_CHECKING:
+    # 仅供类型检查器解析名称，运行时按下方的映射表导入
+    from .pet import *  # noqa: F403
+    from .pet_advance import *  # noqa: F403
+    from .pet_skin import *  # noqa: F403
+    from .petbook import *  # noqa: F403
+    from .soulmark import *  # noqa: F403
+
+# 名称到其所在子模块的映射，按需导入与立即导入都据此导入，须与 __all__ 保持一致
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    '.pet': (
+        'BaseStatORM',
+        'DiyStatsRangeORM',
+        'Pet',
+        'PetClass',
+        'PetClassORM',
+        'PetGenderCategory',
+        'PetGenderORM',
+        'PetMountTypeCategory',
+        'PetMountTypeORM',
+        'PetORM',
+        'PetVipBuffCategory',
+        'PetVipBuffORM',
+        'SkillInPet',
+        'SkillInPetORM',
+        'YieldingEvORM',
+    ),
+    '.pet_advance': (
+        'PetAdvance',
+        'PetAdvanceORM',
+    ),
+    '.pet_skin': (
+        'PetSkin',
+        'PetSkinCategory',
+        'PetSkinCategoryORM',
+        'PetSkinORM',
+    ),
+    '.petbook': (
+        'PetArchiveStoryBook',
+        'PetArchiveStoryBookORM',
+        'PetArchiveStoryEntry',
+        'PetArchiveStoryEntryORM',
+        'PetEncyclopediaEntry',
+        'PetEncyclopediaEntryORM',
+    ),
+    '.soulmark': (
+        'Soulmark',
+        'SoulmarkORM',
+        'SoulmarkTagCategory',
+        'SoulmarkTagORM',
+    ),
+}
+
+if not TYPE_CHECKING:
+    if LAZY_IMPORT:
+        __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+    else:
+        import_exports(__name__, _EXPORTS)
 
 __all__ = [
     'BaseStatORM',
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, ClassVar, Optional, cast
 
 from pydantic import BaseModel
 from sqlmodel import Field, Relationship, SQLModel
@@ -6,10 +6,13 @@ from sqlmodel import Field, Relationship, SQLModel
 from seerapi_models.build_model import (
     BaseCategoryModel,
     BaseResModel,
+    ConvertToModel,
     ConvertToORM,
 )
 from seerapi_models.common import ResourceRef, SixAttributes, SixAttributesORMBase
 
+from .soulmark import PetSoulmarkLink
+
 if TYPE_CHECKING:
     from seerapi_models.element_type import TypeCombination, TypeCombinationORM
     from seerapi_models.glossary import GlossaryEntryORM
@@ -270,6 +273,7 @@ class Pet(PetBase, ConvertToORM['PetORM']):
             type_id=self.type.id,
             gender_id=self.gender.id,
             pet_class_id=self.pet_class.id if self.pet_class else None,
+            evolution_chain_index=self.evolution_chain_index,
             base_stats_id=cast(int, base_stats.id),
             base_stats=base_stats,
             skill_links=skill_links,
@@ -288,8 +292,14 @@ class Pet(PetBase, ConvertToORM['PetORM']):
             peak_pool_vote_id=self.peak_pool_vote_id,
         )
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return [
+            PetSoulmarkLink(pet_id=self.id, soulmark_id=soulmark.id)
+            for soulmark in self.soulmark or []
+        ]
+
 
-class PetORM(PetBase, table=True):
+class PetORM(PetBase, ConvertToModel['Pet'], table=True):
     type_id: int = Field(foreign_key='element_type_combination.id')
     type: 'TypeCombinationORM' = Relationship(
         back_populates='pet',
@@ -302,6 +312,7 @@ class PetORM(PetBase, table=True):
     pet_class: Optional['PetClassORM'] = Relationship(
         back_populates='evolution_chain',
     )
+    evolution_chain_index: int = Field(description='该精灵在进化链中的位置，从0开始')
     base_stats_id: int = Field(foreign_key='pet_base_stats.id')
     base_stats: BaseStatORM = Relationship(
         back_populates='pet',
@@ -430,8 +441,11 @@ class PetClass(PetClassBase, ConvertToORM['PetClassORM']):
         )
 
 
-class PetClassORM(PetClassBase, table=True):
-    evolution_chain: list['PetORM'] = Relationship(back_populates='pet_class')
+class PetClassORM(PetClassBase, ConvertToModel['PetClass'], table=True):
+    evolution_chain: list['PetORM'] = Relationship(
+        back_populates='pet_class',
+        sa_relationship_kwargs={'order_by': 'PetORM.evolution_chain_index'},
+    )
 
 
 class PetCategoryBase(BaseCategoryModel):
@@ -450,6 +464,8 @@ class PetGenderBase(PetCategoryBase):
 
 
 class PetGenderCategory(PetGenderBase, PetCategoryRefs, ConvertToORM['PetGenderORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'gender')}
+
     @classmethod
     def get_orm_model(cls) -> type['PetGenderORM']:
         return PetGenderORM
@@ -462,7 +478,7 @@ class PetGenderCategory(PetGenderBase, PetCategoryRefs, ConvertToORM['PetGenderO
         )
 
 
-class PetGenderORM(PetGenderBase, table=True):
+class PetGenderORM(PetGenderBase, ConvertToModel['PetGenderCategory'], table=True):
     pet: list['PetORM'] = Relationship(back_populates='gender')
 
 
@@ -475,6 +491,8 @@ class PetVipBuffBase(PetCategoryBase):
 class PetVipBuffCategory(
     PetVipBuffBase, PetCategoryRefs, ConvertToORM['PetVipBuffORM']
 ):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'vipbuff')}
+
     @classmethod
     def get_orm_model(cls) -> type['PetVipBuffORM']:
         return PetVipBuffORM
@@ -487,7 +505,7 @@ class PetVipBuffCategory(
         )
 
 
-class PetVipBuffORM(PetVipBuffBase, table=True):
+class PetVipBuffORM(PetVipBuffBase, ConvertToModel['PetVipBuffCategory'], table=True):
     pet: list['PetORM'] = Relationship(back_populates='vipbuff')
 
 
@@ -500,6 +518,8 @@ class PetMountTypeBase(PetCategoryBase):
 class PetMountTypeCategory(
     PetMountTypeBase, PetCategoryRefs, ConvertToORM['PetMountTypeORM']
 ):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'mount_type')}
+
     @classmethod
     def get_orm_model(cls) -> type['PetMountTypeORM']:
         return PetMountTypeORM
@@ -512,5 +532,7 @@ class PetMountTypeCategory(
         )
 
 
-class PetMountTypeORM(PetMountTypeBase, table=True):
+class PetMountTypeORM(
+    PetMountTypeBase, ConvertToModel['PetMountTypeCategory'], table=True
+):
     pet: list['PetORM'] = Relationship(back_populates='mount_type')
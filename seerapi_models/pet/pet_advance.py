@@ -1,8 +1,8 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from sqlmodel import Field, Relationship
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 from seerapi_models.common import ResourceRef, SixAttributes, SixAttributesORMBase
 
 if TYPE_CHECKING:
@@ -33,6 +33,10 @@ class PetAdvanceBase(BaseResModel):
 
 
 class PetAdvance(PetAdvanceBase, ConvertToORM['PetAdvanceORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'skill': ('skill', 'advance')
+    }
+
     pet: ResourceRef['Pet'] = Field(description='该项觉醒对应的精灵')
     skill: list[ResourceRef['Skill']] = Field(description='完成觉醒可开启的技能')
     soulmark: ResourceRef['Soulmark'] = Field(description='完成觉醒可开启的魂印')
@@ -55,7 +59,7 @@ class PetAdvance(PetAdvanceBase, ConvertToORM['PetAdvanceORM']):
         )
 
 
-class PetAdvanceORM(PetAdvanceBase, table=True):
+class PetAdvanceORM(PetAdvanceBase, ConvertToModel['PetAdvance'], table=True):
     pet_id: int = Field(foreign_key='pet.id', unique=True)
     pet: 'PetORM' = Relationship(back_populates='advance')
     skill: list['SkillORM'] = Relationship(back_populates='advance')
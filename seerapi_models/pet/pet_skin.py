@@ -1,8 +1,8 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from sqlmodel import Field, Relationship
 
-from seerapi_models.build_model import BaseResModel, ConvertToORM
+from seerapi_models.build_model import BaseResModel, ConvertToModel, ConvertToORM
 from seerapi_models.common import ResourceRef
 
 if TYPE_CHECKING:
@@ -38,12 +38,13 @@ class PetSkin(PetSkinBase, ConvertToORM['PetSkinORM']):
             id=self.id,
             name=self.name,
             resource_id=self.resource_id,
+            enemy_resource_id=self.enemy_resource_id,
             pet_id=self.pet.id,
             category_id=self.category.id,
         )
 
 
-class PetSkinORM(PetSkinBase, table=True):
+class PetSkinORM(PetSkinBase, ConvertToModel['PetSkin'], table=True):
     pet_id: int = Field(foreign_key='pet.id')
     pet: 'PetORM' = Relationship(back_populates='skins')
     category_id: int = Field(foreign_key='pet_skin_category.id')
@@ -62,6 +63,10 @@ class PetSkinCategoryBase(BaseResModel):
 
 
 class PetSkinCategory(PetSkinCategoryBase, ConvertToORM['PetSkinCategoryORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'skins': ('pet_skin', 'category')
+    }
+
     skins: list[ResourceRef['PetSkin']] = Field(
         default_factory=list, description='该系列的皮肤列表'
     )
@@ -74,5 +79,7 @@ class PetSkinCategory(PetSkinCategoryBase, ConvertToORM['PetSkinCategoryORM']):
         return PetSkinCategoryORM(id=self.id)
 
 
-class PetSkinCategoryORM(PetSkinCategoryBase, table=True):
+class PetSkinCategoryORM(
+    PetSkinCategoryBase, ConvertToModel['PetSkinCategory'], table=True
+):
     skins: list['PetSkinORM'] = Relationship(back_populates='category')
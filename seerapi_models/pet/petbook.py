@@ -5,6 +5,7 @@ from sqlmodel import Field, Relationship
 from seerapi_models.build_model import (
     BaseCategoryModel,
     BaseResModel,
+    ConvertToModel,
     ConvertToORM,
 )
 from seerapi_models.common import ResourceRef
@@ -56,7 +57,9 @@ class PetEncyclopediaEntry(
         )
 
 
-class PetEncyclopediaEntryORM(PetEncyclopediaEntryBase, table=True):
+class PetEncyclopediaEntryORM(
+    PetEncyclopediaEntryBase, ConvertToModel['PetEncyclopediaEntry'], table=True
+):
     pet: 'PetORM' = Relationship(back_populates='encyclopedia')
 
 
@@ -85,7 +88,9 @@ class PetArchiveStoryEntry(
         )
 
 
-class PetArchiveStoryEntryORM(PetArchiveStoryEntryBase, table=True):
+class PetArchiveStoryEntryORM(
+    PetArchiveStoryEntryBase, ConvertToModel['PetArchiveStoryEntry'], table=True
+):
     pet_id: int = Field(description='精灵ID', foreign_key='pet.id')
     pet: 'PetORM' = Relationship(back_populates='archive_story')
     book_id: int = Field(
@@ -120,5 +125,7 @@ class PetArchiveStoryBook(
         )
 
 
-class PetArchiveStoryBookORM(PetArchiveStoryBookBase, table=True):
+class PetArchiveStoryBookORM(
+    PetArchiveStoryBookBase, ConvertToModel['PetArchiveStoryBook'], table=True
+):
     entries: list[PetArchiveStoryEntryORM] = Relationship(back_populates='book')
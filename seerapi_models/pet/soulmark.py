@@ -5,7 +5,9 @@ from sqlmodel import Field, Relationship, SQLModel
 
 from seerapi_models.build_model import (
     BaseCategoryModel,
+    BaseClosureModel,
     BaseResModel,
+    ConvertToModel,
     ConvertToORM,
 )
 from seerapi_models.common import EidEffectInUse, EidEffectInUseORM, ResourceRef
@@ -54,6 +56,7 @@ class SoulmarkBase(BaseResModel):
 
 class Soulmark(SoulmarkBase, ConvertToORM['SoulmarkORM']):
     __name_fields__: ClassVar[list[str]] = ['effect_alias']
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'soulmark')}
 
     pet: list[ResourceRef['Pet']] = Field(description='可持有该魂印的精灵ID')
     effect: EidEffectInUse | None = Field(description='魂印效果')
@@ -89,14 +92,30 @@ class Soulmark(SoulmarkBase, ConvertToORM['SoulmarkORM']):
             intensified=self.intensified,
             is_adv=self.is_adv,
             effect_in_use=self.effect.to_orm() if self.effect else None,
+            effect_alias=self.effect_alias,
             intensified_to_id=self.intensified_to.id if self.intensified_to else None,
             desc_formatting_adjustment=self.desc_formatting_adjustment,
             pve_effective=self.pve_effective,
             analyze_desc=self.analyze_desc,
         )
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return [
+            *(PetSoulmarkLink(pet_id=pet.id, soulmark_id=self.id) for pet in self.pet),
+            *(SoulmarkTagLink(soulmark_id=self.id, tag_id=tag.id) for tag in self.tag),
+        ]
 
-class SoulmarkORM(SoulmarkBase, table=True):
+
+class SoulmarkIntensifyClosure(BaseClosureModel, table=True):
+    """魂印强化链的闭包表，ancestor 为强化前的魂印"""
+
+    __closure_of__: ClassVar[tuple[str, str]] = ('soulmark', 'intensified_to_id')
+
+    ancestor_id: int = Field(primary_key=True, foreign_key='soulmark.id')
+    descendant_id: int = Field(primary_key=True, foreign_key='soulmark.id', index=True)
+
+
+class SoulmarkORM(SoulmarkBase, ConvertToModel['Soulmark'], table=True):
     pet: list['PetORM'] = Relationship(
         back_populates='soulmark', link_model=PetSoulmarkLink
     )
@@ -109,6 +128,7 @@ class SoulmarkORM(SoulmarkBase, table=True):
     effect_in_use: EidEffectInUseORM | None = Relationship(
         back_populates='soulmark',
     )
+    effect_alias: str | None = Field(default=None, description='效果别名')
 
     from_: Optional['SoulmarkORM'] = Relationship(
         back_populates='intensified_to',
@@ -146,6 +166,10 @@ class SoulmarkTagBase(BaseCategoryModel):
 
 
 class SoulmarkTagCategory(SoulmarkTagBase, ConvertToORM['SoulmarkTagORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'soulmark': ('soulmark', 'tag')
+    }
+
     soulmark: list[ResourceRef] = Field(default_factory=list, description='魂印列表')
 
     @classmethod
@@ -159,7 +183,9 @@ class SoulmarkTagCategory(SoulmarkTagBase, ConvertToORM['SoulmarkTagORM']):
         )
 
 
-class SoulmarkTagORM(SoulmarkTagBase, table=True):
+class SoulmarkTagORM(
+    SoulmarkTagBase, ConvertToModel['SoulmarkTagCategory'], table=True
+):
     soulmark: list['SoulmarkORM'] = Relationship(
         back_populates='tag', link_model=SoulmarkTagLink
     )
@@ -0,0 +1,274 @@
+"""按 (resource_name, id) 索引的内存资源注册表
+
+``ResourceRef`` 只包含资源ID与URL，从引用找回对应的模型时，
+参数化的引用（如 ``ResourceRef['Skill']``）由类型参数对应的已注册模型得到资源名称，
+其他引用需要从 URL 中解析出资源名称，再按资源名称与ID查找。
+``ResourceRegistry`` 收集任意 ``BaseResModel`` 子类的模型，
+以 ``{resource_name: {id: model}}`` 的两层 dict 保存，
+除模型本身外每个资源只占用一个 dict 条目（约 40 字节），解析引用为 O(1)。
+
+用法::
+
+    registry = ResourceRegistry(import_ndjson('data', [Pet, Skill, TypeCombination]))
+    combination = registry.resolve(pet.type)
+    skills = registry.resolve_many(item.skill for item in pet.skill)
+    resources = registry.resolve_many(collect_refs(pet))
+
+    registry.fill_back_refs()  # 填充 SkillCategory.skill 等反向引用列表
+"""
+
+from collections.abc import Callable, Iterable
+from functools import cache
+from typing import Any, TypeVar, get_args, overload
+
+from pydantic import BaseModel
+
+from .build_model import BaseResModel
+from .common import ResourceRef, _ref_model_name, _ref_pair
+
+_TResModel = TypeVar('_TResModel', bound=BaseResModel)
+_TDefault = TypeVar('_TDefault')
+
+
+# 正在计算的模型类，自身嵌套自身时保守地认为可能包含引用
+_pending: set[type[BaseModel]] = set()
+
+
+def _may_contain_ref(annotation: Any) -> bool:
+    # list[X] 等泛型别名也是 type 的实例，需要先检查类型参数
+    args = get_args(annotation)
+    if args:
+        return any(_may_contain_ref(arg) for arg in args)
+    if isinstance(annotation, type):
+        if issubclass(annotation, ResourceRef):
+            return True
+        if issubclass(annotation, BaseModel):
+            return annotation in _pending or bool(_ref_fields(annotation))
+        return False
+    # 未解析的前向引用等无法判断的注解
+    return annotation is not None
+
+
+@cache
+def _ref_fields(model: type[BaseModel]) -> tuple[str, ...]:
+    """模型中可能包含 ResourceRef 的字段"""
+    _pending.add(model)
+    try:
+        return tuple(
+            name
+            for name, field in model.model_fields.items()
+            if _may_contain_ref(field.annotation)
+        )
+    finally:
+        _pending.discard(model)
+
+
+def _collect_refs(model: BaseModel, append: Callable[[ResourceRef], None]) -> None:
+    values = model.__dict__
+    for name in _ref_fields(type(model)):
+        value = values.get(name)
+        if isinstance(value, ResourceRef):
+            append(value)
+        elif isinstance(value, BaseModel):
+            _collect_refs(value, append)
+        elif isinstance(value, list | tuple):
+            for item in value:
+                if isinstance(item, ResourceRef):
+                    append(item)
+                elif isinstance(item, BaseModel):
+                    _collect_refs(item, append)
+
+
+def collect_refs(model: BaseModel) -> list[ResourceRef]:
+    """按字段顺序递归收集模型中的全部 ResourceRef，包括列表与嵌套模型中的引用"""
+    refs: list[ResourceRef] = []
+    _collect_refs(model, refs.append)
+    return refs
+
+
+class ResourceRegistry:
+    """内存资源注册表
+
+    参数化的引用按类型参数的类名找到已注册模型的资源名称，
+    找不到或类名对应多个资源时才从 URL 解析，结果与服务地址无关；
+    带有子路径的引用解析为其所属的资源。
+    同一资源重复加入时，后加入的模型会覆盖先加入的。
+    """
+
+    __slots__ = ('_model_types', '_resources', '_type_names')
+
+    def __init__(self, models: Iterable[BaseResModel] = ()) -> None:
+        self._resources: dict[str, dict[int, BaseResModel]] = {}
+        # 已注册模型及其资源基类的类名 -> 资源名称，类名对应多个资源时为 None
+        self._type_names: dict[str, str | None] = {}
+        self._model_types: set[type[BaseResModel]] = set()
+        self.add_all(models)
+
+    def _add_type(self, model_type: type[BaseResModel], resource_name: str) -> None:
+        self._model_types.add(model_type)
+        names = self._type_names
+        for cls in model_type.__mro__:
+            # 引用的类型参数也可能是同一资源的基类，如 PetArchiveStoryEntryBase
+            if not (
+                issubclass(cls, BaseResModel) and cls.resource_name() == resource_name
+            ):
+                continue
+            if names.setdefault(cls.__name__, resource_name) != resource_name:
+                names[cls.__name__] = None
+
+    def _ref_type_resource_name(self, ref_type: type[ResourceRef]) -> str | None:
+        """引用类型对应的资源名称，无法由类型参数确定时返回 None"""
+        model_name = _ref_model_name(ref_type)
+        if model_name is None:
+            return None
+        return self._type_names.get(model_name)
+
+    def _resource_name(self, ref: ResourceRef) -> str:
+        resource_name = self._ref_type_resource_name(type(ref))
+        if resource_name is None:
+            resource_name = _ref_pair(ref.url, ref.id)[0]
+        return resource_name
+
+    def add(self, model: BaseResModel) -> None:
+        """加入一个模型
+
+        Raises:
+            ValueError: 模型没有ID
+
+        """
+        if model.id is None:
+            raise ValueError(f'{type(model).__name__} 没有ID，无法加入注册表')
+        resource_name = model.resource_name()
+        resources = self._resources.get(resource_name)
+        if resources is None:
+            resources = self._resources[resource_name] = {}
+        if type(model) not in self._model_types:
+            self._add_type(type(model), resource_name)
+        resources[model.id] = model
+
+    def add_all(self, models: Iterable[BaseResModel]) -> int:
+        """加入多个模型，可以是多种资源类型混合的生成器
+
+        Returns:
+            加入的模型数量
+
+        """
+        count = 0
+        for model in models:
+            self.add(model)
+            count += 1
+        return count
+
+    @overload
+    def get(self, model: type[_TResModel], id: int) -> _TResModel | None: ...
+
+    @overload
+    def get(
+        self, model: type[_TResModel], id: int, default: _TDefault
+    ) -> _TResModel | _TDefault: ...
+
+    def get(self, model, id, default=None):
+        """按资源类型与ID查找模型，不存在时返回 default"""
+        resources = self._resources.get(model.resource_name())
+        if resources is None:
+            return default
+        return resources.get(id, default)
+
+    def models(self, model: type[_TResModel]) -> list[_TResModel]:
+        """某一资源类型的全部模型，按加入顺序排列"""
+        return list(self._resources.get(model.resource_name(), {}).values())  # type: ignore[arg-type]
+
+    def resolve(self, ref: ResourceRef[_TResModel]) -> _TResModel:
+        """解析引用指向的模型
+
+        Raises:
+            KeyError: 引用的资源不在注册表中
+
+        """
+        resource_name = self._resource_name(ref)
+        try:
+            return self._resources[resource_name][ref.id]  # type: ignore[return-value]
+        except KeyError:
+            raise KeyError(f'未注册的资源：{resource_name}/{ref.id}') from None
+
+    def resolve_many(self, refs: Iterable[ResourceRef[_TResModel]]) -> list[_TResModel]:
+        """按顺序批量解析引用
+
+        Raises:
+            KeyError: 某个引用的资源不在注册表中
+
+        """
+        resources = self._resources
+        # 同一批中的引用类型很少，每种类型只查找一次资源名称
+        type_names: dict[type[ResourceRef], str | None] = {}
+        results: list[BaseResModel] = []
+        append = results.append
+        for ref in refs:
+            ref_type = type(ref)
+            try:
+                resource_name = type_names[ref_type]
+            except KeyError:
+                resource_name = type_names[ref_type] = self._ref_type_resource_name(
+                    ref_type
+                )
+            if resource_name is None:
+                resource_name = _ref_pair(ref.url, ref.id)[0]
+            try:
+                append(resources[resource_name][ref.id])
+            except KeyError:
+                raise KeyError(f'未注册的资源：{resource_name}/{ref.id}') from None
+        return results  # type: ignore[return-value]
+
+    def fill_back_refs(self) -> int:
+        """按各模型的 __back_refs__ 声明，由正向引用填充反向引用列表
+
+        例如 SkillCategory 声明了 {'skill': ('skill', 'category')}，
+        则每个 Skill 会被加入其 category 指向的 SkillCategory 的 skill 列表。
+        声明的列表会先被清空，再按正向模型加入注册表的顺序追加，可以重复调用。
+        耗时与模型及引用的数量成正比，指向未注册资源的引用会被忽略。
+
+        Returns:
+            追加的引用数量
+
+        """
+        resources = self._resources
+        # (正向资源名称, 正向字段) -> [(反向资源名称, 列表字段, 引用类型)]
+        specs: dict[tuple[str, str], list[tuple[str, str, type[ResourceRef]]]] = {}
+        for resource_name, models in resources.items():
+            for cls in {type(model) for model in models.values()}:
+                for field, forward in cls.__back_refs__.items():
+                    ref_type = get_args(cls.model_fields[field].annotation)[0]
+                    specs.setdefault(forward, []).append(
+                        (resource_name, field, ref_type)
+                    )
+            for model in models.values():
+                for field in model.__back_refs__:
+                    setattr(model, field, [])
+
+        count = 0
+        for (forward_name, forward_field), targets in specs.items():
+            for model in resources.get(forward_name, {}).values():
+                value = getattr(model, forward_field, None)
+                if value is None:
+                    continue
+                refs = value if isinstance(value, list) else (value,)
+                for target_name, field, ref_type in targets:
+                    target_models = resources[target_name]
+                    back_ref = ref_type.from_res_name(model.id, forward_name)
+                    for ref in refs:
+                        target = target_models.get(ref.id)
+                        if target is not None:
+                            getattr(target, field).append(back_ref)
+                            count += 1
+        return count
+
+    def __contains__(self, ref: object) -> bool:
+        if not isinstance(ref, ResourceRef):
+            return False
+        return ref.id in self._resources.get(self._resource_name(ref), ())
+
+    def __len__(self) -> int:
+        return sum(map(len, self._resources.values()))
+
+
+__all__ = ['ResourceRegistry', 'collect_refs']
@@ -0,0 +1,448 @@
+"""按名称与描述全文搜索资源
+
+精灵、技能、魂印、词条、物品与成就的名称及描述大多是中文，
+``LIKE '%…%'`` 需要逐行扫描，而 SQLite 默认的分词器不会切分中文。
+本模块在 SQLite 中创建一张使用 trigram 分词器的 FTS5 虚拟表 ``search_fts``，
+由各资源表以一条 ``INSERT ... SELECT`` 填充，
+``search`` 按 bm25 排序返回 ``NamedResourceRef``。
+其他数据库可以使用内存中的 ``SearchIndex``，同样按三字组（trigram）建立倒排索引，
+排序规则与 SQLite 的 bm25 相同。
+
+trigram 分词器只能匹配不少于三个字的词，较短的词改为按子串过滤，
+只包含短词的查询结果按名称是否匹配、再按写入顺序排列。
+
+FTS5 虚拟表不会随资源表自动更新。``bulk_load`` 在 SQLite 中写入了参与搜索的资源后
+默认调用 ``rebuild_search_index`` 重新填充，``build_snapshot`` 默认在快照中创建并填充；
+``apply_diff`` 只会重新填充已经存在的表。以其他方式写入资源表后需要手动调用
+``rebuild_search_index``，否则 ``search`` 仍返回旧的结果，从未建立时会抛出异常。
+
+用法::
+
+    bulk_load(session, models)  # 同时填充全文搜索索引
+    refs = search(session, '火焰伤害', Skill)
+
+    index = SearchIndex(models)  # 或 SearchIndex.from_session(session)
+    refs = index.search('火焰伤害', Skill)
+"""
+
+from collections.abc import Iterable
+import math
+from typing import Any, NamedTuple, TypeVar, overload
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    and_,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel
+
+from .achievement import Achievement
+from .build_model import BaseResModel
+from .common import NamedResourceRef
+from .glossary import GlossaryEntry
+from .items import Item
+from .pet import Pet, Soulmark
+from .skill import Skill
+
+_TResModel = TypeVar('_TResModel', bound=BaseResModel)
+
+
+class SearchSource(NamedTuple):
+    """参与全文搜索的资源"""
+
+    model: type[BaseResModel]
+    """资源模型，资源名称同时是数据库中的表名"""
+    name: str | None
+    """名称字段，没有名称的资源为 None"""
+    text: str | None
+    """描述字段"""
+
+
+SEARCH_SOURCES: tuple[SearchSource, ...] = (
+    SearchSource(Pet, 'name', None),
+    SearchSource(Skill, 'name', 'info'),
+    SearchSource(Soulmark, None, 'desc'),
+    SearchSource(GlossaryEntry, 'name', 'desc'),
+    SearchSource(Item, 'name', 'desc'),
+    SearchSource(Achievement, 'name', 'desc'),
+)
+
+SEARCH_TABLE = 'search_fts'
+
+# bm25 中名称与描述的权重
+NAME_WEIGHT = 10.0
+TEXT_WEIGHT = 1.0
+
+# trigram 分词器能够匹配的最短长度
+_MIN_TERM = 3
+
+_search_table = table(
+    SEARCH_TABLE,
+    column('name'),
+    column('text'),
+    column('resource'),
+    column('ref_id'),
+)
+
+
+def _source(model: type[BaseResModel]) -> SearchSource:
+    for source in SEARCH_SOURCES:
+        if source.model.resource_name() == model.resource_name():
+            return source
+    raise ValueError(f'{model.__name__} 不支持全文搜索')
+
+
+def _terms(query: str) -> tuple[list[str], list[str]]:
+    """将查询按空白拆分为 (可以使用 trigram 匹配的词, 较短的词)"""
+    terms = query.split()
+    return (
+        [term for term in terms if len(term) >= _MIN_TERM],
+        [term for term in terms if len(term) < _MIN_TERM],
+    )
+
+
+def _connection(bind: Session | Connection) -> Connection:
+    connection = bind.connection() if isinstance(bind, Session) else bind
+    if connection.dialect.name != 'sqlite':
+        raise ValueError(
+            f'全文搜索索引只支持 SQLite，{connection.dialect.name} 请使用 SearchIndex'
+        )
+    return connection
+
+
+def create_search_table(bind: Session | Connection) -> None:
+    """创建 FTS5 虚拟表，已存在时不做任何操作
+
+    Raises:
+            ValueError: 数据库不是 SQLite
+
+    """
+    _connection(bind).exec_driver_sql(
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5('
+        "name, text, resource UNINDEXED, ref_id UNINDEXED, tokenize='trigram')"
+    )
+
+
+def rebuild_search_index(bind: Session | Connection) -> dict[str, int]:
+    """创建 FTS5 虚拟表，清空后由各资源表重新填充，每种资源只执行一条 INSERT ... SELECT
+
+    资源表写入后需要调用，bulk_load 与 build_snapshot 默认会自动调用。
+
+    Returns:
+            各资源写入的行数
+
+    Raises:
+            ValueError: 数据库不是 SQLite
+
+    """
+    connection = _connection(bind)
+    create_search_table(connection)
+    connection.execute(delete(_search_table))
+    counts: dict[str, int] = {}
+    for source in SEARCH_SOURCES:
+        resource_name = source.model.resource_name()
+        source_table = SQLModel.metadata.tables[resource_name]
+        result = connection.execute(
+            insert(_search_table).from_select(
+                ['name', 'text', 'resource', 'ref_id'],
+                select(
+                    source_table.c[source.name] if source.name else null(),
+                    source_table.c[source.text] if source.text else null(),
+                    literal(resource_name),
+                    source_table.c.id,
+                ).order_by(source_table.c.id),
+            )
+        )
+        counts[resource_name] = result.rowcount
+    return counts
+
+
+@overload
+def search(
+    bind: Session | Connection,
+    query: str,
+    model: type[_TResModel],
+    *,
+    limit: int = 20,
+) -> list[NamedResourceRef[_TResModel]]: ...
+
+
+@overload
+def search(
+    bind: Session | Connection,
+    query: str,
+    model: None = None,
+    *,
+    limit: int = 20,
+) -> list[NamedResourceRef[Any]]: ...
+
+
+def search(bind, query, model=None, *, limit=20):
+    """在 FTS5 虚拟表中搜索，结果按 bm25 从高到低排列
+
+    查询按空白拆分为多个词，结果需要包含全部的词（不区分大小写）。
+    只能搜索到最近一次 rebuild_search_index 时资源表中的数据。
+
+    Args:
+                bind: 使用的 Session 或 Connection
+                query: 查询文本
+                model: 只搜索该类型的资源，为 None 时搜索全部资源
+                limit: 最多返回的结果数量
+
+    Raises:
+            ValueError: 数据库不是 SQLite，或 model 不支持全文搜索
+
+    """
+    connection = _connection(bind)
+    long_terms, short_terms = _terms(query)
+    if not long_terms and not short_terms:
+        return []
+    c = _search_table.c
+    conditions: list[ColumnElement[bool]] = []
+    if model is not None:
+        conditions.append(c.resource == _source(model).model.resource_name())
+    for term in short_terms:
+        conditions.append(
+            or_(
+                c.name.contains(term, autoescape=True),
+                c.text.contains(term, autoescape=True),
+            )
+        )
+    statement = select(c.resource, c.ref_id, c.name)
+    if long_terms:
+        phrases = ' '.join('"' + term.replace('"', '""') + '"' for term in long_terms)
+        fts = literal_column(SEARCH_TABLE)
+        conditions.append(fts.op('MATCH')(phrases))
+        statement = statement.order_by(func.bm25(fts, NAME_WEIGHT, TEXT_WEIGHT))
+    else:
+        name = func.coalesce(c.name, '')
+        name_matches = and_(
+            *(name.contains(term, autoescape=True) for term in short_terms)
+        )
+        statement = statement.order_by(name_matches.desc(), literal_column('rowid'))
+    rows = connection.execute(statement.where(*conditions).limit(limit))
+    return [
+        NamedResourceRef.from_res_name(ref_id, resource, name=name)
+        for resource, ref_id, name in rows
+    ]
+
+
+def _trigram_count(value: str) -> int:
+    return max(len(value) - _MIN_TERM + 1, 0)
+
+
+def _occurrences(value: str, term: str) -> int:
+    """term 在 value 中出现的次数，包括相互重叠的位置"""
+    count = 0
+    start = value.find(term)
+    while start != -1:
+        count += 1
+        start = value.find(term, start + 1)
+    return count
+
+
+class _Document(NamedTuple):
+    resource: str
+    id: int
+    name: str | None
+    # 转换为小写后的名称与描述
+    folded_name: str
+    folded_text: str
+    length: int
+
+
+class SearchIndex:
+    """内存中的三字组倒排索引，用于 SQLite 以外的数据库或直接搜索 API 模型
+
+    搜索结果、排序与 SQLite 的 search 相同（得分相同的资源按加入顺序排列）。
+    """
+
+    __slots__ = ('_documents', '_postings', '_total_length')
+
+    def __init__(self, models: Iterable[BaseResModel] = ()) -> None:
+        """
+        Args:
+                models: 资源模型，不支持全文搜索的资源会被忽略
+
+        """
+        self._documents: list[_Document] = []
+        self._postings: dict[str, list[int]] = {}
+        self._total_length = 0
+        sources = {source.model.resource_name(): source for source in SEARCH_SOURCES}
+        for model in models:
+            source = sources.get(model.resource_name())
+            if source is None:
+                continue
+            self.add(
+                source.model,
+                model.id,
+                getattr(model, source.name) if source.name else None,
+                getattr(model, source.text) if source.text else None,
+            )
+
+    @classmethod
+    def from_session(cls, bind: Session | Connection) -> 'SearchIndex':
+        """由数据库中的资源表构建，每种资源只执行一次查询，不加载 ORM 对象"""
+        connection = bind.connection() if isinstance(bind, Session) else bind
+        index = cls()
+        for source in SEARCH_SOURCES:
+            source_table = SQLModel.metadata.tables[source.model.resource_name()]
+            rows = connection.execute(
+                select(
+                    source_table.c.id,
+                    source_table.c[source.name] if source.name else null(),
+                    source_table.c[source.text] if source.text else null(),
+                ).order_by(source_table.c.id)
+            )
+            for id, name, description in rows:
+                index.add(source.model, id, name, description)
+        return index
+
+    def add(
+        self,
+        model: type[BaseResModel],
+        id: int,
+        name: str | None,
+        description: str | None,
+    ) -> None:
+        """加入一个资源的名称与描述"""
+        folded_name = (name or '').casefold()
+        folded_text = (description or '').casefold()
+        length = _trigram_count(folded_name) + _trigram_count(folded_text)
+        position = len(self._documents)
+        self._documents.append(
+            _Document(model.resource_name(), id, name, folded_name, folded_text, length)
+        )
+        self._total_length += length
+        for value in (folded_name, folded_text):
+            for trigram in {value[i : i + _MIN_TERM] for i in range(len(value) - 2)}:
+                postings = self._postings.setdefault(trigram, [])
+                if not postings or postings[-1] != position:
+                    postings.append(position)
+
+    def _candidates(self, term: str) -> list[int]:
+        """包含 term 全部三字组的资源，仍需要再检查是否包含 term 本身"""
+        lists = sorted(
+            (
+                self._postings.get(term[i : i + _MIN_TERM], [])
+                for i in range(len(term) - 2)
+            ),
+            key=len,
+        )
+        result = set(lists[0])
+        for postings in lists[1:]:
+            result.intersection_update(postings)
+        return sorted(result)
+
+    @overload
+    def search(
+        self, query: str, model: type[_TResModel], *, limit: int = 20
+    ) -> list[NamedResourceRef[_TResModel]]: ...
+
+    @overload
+    def search(
+        self, query: str, model: None = None, *, limit: int = 20
+    ) -> list[NamedResourceRef[Any]]: ...
+
+    def search(self, query, model=None, *, limit=20):
+        """搜索资源，参数与结果同模块级的 search
+
+        Raises:
+            ValueError: model 不支持全文搜索
+
+        """
+        long_terms, short_terms = _terms(query.casefold())
+        if not long_terms and not short_terms:
+            return []
+        resource = _source(model).model.resource_name() if model else None
+        documents = self._documents
+        if not documents:
+            return []
+
+        # 每个词各自出现在哪些资源中，计算 idf 时不考虑资源类型与其他词
+        matches: list[list[int]] = []
+        for term in long_terms:
+            matches.append(
+                [
+                    position
+                    for position in self._candidates(term)
+                    if term in documents[position].folded_name
+                    or term in documents[position].folded_text
+                ]
+            )
+        if matches:
+            positions = set(matches[0]).intersection(*matches[1:])
+        else:
+            positions = range(len(documents))
+
+        def accept(document: _Document) -> bool:
+            return (resource is None or document.resource == resource) and all(
+                term in document.folded_name or term in document.folded_text
+                for term in short_terms
+            )
+
+        selected = [p for p in sorted(positions) if accept(documents[p])]
+        if long_terms:
+            # 与 FTS5 的 bm25 相同，k1 = 1.2，b = 0.75，得分越高越相关
+            count = len(documents)
+            average = self._total_length / count
+            idfs = [
+                max(math.log((count - len(m) + 0.5) / (len(m) + 0.5)), 1e-6)
+                for m in matches
+            ]
+
+            def score(position: int) -> float:
+                document = documents[position]
+                total = 0.0
+                for term, idf in zip(long_terms, idfs):
+                    frequency = NAME_WEIGHT * _occurrences(
+                        document.folded_name, term
+                    ) + TEXT_WEIGHT * _occurrences(document.folded_text, term)
+                    total += (
+                        idf
+                        * frequency
+                        * 2.2
+                        / (frequency + 1.2 * (0.25 + 0.75 * document.length / average))
+                    )
+                return total
+
+            selected.sort(key=score, reverse=True)
+        else:
+            selected.sort(
+                key=lambda p: (
+                    not all(term in documents[p].folded_name for term in short_terms)
+                )
+            )
+        return [
+            NamedResourceRef.from_res_name(
+                documents[p].id, documents[p].resource, name=documents[p].name
+            )
+            for p in selected[:limit]
+        ]
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+__all__ = [
+    'NAME_WEIGHT',
+    'SEARCH_SOURCES',
+    'SEARCH_TABLE',
+    'TEXT_WEIGHT',
+    'SearchIndex',
+    'SearchSource',
+    'create_search_table',
+    'rebuild_search_index',
+    'search',
+]
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, ClassVar, Optional
 
 from sqlmodel import JSON, Field, Relationship, SQLModel
 
@@ -6,6 +6,7 @@ from .build_model import (
     BaseCategoryModel,
     BaseResModel,
     BaseResModelWithOptionalId,
+    ConvertToModel,
     ConvertToORM,
 )
 from .common import ResourceRef, SkillEffectInUse, SkillEffectInUseORM
@@ -76,7 +77,9 @@ class SkillEffectParam(BaseResModel, ConvertToORM['SkillEffectParamORM']):
         )
 
 
-class SkillEffectParamORM(SkillEffectParam, table=True):
+class SkillEffectParamORM(
+    SkillEffectParam, ConvertToModel['SkillEffectParam'], table=True
+):
     in_type: list['SkillEffectParamInTypeORM'] = Relationship(
         back_populates='param',
     )
@@ -107,7 +110,9 @@ class SkillEffectParamInType(
         )
 
 
-class SkillEffectParamInTypeORM(SkillEffectParamInTypeBase, table=True):
+class SkillEffectParamInTypeORM(
+    SkillEffectParamInTypeBase, ConvertToModel['SkillEffectParamInType'], table=True
+):
     param_id: int = Field(foreign_key='skill_effect_param.id')
     param: 'SkillEffectParamORM' = Relationship(back_populates='in_type')
     effect: 'SkillEffectTypeORM' = Relationship(
@@ -155,10 +160,18 @@ class SkillEffectType(SkillEffectTypeBase, ConvertToORM['SkillEffectTypeORM']):
             pve_effective=self.pve_effective,
             info_formatting_adjustment=self.info_formatting_adjustment,
             analyze_info=self.analyze_info,
+            param=[param.to_orm() for param in self.param or []],
         )
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return [
+            SkillEffectTypeTagLink(effect_id=self.id, tag_id=tag.id) for tag in self.tag
+        ]
+
 
-class SkillEffectTypeORM(SkillEffectTypeBase, table=True):
+class SkillEffectTypeORM(
+    SkillEffectTypeBase, ConvertToModel['SkillEffectType'], table=True
+):
     param: list['SkillEffectParamInTypeORM'] = Relationship(
         back_populates='effect', link_model=EffectParamLink
     )
@@ -177,6 +190,10 @@ class SkillCategoryBase(BaseCategoryModel):
 
 
 class SkillCategory(SkillCategoryBase, ConvertToORM['SkillCategoryORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'skill': ('skill', 'category')
+    }
+
     skill: list[ResourceRef['Skill']] = Field(
         default_factory=list, description='使用该分类的技能列表'
     )
@@ -192,7 +209,7 @@ class SkillCategory(SkillCategoryBase, ConvertToORM['SkillCategoryORM']):
         )
 
 
-class SkillCategoryORM(SkillCategoryBase, table=True):
+class SkillCategoryORM(SkillCategoryBase, ConvertToModel['SkillCategory'], table=True):
     skill: list['SkillORM'] = Relationship(back_populates='category')
 
 
@@ -206,6 +223,10 @@ class SkillHideEffectBase(BaseCategoryModel):
 
 
 class SkillHideEffect(SkillHideEffectBase, ConvertToORM['SkillHideEffectORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'skill': ('skill', 'hide_effect')
+    }
+
     skill: list[ResourceRef['Skill']] = Field(
         default_factory=list, description='使用该隐藏效果的技能列表'
     )
@@ -222,7 +243,9 @@ class SkillHideEffect(SkillHideEffectBase, ConvertToORM['SkillHideEffectORM']):
         )
 
 
-class SkillHideEffectORM(SkillHideEffectBase, table=True):
+class SkillHideEffectORM(
+    SkillHideEffectBase, ConvertToModel['SkillHideEffect'], table=True
+):
     skill: list['SkillORM'] = Relationship(back_populates='hide_effect')
 
 
@@ -235,6 +258,10 @@ class SkillEffectTypeTagBase(BaseCategoryModel):
 
 
 class SkillEffectTypeTag(SkillEffectTypeTagBase, ConvertToORM['SkillEffectTypeTagORM']):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {
+        'effect': ('skill_effect_type', 'tag')
+    }
+
     effect: list[ResourceRef['SkillEffectType']] = Field(
         default_factory=list, description='技能效果类型列表'
     )
@@ -246,8 +273,16 @@ class SkillEffectTypeTag(SkillEffectTypeTagBase, ConvertToORM['SkillEffectTypeTa
     def to_orm(self) -> 'SkillEffectTypeTagORM':
         return SkillEffectTypeTagORM(id=self.id, name=self.name)
 
+    def to_orm_links(self) -> list[SQLModel]:
+        return [
+            SkillEffectTypeTagLink(effect_id=effect.id, tag_id=self.id)
+            for effect in self.effect
+        ]
 
-class SkillEffectTypeTagORM(SkillEffectTypeTagBase, table=True):
+
+class SkillEffectTypeTagORM(
+    SkillEffectTypeTagBase, ConvertToModel['SkillEffectTypeTag'], table=True
+):
     effect: list['SkillEffectTypeORM'] = Relationship(
         back_populates='tag', link_model=SkillEffectTypeTagLink
     )
@@ -312,10 +347,14 @@ class Skill(SkillBase, ConvertToORM['SkillORM']):
             hide_effect_id=self.hide_effect.id if self.hide_effect else None,
             atk_num=self.atk_num,
             advance_id=self.advance.id if self.advance else None,
+            skill_effect=[effect.to_orm() for effect in self.skill_effect],
+            friend_skill_effect=[
+                effect.to_orm() for effect in self.friend_skill_effect
+            ],
         )
 
 
-class SkillORM(SkillBase, table=True):
+class SkillORM(SkillBase, ConvertToModel['Skill'], table=True):
     category_id: int = Field(foreign_key='skill_category.id')
     category: SkillCategoryORM = Relationship(back_populates='skill')
     type_id: int = Field(foreign_key='element_type_combination.id')
@@ -332,7 +371,7 @@ class SkillORM(SkillBase, table=True):
         back_populates='skill', link_model=SkillEffectLink
     )
     friend_skill_effect: list[SkillEffectInUseORM] = Relationship(
-        back_populates='skill', link_model=SkillFriendSkillEffectLink
+        back_populates='friend_skill', link_model=SkillFriendSkillEffectLink
     )
     hide_effect_id: int | None = Field(default=None, foreign_key='skill_hide_effect.id')
     hide_effect: SkillHideEffectORM | None = Relationship(back_populates='skill')
@@ -0,0 +1,172 @@
+"""构建用于只读服务的 SQLite 快照
+
+ORM 模型只声明了外键，没有二级索引，在 SQLite 中查询“学习某技能的精灵”
+“某属性的技能”等都需要全表扫描。``build_snapshot`` 由 ``SQLModel.metadata`` 创建表结构，
+通过 ``bulk_load`` 批量写入数据，写入完成后再一次性创建 ``snapshot_indexes``
+给出的索引，最后执行 ``ANALYZE`` 与 ``VACUUM``，
+得到一个紧凑、带有查询规划统计信息的只读文件。
+
+索引包括 ``SNAPSHOT_INDEXES`` 中按常用查询挑选的索引，以及每个外键列上的索引。
+复合主键（链接表）中非首列的外键，索引中会带上主键的其余列，反向查询时只读索引即可完成；
+SQLite 的二级索引本身包含 rowid，单列外键索引同样可以覆盖“按外键查ID”的查询。
+
+用法::
+
+    build_snapshot('seerapi.db', [*pets, *skills, *mintmarks])
+    engine = open_snapshot('seerapi.db')
+"""
+
+from collections.abc import Iterable
+import os
+from pathlib import Path
+
+from sqlalchemy import Connection, Engine, MetaData, create_engine
+from sqlmodel import SQLModel
+
+from .bulk import DEFAULT_BATCH_SIZE, SupportsToORM, bulk_load
+from .search import rebuild_search_index
+
+# (表名, 列名)，按常用查询挑选的索引，与外键索引的首列相同时代替外键索引
+SNAPSHOT_INDEXES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ('pet', ('name',)),
+    ('pet', ('pet_class_id', 'evolution_chain_index')),
+    ('skill', ('name',)),
+    ('skillinpetorm', ('pet_id', 'learning_level', 'skill_id')),
+    ('item', ('name',)),
+    ('mintmark', ('name',)),
+    ('gem', ('name',)),
+    ('equip', ('name',)),
+    ('achievement', ('name',)),
+    ('pet_skin', ('name',)),
+)
+
+
+def snapshot_indexes(
+    metadata: MetaData = SQLModel.metadata,
+) -> list[tuple[str, tuple[str, ...]]]:
+    """快照中创建的全部索引
+
+    包括 SNAPSHOT_INDEXES 中的索引，以及每个外键列上的索引；
+    外键列已经是主键、已有索引或上述索引的首列时不再重复创建。
+
+    Returns:
+            (表名, 列名) 的列表
+
+    """
+    indexes: list[tuple[str, tuple[str, ...]]] = []
+    for table in metadata.tables.values():
+        curated = [columns for name, columns in SNAPSHOT_INDEXES if name == table.name]
+        primary_key = tuple(column.name for column in table.primary_key)
+        leading = {primary_key[0]} if primary_key else set()
+        leading.update(index.columns[0].name for index in table.indexes)
+        leading.update(columns[0] for columns in curated)
+        indexes.extend((table.name, columns) for columns in curated)
+        for column in table.columns:
+            if not column.foreign_keys or column.name in leading:
+                continue
+            leading.add(column.name)
+            if column.name in primary_key:
+                rest = tuple(name for name in primary_key if name != column.name)
+                indexes.append((table.name, (column.name, *rest)))
+            else:
+                indexes.append((table.name, (column.name,)))
+    return indexes
+
+
+def create_snapshot_indexes(
+    connection: Connection, metadata: MetaData = SQLModel.metadata
+) -> list[str]:
+    """在已有的数据库中创建 snapshot_indexes 给出的索引，已存在的索引会被跳过
+
+    Returns:
+            索引名称
+
+    """
+    quote = connection.dialect.identifier_preparer.quote
+    names: list[str] = []
+    for table, columns in snapshot_indexes(metadata):
+        name = f'ix_snapshot_{table}_{"_".join(columns)}'
+        connection.exec_driver_sql(
+            f'CREATE INDEX IF NOT EXISTS {quote(name)} ON {quote(table)} '
+            f'({", ".join(map(quote, columns))})'
+        )
+        names.append(name)
+    return names
+
+
+def build_snapshot(
+    path: str | os.PathLike[str],
+    models: Iterable[SupportsToORM | SQLModel],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    search_index: bool = True,
+) -> dict[str, int]:
+    """将模型写入新的 SQLite 快照文件
+
+    先写入同目录下的临时文件，完成后设为只读并替换 path，
+    构建失败时不会留下不完整的快照。写入期间关闭日志与同步以加快构建。
+
+    Args:
+                path: 快照文件路径，已存在时会被替换
+                models: 写入的模型，参数含义见 bulk_load
+                batch_size: 每批写入的最大行数
+                search_index: 是否同时创建并填充全文搜索使用的 FTS5 虚拟表，
+                        见 search 模块，不创建时无法对快照使用 search
+
+    Returns:
+            各表写入的行数
+
+    """
+    path = Path(path)
+    temp = path.with_name(f'{path.name}.tmp')
+    temp.unlink(missing_ok=True)
+    engine = create_engine(f'sqlite:///{temp}')
+    try:
+        with engine.connect() as connection:
+            connection.exec_driver_sql('PRAGMA journal_mode = OFF')
+            connection.exec_driver_sql('PRAGMA synchronous = OFF')
+            SQLModel.metadata.create_all(connection)
+            # 全文搜索索引在建立其他索引后统一填充，快照中没有可搜索的资源时也会创建
+            counts = bulk_load(
+                connection, models, batch_size=batch_size, search_index=False
+            )
+            create_snapshot_indexes(connection)
+            if search_index:
+                rebuild_search_index(connection)
+            connection.commit()
+            # ANALYZE 与 VACUUM 不能在事务中执行
+            connection = connection.execution_options(isolation_level='AUTOCOMMIT')
+            connection.exec_driver_sql('ANALYZE')
+            connection.exec_driver_sql('VACUUM')
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+    finally:
+        engine.dispose()
+    temp.chmod(0o444)
+    os.replace(temp, path)
+    return counts
+
+
+def open_snapshot(path: str | os.PathLike[str], **kwargs) -> Engine:
+    """以只读、不可变模式打开快照，SQLite 不再对文件加锁或检查是否被修改
+
+    Args:
+                path: 快照文件路径
+                kwargs: 传给 create_engine 的其他参数
+
+    """
+    uri = Path(path).resolve().as_uri()
+    return create_engine(
+        f'sqlite:///{uri.replace("file://", "file:", 1)}?mode=ro&immutable=1&uri=true',
+        **kwargs,
+    )
+
+
+__all__ = [
+    'SNAPSHOT_INDEXES',
+    'build_snapshot',
+    'create_snapshot_indexes',
+    'open_snapshot',
+    'snapshot_indexes',
+]
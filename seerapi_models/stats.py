@@ -0,0 +1,207 @@
+"""精灵能力值计算
+
+由种族值（``Pet.base_stats``、``PetAdvance.base_stats`` 或合体精灵王的自定义种族值）、
+个体值、学习力与等级计算等级能力值，再依次加上性格修正与刻印、称号、能量珠等加成。
+以 ``SixAttributes`` 的 ``+`` 串联计算时，每一步都会创建一个模型；
+本模块只在元组上计算，结果为 ``CompactSixAttributes``，
+每一步加成的规则与 ``SixAttributes.__add__`` 完全一致：
+百分比加成（``percent`` 为 True）按 ``值 * (1 + 加成 / 100)`` 计算，其余直接相加。
+
+用法::
+
+    build = StatBuild(level=100, ev=ev, bonuses=(mintmark.max_attr_value, title_bonus))
+    stats = calc_stats(pet.base_stats, nature, build)
+
+    # 批量计算多个 (种族值, 性格, 培养方案) 组合，相同的输入只解析一次
+    results = calc_stats_many((pet.base_stats, nature, build) for ...)
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from math import floor
+
+from .common import CompactSixAttributes, SixAttributesBase
+from .nature import Nature
+
+Attributes = SixAttributesBase | CompactSixAttributes
+
+# 六项属性中体力所在的位置
+_HP = 5
+_ZERO = (0, 0, 0, 0, 0, 0)
+
+
+@dataclass(frozen=True)
+class StatBuild:
+    """一套培养方案
+
+    Attributes:
+            level: 等级
+            iv: 个体值
+            ev: 学习力，为 None 时全部为 0
+            bonuses: 刻印、称号、能量珠等加成，在性格修正之后按顺序依次相加
+            diy_stats: 合体精灵王的自定义种族值，给出时代替传入的种族值
+
+    """
+
+    level: int = 100
+    iv: int = 31
+    ev: Attributes | None = None
+    bonuses: Sequence[Attributes] = ()
+    diy_stats: Attributes | None = None
+
+
+def _unpack(attributes: Attributes) -> tuple[tuple[float, ...], bool]:
+    if isinstance(attributes, CompactSixAttributes):
+        return attributes[:6], attributes.percent
+    return (
+        attributes.atk,
+        attributes.def_,
+        attributes.sp_atk,
+        attributes.sp_def,
+        attributes.spd,
+        attributes.hp,
+    ), attributes.percent
+
+
+def _nature_attributes(nature: Nature | Attributes) -> Attributes:
+    return nature.attributes if isinstance(nature, Nature) else nature
+
+
+def _flat(attributes: Attributes | None, name: str) -> tuple[float, ...]:
+    if attributes is None:
+        return _ZERO
+    values, percent = _unpack(attributes)
+    if percent:
+        raise ValueError(f'{name}不能是百分比加成')
+    return values
+
+
+def _level_stats(
+    base: Sequence[float], ev: Sequence[float], level: int, iv: int
+) -> list[float]:
+    """等级能力值，学习力每 4 点折算为 1 点，结果向下取整"""
+    values: list[float] = [
+        floor((base[i] * 2 + iv + int(ev[i]) // 4) * level / 100 + 5) for i in range(6)
+    ]
+    values[_HP] = floor(
+        (base[_HP] * 2 + iv + int(ev[_HP]) // 4) * level / 100 + level + 10
+    )
+    return values
+
+
+def _apply(values: list[float], bonus: tuple[float, ...], percent: bool) -> None:
+    """在非百分比的能力值上加上一项加成，规则同 SixAttributes.__add__"""
+    if percent:
+        for i in range(6):
+            values[i] = values[i] * (1 + bonus[i] / 100)
+    else:
+        for i in range(6):
+            values[i] = values[i] + bonus[i]
+
+
+def level_stats(
+    base_stats: Attributes,
+    *,
+    level: int = 100,
+    iv: int = 31,
+    ev: Attributes | None = None,
+) -> CompactSixAttributes:
+    """不含任何加成的等级能力值
+
+    体力为 (种族值 × 2 + 个体值 + 学习力 ÷ 4) × 等级 ÷ 100 + 等级 + 10，
+    其余属性为 (种族值 × 2 + 个体值 + 学习力 ÷ 4) × 等级 ÷ 100 + 5，均向下取整。
+
+    Raises:
+            ValueError: 种族值或学习力是百分比加成
+
+    """
+    values = _level_stats(_flat(base_stats, '种族值'), _flat(ev, '学习力'), level, iv)
+    return CompactSixAttributes._make((*values, False))
+
+
+def calc_stats(
+    base_stats: Attributes,
+    nature: Nature | Attributes | None = None,
+    build: StatBuild = StatBuild(),
+) -> CompactSixAttributes:
+    """计算最终能力值
+
+    结果与 ``level_stats(...).to_model() + nature.attributes + bonus...``
+    逐个相加的结果相同，但不会创建中间模型。
+
+    Args:
+                base_stats: 种族值，觉醒后的精灵请传入 PetAdvance.base_stats
+                nature: 性格或性格修正属性，为 None 时不修正
+                build: 培养方案
+
+    Raises:
+            ValueError: 种族值或学习力是百分比加成
+
+    """
+    base = _flat(
+        build.diy_stats if build.diy_stats is not None else base_stats, '种族值'
+    )
+    values = _level_stats(base, _flat(build.ev, '学习力'), build.level, build.iv)
+    if nature is not None:
+        _apply(values, *_unpack(_nature_attributes(nature)))
+    for bonus in build.bonuses:
+        _apply(values, *_unpack(bonus))
+    return CompactSixAttributes._make((*values, False))
+
+
+def calc_stats_many(
+    combinations: Iterable[tuple[Attributes, Nature | Attributes | None, StatBuild]],
+) -> list[CompactSixAttributes]:
+    """批量计算多个 (种族值, 性格, 培养方案) 组合的最终能力值
+
+    同一批中重复出现的种族值、性格与加成（以对象本身区分）只解析一次，
+    相同的种族值与培养方案的等级能力值也只计算一次。
+
+    Raises:
+            ValueError: 种族值或学习力是百分比加成
+
+    """
+    # 以 id 为键时需要同时保留对象本身，避免对象被回收后 id 被复用
+    unpacked: dict[int, tuple[object, tuple[tuple[float, ...], bool]]] = {}
+    leveled: dict[tuple[int, int], tuple[object, object, list[float]]] = {}
+
+    def cached(attributes: Attributes) -> tuple[tuple[float, ...], bool]:
+        entry = unpacked.get(id(attributes))
+        if entry is None:
+            entry = unpacked[id(attributes)] = (attributes, _unpack(attributes))
+        return entry[1]
+
+    results: list[CompactSixAttributes] = []
+    append = results.append
+    for base_stats, nature, build in combinations:
+        key = (id(base_stats), id(build))
+        entry = leveled.get(key)
+        if entry is None:
+            base = build.diy_stats if build.diy_stats is not None else base_stats
+            values, percent = cached(base)
+            if percent:
+                raise ValueError('种族值不能是百分比加成')
+            ev, percent = cached(build.ev) if build.ev is not None else (_ZERO, False)
+            if percent:
+                raise ValueError('学习力不能是百分比加成')
+            entry = leveled[key] = (
+                base_stats,
+                build,
+                _level_stats(values, ev, build.level, build.iv),
+            )
+        values = entry[2].copy()
+        if nature is not None:
+            _apply(values, *cached(_nature_attributes(nature)))
+        for bonus in build.bonuses:
+            _apply(values, *cached(bonus))
+        append(CompactSixAttributes._make((*values, False)))
+    return results
+
+
+__all__ = [
+    'Attributes',
+    'StatBuild',
+    'calc_stats',
+    'calc_stats_many',
+    'level_stats',
+]
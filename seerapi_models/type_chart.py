@@ -0,0 +1,213 @@
+"""以属性组合ID索引的属性克制矩阵
+
+``ElementType`` 与 ``TypeCombination`` 只包含名称与第一、第二属性，
+计算伤害时每次都需要由单属性之间的克制系数推导双属性的系数。
+``TypeEffectivenessMatrix`` 预先计算全部属性组合两两之间的系数，
+以 N×N 的 ``array('d')`` 按行保存（攻击方为行，防守方为列），查询为 O(1)。
+
+双属性的组合规则只在 ``combine_multipliers`` 中实现。矩阵可以转换为
+``TypeEffectiveness`` 资源，与其他资源一同导出为 JSON/NDJSON 或写入数据库。
+
+用法::
+
+    # chart 为单属性之间的克制系数，{(攻击方属性ID, 防守方属性ID): 系数}
+    matrix = TypeEffectivenessMatrix.from_chart(combinations, chart)
+    matrix.multiplier(skill.type.id, pet.type.id)
+
+    export_ndjson('data', matrix.to_models())
+    models = import_ndjson('data', [TypeEffectiveness])
+    matrix = TypeEffectivenessMatrix.from_models(models)
+"""
+
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+
+from sqlmodel import Session, col, select
+
+from .element_type import (
+    TypeCombination,
+    TypeEffectiveness,
+    TypeEffectivenessEntryORM,
+    TypeEffectivenessORM,
+)
+
+
+def combine_multipliers(first: float, second: float) -> float:
+    """合并双属性中两个属性各自的克制系数
+
+    两项均为克制（2）时为 4 倍；其中一项为无效（0）时为另一项的四分之一；
+    其余情况取两项的平均值。防守方与攻击方为双属性时均按此规则合并。
+    """
+    if first == second == 2:
+        return 4.0
+    if first == 0 or second == 0:
+        return (first + second) / 4
+    return (first + second) / 2
+
+
+class TypeEffectivenessMatrix:
+    """属性组合之间的克制系数矩阵
+
+    未在矩阵中的属性组合ID会引发 KeyError。
+    """
+
+    __slots__ = ('_ids', '_index', '_values')
+
+    def __init__(self, ids: Sequence[int], values: Iterable[float]) -> None:
+        """
+        Args:
+                ids: 属性组合ID，依次对应矩阵的各行与各列
+                values: 按行排列的 N×N 个克制系数
+
+        Raises:
+                ValueError: 系数的数量不是 N×N
+
+        """
+        self._ids = tuple(ids)
+        self._index = {id: i for i, id in enumerate(self._ids)}
+        self._values = array('d', values)
+        if len(self._values) != len(self._ids) ** 2:
+            raise ValueError(
+                f'克制系数的数量应为 {len(self._ids) ** 2}，实际为 {len(self._values)}'
+            )
+
+    @classmethod
+    def from_chart(
+        cls,
+        combinations: Iterable[TypeCombination],
+        chart: Mapping[tuple[int, int], float],
+    ) -> 'TypeEffectivenessMatrix':
+        """由单属性之间的克制系数计算全部属性组合之间的系数
+
+        Args:
+                combinations: 全部属性组合
+                chart: {(攻击方属性ID, 防守方属性ID): 系数}，未给出的组合系数为 1
+
+        """
+        parts = {
+            combination.id: tuple(
+                ref.id
+                for ref in (combination.primary, combination.secondary)
+                if ref is not None
+            )
+            for combination in combinations
+        }
+
+        def defend(attacker: int, defender: tuple[int, ...]) -> float:
+            if len(defender) == 1:
+                return chart.get((attacker, defender[0]), 1.0)
+            return combine_multipliers(
+                chart.get((attacker, defender[0]), 1.0),
+                chart.get((attacker, defender[1]), 1.0),
+            )
+
+        values: list[float] = []
+        for attacker in parts.values():
+            for defender in parts.values():
+                if len(attacker) == 1:
+                    values.append(defend(attacker[0], defender))
+                else:
+                    values.append(
+                        combine_multipliers(
+                            defend(attacker[0], defender), defend(attacker[1], defender)
+                        )
+                    )
+        return cls(list(parts), values)
+
+    @classmethod
+    def from_models(
+        cls, models: Iterable[TypeEffectiveness]
+    ) -> 'TypeEffectivenessMatrix':
+        """由 TypeEffectiveness 资源还原，省略的系数为 1"""
+        models = list(models)
+        ids = [model.id for model in models]
+        index = {id: i for i, id in enumerate(ids)}
+        values = array('d', [1.0]) * (len(ids) ** 2)
+        for row, model in enumerate(models):
+            for defender_id, multiplier in model.multipliers.items():
+                values[row * len(ids) + index[defender_id]] = multiplier
+        return cls(ids, values)
+
+    @classmethod
+    def from_session(cls, session: Session) -> 'TypeEffectivenessMatrix':
+        """由数据库中的克制系数表还原，只执行一次查询"""
+        rows = session.exec(
+            select(
+                TypeEffectivenessORM.id,
+                TypeEffectivenessEntryORM.defender_id,
+                TypeEffectivenessEntryORM.multiplier,
+            )
+            .outerjoin(TypeEffectivenessEntryORM)
+            .order_by(col(TypeEffectivenessORM.id))
+        )
+        # 全部系数均为 1 的攻击方没有对应的系数行
+        multipliers: dict[int, dict[int, float]] = {}
+        for attacker_id, defender_id, multiplier in rows:
+            values = multipliers.setdefault(attacker_id, {})
+            if defender_id is not None:
+                values[defender_id] = multiplier
+        return cls.from_models(
+            TypeEffectiveness(id=id, multipliers=values)
+            for id, values in multipliers.items()
+        )
+
+    @property
+    def ids(self) -> tuple[int, ...]:
+        """矩阵各行与各列对应的属性组合ID"""
+        return self._ids
+
+    def multiplier(self, attacker: int, defender: int) -> float:
+        """攻击方属性组合对防守方属性组合的克制系数"""
+        return self._values[
+            self._index[attacker] * len(self._ids) + self._index[defender]
+        ]
+
+    def multipliers(
+        self, attackers: Iterable[int], defenders: Iterable[int]
+    ) -> list[float]:
+        """逐对查询克制系数，attackers 与 defenders 的长度需要相同
+
+        Raises:
+                ValueError: attackers 与 defenders 的长度不同
+
+        """
+        index = self._index
+        values = self._values
+        size = len(self._ids)
+        return [
+            values[index[attacker] * size + index[defender]]
+            for attacker, defender in zip(attackers, defenders, strict=True)
+        ]
+
+    def row(self, attacker: int) -> dict[int, float]:
+        """攻击方属性组合对全部属性组合的克制系数"""
+        start = self._index[attacker] * len(self._ids)
+        return dict(zip(self._ids, self._values[start : start + len(self._ids)]))
+
+    def to_models(self) -> list[TypeEffectiveness]:
+        """转换为 TypeEffectiveness 资源，每个攻击方属性组合一个，省略系数为 1 的组合"""
+        return [
+            TypeEffectiveness(
+                id=attacker,
+                multipliers={
+                    defender: multiplier
+                    for defender, multiplier in self.row(attacker).items()
+                    if multiplier != 1
+                },
+            )
+            for attacker in self._ids
+        ]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TypeEffectivenessMatrix):
+            return NotImplemented
+        return self._ids == other._ids and self._values == other._values
+
+    def __reduce__(self) -> tuple[type['TypeEffectivenessMatrix'], tuple]:
+        return type(self), (self._ids, self._values)
+
+
+__all__ = ['TypeEffectivenessMatrix', 'combine_multipliers']
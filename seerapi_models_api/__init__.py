@@ -0,0 +1,2052 @@
+"""不依赖 SQLAlchemy 的 API 模型
+
+本包由 seerapi_models/_api_codegen.py 自动生成，请勿手动修改。
+
+模型的字段定义与 seerapi_models 中对应的 API 模型相同，
+但基于 pydantic.BaseModel，不注册 ORM 表，也不会触发映射配置，
+适用于只需要校验和序列化数据的场景。
+
+本包不依赖 seerapi_models 包，导入时不会加载 ORM 模型与 SQLAlchemy。
+"""
+
+import inspect
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from enum import Enum
+from functools import cache, lru_cache
+from operator import attrgetter
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, GetCoreSchemaHandler, SerializationInfo, SerializerFunctionWrapHandler, WithJsonSchema, computed_field, model_serializer, model_validator
+from pydantic_core import CoreSchema, core_schema
+from typing import Annotated, Any, ClassVar, Generic, Literal, NamedTuple, TypeVar, cast, overload
+from typing_extensions import Self
+from urllib.parse import urlsplit
+
+_TModel = TypeVar('_TModel')
+
+
+class ApiModel(BaseModel):
+    """对应 SQLModel 的基类"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BaseResModel(ApiModel, ABC):
+    """资源模型抽象基类"""
+
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {}
+
+    id: int = Field(description='资源ID')
+
+    @classmethod
+    @abstractmethod
+    def resource_name(cls) -> str:
+        pass
+
+
+class BaseResModelWithOptionalId(ApiModel, ABC):
+    """资源模型抽象基类"""
+
+    id: int | None = Field(default=None, exclude=True)
+
+    @classmethod
+    @abstractmethod
+    def resource_name(cls) -> str:
+        pass
+
+
+class BaseGeneralModel(ApiModel, ABC):
+    @classmethod
+    @abstractmethod
+    def schema_path(cls) -> str:
+        pass
+
+
+class BaseCategoryModel(BaseResModel, ABC, Generic[_TModel]): ...
+
+
+def move_to_last(lst: list, index: int) -> None:
+    """
+    将列表中指定索引位置的元素移动到列表的最后一位。
+
+    Args:
+            lst: 要操作的列表
+            index: 要移动的元素的索引位置
+
+    """
+    if 0 <= index < len(lst):
+        element = lst.pop(index)
+        lst.append(element)
+
+
+BASE_DATA_URL = 'you_should_set_this_url.example.com'
+
+
+_REF_CACHE_SIZE = 1 << 16
+
+
+_bound_base_data_url: ContextVar[str | None] = ContextVar('seerapi_models_base_data_url', default=None)
+
+
+TResModel = TypeVar('TResModel', bound=BaseResModel)
+
+
+_TResModelArg = TypeVar('_TResModelArg', bound=BaseResModel)
+
+
+@lru_cache(maxsize=_REF_CACHE_SIZE)
+def _cached_ref(cls: 'type[ResourceRef]', base_data_url: str, *args: Any) -> 'ResourceRef':
+    return cls._create(*args)
+
+
+_ref_pairs: dict[str, tuple[Any, ...]] = {}
+
+
+def _remember_ref_pair(url: str, pair: tuple[Any, ...]) -> None:
+    if len(_ref_pairs) >= _REF_CACHE_SIZE:
+        _ref_pairs.clear()
+    _ref_pairs[url] = pair
+
+
+def _ref_pair(url: str, id: int) -> tuple[Any, ...]:
+    pair = _ref_pairs.get(url)
+    if pair is None:
+        pair = _parse_ref_pair(url, id)
+        _remember_ref_pair(url, pair)
+    return pair
+
+
+def _parse_ref_pair(url: str, id: int) -> tuple[Any, ...]:
+    """从 URL 中解析引用的紧凑编码 (resource_name, id[, sub_path])
+
+    通过 from_res_name 创建的引用在创建时已记录了编码，这里只处理校验得到的引用，
+    URL 形如 {base_data_url}/{resource_name}/{id}[/{sub_path}]。
+    """
+    for base_data_url in (ResourceRef.current_base_data_url(), BASE_DATA_URL):
+        prefix = base_data_url.removesuffix('/') + '/'
+        if url.startswith(prefix):
+            (name, _, rest) = url[len(prefix):].partition('/')
+            (id_part, _, sub_path) = rest.partition('/')
+            if name and id_part == str(id):
+                return (name, id, sub_path) if sub_path else (name, id)
+    segments = [part for part in urlsplit(url).path.split('/') if part]
+    if len(segments) >= 2 and segments[-1] == str(id):
+        return (segments[-2], id)
+    raise ValueError(f'无法从 URL {url!r} 中解析资源名称与ID')
+
+
+_ref_params: dict[type, tuple[type, Any]] = {}
+
+
+_ref_classes: dict[tuple[type, Any], 'type[ResourceRef]'] = {}
+
+
+def _restore_ref(origin: 'type[ResourceRef]', params: Any, state: Any) -> 'ResourceRef':
+    """从 pickle 中还原参数化的 ResourceRef 实例"""
+    cls = _ref_classes.get((origin, params))
+    if cls is None:
+        cls = cast(Any, origin)[params]
+    obj = cls.__new__(cls)
+    obj.__setstate__(state)
+    return obj
+
+
+class ResourceRef(BaseGeneralModel, Generic[TResModel]):
+    """API资源类
+
+    URL 中的服务地址由 current_base_data_url 决定：
+    在 bind_base_data_url 的上下文中为绑定的地址，否则为类属性 base_data_url。
+    以占位地址 BASE_DATA_URL 开头的 URL 会在序列化时替换为当前地址，
+    在绑定的上下文中创建的 URL 已是最终地址，序列化时原样输出。
+
+    from_res_name 与 from_model 按 (类型, 服务地址, 参数) 缓存创建的实例，
+    相同参数返回同一个实例，因此实例是不可变的，修改字段会抛出 ValidationError，
+    需要不同的值时请用 model_copy(update=...) 创建新的实例。
+    修改服务地址后旧的缓存不会再被使用，
+    也可以通过 set_base_data_url 修改并清空缓存。
+
+    默认序列化为完整格式，序列化时的 context 中带有 ref_encoding 时输出紧凑编码，
+    见 ref_encoding_context。校验时也接受紧凑编码的输入，
+    'id' 编码的资源名称由类型参数确定，见 expand_ref。
+    NamedResourceRef 的 name 无法用紧凑编码表示，始终输出完整格式。
+
+    参数化的 ResourceRef 可以 pickle，还原后仍是原来的类。
+    """
+    model_config = ConfigDict(frozen=True)
+    base_data_url: ClassVar[str] = BASE_DATA_URL
+    id: int = Field(description='资源ID')
+    url: str = Field(description='资源URL', json_schema_extra={'format': 'uri'})
+
+    @model_serializer(mode='wrap')
+    def _serialize(self, handler: SerializerFunctionWrapHandler, info: SerializationInfo):
+        context = info.context
+        if isinstance(context, dict):
+            encoding = context.get(REF_ENCODING_CONTEXT_KEY)
+            if encoding is not None:
+                return _REF_ENCODERS[encoding](self)
+        if info.include is not None or info.exclude is not None:
+            return self._replace_base_data_url(handler(self))
+        data = dict(self.__dict__)
+        url: str = data['url']
+        if url.startswith(BASE_DATA_URL):
+            base_data_url = self.current_base_data_url()
+            if base_data_url != BASE_DATA_URL:
+                data['url'] = base_data_url.removesuffix('/') + url[len(BASE_DATA_URL):]
+        return data
+
+    def _replace_base_data_url(self, data: dict[str, Any]) -> dict[str, Any]:
+        url: str | None = data.get('url')
+        if url is None or not url.startswith(BASE_DATA_URL):
+            return data
+        base_data_url = self.current_base_data_url()
+        if base_data_url != BASE_DATA_URL:
+            data['url'] = base_data_url.removesuffix('/') + url[len(BASE_DATA_URL):]
+        return data
+
+    @model_validator(mode='before')
+    @classmethod
+    def _expand_compact(cls, data: Any) -> Any:
+        if isinstance(data, int | list | tuple) and (not isinstance(data, bool)):
+            return expand_ref(data, ref_type=cls)
+        return data
+
+    def __class_getitem__(cls, params: Any) -> Any:
+        sub: Any = super().__class_getitem__(params)
+        if sub is not cls and sub not in _ref_params:
+            _ref_params[sub] = (cls, params)
+            _ref_classes[cls, params] = sub
+        return sub
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        origin = _ref_params.get(type(self))
+        if origin is None:
+            return super().__reduce_ex__(protocol)
+        return (_restore_ref, (*origin, self.__getstate__()))
+
+    @classmethod
+    def schema_path(cls) -> str:
+        return 'common/resource_ref/'
+
+    @classmethod
+    def current_base_data_url(cls) -> str:
+        """当前生效的服务地址"""
+        bound = _bound_base_data_url.get()
+        return cls.base_data_url if bound is None else bound
+
+    @classmethod
+    def set_base_data_url(cls, url: str) -> None:
+        """修改 base_data_url 并清空缓存"""
+        cls.base_data_url = url
+        cls.clear_cache()
+
+    @staticmethod
+    @contextmanager
+    def bind_base_data_url(url: str) -> Iterator[None]:
+        """在上下文中绑定服务地址，适用于同一进程中按不同镜像导出数据
+
+        绑定基于 contextvars，只对当前线程或异步任务生效，可以嵌套使用。
+        绑定空字符串时，以占位地址创建的 URL 序列化为不含服务地址的资源路径。
+
+        Args:
+                url: 服务地址，末尾的 / 会被去除
+
+        """
+        token = _bound_base_data_url.set(url.removesuffix('/'))
+        try:
+            yield
+        finally:
+            _bound_base_data_url.reset(token)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """清空所有 ResourceRef 实例的缓存"""
+        _cached_ref.cache_clear()
+
+    @classmethod
+    def _create(cls, id: int, resource_name: str, sub_path: str | None=None) -> Self:
+        path_parts = filter(bool, [cls.current_base_data_url(), resource_name, str(id), sub_path])
+        url = '/'.join(cast(Iterable[str], path_parts))
+        _remember_ref_pair(url, (resource_name, id, sub_path) if sub_path else (resource_name, id))
+        return cls(id=id, url=url)
+
+    @classmethod
+    def from_res_name(cls, id: int, resource_name: str, sub_path: str | None=None) -> Self:
+        base_data_url = cls.current_base_data_url()
+        return cast(Self, _cached_ref(cls, base_data_url, id, resource_name, sub_path))
+
+    @overload
+    @classmethod
+    def from_model(cls, model: _TResModelArg) -> 'ResourceRef[_TResModelArg]':
+        ...
+
+    @overload
+    @classmethod
+    def from_model(cls, model: type[_TResModelArg], *, id: int) -> 'ResourceRef[_TResModelArg]':
+        ...
+
+    @classmethod
+    def from_model(cls, model: type[_TResModelArg] | _TResModelArg, *, id: int | None=None) -> 'ResourceRef[_TResModelArg]':
+        if not inspect.isclass(model):
+            id = model.id
+        if id is None:
+            raise ValueError('id is required')
+        obj = cls.from_res_name(id=id, resource_name=model.resource_name())
+        return cast(ResourceRef[_TResModelArg], obj)
+
+
+class NamedResourceRef(ResourceRef[TResModel]):
+    name: str | None = Field(default=None, description='资源名称')
+
+    @model_serializer(mode='wrap')
+    def _serialize(self, handler: SerializerFunctionWrapHandler, info: SerializationInfo):
+        return self._replace_base_data_url(handler(self))
+
+    @classmethod
+    def schema_path(cls) -> str:
+        return 'common/named_resource_ref/'
+
+    @classmethod
+    def _create(cls, id: int, resource_name: str, sub_path: str | None=None, name: str | None=None) -> Self:
+        path_parts: list[str] = [cls.current_base_data_url(), resource_name, str(id)]
+        if sub_path:
+            path_parts.append(sub_path)
+        return cls(id=id, url='/'.join(path_parts), name=name)
+
+    @classmethod
+    def from_res_name(cls, id: int, resource_name: str, sub_path: str | None=None, *, name: str | None=None) -> Self:
+        base_data_url = cls.current_base_data_url()
+        return cast(Self, _cached_ref(cls, base_data_url, id, resource_name, sub_path, name))
+
+    @overload
+    @classmethod
+    def from_model(cls, model: _TResModelArg, *, name: str | None=None) -> 'NamedResourceRef[_TResModelArg]':
+        ...
+
+    @overload
+    @classmethod
+    def from_model(cls, model: type[_TResModelArg], *, id: int, name: str | None=None) -> 'NamedResourceRef[_TResModelArg]':
+        ...
+
+    @classmethod
+    def from_model(cls, model: type[_TResModelArg] | _TResModelArg, *, id: int | None=None, name: str | None=None) -> 'NamedResourceRef[_TResModelArg]':
+        if not inspect.isclass(model):
+            id = model.id
+            if name is None and hasattr(model, 'name'):
+                name = getattr(model, 'name')
+        if id is None:
+            raise ValueError('id is required')
+        obj = cls.from_res_name(id=id, resource_name=model.resource_name(), name=name)
+        return cast(NamedResourceRef[_TResModelArg], obj)
+
+
+@cache
+def _ref_model_name(ref_type: type[ResourceRef]) -> str | None:
+    """参数化的引用类型所引用的模型类名，未参数化时返回 None
+
+    类型参数可能是模型类，也可能是前向引用的类名字符串。
+    """
+    origin = _ref_params.get(ref_type)
+    if origin is None:
+        return None
+    param = origin[1]
+    if isinstance(param, str):
+        return param
+    return param.__name__ if isinstance(param, type) else None
+
+
+def _find_res_model(name: str) -> type[BaseResModel] | None:
+    pending: list[type[BaseResModel]] = [BaseResModel]
+    while pending:
+        cls = pending.pop()
+        if cls.__name__ == name:
+            return cls
+        pending.extend(cls.__subclasses__())
+    found = getattr(sys.modules.get(__package__ or ''), name, None)
+    if isinstance(found, type) and issubclass(found, BaseResModel):
+        return found
+    return None
+
+
+@cache
+def ref_resource_name(ref_type: type[ResourceRef]) -> str | None:
+    """参数化的引用类型（如 ResourceRef['Skill']）所引用的资源名称
+
+    未参数化或类型参数不是资源模型时返回 None。
+    """
+    name = _ref_model_name(ref_type)
+    model = _find_res_model(name) if name is not None else None
+    return model.resource_name() if model is not None else None
+
+
+_TResourceRef = TypeVar('_TResourceRef', bound=ResourceRef)
+
+
+@overload
+def expand_ref(value: int | Sequence[Any], resource_name: str | None=None) -> ResourceRef:
+    ...
+
+
+@overload
+def expand_ref(value: int | Sequence[Any], resource_name: str | None=None, *, ref_type: type[_TResourceRef]) -> _TResourceRef:
+    ...
+
+
+def expand_ref(value: int | Sequence[Any], resource_name: str | None=None, *, ref_type: type[ResourceRef]=ResourceRef) -> ResourceRef:
+    """将紧凑编码的引用还原为 ResourceRef
+
+    'id' 编码不包含资源名称，未传入 resource_name 时由 ref_type 的类型参数确定，
+    因此 ResourceRef['Skill'] 等字段可以直接校验 'id' 编码的输入。
+
+    Args:
+                value: 'id' 编码的资源ID，或 'pair' 编码的元组
+                resource_name: 资源名称，默认由 ref_type 的类型参数确定
+                ref_type: 创建的引用类型
+
+    Raises:
+            ValueError: 还原 'id' 编码时无法确定资源名称
+
+    """
+    if isinstance(value, int):
+        if resource_name is None:
+            resource_name = ref_resource_name(ref_type)
+        if resource_name is None:
+            raise ValueError(f'{ref_type.__name__} 未指定资源类型，还原 id 编码的引用需要提供 resource_name')
+        return ref_type.from_res_name(value, resource_name)
+    (name, id, *sub_path) = value
+    return ref_type.from_res_name(id, name, *sub_path)
+
+
+RefEncoding = Literal['id', 'pair']
+
+
+REF_ENCODING_CONTEXT_KEY = 'ref_encoding'
+
+
+def _encode_ref_id(ref: ResourceRef) -> int:
+    return ref.id
+
+
+def _encode_ref_pair(ref: ResourceRef) -> tuple[Any, ...]:
+    return _ref_pair(ref.url, ref.id)
+
+
+_REF_ENCODERS = {'id': _encode_ref_id, 'pair': _encode_ref_pair}
+
+
+def ref_encoding_context(encoding: RefEncoding, context: dict[str, Any] | None=None) -> dict[str, Any]:
+    """序列化时以紧凑编码输出 ResourceRef 的 context
+
+    'id' 只输出资源ID，'pair' 输出 (resource_name, id) 元组，
+    NamedResourceRef 的 name 无法用紧凑编码表示，仍输出完整格式。
+    未指定编码时输出完整格式，默认的序列化不会为紧凑编码付出额外开销::
+
+        pet.model_dump_json(context=ref_encoding_context('id'))
+
+    Args:
+                encoding: 引用的编码，'id' 或 'pair'
+                context: 需要一起传给序列化器的其他 context
+
+    Raises:
+            ValueError: 未知的编码
+
+    """
+    if encoding not in _REF_ENCODERS:
+        raise ValueError(f'未知的引用编码：{encoding}')
+    return {**(context or {}), REF_ENCODING_CONTEXT_KEY: encoding}
+
+
+class ApiResourceList(BaseGeneralModel, Generic[TResModel]):
+    """API资源列表，兼容RFC 5988的Link标准"""
+    count: int = Field(description='资源数量')
+    next: str | None = Field(default=None, description='下一页URL')
+    previous: str | None = Field(default=None, description='上一页URL')
+    first: str | None = Field(default=None, description='第一页URL')
+    last: str | None = Field(default=None, description='最后一页URL')
+    results: list[NamedResourceRef[TResModel]] = Field(description='资源列表')
+
+    @classmethod
+    def schema_path(cls) -> str:
+        return 'common/api_resource_list/'
+
+
+class NamedData(BaseGeneralModel, Generic[TResModel]):
+    data: dict[int, TResModel]
+
+    @classmethod
+    def schema_path(cls) -> str:
+        return 'common/named_data/'
+
+
+class EidEffect(BaseResModel, BaseGeneralModel):
+    args_num: int = Field(description='效果需要的参数数量，该值是从使用该效果的资源中推测得出的')
+
+    @classmethod
+    def schema_path(cls) -> str:
+        return 'common/eid_effect/'
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'eid_effect'
+
+
+class EidEffectInUseBase(BaseResModelWithOptionalId):
+    effect_args: list[int] | None = Field(default=None, description='效果参数，当效果参数为空时，该字段为null')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'eid_effect_in_use'
+
+
+class EidEffectInUse(EidEffectInUseBase, BaseGeneralModel):
+    effect: 'ResourceRef[EidEffect]' = Field(description='效果引用')
+
+    @classmethod
+    def schema_path(cls) -> str:
+        return 'common/eid_effect_in_use/'
+
+
+AttrValue = Annotated[int | float, WithJsonSchema({'type': 'number'})]
+
+
+_SIX_ATTRIBUTES_KEYS = ('atk', 'def_', 'sp_atk', 'sp_def', 'spd', 'hp')
+
+
+_get_six_attributes = attrgetter(*_SIX_ATTRIBUTES_KEYS)
+
+
+_SixAttributesOperator = Literal['add', 'sub', 'percent_mul', 'percent_div']
+
+
+def _percent_rule(left_percent: bool, right_percent: bool, *, subtract: bool) -> tuple[_SixAttributesOperator, bool, bool | None]:
+    """六维属性加减法中百分比加成的处理规则
+
+    两者都是百分比时直接相加减，其中一方是百分比时将另一方按百分比放大或缩小。
+
+    Returns:
+            (逐属性运算, 是否交换左右两侧, 结果的 percent，为 None 时保持默认值)
+
+    """
+    if left_percent and right_percent:
+        return ('sub' if subtract else 'add', False, True)
+    if left_percent:
+        return ('percent_div' if subtract else 'percent_mul', True, False)
+    if right_percent:
+        return ('percent_div' if subtract else 'percent_mul', False, False)
+    return ('sub' if subtract else 'add', False, None)
+
+
+def _calc_values(left: Iterable[int | float], right: Iterable[int | float], operator: _SixAttributesOperator) -> list[int | float]:
+    """逐属性计算两组按相同顺序排列的属性值"""
+    if operator == 'add':
+        return [a + b for (a, b) in zip(left, right)]
+    if operator == 'sub':
+        return [a - b for (a, b) in zip(left, right)]
+    if operator == 'percent_mul':
+        return [a * (1 + b / 100) for (a, b) in zip(left, right)]
+    return [a * (1 - b / 100) for (a, b) in zip(left, right)]
+
+
+class SixAttributesBase(BaseResModelWithOptionalId, BaseGeneralModel):
+    """六维属性类"""
+    atk: AttrValue = Field(description='攻击')
+    def_: AttrValue = Field(description='防御', serialization_alias='def', validation_alias=AliasChoices('def', 'def_'))
+    sp_atk: AttrValue = Field(description='特攻')
+    sp_def: AttrValue = Field(description='特防')
+    spd: AttrValue = Field(description='速度')
+    hp: AttrValue = Field(description='体力')
+    percent: bool = Field(default=False, description='该对象描述的是否是百分比加成，如果为true，属性值为百分比值')
+
+    @classmethod
+    def schema_path(cls) -> str:
+        return 'common/six_attributes/'
+
+    @classmethod
+    def from_string(cls, value: str, *, hp_first: bool=False, percent: bool=False) -> Self:
+        """从字符串创建六维属性对象"""
+        attributes = value.split(' ')
+        if len(attributes) < 6:
+            raise ValueError('无效的属性字符串')
+        attributes = [int(attribute) for attribute in attributes[0:6]]
+        return cls.from_list(attributes, hp_first=hp_first, percent=percent)
+
+    @classmethod
+    def from_list(cls, attributes: list[int], *, hp_first: bool=False, percent: bool=False) -> Self:
+        if len(attributes) < 6:
+            raise ValueError('无效的属性列表')
+        if hp_first:
+            move_to_last(attributes, 0)
+        return cls(atk=attributes[0], def_=attributes[1], sp_atk=attributes[2], sp_def=attributes[3], spd=attributes[4], hp=attributes[5], percent=percent)
+
+
+class SixAttributes(SixAttributesBase, BaseGeneralModel):
+
+    @computed_field
+    @property
+    def total(self) -> float:
+        """总属性值"""
+        return self.atk + self.def_ + self.sp_atk + self.sp_def + self.spd + self.hp
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'six_attributes'
+
+    @classmethod
+    def _from_values(cls, values: Iterable[int | float], percent: bool | None=None, *, validate: bool=False) -> Self:
+        """根据按 atk、def、sp_atk、sp_def、spd、hp 顺序排列的属性值创建实例
+
+        由已校验的实例计算得到的值一定是 int 或 float，默认跳过校验
+        （包括 def/def_ 别名解析）直接构造，结果与校验后创建的实例完全相同。
+        子类可能定义了额外的字段或校验器，总是会进行校验。
+
+        Args:
+                values: 六项属性值
+                percent: 为 None 时保持默认值，且不计入 model_fields_set
+                validate: 是否强制校验
+
+        """
+        data: dict[str, Any] = dict(zip(_SIX_ATTRIBUTES_KEYS, values))
+        if percent is not None:
+            data['percent'] = percent
+        if validate or cls is not SixAttributes:
+            return cls(**data)
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, '__pydantic_fields_set__', set(data))
+        object.__setattr__(obj, '__pydantic_extra__', None)
+        object.__setattr__(obj, '__pydantic_private__', None)
+        object.__setattr__(obj, '__dict__', {'id': None, **data, 'percent': bool(percent)})
+        return obj
+
+    def _calc_number(self, other: 'SixAttributesBase', *, operator: _SixAttributesOperator, swap: bool=False, percent: bool | None=None) -> Self:
+        """逐属性计算，swap=True 时交换 self 和 other 的运算位置
+
+        percent 不为 None 时同时设置结果的 percent 字段。
+        """
+        left = _get_six_attributes(self)
+        right = _get_six_attributes(other)
+        if swap:
+            (left, right) = (right, left)
+        values = _calc_values(left, right, operator)
+        return self._from_values(values, percent, validate=not isinstance(other, SixAttributes))
+
+    def __add__(self, other) -> Self:
+        """两个六维属性相加"""
+        if not isinstance(other, SixAttributesBase):
+            raise TypeError(f'Cannot add {type(self)} and {type(other)}')
+        (operator, swap, percent) = _percent_rule(self.percent, other.percent, subtract=False)
+        return self._calc_number(other, operator=operator, swap=swap, percent=percent)
+
+    def __sub__(self, other) -> Self:
+        """两个六维属性相减"""
+        if not isinstance(other, SixAttributesBase):
+            raise TypeError(f'Cannot sub {type(self)} and {type(other)}')
+        (operator, swap, percent) = _percent_rule(self.percent, other.percent, subtract=True)
+        return self._calc_number(other, operator=operator, swap=swap, percent=percent)
+
+    def round(self, ndigits: int | None=None) -> Self:
+        return self._from_values([round(value, ndigits) for value in _get_six_attributes(self)], self.percent)
+
+
+class CompactSixAttributes(NamedTuple):
+    """六维属性的紧凑表示
+
+    SixAttributes 的每个实例都带有 __dict__、字段集合等 Pydantic 模型的额外开销，
+    在内存中缓存大量精灵、刻印等数据时占用明显。
+    本类型是只保存六项属性与 percent 的元组，数值保留原本的 int/float 类型，
+    与 SixAttributes 之间可以无损互相转换。
+
+    可以直接作为 Pydantic 字段类型使用：
+    校验时接受本类型、SixAttributes 或相同结构的数据，
+    序列化结果与 JSON Schema 均与 SixAttributes 一致。
+    """
+    atk: int | float
+    def_: int | float
+    sp_atk: int | float
+    sp_def: int | float
+    spd: int | float
+    hp: int | float
+    percent: bool = False
+
+    @property
+    def total(self) -> int | float:
+        """总属性值"""
+        return self.atk + self.def_ + self.sp_atk + self.sp_def + self.spd + self.hp
+
+    @classmethod
+    def from_model(cls, model: SixAttributesBase) -> 'CompactSixAttributes':
+        return cls(model.atk, model.def_, model.sp_atk, model.sp_def, model.spd, model.hp, model.percent)
+
+    def to_model(self) -> SixAttributes:
+        return SixAttributes(atk=self.atk, def_=self.def_, sp_atk=self.sp_atk, sp_def=self.sp_def, spd=self.spd, hp=self.hp, percent=self.percent)
+
+    def _calc(self, other: Any, *, subtract: bool) -> 'CompactSixAttributes':
+        """直接在元组上按与 SixAttributes 相同的规则逐属性加减"""
+        if isinstance(other, CompactSixAttributes):
+            (right, right_percent) = (other[:6], other.percent)
+        elif isinstance(other, SixAttributesBase):
+            if not isinstance(other, SixAttributes):
+                other = SixAttributes.model_validate(other, from_attributes=True)
+            (right, right_percent) = (_get_six_attributes(other), other.percent)
+        else:
+            action = 'sub' if subtract else 'add'
+            raise TypeError(f'Cannot {action} {type(self)} and {type(other)}')
+        (operator, swap, percent) = _percent_rule(self.percent, right_percent, subtract=subtract)
+        left = self[:6]
+        if swap:
+            (left, right) = (right, left)
+        return CompactSixAttributes(*_calc_values(left, right, operator), percent=bool(percent))
+
+    def __add__(self, other: Any) -> 'CompactSixAttributes':
+        return self._calc(other, subtract=False)
+
+    def __sub__(self, other: Any) -> 'CompactSixAttributes':
+        return self._calc(other, subtract=True)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        model_schema = handler.generate_schema(SixAttributes)
+        from_model = core_schema.no_info_after_validator_function(cls.from_model, model_schema)
+        return core_schema.json_or_python_schema(json_schema=from_model, python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_model]), serialization=core_schema.plain_serializer_function_ser_schema(cls.to_model, return_schema=model_schema))
+
+
+class SkillEffectInUseBase(BaseResModelWithOptionalId):
+    """描述一条“使用中的”技能效果"""
+    info: str = Field(description='技能效果描述')
+    analyze_info: str = Field(description='新版 Unity 端采用的格式化技能效果描述文本')
+    args: list[int | float] | list[int] | list[float] = Field(description='技能效果参数列表')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_effect_in_use'
+
+
+class SkillEffectInUse(SkillEffectInUseBase, BaseGeneralModel):
+    effect: ResourceRef['SkillEffectType']
+
+    @classmethod
+    def schema_path(cls) -> str:
+        return 'common/skill_effect_in_use/'
+
+
+class AchievementCategoryNameEnum(str, Enum):
+    ability_achievement = 'ability_achievement'
+    hide_achievement = 'hide_achievement'
+
+
+class AbilityBonusMixin(ApiModel):
+    """能力加成字段的混入类"""
+    is_ability_bonus: bool = Field(description='是否是能力加成成就')
+    ability_desc: str | None = Field(default=None, description='能力加成描述')
+
+
+class TitleInfoMixin(ApiModel):
+    """称号信息字段的混入类"""
+    name: str = Field(description='称号名称')
+    original_name: str = Field(description='称号原始名称，包含分隔符')
+
+
+class BaseAchievement(BaseResModel):
+    id: int = Field(description='成就ID，由 SeerAPI 生成，游戏内不存在该ID')
+    name: str = Field(description='成就名称')
+    point: int = Field(description='成就点数')
+    desc: str = Field(description='成就描述')
+    is_hide: bool = Field(description='是否是隐藏成就，隐藏成就在游戏成就列表中不会显示')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'achievement'
+
+
+class AchievementRefsMixin(ApiModel):
+    type: ResourceRef['AchievementType'] = Field(description='成就类型')
+    branch: ResourceRef['AchievementBranch'] = Field(description='成就所属的分支')
+    next_level_achievement: ResourceRef['Achievement'] | None = Field(default=None, description='下一级成就')
+    prev_level_achievement: ResourceRef['Achievement'] | None = Field(default=None, description='上一级成就')
+    attr_bonus: SixAttributes | None = Field(default=None, description='成就能力加成属性，该值仅在成就有能力加成且为数值加成时不为空')
+
+
+class Achievement(BaseAchievement, AchievementRefsMixin, AbilityBonusMixin):
+    """成就资源"""
+    title_id: int | None = Field(default=None, description='称号ID')
+    title: str | None = Field(default=None, description='成就称号')
+    original_title: str | None = Field(default=None, description='成就称号原始名称，包含分隔符')
+
+    def to_title(self) -> 'Title | None':
+        if self.title_id is None:
+            return None
+        kwargs = self.model_dump()
+        title_id = kwargs.pop('title_id')
+        title_name = kwargs.pop('title')
+        achievement_id = kwargs.pop('id')
+        achievement_name = kwargs.pop('name')
+        return Title(id=title_id, name=title_name, original_name=kwargs['original_title'], achievement_id=achievement_id, achievement_name=achievement_name, **kwargs)
+
+
+class BaseTitle(BaseAchievement, AbilityBonusMixin):
+    id: int = Field(description='称号ID')
+    achievement_id: int = Field(description='成就ID，由 SeerAPI 生成，游戏内不存在该ID')
+    achievement_name: str = Field(description='成就名称')
+    name: str = Field(description='称号名称')
+    original_name: str = Field(description='称号原始名称，包含分隔符')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'title'
+
+
+class Title(BaseTitle, AchievementRefsMixin):
+    """成就称号资源"""
+
+
+class BaseAchievementType(BaseCategoryModel):
+    name: str = Field(description='成就类型名称')
+    point_total: int = Field(description='该类型下成就点数总和')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'achievement_type'
+
+
+class AchievementType(BaseAchievementType):
+    """成就类型资源"""
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'achievement': ('achievement', 'type'), 'branch': ('achievement_branch', 'type')}
+    achievement: list[ResourceRef['Achievement']] = Field(default_factory=list, description='该类型下的成就')
+    branch: list[ResourceRef['AchievementBranch']] = Field(default_factory=list, description='该类型下的成就分支')
+
+
+class BaseAchievementBranch(BaseCategoryModel):
+    name: str = Field(description='成就分支名称')
+    point_total: int = Field(description='该分支下成就点数总和')
+    is_series: bool = Field(description='表示该分支下的成就是否是系列成就，当该值为False时，成就彼此之间独立。')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'achievement_branch'
+
+
+class AchievementBranch(BaseAchievementBranch):
+    """成就分支资源，当is_series为True时，分支存放同一个系列的成就，反之仅作为分类使用"""
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'achievement': ('achievement', 'branch')}
+    achievement: list[ResourceRef['Achievement']] = Field(default_factory=list, description='该分支下的成就')
+    type: ResourceRef['AchievementType'] = Field(description='成就所属的类型')
+
+
+class BaseAchievementCategory(BaseCategoryModel, use_enum_values=True):
+    name: AchievementCategoryNameEnum = Field(description='成就分类名称，`hide_achievement`表示分类下隐藏成就，`ability_achievement`表示仅包含能力加成成就')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'achievement_category'
+
+
+class AchievementCategory(BaseAchievementCategory):
+    """成就分类资源，用于在API中便捷地获取成就"""
+    achievement: list[ResourceRef['Achievement']] = Field(default_factory=list, description='该分类下的成就')
+
+
+class BattleEffectBase(BaseResModel):
+    name: str = Field(description='状态名称')
+    desc: str = Field(description='状态描述')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'battle_effect'
+
+
+class BattleEffect(BattleEffectBase):
+    type: list[ResourceRef['BattleEffectCategory']] = Field(default_factory=list, description='状态类型，可能同时属于多个类型，例如瘫痪同时属于控制类和限制类异常')
+
+
+class BattleEffectCategoryBase(BaseCategoryModel):
+    name: str = Field(description='状态类型名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'battle_effect_type'
+
+
+class BattleEffectCategory(BattleEffectCategoryBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'effect': ('battle_effect', 'type')}
+    effect: list[ResourceRef['BattleEffect']] = Field(default_factory=list, description='异常状态列表')
+
+
+class BaseDecoration(BaseResModel):
+    name: str = Field(description='资源名称')
+    desc: str = Field(description='资源描述')
+    icon_id: int = Field(description='资源ID（对应profilephoto配置中的icon字段）')
+
+
+class AvatarHead(BaseDecoration):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'avatar_head'
+
+
+class AvatarFrame(BaseDecoration):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'avatar_frame'
+
+
+class NamecardBackground(BaseDecoration):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'namecard_background'
+
+
+class NicknameBackground(BaseDecoration):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'nickname_background'
+
+
+class HomepageBackground(BaseDecoration):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'homepage_background'
+
+
+class Emoji(BaseDecoration):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'emoji'
+
+
+class EffectSeDataBase(BaseResModel):
+    name: str = Field(description='名称')
+    desc: str = Field(description='描述')
+
+
+class EffectSeData(EffectSeDataBase):
+    __name_fields__: ClassVar[list[str]] = ['name', 'effect_alias']
+    effect: EidEffectInUse = Field(description='效果')
+    effect_alias: str = Field(description='效果别名，命名规则为：[效果名称]_[参数1]_[参数2]_…')
+
+
+class VariationEffectBase(BaseResModel):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_variation'
+
+
+class VariationEffect(VariationEffectBase, EffectSeData):
+    """特质效果"""
+
+
+class PetEffectBase(EffectSeDataBase):
+    star_level: int = Field(description='特性星级')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_effect'
+
+
+class PetEffect(PetEffectBase, EffectSeData):
+    effect_group: ResourceRef['PetEffectGroup'] = Field(description='特性组资源引用，同特性的不同星级属于同一组')
+
+
+class PetEffectGroupBase(BaseCategoryModel):
+    name: str = Field(description='名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_effect_group'
+
+
+class PetEffectGroup(PetEffectGroupBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'effect': ('pet_effect', 'effect_group')}
+    effect: list[ResourceRef[PetEffect]] = Field(default_factory=list, description='特性列表')
+
+
+class ElementType(BaseResModel):
+    name: str = Field(description='属性中文名')
+    name_en: str = Field(description='属性英文名')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'element_type'
+
+
+class TypeCombinationBase(BaseResModel):
+    name: str = Field(description='组合类型中文名')
+    name_en: str = Field(description='组合类型英文名')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'element_type_combination'
+
+
+class TypeCombination(TypeCombinationBase):
+    primary: ResourceRef[ElementType] = Field(description='第一属性')
+    secondary: ResourceRef[ElementType] | None = Field(default=None, description='第二属性，仅在该属性为双属性时有效')
+
+    @computed_field(description='是否是双属性')
+    @property
+    def is_double(self) -> bool:
+        return self.secondary is not None
+
+
+class TypeEffectivenessBase(BaseResModel):
+    id: int = Field(description='攻击方的属性组合ID')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'element_type_effectiveness'
+
+
+class TypeEffectiveness(TypeEffectivenessBase):
+    """一个属性组合作为攻击方时，对各属性组合的克制系数
+
+    完整的克制矩阵见 seerapi_models.type_chart.TypeEffectivenessMatrix。
+    """
+    multipliers: dict[int, float] = Field(default_factory=dict, description='防守方属性组合ID到克制系数的映射，系数为1的组合被省略')
+
+
+class BaseErrorCode(BaseResModel):
+    name: str = Field(description='名称')
+    message: str = Field(description='错误消息')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'error_code'
+
+
+class ErrorCode(BaseErrorCode):
+    ...
+
+
+class GlossaryEntryBase(BaseResModel):
+    id: int = Field(description='术语ID')
+    name: str = Field(description='术语名称')
+    desc: str = Field(description='术语描述')
+    kind: int = Field(description='术语类型，数值对应的类型尚不明确，这里暂时保留原始值')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'glossary_entry'
+
+
+class GlossaryEntry(GlossaryEntryBase):
+    link: list[ResourceRef['GlossaryEntry']] | None = Field(default_factory=list, description='术语链接，用于指示显示该术语时应同时显示的其他术语')
+    pet: list[ResourceRef['Pet']] | None = Field(default=None, description='用于指示该术语是否是特定精灵专属的')
+
+
+class ItemBase(BaseResModel):
+    name: str = Field(description='物品名称')
+    desc: str | None = Field(default=None, description='物品描述，可能为空（在游戏内显示为默认描述）')
+    max: int = Field(description='物品最大数量')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'item'
+
+
+class Item(ItemBase):
+    category: ResourceRef['ItemCategory'] = Field(description='物品分类')
+
+
+class ItemCategoryBase(BaseCategoryModel):
+    name: str = Field(description='物品分类名称')
+    max: int = Field(description='物品最大数量')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'item_category'
+
+
+class ItemCategory(ItemCategoryBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'item': ('item', 'category')}
+    item: list[ResourceRef['Item']] = Field(default_factory=list, description='该分类下的所有物品')
+
+
+class EnergyBeadBase(BaseResModel):
+    id: int = Field(description='能量珠ID')
+    name: str = Field(description='能量珠名称')
+    desc: str = Field(description='能量珠描述')
+    idx: int = Field(description='能量珠效果ID')
+    use_times: int = Field(description='使用次数')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'energy_bead'
+
+
+class EnergyBead(EnergyBeadBase):
+    item: ResourceRef['Item'] = Field(description='能量珠物品资源引用')
+    effect: EidEffectInUse = Field(description='能量珠效果')
+    ability_buff: SixAttributes | None = Field(default=None, description='能力加成数值，仅当能量珠效果为属性加成时有效')
+
+
+class PkAttribute(BaseModel):
+    """装备PK加成（战队保卫战等远古活动使用）"""
+    pk_hp: int = Field(description='装备提供的血量加成')
+    pk_atk: int = Field(description='装备提供的攻击力加成')
+    pk_fire_range: int = Field(description='装备提供的射击范围加成')
+
+
+class OtherAttribute(BaseModel):
+    hit_rate: int = Field(default=0, description='命中加成')
+    dodge_rate: int = Field(default=0, description='闪避加成')
+    crit_rate: int = Field(default=0, description='暴击加成')
+
+    @classmethod
+    def from_list(cls, other_attr_args: list[int]) -> Self:
+        return cls(hit_rate=other_attr_args[0], dodge_rate=other_attr_args[1], crit_rate=other_attr_args[2])
+
+
+class EquipEffect(ApiModel):
+    newse_id: int | None = Field(default=None, description='部件特性ID，一部分套装使用该字段来表示效果')
+    eid_effect: EidEffectInUse | None = Field(default=None, description='部件效果，一部分套装使用该字段来表示效果')
+
+
+class EquipBonusBase(BaseResModelWithOptionalId):
+    desc: str = Field(description='部件描述')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'equip_bonus'
+
+
+class EquipBonus(EquipBonusBase, EquipEffect):
+    attribute: SixAttributes | None = Field(default=None, description='属性加成，仅在部件有属性加成时有效')
+    other_attribute: OtherAttribute | None = Field(default=None, description='其他属性加成，仅在部件有命中/闪避/暴击加成时有效')
+
+
+class SuitBonusBase(BaseResModel):
+    id: int = Field(description='套装效果ID')
+    desc: str = Field(description='套装描述')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'suit_bonus'
+
+
+class SuitBonus(SuitBonusBase, EquipEffect):
+    effective_pets: list[ResourceRef['Pet']] | None = Field(default=None, description='表示套装效果仅在这些精灵上生效，null表示对所有精灵都生效')
+    attribute: SixAttributes | None = Field(default=None, description='属性加成，仅在套装效果为属性加成时有效')
+
+
+class SuitBase(BaseResModel):
+    name: str = Field(description='名称')
+    transform: bool = Field(description='是否可变形')
+    tran_speed: float | None = Field(default=None, description='变形速度，仅当该套装可变形时有效')
+    suit_desc: str = Field(description='套装描述')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'suit'
+
+
+class Suit(SuitBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'equips': ('equip', 'suit')}
+    equips: list[ResourceRef['Equip']] = Field(default_factory=list, description='部件列表')
+    bonus: SuitBonus | None = Field(default=None, description='套装效果，仅当该套装为能力加成套装时有效')
+
+
+class EquipBase(BaseResModel):
+    id: int = Field(description='部件ID')
+    name: str = Field(description='部件名称')
+    speed: float | None = Field(default=None, description='部件速度移动加成，一般只有脚部部件提供')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'equip'
+
+
+class Equip(EquipBase):
+    item: ResourceRef['Item'] = Field(description='装备部件物品资源引用')
+    bonus: EquipBonus | None = Field(default=None, description='部件效果，仅当该部件为能力加成部件时有效')
+    occasion: ResourceRef['EquipEffectiveOccasion'] | None = Field(default=None, description='部件生效场合，仅当该部件为能力加成部件时有效')
+    suit: ResourceRef[Suit] | None = Field(default=None, description='部件所属套装，仅当该部件有套装时有效')
+    part_type: ResourceRef['EquipType'] = Field(description='部件类型')
+    pk_attribute: PkAttribute | None = Field(default=None, description='部件PK加成，战队保卫战等老玩法使用，当三个加成项都为0时为null')
+
+
+class EquipTypeBase(BaseCategoryModel):
+    name: str = Field(description='部件类型名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'equip_type'
+
+
+class EquipType(EquipTypeBase):
+    equip: list[ResourceRef] = Field(default_factory=list, description='部件列表')
+
+
+class EquipEffectiveOccasionBase(BaseCategoryModel):
+    description: str = Field(description='部件生效场合描述')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'equip_effective_occasion'
+
+
+class EquipEffectiveOccasion(EquipEffectiveOccasionBase):
+    equip: list[ResourceRef] = Field(default_factory=list, description='部件列表')
+
+
+class GemBase(BaseResModel):
+    id: int = Field(description='宝石ID')
+    name: str = Field(description='宝石名称')
+    level: int = Field(description='宝石等级')
+    generation_id: int = Field(description='宝石世代')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'gem'
+
+
+class GemResRefs(ApiModel):
+    prev_level_gem: ResourceRef['Gem'] | None = Field(default=None, description='该宝石的上一等级的引用，当为None时表示该宝石为最低等级')
+    next_level_gem: ResourceRef['Gem'] | None = Field(default=None, description='该宝石的下一等级的引用，当为None时表示该宝石为最高等级')
+    category: ResourceRef['GemCategory'] = Field(description='宝石类型引用')
+    effect: list[SkillEffectInUse] = Field(description='宝石效果')
+    item: ResourceRef['Item'] = Field(description='宝石物品资源引用')
+
+
+class Gem(GemBase, GemResRefs):
+    inlay_rate: float | None = Field(default=None, description='镶嵌成功率')
+    equivalent_level1_count: int | None = Field(default=None, description='相当于多少个1级宝石')
+    fail_compensate_range: tuple[int, int] | None = Field(default=None, description='当镶嵌失败时返还的宝石的等级范围，仅在1代宝石中有效')
+    upgrade_cost: int | None = Field(default=None, description='升级到该等级需要的石之砂数量，仅在2代宝石中有效')
+
+    def to_detailed(self) -> 'GemGen1 | GemGen2':
+        general_args = {'id': self.id, 'name': self.name, 'level': self.level, 'generation_id': self.generation_id, 'category': self.category, 'effect': self.effect, 'prev_level_gem': self.prev_level_gem, 'next_level_gem': self.next_level_gem, 'item': self.item}
+        if self.generation_id == 1:
+            return GemGen1(**general_args, inlay_rate=cast(float, self.inlay_rate), equivalent_level1_count=cast(int, self.equivalent_level1_count), fail_compensate_range=cast(tuple[int, int], self.fail_compensate_range))
+        else:
+            return GemGen2(**general_args, upgrade_cost=cast(int, self.upgrade_cost))
+
+
+class GemGen1(GemBase, GemResRefs):
+    inlay_rate: float = Field(description='镶嵌成功率')
+    equivalent_level1_count: int = Field(description='相当于多少个1级宝石')
+    fail_compensate_range: tuple[int, int] = Field(description='当镶嵌失败时返还的宝石的等级范围')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'gem_gen1'
+
+
+class GemGen2(GemBase, GemResRefs):
+    upgrade_cost: int = Field(description='升级到该等级需要的石之砂数量')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'gem_gen2'
+
+
+class GemCategoryBase(BaseCategoryModel):
+    name: str = Field(description='名称')
+    generation_id: int = Field(description='宝石世代')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'gem_category'
+
+
+class GemCategory(GemCategoryBase):
+    gem: list[ResourceRef] = Field(default_factory=list, description='宝石列表')
+
+
+class GemGenCategoryBase(BaseCategoryModel):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'gem_generation_category'
+
+
+class GemGenCategory(GemGenCategoryBase):
+    gem_category: list[ResourceRef] = Field(default_factory=list, description='宝石类别列表')
+
+
+class SkillActivationItemBase(BaseResModel):
+    id: int = Field(description='技能激活道具ID')
+    name: str = Field(description='技能激活道具名称')
+    item_number: int = Field(description='激活技能需要的该道具数量')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_activation_item'
+
+
+class SkillActivationItem(SkillActivationItemBase):
+    item: ResourceRef['Item'] = Field(description='道具资源引用')
+    skill: ResourceRef['Skill'] = Field(description='使用该道具激活的技能')
+    pet: ResourceRef['Pet'] = Field(description='使用该道具的精灵')
+
+
+class SkillStoneEffectBase(BaseResModelWithOptionalId):
+    inner_id: int = Field(description='技能石效果的内部ID，当技能石为完美技能石时，会使用此ID表示效果')
+    prob: float = Field(description='技能石效果激活概率，0到1之间')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_stone_effect'
+
+
+class SkillStoneEffect(SkillStoneEffectBase):
+    effect: list['SkillEffectInUse'] = Field(description='技能石效果列表')
+
+
+class SkillStoneBase(BaseResModel):
+    id: int = Field(description='技能石ID')
+    name: str = Field(description='技能石名称')
+    rank: int = Field(description='技能石等级，1到5分别对应D, C, B, A, S')
+    power: int = Field(description='技能石威力')
+    max_pp: int = Field(description='技能石最大PP')
+    accuracy: int = Field(description='技能石命中率')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_stone'
+
+
+class SkillStone(SkillStoneBase):
+    category: ResourceRef['SkillStoneCategory'] = Field(description='技能石分类')
+    item: ResourceRef['Item'] = Field(description='技能石物品资源引用')
+    effect: list['SkillStoneEffect'] = Field(description='完美技能石效果列表')
+
+
+class SkillStoneCategoryBase(BaseCategoryModel):
+    name: str = Field(description='技能石分类名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_stone_category'
+
+
+class SkillStoneCategory(SkillStoneCategoryBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'skill_stone': ('skill_stone', 'category')}
+    skill_stone: list[ResourceRef['SkillStone']] = Field(default_factory=list, description='技能石列表')
+    type: ResourceRef['TypeCombination'] = Field(description='技能石类型')
+
+
+class ApiMetadata(BaseModel):
+    api_url: str = Field(description='当前API的URL')
+    api_version: str = Field(description='API版本')
+    generator_name: str = Field(description='生成器名称')
+    generator_version: str = Field(description='生成器版本')
+    generate_time: datetime = Field(default_factory=datetime.now, description='生成时间')
+    data_source: str = Field(default='', description='数据源，可填写git仓库地址或url')
+    data_version: str = Field(default='', description='数据版本')
+    patch_source: str = Field(default='', description='补丁源，可填写git仓库地址或url')
+    patch_version: str = Field(default='', description='补丁版本')
+
+
+class SkillMintmarkEffect(BaseModel):
+    effect: int = Field(description='增幅效果ID')
+    arg: int | None = Field(description='增幅效果参数')
+
+
+class MintmarkBase(BaseResModel):
+    name: str = Field(description='名称')
+    desc: str = Field(description='刻印描述')
+
+
+class MintmarkResRefs(ApiModel):
+    type: ResourceRef['MintmarkTypeCategory'] = Field(description='刻印类型')
+    rarity: ResourceRef['MintmarkRarityCategory'] = Field(description='刻印稀有度')
+    pet: list[ResourceRef['Pet']] | None = Field(default=None, description='表示该刻印仅能安装在这些精灵上，null表示无精灵限制')
+
+
+class AbilityMintmark(MintmarkBase, MintmarkResRefs):
+    max_attr_value: SixAttributes = Field(description='刻印属性值')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'ability_mintmark'
+
+
+class SkillMintmark(MintmarkBase, MintmarkResRefs):
+    effect: SkillMintmarkEffect = Field(description='技能刻印效果，仅当刻印类型为技能刻印时有效')
+    skill: list[ResourceRef['Skill']] = Field(default_factory=list, description='该刻印所绑定的技能列表')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_mintmark'
+
+
+class UniversalMintmark(MintmarkBase, MintmarkResRefs):
+    mintmark_class: ResourceRef['MintmarkClassCategory'] | None = Field(default=None, description='刻印所属系列，当该刻印是精灵专属刻印时可能为null')
+    base_attr_value: SixAttributes = Field(description='刻印基础属性值，仅当该刻印为全能刻印时有效')
+    max_attr_value: SixAttributes = Field(description='刻印满级属性值，仅当该刻印为能力刻印或全能刻印时有效')
+    extra_attr_value: SixAttributes | None = Field(default=None, description='刻印隐藏属性值，仅当该刻印为全能刻印并具有隐藏属性时有效')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'universal_mintmark'
+
+
+class Mintmark(MintmarkBase, MintmarkResRefs):
+    effect: SkillMintmarkEffect | None = Field(default=None, description='技能刻印效果，仅当刻印类型为技能刻印时有效')
+    mintmark_class: ResourceRef['MintmarkClassCategory'] | None = Field(default=None, description='刻印所属系列，仅当该刻印为全能刻印时有效')
+    base_attr_value: SixAttributes | None = Field(default=None, description='刻印基础属性值，仅当该刻印为全能刻印时有效')
+    max_attr_value: SixAttributes | None = Field(default=None, description='刻印满级属性值，仅当该刻印为能力刻印或全能刻印时有效')
+    extra_attr_value: SixAttributes | None = Field(default=None, description='刻印隐藏属性值，仅当该刻印为全能刻印并具有隐藏属性时有效')
+    skill: list[ResourceRef['Skill']] | None = Field(default=None, description='该刻印所绑定的技能列表，仅当该刻印为技能刻印时有效')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'mintmark'
+
+    def to_detailed(self) -> 'AbilityMintmark | SkillMintmark | UniversalMintmark':
+        general_args = {'id': self.id, 'name': self.name, 'desc': self.desc, 'pet': self.pet, 'rarity': self.rarity, 'type': self.type}
+        if self.type.id == 0:
+            self = cast(AbilityMintmark, self)
+            return AbilityMintmark(**general_args, max_attr_value=self.max_attr_value)
+        elif self.type.id == 1:
+            self = cast(SkillMintmark, self)
+            return SkillMintmark(**general_args, effect=self.effect, skill=self.skill or [])
+        elif self.type.id == 3:
+            self = cast(UniversalMintmark, self)
+            return UniversalMintmark(**general_args, mintmark_class=self.mintmark_class, base_attr_value=self.base_attr_value, max_attr_value=self.max_attr_value, extra_attr_value=self.extra_attr_value)
+        raise ValueError(f'Invalid mintmark type: {self.type.id}')
+
+
+class MintmarkRarityBase(BaseCategoryModel):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'mintmark_rarity'
+
+
+class MintmarkRarityCategory(MintmarkRarityBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'mintmark': ('mintmark', 'rarity')}
+    mintmark: list[ResourceRef['Mintmark']] = Field(default_factory=list, description='刻印列表')
+
+
+class MintmarkTypeBase(BaseCategoryModel):
+    name: str = Field(description='名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'mintmark_type'
+
+
+class MintmarkTypeCategory(MintmarkTypeBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'mintmark': ('mintmark', 'type')}
+    mintmark: list[ResourceRef['Mintmark']] = Field(default_factory=list, description='刻印列表')
+
+
+class MintmarkClassBase(BaseCategoryModel):
+    name: str = Field(description='名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'mintmark_class'
+
+
+class MintmarkClassCategory(MintmarkClassBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'mintmark': ('universal_mintmark', 'mintmark_class')}
+    mintmark: list[ResourceRef['UniversalMintmark']] = Field(default_factory=list, description='刻印列表')
+
+
+class BaseNature(BaseResModel):
+    name: str = Field(description='性格名称')
+    des: str = Field(description='性格描述')
+    des2: str = Field(description='性格描述2')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'nature'
+
+
+class Nature(BaseNature):
+    """精灵性格修正模型"""
+    attributes: SixAttributes = Field(description='性格修正属性')
+
+
+class BasePeakSeason(BaseResModel):
+    id: int = Field(description='该赛季的ID，固定为1')
+    start_time: datetime = Field(description='该赛季的开始时间')
+    end_time: datetime = Field(description='该赛季的结束时间，由 `start_time`加上固定时长计算得出，游戏内没有准确数据')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'peak_season'
+
+
+class PeakSeason(BasePeakSeason):
+    ...
+
+
+class BasePeakPool(BaseResModel):
+    count: int = Field(description='该池内精灵最大可携带数量')
+    start_time: datetime = Field(description='该池的开始时间')
+    end_time: datetime = Field(description='该池的结束时间，由 `start_time` 加上固定时长计算得出')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'peak_pool'
+
+
+class PeakPool(BasePeakPool):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'peak_pool')}
+    pet: list[ResourceRef['Pet']] = Field(default_factory=list, description='该池内的精灵')
+
+
+class BasePeakExpertPool(BaseResModel):
+    count: int = Field(description='该池内精灵最大可携带数量')
+    start_time: datetime = Field(description='该池的开始时间')
+    end_time: datetime = Field(description='该池的结束时间，由 `start_time` 加上固定时长计算得出')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'peak_expert_pool'
+
+
+class PeakExpertPool(BasePeakExpertPool):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'peak_expert_pool')}
+    pet: list[ResourceRef['Pet']] = Field(default_factory=list, description='该池内的精灵')
+
+
+class BasePeakPoolVote(BaseResModel):
+    start_time: datetime = Field(description='本轮票选的开始时间')
+    end_time: datetime = Field(description='本轮票选的截至时间')
+    count: int = Field(description='票选的精灵的限制数量')
+    subkey: int = Field(description='票选数据子键，用于其他工具获取投票结果')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'peak_pool_vote'
+
+
+class PeakPoolVote(BasePeakPoolVote):
+    pet: list[ResourceRef['Pet']] = Field(default_factory=list, description='参与投票的精灵')
+
+
+class DiyStatsRange(BaseModel):
+    min: SixAttributes = Field(description='精灵自定义种族值最小值')
+    max: SixAttributes = Field(description='精灵自定义种族值最大值')
+
+
+class SkillInPetBase(ApiModel):
+    learning_level: int | None = Field(default=None, description='技能的学习等级，当该技能无法通过升级获得时，该字段为null')
+    is_special: bool = Field(default=False, description='是否是特训技能')
+    is_advanced: bool = Field(default=False, description='是否是神谕觉醒技能')
+    is_fifth: bool = Field(default=False, description='是否是第五技能')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_in_pet'
+
+
+class SkillInPet(SkillInPetBase):
+    skill: ResourceRef['Skill'] = Field(description='技能资源')
+    skill_activation_item: ResourceRef['SkillActivationItem'] | None = Field(default=None, description='学习该技能需要的激活道具')
+
+
+class PetBase(BaseResModel):
+    name: str = Field(description='精灵名称')
+    yielding_exp: int = Field(description='击败精灵可获得的经验值')
+    catch_rate: int = Field(description='精灵捕捉率')
+    evolving_lv: int | None = Field(default=None, description='精灵进化等级，当精灵无法再通过等级进化时为null')
+    releaseable: bool = Field(description='精灵是否可放生')
+    fusion_master: bool = Field(description='精灵是否可作为融合精灵的主宠')
+    fusion_sub: bool = Field(description='精灵是否可作为融合精灵的副宠')
+    has_resistance: bool = Field(description='精灵是否可获得抗性')
+    resource_id: int = Field(description='精灵资源ID')
+    enemy_resource_id: int | None = Field(default=None, description='该精灵在对手侧时使用的资源的ID，仅少数精灵存在这种资源')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet'
+
+
+class Pet(PetBase):
+    type: ResourceRef['TypeCombination'] = Field(description='精灵属性')
+    gender: ResourceRef['PetGenderCategory'] = Field(description='精灵性别')
+    base_stats: SixAttributes = Field(description='精灵种族值')
+    pet_class: ResourceRef['PetClass'] | None = Field(default=None, description='精灵类别，同一进化链中的精灵属于同一类')
+    evolution_chain_index: int = Field(description='该精灵在进化链中的位置，从0开始')
+    yielding_ev: SixAttributes = Field(description='击败精灵可获得的学习力')
+    vipbuff: ResourceRef['PetVipBuffCategory'] | None = Field(default=None, description='精灵VIP加成，仅在闪光/暗黑精灵上使用')
+    mount_type: ResourceRef['PetMountTypeCategory'] | None = Field(default=None, description='精灵骑乘类型，仅在坐骑精灵上使用')
+    diy_stats: DiyStatsRange | None = Field(default=None, description='精灵自定义种族值，仅在合体精灵王上使用')
+    skill: list['SkillInPet'] = Field(description='精灵可学习的技能')
+    soulmark: list[ResourceRef['Soulmark']] | None = Field(default=None, description='精灵可持有的魂印')
+    encyclopedia_entry: ResourceRef['PetEncyclopediaEntry'] | None = Field(default=None, description='精灵图鉴条目')
+    archive_story_entry: ResourceRef['PetArchiveStoryEntry'] | None = Field(default=None, description='精灵故事条目')
+    peak_pool: ResourceRef['PeakPool'] | None = Field(default=None, description='精灵所属巅峰池')
+    peak_expert_pool: ResourceRef['PeakExpertPool'] | None = Field(default=None, description='精灵所属巅峰专家池')
+    peak_pool_vote_id: int | None = Field(default=None, description='精灵所属巅峰池票选ID', exclude=True)
+    advance: ResourceRef['PetAdvance'] | None = Field(default=None, description='精灵觉醒信息')
+
+
+class PetClassBase(BaseResModel):
+    is_variant_pet: bool = Field(default=False, description='是否是异能精灵')
+    is_dark_pet: bool = Field(default=False, description='是否是暗黑精灵')
+    is_shine_pet: bool = Field(default=False, description='是否是闪光精灵')
+    is_rare_pet: bool = Field(default=False, description='是否是稀有精灵')
+    is_breeding_pet: bool = Field(default=False, description='是否是繁殖二代精灵')
+    is_fusion_pet: bool = Field(default=False, description='是否是融合二代精灵')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_class'
+
+
+class PetClass(PetClassBase):
+    """描述一个精灵类别，所有第一形态为同一ID的精灵为一类"""
+    evolution_chain: list[ResourceRef['Pet']] = Field(description='精灵进化链，从第一形态到最终形态的精灵列表')
+
+
+class PetCategoryBase(BaseCategoryModel):
+    name: str = Field(description='名称')
+    description: str = Field(description='描述')
+
+
+class PetCategoryRefs(ApiModel):
+    pet: list[ResourceRef['Pet']] = Field(description='精灵列表')
+
+
+class PetGenderBase(PetCategoryBase):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_gender'
+
+
+class PetGenderCategory(PetGenderBase, PetCategoryRefs):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'gender')}
+
+
+class PetVipBuffBase(PetCategoryBase):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_vipbuff'
+
+
+class PetVipBuffCategory(PetVipBuffBase, PetCategoryRefs):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'vipbuff')}
+
+
+class PetMountTypeBase(PetCategoryBase):
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_mount_type'
+
+
+class PetMountTypeCategory(PetMountTypeBase, PetCategoryRefs):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'mount_type')}
+
+
+class PetAdvanceBase(BaseResModel):
+    id: int = Field()
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_advance'
+
+
+class PetAdvance(PetAdvanceBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'skill': ('skill', 'advance')}
+    pet: ResourceRef['Pet'] = Field(description='该项觉醒对应的精灵')
+    skill: list[ResourceRef['Skill']] = Field(description='完成觉醒可开启的技能')
+    soulmark: ResourceRef['Soulmark'] = Field(description='完成觉醒可开启的魂印')
+    base_stats: SixAttributes = Field(description='觉醒后的种族值')
+
+
+class PetSkinBase(BaseResModel):
+    id: int = Field(description='皮肤ID，注意该字段不是头像/立绘等所使用的资源ID')
+    name: str = Field(description='皮肤名称')
+    resource_id: int = Field(description='皮肤资源ID')
+    enemy_resource_id: int | None = Field(default=None, description='该皮肤在对手侧时使用的资源的ID，仅少数皮肤存在这种资源')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_skin'
+
+
+class PetSkin(PetSkinBase):
+    pet: ResourceRef['Pet'] = Field(description='使用该皮肤的精灵')
+    category: ResourceRef['PetSkinCategory'] = Field(description='该皮肤所属的系列')
+
+
+class PetSkinCategoryBase(BaseResModel):
+    id: int = Field(description='系列ID')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_skin_category'
+
+
+class PetSkinCategory(PetSkinCategoryBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'skins': ('pet_skin', 'category')}
+    skins: list[ResourceRef['PetSkin']] = Field(default_factory=list, description='该系列的皮肤列表')
+
+
+class PetEncyclopediaEntryBase(BaseResModel):
+    id: int = Field(description='精灵图鉴ID')
+    name: str = Field(description='精灵名称')
+    has_sound: bool = Field(description='精灵是否存在叫声')
+    height: float | None = Field(default=None, description="精灵身高，当这个值在图鉴中为'未知'时，这个值为null")
+    weight: float | None = Field(default=None, description="精灵重量，当这个值在图鉴中为'未知'时，这个值为null")
+    foundin: str | None = Field(default=None, description='精灵发现地点')
+    food: str | None = Field(default=None, description='精灵喜爱的食物')
+    introduction: str = Field(description='精灵介绍')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_encyclopedia_entry'
+
+
+class PetEncyclopediaEntry(PetEncyclopediaEntryBase):
+    pet: ResourceRef['Pet'] = Field(description='精灵')
+
+
+class PetArchiveStoryEntryBase(BaseResModel):
+    id: int = Field(description='故事条目ID')
+    content: str = Field(description='故事条目内容')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_archive_story_entry'
+
+
+class PetArchiveStoryEntry(PetArchiveStoryEntryBase):
+    pet: ResourceRef['Pet'] = Field(description='精灵')
+    book: ResourceRef['PetArchiveStoryBook'] = Field(description='故事系列')
+
+
+class PetArchiveStoryBookBase(BaseCategoryModel):
+    name: str = Field(description='故事名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'pet_archive_story_book'
+
+
+class PetArchiveStoryBook(PetArchiveStoryBookBase):
+    entries: list[ResourceRef[PetArchiveStoryEntryBase]] = Field(default_factory=list, description='故事条目')
+
+
+class SoulmarkBase(BaseResModel):
+    desc: str = Field(description='魂印描述')
+    desc_formatting_adjustment: str | None = Field(default=None, description='Unity 客户端历史格式的魂印描述文本（部分旧魂印专用，应优先使用 analyze_desc 字段）')
+    analyze_desc: str | None = Field(default=None, description='当前 Unity 端采用的格式化魂印描述文本')
+    pve_effective: bool | None = Field(default=None, description='该魂印是否PVE生效，如果为null则表示无法通过数据层面推断其是否生效')
+    intensified: bool = Field(description='是否是强化的魂印')
+    is_adv: bool = Field(description='是否是神谕觉醒魂印')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'soulmark'
+
+
+class Soulmark(SoulmarkBase):
+    __name_fields__: ClassVar[list[str]] = ['effect_alias']
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'pet': ('pet', 'soulmark')}
+    pet: list[ResourceRef['Pet']] = Field(description='可持有该魂印的精灵ID')
+    effect: EidEffectInUse | None = Field(description='魂印效果')
+    effect_alias: str | None = Field(default=None, description='效果别名，命名规则为：alias_[效果ID]_[参数1]_[参数2]_…')
+    tag: list[ResourceRef['SoulmarkTagCategory']] = Field(description='魂印标签，例如强攻，断回合等')
+    intensified_to: ResourceRef['Soulmark'] | None = Field(description='强化后的魂印资源，该字段仅在该魂印有强化版时有效，否则为null')
+    from_: ResourceRef['Soulmark'] | None = Field(description='强化前的魂印资源，该字段仅在该魂印是强化/觉醒魂印时有效', serialization_alias='from', validation_alias=AliasChoices('from', 'from_'))
+    advance: ResourceRef['PetAdvance'] | None = Field(default=None, description='觉醒后的魂印资源，该字段仅在该魂印是神谕觉醒魂印时有效')
+
+
+class SoulmarkTagBase(BaseCategoryModel):
+    name: str = Field(description='魂印标签名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'soulmark_tag'
+
+
+class SoulmarkTagCategory(SoulmarkTagBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'soulmark': ('soulmark', 'tag')}
+    soulmark: list[ResourceRef] = Field(default_factory=list, description='魂印列表')
+
+
+class SkillEffectParam(BaseResModel):
+    infos: list[str] | None = Field(default=None, description='参数类型描述列表')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_effect_param'
+
+
+class SkillEffectParamInTypeBase(BaseResModelWithOptionalId):
+    position: int = Field(description='参数位置')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_effect_param_in_type'
+
+
+class SkillEffectParamInType(SkillEffectParamInTypeBase):
+    param: ResourceRef[SkillEffectParam] = Field(description='参数类型引用')
+
+
+class SkillEffectTypeBase(BaseResModel):
+    """描述一条技能效果类型"""
+    args_num: int = Field(description='参数数量')
+    info: str = Field(description='效果描述')
+    info_formatting_adjustment: str | None = Field(default=None, description='效果描述的"可格式化版本"，用于呈现Unity端中的多行描述形式')
+    analyze_info: str = Field(description='新版 Unity 端采用的格式化技能效果描述文本')
+    pve_effective: bool = Field(description='该效果是否PVE生效')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_effect_type'
+
+
+class SkillEffectType(SkillEffectTypeBase):
+    param: list[SkillEffectParamInType] | None = Field(default=None, description='参数类型列表，描述参数类型和参数位置')
+    skill: list[ResourceRef['Skill']] = Field(default_factory=list, description='使用该效果的技能列表')
+    tag: list[ResourceRef['SkillEffectTypeTag']] = Field(default_factory=list, description='标签列表')
+
+
+class SkillCategoryBase(BaseCategoryModel):
+    name: str = Field(description='技能分类名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_category'
+
+
+class SkillCategory(SkillCategoryBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'skill': ('skill', 'category')}
+    skill: list[ResourceRef['Skill']] = Field(default_factory=list, description='使用该分类的技能列表')
+
+
+class SkillHideEffectBase(BaseCategoryModel):
+    name: str = Field(description='技能隐藏效果名称')
+    description: str = Field(description='技能隐藏效果描述')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_hide_effect'
+
+
+class SkillHideEffect(SkillHideEffectBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'skill': ('skill', 'hide_effect')}
+    skill: list[ResourceRef['Skill']] = Field(default_factory=list, description='使用该隐藏效果的技能列表')
+
+
+class SkillEffectTypeTagBase(BaseCategoryModel):
+    name: str = Field(description='标签名称')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill_effect_type_tag'
+
+
+class SkillEffectTypeTag(SkillEffectTypeTagBase):
+    __back_refs__: ClassVar[dict[str, tuple[str, str]]] = {'effect': ('skill_effect_type', 'tag')}
+    effect: list[ResourceRef['SkillEffectType']] = Field(default_factory=list, description='技能效果类型列表')
+
+
+class SkillBase(BaseResModel):
+    name: str = Field(description='技能名称')
+    power: int = Field(description='技能威力')
+    max_pp: int = Field(description='技能最大PP')
+    accuracy: int = Field(description='技能命中率')
+    crit_rate: float | None = Field(description='技能暴击率, 该技能无法暴击时为null（例如属性技能）')
+    priority: int = Field(description='技能优先级')
+    must_hit: bool = Field(description='技能是否必定命中')
+    atk_num: int = Field(default=1, description='组队对战中技能可作用目标数量，默认为1')
+    info: str | None = Field(default=None, description='技能描述')
+
+    @classmethod
+    def resource_name(cls) -> str:
+        return 'skill'
+
+
+class Skill(SkillBase):
+    category: ResourceRef[SkillCategory] = Field(description='技能分类')
+    type: ResourceRef['TypeCombination'] = Field(description='技能属性')
+    learned_by_pet: list[ResourceRef['Pet']] = Field(default_factory=list, description='可学习该技能的精灵列表')
+    skill_effect: list[SkillEffectInUse] = Field(default_factory=list, description='技能效果列表')
+    friend_skill_effect: list[SkillEffectInUse] = Field(default_factory=list, description='旧版伙伴系统强化后的技能效果')
+    hide_effect: ResourceRef[SkillHideEffect] | None = Field(default=None, description='技能隐藏效果')
+    advance: ResourceRef['PetAdvance'] | None = Field(default=None, description='技能觉醒信息，仅在该技能是通过神谕觉醒开启的技能时生效')
+
+
+# 所有模型定义完成后统一解析前向引用
+for _model in (ResourceRef, NamedResourceRef, ApiResourceList, NamedData, EidEffect, EidEffectInUseBase, EidEffectInUse, SixAttributesBase, SixAttributes, CompactSixAttributes, SkillEffectInUseBase, SkillEffectInUse, AchievementCategoryNameEnum, AbilityBonusMixin, TitleInfoMixin, BaseAchievement, AchievementRefsMixin, Achievement, BaseTitle, Title, BaseAchievementType, AchievementType, BaseAchievementBranch, AchievementBranch, BaseAchievementCategory, AchievementCategory, BattleEffectBase, BattleEffect, BattleEffectCategoryBase, BattleEffectCategory, BaseDecoration, AvatarHead, AvatarFrame, NamecardBackground, NicknameBackground, HomepageBackground, Emoji, EffectSeDataBase, EffectSeData, VariationEffectBase, VariationEffect, PetEffectBase, PetEffect, PetEffectGroupBase, PetEffectGroup, ElementType, TypeCombinationBase, TypeCombination, TypeEffectivenessBase, TypeEffectiveness, BaseErrorCode, ErrorCode, GlossaryEntryBase, GlossaryEntry, ItemBase, Item, ItemCategoryBase, ItemCategory, EnergyBeadBase, EnergyBead, PkAttribute, OtherAttribute, EquipEffect, EquipBonusBase, EquipBonus, SuitBonusBase, SuitBonus, SuitBase, Suit, EquipBase, Equip, EquipTypeBase, EquipType, EquipEffectiveOccasionBase, EquipEffectiveOccasion, GemBase, GemResRefs, Gem, GemGen1, GemGen2, GemCategoryBase, GemCategory, GemGenCategoryBase, GemGenCategory, SkillActivationItemBase, SkillActivationItem, SkillStoneEffectBase, SkillStoneEffect, SkillStoneBase, SkillStone, SkillStoneCategoryBase, SkillStoneCategory, ApiMetadata, SkillMintmarkEffect, MintmarkBase, MintmarkResRefs, AbilityMintmark, SkillMintmark, UniversalMintmark, Mintmark, MintmarkRarityBase, MintmarkRarityCategory, MintmarkTypeBase, MintmarkTypeCategory, MintmarkClassBase, MintmarkClassCategory, BaseNature, Nature, BasePeakSeason, PeakSeason, BasePeakPool, PeakPool, BasePeakExpertPool, PeakExpertPool, BasePeakPoolVote, PeakPoolVote, DiyStatsRange, SkillInPetBase, SkillInPet, PetBase, Pet, PetClassBase, PetClass, PetCategoryBase, PetCategoryRefs, PetGenderBase, PetGenderCategory, PetVipBuffBase, PetVipBuffCategory, PetMountTypeBase, PetMountTypeCategory, PetAdvanceBase, PetAdvance, PetSkinBase, PetSkin, PetSkinCategoryBase, PetSkinCategory, PetEncyclopediaEntryBase, PetEncyclopediaEntry, PetArchiveStoryEntryBase, PetArchiveStoryEntry, PetArchiveStoryBookBase, PetArchiveStoryBook, SoulmarkBase, Soulmark, SoulmarkTagBase, SoulmarkTagCategory, SkillEffectParam, SkillEffectParamInTypeBase, SkillEffectParamInType, SkillEffectTypeBase, SkillEffectType, SkillCategoryBase, SkillCategory, SkillHideEffectBase, SkillHideEffect, SkillEffectTypeTagBase, SkillEffectTypeTag, SkillBase, Skill):
+    if issubclass(_model, BaseModel):
+        _model.model_rebuild()
+
+
+__all__ = [
+    'AbilityBonusMixin',
+    'AbilityMintmark',
+    'Achievement',
+    'AchievementBranch',
+    'AchievementCategory',
+    'AchievementCategoryNameEnum',
+    'AchievementRefsMixin',
+    'AchievementType',
+    'ApiMetadata',
+    'ApiModel',
+    'ApiResourceList',
+    'AvatarFrame',
+    'AvatarHead',
+    'BaseAchievement',
+    'BaseAchievementBranch',
+    'BaseAchievementCategory',
+    'BaseAchievementType',
+    'BaseCategoryModel',
+    'BaseDecoration',
+    'BaseErrorCode',
+    'BaseGeneralModel',
+    'BaseNature',
+    'BasePeakExpertPool',
+    'BasePeakPool',
+    'BasePeakPoolVote',
+    'BasePeakSeason',
+    'BaseResModel',
+    'BaseResModelWithOptionalId',
+    'BaseTitle',
+    'BattleEffect',
+    'BattleEffectBase',
+    'BattleEffectCategory',
+    'BattleEffectCategoryBase',
+    'CompactSixAttributes',
+    'DiyStatsRange',
+    'EffectSeData',
+    'EffectSeDataBase',
+    'EidEffect',
+    'EidEffectInUse',
+    'EidEffectInUseBase',
+    'ElementType',
+    'Emoji',
+    'EnergyBead',
+    'EnergyBeadBase',
+    'Equip',
+    'EquipBase',
+    'EquipBonus',
+    'EquipBonusBase',
+    'EquipEffect',
+    'EquipEffectiveOccasion',
+    'EquipEffectiveOccasionBase',
+    'EquipType',
+    'EquipTypeBase',
+    'ErrorCode',
+    'Gem',
+    'GemBase',
+    'GemCategory',
+    'GemCategoryBase',
+    'GemGen1',
+    'GemGen2',
+    'GemGenCategory',
+    'GemGenCategoryBase',
+    'GemResRefs',
+    'GlossaryEntry',
+    'GlossaryEntryBase',
+    'HomepageBackground',
+    'Item',
+    'ItemBase',
+    'ItemCategory',
+    'ItemCategoryBase',
+    'Mintmark',
+    'MintmarkBase',
+    'MintmarkClassBase',
+    'MintmarkClassCategory',
+    'MintmarkRarityBase',
+    'MintmarkRarityCategory',
+    'MintmarkResRefs',
+    'MintmarkTypeBase',
+    'MintmarkTypeCategory',
+    'NamecardBackground',
+    'NamedData',
+    'NamedResourceRef',
+    'Nature',
+    'NicknameBackground',
+    'OtherAttribute',
+    'PeakExpertPool',
+    'PeakPool',
+    'PeakPoolVote',
+    'PeakSeason',
+    'Pet',
+    'PetAdvance',
+    'PetAdvanceBase',
+    'PetArchiveStoryBook',
+    'PetArchiveStoryBookBase',
+    'PetArchiveStoryEntry',
+    'PetArchiveStoryEntryBase',
+    'PetBase',
+    'PetCategoryBase',
+    'PetCategoryRefs',
+    'PetClass',
+    'PetClassBase',
+    'PetEffect',
+    'PetEffectBase',
+    'PetEffectGroup',
+    'PetEffectGroupBase',
+    'PetEncyclopediaEntry',
+    'PetEncyclopediaEntryBase',
+    'PetGenderBase',
+    'PetGenderCategory',
+    'PetMountTypeBase',
+    'PetMountTypeCategory',
+    'PetSkin',
+    'PetSkinBase',
+    'PetSkinCategory',
+    'PetSkinCategoryBase',
+    'PetVipBuffBase',
+    'PetVipBuffCategory',
+    'PkAttribute',
+    'ResourceRef',
+    'SixAttributes',
+    'SixAttributesBase',
+    'Skill',
+    'SkillActivationItem',
+    'SkillActivationItemBase',
+    'SkillBase',
+    'SkillCategory',
+    'SkillCategoryBase',
+    'SkillEffectInUse',
+    'SkillEffectInUseBase',
+    'SkillEffectParam',
+    'SkillEffectParamInType',
+    'SkillEffectParamInTypeBase',
+    'SkillEffectType',
+    'SkillEffectTypeBase',
+    'SkillEffectTypeTag',
+    'SkillEffectTypeTagBase',
+    'SkillHideEffect',
+    'SkillHideEffectBase',
+    'SkillInPet',
+    'SkillInPetBase',
+    'SkillMintmark',
+    'SkillMintmarkEffect',
+    'SkillStone',
+    'SkillStoneBase',
+    'SkillStoneCategory',
+    'SkillStoneCategoryBase',
+    'SkillStoneEffect',
+    'SkillStoneEffectBase',
+    'Soulmark',
+    'SoulmarkBase',
+    'SoulmarkTagBase',
+    'SoulmarkTagCategory',
+    'Suit',
+    'SuitBase',
+    'SuitBonus',
+    'SuitBonusBase',
+    'Title',
+    'TitleInfoMixin',
+    'TypeCombination',
+    'TypeCombinationBase',
+    'TypeEffectiveness',
+    'TypeEffectivenessBase',
+    'UniversalMintmark',
+    'VariationEffect',
+    'VariationEffectBase',
+]
@@ -0,0 +1,23 @@
+"""pytest 配置"""
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        '--run-benchmark',
+        action='store_true',
+        default=False,
+        help='运行标记为 benchmark 的耗时对比测试',
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption('--run-benchmark'):
+        return
+    skip = pytest.mark.skip(reason='基准测试默认跳过，使用 --run-benchmark 运行')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,88 @@
+"""根据字段注解生成测试用的模型实例"""
+
+from datetime import datetime, timezone
+from enum import Enum
+import sys
+import types
+from typing import Any, ForwardRef, Literal, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+import seerapi_models  # noqa: F401  确保全部模型都已定义
+from seerapi_models.build_model import ConvertToORM
+from seerapi_models.common import ResourceRef
+
+_TModel = TypeVar('_TModel', bound=BaseModel)
+
+# 生成的引用 URL 的服务地址，路径与 ResourceRef.from_res_name 创建的一致
+FAKE_BASE_DATA_URL = 'https://example.com'
+
+
+def _fake_value(annotation: Any, seed: int, module: str) -> Any:
+    if isinstance(annotation, ForwardRef):
+        annotation = annotation.__forward_arg__
+    if isinstance(annotation, str):
+        annotation = getattr(sys.modules[module], annotation)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in (Union, types.UnionType):
+        # 可选字段同样填充，以覆盖更多转换分支
+        return _fake_value(
+            next(arg for arg in args if arg is not type(None)), seed, module
+        )
+    if origin is Literal:
+        return args[0]
+    if origin is list:
+        return [_fake_value(args[0], seed, module)]
+    if origin is tuple:
+        return tuple(_fake_value(arg, seed + i, module) for i, arg in enumerate(args))
+    if origin is dict:
+        return {}
+    if isinstance(annotation, type):
+        if issubclass(annotation, ResourceRef):
+            return {'id': seed, 'url': f'{FAKE_BASE_DATA_URL}/resource/{seed}'}
+        if issubclass(annotation, BaseModel):
+            return fake_data(annotation, seed)
+        if issubclass(annotation, Enum):
+            return next(iter(annotation)).value
+        if issubclass(annotation, bool):
+            return seed % 2 == 0
+        if issubclass(annotation, int | float):
+            return seed
+        if issubclass(annotation, str):
+            return f'text-{seed}'
+        if issubclass(annotation, datetime):
+            return datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return seed
+
+
+def fake_data(model: type[BaseModel], seed: int = 1, **overrides: Any) -> dict:
+    """生成可以通过模型校验的数据，所有字段（包括可选字段）都会被填充"""
+    data = {
+        field.alias or name: _fake_value(field.annotation, seed, model.__module__)
+        for name, field in model.model_fields.items()
+    }
+    data.update(overrides)
+    return data
+
+
+def fake(model: type[_TModel], seed: int = 1, **overrides: Any) -> _TModel:
+    """生成模型实例，seed 同时作为资源ID和所有数值字段的取值"""
+    return model.model_validate(fake_data(model, seed, **overrides))
+
+
+def _convertible_models() -> list[type[BaseModel]]:
+    seen: set[type] = set()
+    pending: list[type] = [ConvertToORM]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                pending.append(subclass)
+    # ORM 模型继承自 API 模型，需要排除
+    models = [model for model in seen if not hasattr(model, '__table__')]
+    return sorted(models, key=lambda model: model.__name__)
+
+
+# 全部可以转换为 ORM 模型的 API 模型
+CONVERTIBLE_MODELS = _convertible_models()
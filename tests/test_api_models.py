@@ -0,0 +1,119 @@
+"""测试不依赖 SQLAlchemy 的 API 模型"""
+
+import ast
+import importlib
+
+import pytest
+
+from seerapi_models import _api_codegen
+from seerapi_models.common import ResourceRef, SixAttributes
+from seerapi_models.items import Item
+from seerapi_models.nature import Nature
+import seerapi_models_api as api
+
+from .test_lazy_import import run_python
+
+
+def _source_models() -> dict[str, type]:
+    models: dict[str, type] = {}
+    for module in _api_codegen.SOURCE_MODULES:
+        submodule = importlib.import_module(
+            f'seerapi_models.{module.replace("/", ".")}'
+        )
+        models.update(
+            (name, value)
+            for name, value in vars(submodule).items()
+            if isinstance(value, type) and value.__module__ == submodule.__name__
+        )
+    return models
+
+
+SOURCE_MODELS = _source_models()
+API_MODELS = [
+    name
+    for name in api.__all__
+    if name in SOURCE_MODELS and hasattr(getattr(api, name), 'model_fields')
+]
+
+
+def test_generated_module_is_up_to_date():
+    """测试已提交的 seerapi_models_api 与代码生成结果一致"""
+    assert _api_codegen.OUTPUT_PATH.read_text(encoding='utf-8') == (
+        _api_codegen.render()
+    )
+
+
+def test_field_positional_args_rejected():
+    """测试 Field 的位置参数（即默认值）不会被当作字段说明原样生成"""
+    tree = ast.parse("x: int = Field('说明')")
+    statement = tree.body[0]
+    assert isinstance(statement, ast.AnnAssign)
+    assert isinstance(statement.value, ast.Call)
+    with pytest.raises(ValueError, match='位置参数'):
+        _api_codegen._convert_field_call(statement.value)
+
+
+def test_no_orm_models_generated():
+    """测试生成的模块不包含 ORM 模型"""
+    assert not [name for name in api.__all__ if name.endswith(('ORM', 'ORMBase'))]
+
+
+@pytest.mark.parametrize('name', API_MODELS)
+def test_fields_match_source_model(name: str):
+    """测试字段定义与对应的 SQLModel API 模型一致"""
+    api_fields = getattr(api, name).model_fields
+    source_fields = SOURCE_MODELS[name].model_fields
+    assert set(api_fields) == set(source_fields)
+    for field_name, field in api_fields.items():
+        source = source_fields[field_name]
+        assert field.default == source.default
+        assert field.default_factory == source.default_factory
+        assert field.description == source.description
+        assert field.alias == source.alias
+        assert field.exclude == source.exclude
+    assert set(getattr(api, name).model_computed_fields) == set(
+        SOURCE_MODELS[name].model_computed_fields
+    )
+
+
+def test_dump_round_trip():
+    """测试 API 模型与 SQLModel 模型可以互相转换"""
+    item = Item(
+        id=1,
+        name='测试物品',
+        max=100,
+        category=ResourceRef.from_res_name(id=2, resource_name='item_category'),
+    )
+    api_item = api.Item.model_validate(item.model_dump())
+    assert api_item.model_dump() == item.model_dump()
+    assert Item.model_validate(api_item.model_dump()) == item
+
+    nature = Nature(
+        id=1,
+        name='固执',
+        des='攻击+10%，特攻-10%',
+        des2='',
+        attributes=SixAttributes(
+            atk=110, def_=100, sp_atk=90, sp_def=100, spd=100, hp=100
+        ),
+    )
+    api_nature = api.Nature.model_validate(nature, from_attributes=True)
+    assert api_nature.model_dump(by_alias=True) == nature.model_dump(by_alias=True)
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_import_without_sqlalchemy(lazy: bool):
+    """测试无论是否开启按需导入，导入 seerapi_models_api 都不会加载 SQLAlchemy"""
+    output = run_python(
+        """
+        import sys
+        from seerapi_models_api import Pet
+        print(
+            'sqlalchemy' in sys.modules,
+            'sqlmodel' in sys.modules,
+            'seerapi_models' in sys.modules,
+        )
+        """,
+        lazy=lazy,
+    )
+    assert output == 'False False False'
@@ -0,0 +1,185 @@
+"""测试 SixAttributesBatch 批量运算与逐个运算的结果一致"""
+
+import importlib.util
+import random
+
+from hypothesis import given
+from hypothesis import strategies as st
+import pytest
+
+from seerapi_models import attributes_batch
+from seerapi_models.attributes_batch import SixAttributesBatch
+from seerapi_models.common import CompactSixAttributes, SixAttributes
+
+BACKENDS = [
+    pytest.param(
+        'numpy',
+        marks=pytest.mark.skipif(
+            importlib.util.find_spec('numpy') is None, reason='未安装 NumPy'
+        ),
+    ),
+    'array',
+]
+
+KEYS = ('atk', 'def_', 'sp_atk', 'sp_def', 'spd', 'hp')
+
+# 整数与浮点数混合，整数在 float64 中可以精确表示
+attribute_values = st.one_of(
+    st.integers(-10_000, 10_000),
+    st.floats(-10_000, 10_000, allow_nan=False, allow_infinity=False),
+)
+
+
+@st.composite
+def six_attributes(draw: st.DrawFn) -> SixAttributes:
+    data: dict = {key: draw(attribute_values) for key in KEYS}
+    # None 表示不传入 percent，此时 percent 不计入 model_fields_set
+    percent = draw(st.sampled_from([None, False, True]))
+    if percent is not None:
+        data['percent'] = percent
+    return SixAttributes(**data)
+
+
+def random_attributes(rng: random.Random) -> SixAttributes:
+    def value() -> int | float:
+        if rng.random() < 0.5:
+            return rng.randint(-100, 300)
+        return round(rng.uniform(-100, 300), rng.randint(0, 3))
+
+    return SixAttributes(
+        atk=value(),
+        def_=value(),
+        sp_atk=value(),
+        sp_def=value(),
+        spd=value(),
+        hp=value(),
+        percent=rng.random() < 0.5,
+    )
+
+
+def as_tuple(model: SixAttributes) -> tuple:
+    """属性值及其类型、percent 与字段集合，用于比较两个实例是否完全相同"""
+    values = tuple(getattr(model, key) for key in KEYS)
+    return (
+        values,
+        tuple(map(type, values)),
+        model.percent,
+        model.model_fields_set,
+    )
+
+
+def assert_same(actual: list[SixAttributes], expected: list[SixAttributes]) -> None:
+    assert [as_tuple(model) for model in actual] == [
+        as_tuple(model) for model in expected
+    ]
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+class TestMatchesScalar:
+    """比较批量运算与 SixAttributes 运算的结果，包括数值类型与字段集合"""
+
+    @given(pairs=st.lists(st.tuples(six_attributes(), six_attributes()), max_size=20))
+    def test_add_and_sub(self, backend, pairs):
+        left = SixAttributesBatch.from_models([a for a, _ in pairs], backend=backend)
+        right = SixAttributesBatch.from_models([b for _, b in pairs], backend=backend)
+        assert_same((left + right).to_models(), [a + b for a, b in pairs])
+        assert_same((left - right).to_models(), [a - b for a, b in pairs])
+
+    @given(models=st.lists(six_attributes(), max_size=20), bonus=six_attributes())
+    def test_broadcast_single_model(self, backend, models, bonus):
+        batch = SixAttributesBatch.from_models(models, backend=backend)
+        assert_same((batch + bonus).to_models(), [model + bonus for model in models])
+        single = SixAttributesBatch.from_models([bonus], backend=backend)
+        assert_same((single - batch).to_models(), [bonus - model for model in models])
+
+    @given(
+        steps=st.integers(1, 10).flatmap(
+            lambda size: st.lists(
+                st.lists(six_attributes(), min_size=size, max_size=size),
+                min_size=2,
+                max_size=4,
+            )
+        )
+    )
+    def test_chained(self, backend, steps):
+        batch = SixAttributesBatch.from_models(steps[0], backend=backend)
+        expected = steps[0]
+        for step in steps[1:]:
+            batch = batch + SixAttributesBatch.from_models(step, backend=backend)
+            expected = [a + b for a, b in zip(expected, step)]
+        assert_same(batch.to_models(), expected)
+
+    @given(models=st.lists(six_attributes(), max_size=20))
+    def test_round_trip(self, backend, models):
+        batch = SixAttributesBatch.from_models(models, backend=backend)
+        assert_same(batch.to_models(), models)
+        assert batch.to_compact() == [
+            CompactSixAttributes.from_model(model) for model in models
+        ]
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+class TestBatch:
+    """测试批量对象的构造与转换"""
+
+    def test_from_compact(self, backend):
+        compact = CompactSixAttributes(1, 2, 3, 4, 5, 6, percent=True)
+        batch = SixAttributesBatch.from_models([compact], backend=backend)
+        assert batch.to_compact() == [compact]
+        assert len(batch) == 1
+
+    def test_percent_broadcast(self, backend):
+        batch = SixAttributesBatch([[1] * 6, [2] * 6], percent=True, backend=backend)
+        assert [percent for _, percent in batch.rows()] == [True, True]
+
+    def test_percent_not_set_by_default(self, backend):
+        """测试未传入 percent 时转换得到的模型与 SixAttributes 一样不记录该字段"""
+        (model,) = SixAttributesBatch(
+            [[1, 2, 3, 4, 5, 6.5]], backend=backend
+        ).to_models()
+        assert 'percent' not in model.model_fields_set
+        assert model == SixAttributes.from_list([1, 2, 3, 4, 5, 6.5])  # type: ignore[list-item]
+
+    def test_ints_kept(self, backend):
+        batch = SixAttributesBatch([[1, 2, 3, 4, 5, 6.0]], backend=backend)
+        assert [type(value) for value in next(batch.rows())[0]] == [int] * 5 + [float]
+
+    def test_empty(self, backend):
+        batch = SixAttributesBatch([], backend=backend)
+        assert len(batch + SixAttributes.from_list([1] * 6)) == 0
+
+    def test_length_mismatch(self, backend):
+        left = SixAttributesBatch([[1] * 6] * 2, backend=backend)
+        right = SixAttributesBatch([[1] * 6] * 3, backend=backend)
+        with pytest.raises(ValueError, match='批量长度不一致'):
+            _ = left + right
+
+    def test_invalid_row(self, backend):
+        with pytest.raises(ValueError, match='6'):
+            SixAttributesBatch([[1, 2, 3]], backend=backend)
+
+    def test_unsupported_operand(self, backend):
+        batch = SixAttributesBatch([[1] * 6], backend=backend)
+        with pytest.raises(TypeError):
+            _ = batch + 1  # type: ignore[operator]
+
+
+@pytest.mark.skipif(importlib.util.find_spec('numpy') is None, reason='未安装 NumPy')
+def test_mixed_backends():
+    """测试不同后端的批量对象可以互相运算，结果使用左侧的后端"""
+    rng = random.Random(0)
+    models = [random_attributes(rng) for _ in range(10)]
+    numpy_batch = SixAttributesBatch.from_models(models, backend='numpy')
+    array_batch = SixAttributesBatch.from_models(models, backend='array')
+    result = array_batch + numpy_batch
+    assert result.backend == 'array'
+    assert result.to_compact() == (numpy_batch + array_batch).to_compact()
+
+
+def test_numpy_missing(monkeypatch):
+    """测试未安装 NumPy 时默认使用 array 后端"""
+    monkeypatch.setattr(attributes_batch, 'np', None)
+    assert attributes_batch.default_backend() == 'array'
+    assert SixAttributesBatch([[1] * 6]).backend == 'array'
+    with pytest.raises(ModuleNotFoundError):
+        SixAttributesBatch([[1] * 6], backend='numpy')
@@ -0,0 +1,397 @@
+"""测试批量写入"""
+
+from typing import Any
+
+import pytest
+from sqlalchemy import Column, Engine, Integer, Table, func
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from seerapi_models import (
+    ApiMetadata,
+    BattleEffect,
+    BattleEffectCategory,
+    EnergyBead,
+    Gem,
+    GlossaryEntry,
+    Mintmark,
+    Nature,
+    Pet,
+    PetORM,
+    Skill,
+    SkillEffectInUse,
+    Soulmark,
+    Suit,
+    SuitBonus,
+)
+from seerapi_models.achievement import AchievementLevelClosure
+from seerapi_models.bulk import (
+    BulkLoader,
+    bulk_load,
+    rebuild_closure_tables,
+    sorted_tables,
+)
+from seerapi_models.common import (
+    EidEffectInUseORM,
+    ResourceRef,
+    SkillEffectInUseORM,
+)
+from seerapi_models.items.equip import SuitBonusAttrORM
+from seerapi_models.items.mintmark_gem import GemLevelClosure
+from seerapi_models.pet.soulmark import PetSoulmarkLink, SoulmarkORM
+from seerapi_models.skill import (
+    SkillEffectLink,
+    SkillEffectType,
+    SkillEffectTypeTag,
+    SkillFriendSkillEffectLink,
+    SkillORM,
+)
+
+from .factories import CONVERTIBLE_MODELS, fake, fake_data
+
+
+def new_engine() -> Engine:
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def dump_tables(engine: Engine) -> dict[str, list[tuple]]:
+    with engine.connect() as connection:
+        return {
+            table.name: sorted(map(tuple, connection.execute(table.select())), key=repr)
+            for table in sorted_tables()
+        }
+
+
+def count(session: Session, model: type[SQLModel]) -> int:
+    return (
+        session.connection()
+        .execute(select(func.count()).select_from(model))
+        .scalar_one()
+    )
+
+
+def test_matches_session_add():
+    """测试批量写入的结果与逐个通过 session 写入 to_orm 和 to_orm_links 完全一致"""
+    models: list[Any] = [
+        fake(model, seed) for seed, model in enumerate(CONVERTIBLE_MODELS, 1)
+    ]
+    models.append(fake(ApiMetadata))
+
+    expected = new_engine()
+    with Session(expected) as session:
+        for model in models:
+            session.add(model.to_orm())
+            for link in getattr(model, 'to_orm_links', list)():
+                session.merge(link)
+        session.flush()
+        # 闭包表由源表推导而来，逐个写入时需要手动重建
+        rebuild_closure_tables(session)
+        session.commit()
+
+    actual = new_engine()
+    with Session(actual) as session:
+        bulk_load(session, models, interned_models=())
+        session.commit()
+
+    assert dump_tables(actual) == dump_tables(expected)
+
+
+def test_returns_row_counts():
+    """测试返回各表写入的行数，包括链接表"""
+    pet = fake(Pet)
+    with Session(new_engine()) as session:
+        counts = bulk_load(session, [pet])
+    assert counts['pet'] == 1
+    assert counts['pet_base_stats'] == 1
+    assert counts['skillinpetorm'] == len(pet.skill)
+
+
+def test_sorted_tables_follow_registered_tables():
+    """测试表的数量不变但表名变化时重新排序"""
+    metadata = SQLModel.metadata
+    first = Table('sorted_tables_probe_1', metadata, Column('id', Integer))
+    try:
+        assert first in sorted_tables()
+        metadata.remove(first)
+        second = Table('sorted_tables_probe_2', metadata, Column('id', Integer))
+        try:
+            tables = sorted_tables()
+            assert second in tables
+            assert first not in tables
+        finally:
+            metadata.remove(second)
+    finally:
+        if first.name in metadata.tables:
+            metadata.remove(first)
+    assert second not in sorted_tables()
+
+
+def test_duplicate_rows_written_once():
+    """测试主键相同的行只写入一次"""
+    pet = fake(Pet)
+    with Session(new_engine()) as session:
+        counts = bulk_load(session, [pet, pet, pet.to_orm()])
+        assert counts['pet'] == 1
+        assert count(session, PetORM) == 1
+
+
+def test_autoincrement_continues_from_existing_rows():
+    """测试自增主键从数据库中已有的最大值继续分配"""
+    effect = SkillEffectInUseORM(effect_id=1, args=[1], info='', analyze_info='')
+    with Session(new_engine()) as session:
+        session.add(effect)
+        session.flush()
+        assert effect.id is not None
+        loader = BulkLoader(session)
+        loader.add(SkillEffectInUseORM(effect_id=2, args=[], info='', analyze_info=''))
+        loader.flush()
+        ids = session.connection().execute(select(SkillEffectInUseORM.id)).scalars()
+        assert sorted(ids) == [effect.id, effect.id + 1]
+
+
+def test_small_batches():
+    """测试拆分为多条 INSERT 语句时不丢失数据"""
+    models = [fake(SkillEffectInUse, seed) for seed in range(1, 11)]
+    with Session(new_engine()) as session:
+        loader = BulkLoader(session, batch_size=3)
+        loader.add_all(models)
+        assert loader.flush() == {'skill_effect_in_use': 10}
+        assert count(session, SkillEffectInUseORM) == 10
+        assert count(session, SkillEffectLink) == 0
+
+
+@pytest.mark.parametrize(
+    ('model', 'table'),
+    [
+        (Skill, 'skilleffectlink'),
+        (Skill, 'skillfriendskilleffectlink'),
+        (Pet, 'petsoulmarklink'),
+        (Soulmark, 'petsoulmarklink'),
+        (Soulmark, 'soulmarktaglink'),
+        (GlossaryEntry, 'glossaryentrylink'),
+        (GlossaryEntry, 'petglossaryentrylink'),
+        (Mintmark, 'petmintmarklink'),
+        (Mintmark, 'skillmintmarklink'),
+        (SuitBonus, 'petsuitlink'),
+        (Suit, 'petsuitlink'),
+        (BattleEffect, 'battleeffectcategorylink'),
+        (BattleEffectCategory, 'battleeffectcategorylink'),
+        (SkillEffectType, 'effectparamlink'),
+        (SkillEffectType, 'skilleffecttypetaglink'),
+        (SkillEffectTypeTag, 'skilleffecttypetaglink'),
+    ],
+)
+def test_link_rows_written_with_parent(model, table: str):
+    """测试链接表行与其所属的模型在同一批中写入"""
+    with Session(new_engine()) as session:
+        counts = bulk_load(session, [fake(model)])
+    assert counts[table] == 1
+
+
+def test_link_from_both_sides_written_once():
+    """测试两端模型都记录的链接只写入一次"""
+    pet = fake(Pet, 1, soulmark=[{'id': 2, 'url': ''}])
+    soulmark = fake(Soulmark, 2, pet=[{'id': 1, 'url': ''}])
+    with Session(new_engine()) as session:
+        bulk_load(session, [pet, soulmark])
+        links = session.connection().execute(select(PetSoulmarkLink)).all()
+    assert [tuple(link) for link in links] == [(1, 2)]
+
+
+def test_skill_effects_written_by_session():
+    """测试通过 session 写入 Skill.to_orm 时，两种技能效果写入各自的链接表"""
+    skill = fake(Skill)
+    with Session(new_engine()) as session:
+        session.add(skill.to_orm())
+        session.commit()
+        assert count(session, SkillEffectLink) == len(skill.skill_effect)
+        assert count(session, SkillFriendSkillEffectLink) == len(
+            skill.friend_skill_effect
+        )
+
+
+class TestInterning:
+    """测试效果行按内容去重"""
+
+    def test_same_skill_effect_shared(self):
+        """测试内容相同的技能效果只写入一行，链接行都指向这一行"""
+        effect = fake_data(SkillEffectInUse, 5)
+        skills = [
+            fake(Skill, i, skill_effect=[effect], friend_skill_effect=[])
+            for i in (1, 2)
+        ]
+        with Session(new_engine()) as session:
+            bulk_load(session, skills)
+            effect_ids = session.connection().execute(select(SkillEffectLink)).all()
+            assert count(session, SkillEffectInUseORM) == 1
+        assert sorted(effect_ids) == [(1, effect_ids[0][1]), (2, effect_ids[0][1])]
+
+    def test_repeated_skill_effect_kept(self):
+        """测试同一技能中重复出现的效果各占一行，第二次出现的行同样在技能之间共用"""
+        effect = fake_data(SkillEffectInUse, 5)
+        other = fake_data(SkillEffectInUse, 6)
+        skills = [
+            fake(
+                Skill, 1, skill_effect=[effect, other, effect], friend_skill_effect=[]
+            ),
+            fake(Skill, 2, skill_effect=[effect, effect], friend_skill_effect=[]),
+            fake(Skill, 3, skill_effect=[effect], friend_skill_effect=[]),
+        ]
+        with Session(new_engine()) as session:
+            bulk_load(session, skills)
+            session.commit()
+            assert count(session, SkillEffectInUseORM) == 3
+            links = session.connection().execute(select(SkillEffectLink)).all()
+            assert len(links) == 6
+            for skill in skills:
+                loaded = session.get_one(SkillORM, skill.id).skill_effect
+                assert sorted(e.info for e in loaded) == sorted(
+                    e.info for e in skill.skill_effect
+                )
+
+    def test_repeated_skill_effect_reuses_existing_rows(self):
+        """测试复用数据库中已有的行时，重复出现的效果对应已有的各行"""
+        effect = fake_data(SkillEffectInUse, 5)
+        skill = fake(Skill, 1, skill_effect=[effect, effect], friend_skill_effect=[])
+        with Session(new_engine()) as session:
+            bulk_load(session, [skill])
+            loader = BulkLoader(session, reuse_interned=True)
+            loader.add(
+                fake(Skill, 2, skill_effect=[effect, effect], friend_skill_effect=[])
+            )
+            counts = loader.flush()
+            assert 'skill_effect_in_use' not in counts
+            assert counts['skilleffectlink'] == 2
+            assert count(session, SkillEffectInUseORM) == 2
+
+    def test_different_info_not_shared(self):
+        """测试任意一列不同的效果不会合并"""
+        effects = [
+            fake_data(SkillEffectInUse, 5),
+            fake_data(SkillEffectInUse, 5, info='另一种描述'),
+        ]
+        with Session(new_engine()) as session:
+            bulk_load(
+                session, [fake(Skill, 1, skill_effect=effects, friend_skill_effect=[])]
+            )
+            assert count(session, SkillEffectInUseORM) == 2
+
+    def test_eid_effect_shared(self):
+        """测试相同的特性效果去重后由多个资源共用，反向关系中包含全部资源"""
+        effect = fake(Soulmark, 1).effect.model_copy(update={'id': None})
+        soulmark = fake(Soulmark, 1, effect=effect)
+        bead = fake(EnergyBead, 2, effect=effect)
+        with Session(new_engine()) as session:
+            bulk_load(session, [soulmark, bead])
+            session.commit()
+            assert count(session, EidEffectInUseORM) == 1
+            effect_in_use = session.get_one(SoulmarkORM, 1).effect_in_use
+            assert effect_in_use is not None
+            assert [soulmark.id for soulmark in effect_in_use.soulmark] == [1]
+            assert [bead.id for bead in effect_in_use.energy_bead] == [2]
+
+    def test_one_to_one_model_rejected(self):
+        """测试被一对一关系引用的模型不能去重"""
+        with (
+            Session(new_engine()) as session,
+            pytest.raises(ValueError, match='一对一关系'),
+        ):
+            BulkLoader(session, interned_models=[SuitBonusAttrORM])
+
+    def test_disabled(self):
+        """测试关闭去重后每次使用都写入一行"""
+        effect = fake_data(SkillEffectInUse, 5)
+        skills = [
+            fake(Skill, i, skill_effect=[effect], friend_skill_effect=[])
+            for i in (1, 2)
+        ]
+        with Session(new_engine()) as session:
+            bulk_load(session, skills, interned_models=())
+            assert count(session, SkillEffectInUseORM) == 2
+
+
+class TestMerge:
+    """测试合并未绑定数据库的加载器展开的行"""
+
+    def test_same_as_bulk_load(self):
+        """测试分开展开再合并时，重新分配的主键与外键都与一次写入相同"""
+        effect = fake_data(SkillEffectInUse, 5)
+        eid_effect = fake(Soulmark, 1).effect.model_copy(update={'id': None})
+        parts = [
+            [
+                fake(Skill, 1, skill_effect=[effect, effect], friend_skill_effect=[]),
+                fake(Soulmark, 1, effect=eid_effect),
+            ],
+            [
+                fake(Skill, 2, skill_effect=[effect], friend_skill_effect=[effect]),
+                fake(EnergyBead, 2, effect=eid_effect),
+            ],
+        ]
+        expected = new_engine()
+        with Session(expected) as session:
+            bulk_load(session, [model for part in parts for model in part])
+            session.commit()
+
+        engine = new_engine()
+        with Session(engine) as session:
+            loader = BulkLoader(session)
+            for part in parts:
+                other = BulkLoader(None)
+                other.add_all(part)
+                rows = other.take_rows()
+                loader.merge(
+                    {table: rows.values() for table, rows in rows.items()},
+                    other.generated_tables,
+                )
+            loader.flush()
+            session.commit()
+        assert dump_tables(engine) == dump_tables(expected)
+
+    def test_unbound_loader_cannot_flush(self):
+        loader = BulkLoader(None)
+        loader.add(fake(Nature))
+        with pytest.raises(ValueError, match='take_rows'):
+            loader.flush()
+
+    def test_unbound_loader_cannot_reuse_interned(self):
+        with pytest.raises(ValueError, match='复用'):
+            BulkLoader(None, reuse_interned=True)
+
+
+class TestClosureTables:
+    """测试由源表重建自引用链的闭包表"""
+
+    @staticmethod
+    def gems() -> list[Gem]:
+        # 1 -> 2 -> 3，4 单独成链，5 -> 6 -> 5 成环
+        next_levels = {1: 2, 2: 3, 3: None, 4: None, 5: 6, 6: 5}
+        return [
+            fake(
+                Gem,
+                id,
+                next_level_gem=ResourceRef.from_res_name(next_id, 'gem')
+                if next_id
+                else None,
+            )
+            for id, next_id in next_levels.items()
+        ]
+
+    def test_bulk_load(self):
+        with Session(new_engine()) as session:
+            counts = bulk_load(session, self.gems())
+            assert counts['gemlevelclosure'] == 6 + 1 + 4
+            assert session.exec(GemLevelClosure.select_chain(2)).all() == [1, 2, 3]
+            assert session.exec(GemLevelClosure.select_chain(4)).all() == [4]
+            assert session.exec(GemLevelClosure.select_ancestors(3)).all() == [3, 2, 1]
+            assert session.exec(GemLevelClosure.select_descendants(2)).all() == [2, 3]
+            assert session.exec(GemLevelClosure.select_descendants(5)).all() == [5, 6]
+
+    def test_rebuild(self):
+        with Session(new_engine()) as session:
+            bulk_load(session, self.gems())
+            rows = session.exec(select(GemLevelClosure)).all()
+            counts = rebuild_closure_tables(session, [GemLevelClosure])
+            assert counts == {'gemlevelclosure': len(rows)}
+            assert session.exec(select(GemLevelClosure)).all() == rows
+            assert count(session, AchievementLevelClosure) == 0
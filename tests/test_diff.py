@@ -0,0 +1,244 @@
+"""测试数据集差异比较与增量更新"""
+
+from datetime import datetime, timezone
+from typing import Any
+
+from pydantic import BaseModel
+import pytest
+from sqlalchemy import Engine, inspect, select
+from sqlmodel import Session, SQLModel, create_engine
+
+from seerapi_models import Pet, Skill
+from seerapi_models.battle_effect import BattleEffectCategoryLink
+from seerapi_models.bulk import INTERNED_MODELS, bulk_load, closure_models
+from seerapi_models.common import (
+    EidEffectInUse,
+    ResourceRef,
+    SkillEffectInUse,
+    SkillEffectInUseORM,
+)
+from seerapi_models.diff import (
+    TableChanges,
+    apply_diff,
+    content_hash,
+    diff_datasets,
+    latest_metadata,
+)
+from seerapi_models.loading import load_models
+from seerapi_models.metadata import ApiMetadata
+from seerapi_models.mintmark import Mintmark
+from seerapi_models.search import rebuild_search_index, search
+
+from .factories import CONVERTIBLE_MODELS, fake
+
+# 效果模型的自增ID由加载器分配，与重新构建的数据库不同，比较时忽略ID
+INTERNED = (SkillEffectInUse, EidEffectInUse)
+
+
+def make_dataset(seeds: list[int], changed: int | None = None) -> list[Any]:
+    """seed 为 changed 的模型修改第一个字符串字段，链接两端的资源同时改动"""
+    models = []
+    for model in CONVERTIBLE_MODELS:
+        for seed in seeds:
+            overrides: dict[str, Any] = {}
+            if model is Mintmark:
+                overrides['type'] = {'id': 3, 'url': 'x'}
+            instance = fake(model, seed, **overrides)
+            names = [
+                name
+                for name, field in model.model_fields.items()
+                if field.annotation is str
+            ]
+            if seed == changed and names:
+                instance = instance.model_copy(update={names[0]: 'changed'})
+            models.append(instance)
+    return models
+
+
+def make_metadata(version: str) -> ApiMetadata:
+    return ApiMetadata(
+        api_url='https://example.com',
+        api_version='v1',
+        generator_name='test',
+        generator_version='1',
+        generate_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        data_version=version,
+    )
+
+
+def build(models: list[Any], version: str, *, search_index: bool = True) -> Engine:
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        bulk_load(session, [*models, make_metadata(version)], search_index=search_index)
+        session.commit()
+    return engine
+
+
+def dump(engine: Engine, model: type[BaseModel]) -> list[dict]:
+    with Session(engine) as session:
+        if model in INTERNED:
+            items = [
+                item.model_dump(mode='json', exclude={'id'})
+                for item in load_models(session, model)
+            ]
+            return sorted(items, key=repr)
+        return [item.model_dump(mode='json') for item in load_models(session, model)]
+
+
+def test_diff_datasets():
+    old = [fake(Pet, 1), fake(Pet, 2), fake(Pet, 3)]
+    new = [fake(Pet, 1), fake(Pet, 3, name='changed'), fake(Pet, 4)]
+    (diff,) = diff_datasets(old, new).values()
+    assert diff.resource_name == 'pet'
+    assert [pet.id for pet in diff.added] == [4]
+    assert [pet.id for pet in diff.removed] == [2]
+    assert [(before.name, after.name) for before, after in diff.changed] == [
+        ('text-3', 'changed')
+    ]
+    assert len(diff) == 3
+    assert diff_datasets(old, old) == {}
+
+
+def test_diff_datasets_rejects_duplicate_ids():
+    with pytest.raises(ValueError, match='重复'):
+        diff_datasets([fake(Pet, 1), fake(Pet, 1)], [])
+
+
+def test_content_hash_ignores_base_data_url():
+    pet = fake(Pet, 1, type=ResourceRef.from_res_name(1, 'element_type_combination'))
+    with ResourceRef.bind_base_data_url('https://mirror.example.com'):
+        assert 'mirror.example.com' in pet.model_dump_json()
+        mirrored = content_hash(pet)
+    assert mirrored == content_hash(pet)
+    assert content_hash(fake(Pet, 1, name='changed')) != content_hash(pet)
+
+
+def test_content_hash_keeps_text_fields():
+    """测试文本字段中与服务地址相同的内容不会被去掉"""
+    base = ResourceRef.current_base_data_url()
+    with_url = fake(Pet, 1, name=f'{base}/精灵')
+    assert content_hash(with_url) != content_hash(fake(Pet, 1, name='/精灵'))
+
+
+def test_apply_diff_matches_rebuild():
+    old = make_dataset([1, 2, 3])
+    new = make_dataset([1, 3, 4], changed=3)
+    engine = build(old, '1')
+    with Session(engine) as session:
+        changes = apply_diff(
+            session, diff_datasets(old, new), make_metadata('2'), from_version='1'
+        )
+        session.commit()
+
+    expected = build(new, '2')
+    for model in CONVERTIBLE_MODELS:
+        assert dump(engine, model) == dump(expected, model), model.__name__
+    # 链接表按差异增删
+    statement = select(BattleEffectCategoryLink.__table__)  # type: ignore[attr-defined]
+    with engine.connect() as connection, expected.connect() as expected_connection:
+        links = set(connection.execute(statement).all())
+        assert links == set(expected_connection.execute(statement).all())
+    # 闭包表由源表重新计算
+    for closure in closure_models():
+        statement = select(closure.__table__)  # type: ignore[attr-defined]
+        with engine.connect() as connection, expected.connect() as expected_connection:
+            rows = set(connection.execute(statement).all())
+            assert rows == set(expected_connection.execute(statement).all())
+    assert changes['battleeffectcategorylink'] == TableChanges(inserted=1, deleted=1)
+    assert changes['pet'] == TableChanges(inserted=1, updated=1, deleted=1)
+
+    with Session(engine) as session:
+        metadata = latest_metadata(session)
+    assert metadata is not None
+    assert metadata.data_version == '2'
+
+
+def count_rows(engine: Engine, model: type[Any]) -> int:
+    with engine.connect() as connection:
+        return len(connection.execute(select(model.__table__)).all())
+
+
+def test_apply_diff_keeps_shared_interned_rows():
+    models = make_dataset([1])
+    (skill,) = [model for model in models if isinstance(model, Skill)]
+    shared = fake(
+        Skill,
+        2,
+        skill_effect=skill.skill_effect,
+        friend_skill_effect=skill.friend_skill_effect,
+    )
+    engine = build([*models, shared], '1')
+    assert count_rows(engine, SkillEffectInUseORM) == count_rows(
+        build(models, '1'), SkillEffectInUseORM
+    )
+    with Session(engine) as session:
+        changes = apply_diff(
+            session, diff_datasets([*models, shared], models), make_metadata('2')
+        )
+        session.commit()
+    # 被删除的技能与未改动的技能共用同样的效果行
+    assert 'skill_effect_in_use' not in changes
+    assert dump(engine, SkillEffectInUse) == dump(build(models, '1'), SkillEffectInUse)
+    assert dump(engine, Skill) == dump(build(models, '1'), Skill)
+
+
+def test_apply_diff_deletes_unreferenced_interned_rows():
+    old = make_dataset([1, 2])
+    new = make_dataset([1])
+    engine = build(old, '1')
+    with Session(engine) as session:
+        changes = apply_diff(session, diff_datasets(old, new), make_metadata('2'))
+        session.commit()
+    expected = build(new, '2')
+    for model in INTERNED_MODELS:
+        assert count_rows(engine, model) == count_rows(expected, model)
+    assert changes['skill_effect_in_use'].deleted > 0
+
+
+def test_apply_diff_rebuilds_existing_search_index():
+    old = make_dataset([1])
+    new = [
+        model.model_copy(update={'name': '火焰冲击'})
+        if isinstance(model, Skill)
+        else model
+        for model in old
+    ]
+    engine = build(old, '1', search_index=False)
+    with Session(engine) as session:
+        apply_diff(session, diff_datasets(old, new), make_metadata('2'))
+        # 未创建的 FTS5 虚拟表不会自动创建
+        assert not inspect(session.connection()).has_table('search_fts')
+        rebuild_search_index(session)
+        session.commit()
+    with Session(engine) as session:
+        apply_diff(session, diff_datasets(new, old), make_metadata('3'))
+        assert search(session, '火焰冲击', Skill) == []
+        apply_diff(session, diff_datasets(old, new), make_metadata('4'))
+        assert [ref.id for ref in search(session, '火焰冲击', Skill)] == [1]
+
+
+def test_apply_empty_diff_only_records_metadata():
+    models = make_dataset([1])
+    engine = build(models, '1')
+    with Session(engine) as session:
+        changes = apply_diff(session, diff_datasets(models, models), make_metadata('2'))
+    assert changes == {'api_metadata': TableChanges(inserted=1)}
+
+
+def test_apply_diff_checks_version():
+    models = make_dataset([1])
+    engine = build(models, '1')
+    new = make_dataset([1], changed=1)
+    with Session(engine) as session:
+        with pytest.raises(ValueError, match='数据版本'):
+            apply_diff(
+                session,
+                diff_datasets(models, new),
+                make_metadata('3'),
+                from_version='2',
+            )
+        metadata = latest_metadata(session)
+    assert metadata is not None
+    assert metadata.data_version == '1'
+    assert dump(engine, Pet) == dump(build(models, '1'), Pet)
@@ -0,0 +1,87 @@
+"""测试精灵进化链索引"""
+
+import pickle
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from seerapi_models import Pet, PetClass, PetClassORM
+from seerapi_models.bulk import bulk_load
+from seerapi_models.common import ResourceRef
+from seerapi_models.evolution import EvolutionChainIndex, EvolutionEntry
+
+from .factories import fake
+
+# 精灵类别ID -> 进化链
+CHAINS = {1: (3, 1, 2), 4: (4,)}
+
+
+def pets() -> list[Pet]:
+    result = [
+        fake(
+            Pet,
+            pet_id,
+            pet_class=ResourceRef.from_res_name(class_id, 'pet_class'),
+            evolution_chain_index=position,
+        )
+        for class_id, chain in CHAINS.items()
+        for position, pet_id in enumerate(chain)
+    ]
+    result.append(fake(Pet, 5, pet_class=None, evolution_chain_index=0))
+    return result
+
+
+def pet_classes() -> list[PetClass]:
+    return [
+        fake(
+            PetClass,
+            class_id,
+            evolution_chain=[ResourceRef.from_res_name(id, 'pet') for id in chain],
+        )
+        for class_id, chain in CHAINS.items()
+    ]
+
+
+@pytest.fixture
+def index() -> EvolutionChainIndex:
+    return EvolutionChainIndex.from_pet_classes(pet_classes())
+
+
+def test_lookup(index):
+    assert index[2] == EvolutionEntry(class_id=1, position=2, chain=(3, 1, 2))
+    assert index[1].chain is index[3].chain
+    assert len(index) == 4
+    assert 5 not in index
+    assert index.chain(5) == (5,)
+    assert dict(index.chains) == CHAINS
+
+
+def test_empty():
+    index = EvolutionChainIndex()
+    assert len(index) == 0
+    assert dict(index.chains) == {}
+    assert index.chain(1) == (1,)
+
+
+def test_from_pets(index):
+    assert EvolutionChainIndex.from_pets(reversed(pets())) == index
+
+
+def test_from_session(index):
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        bulk_load(session, [*pet_classes(), *pets()])
+        session.commit()
+        assert EvolutionChainIndex.from_session(session) == index
+        # PetClassORM.evolution_chain 同样按进化链中的位置排序
+        pet_class = session.get(PetClassORM, 1)
+        assert pet_class is not None
+        assert [pet.id for pet in pet_class.evolution_chain] == [3, 1, 2]
+
+
+def test_serialize(index):
+    assert EvolutionChainIndex.from_json(index.to_json()) == index
+    restored = pickle.loads(pickle.dumps(index))
+    assert restored == index
+    assert restored[1].chain is restored[2].chain
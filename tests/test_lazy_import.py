@@ -0,0 +1,213 @@
+"""测试按需导入模式"""
+
+import importlib
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from sqlmodel import SQLModel
+
+import seerapi_models
+from seerapi_models import items, pet
+
+
+def run_python(code: str, *, lazy: bool) -> str:
+    """在子进程中执行代码并返回标准输出"""
+    env = dict(os.environ)
+    env['SEERAPI_MODELS_LAZY_IMPORT'] = '1' if lazy else '0'
+    result = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-c', textwrap.dedent(code)],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def run_lazy(code: str) -> str:
+    """在开启按需导入的子进程中执行代码并返回标准输出"""
+    return run_python(code, lazy=True)
+
+
+class TestExportTable:
+    """测试名称映射表与 __all__ 保持一致"""
+
+    @pytest.mark.parametrize('package', [seerapi_models, items, pet])
+    def test_exports_match_all(self, package):
+        """测试 __all__ 覆盖且仅覆盖映射表中的名称"""
+        names = {name for names in package._EXPORTS.values() for name in names}
+        assert set(package.__all__) - {'load_all'} == names
+        assert len(package.__all__) == len(set(package.__all__))
+
+    @pytest.mark.parametrize('package', [seerapi_models, items, pet])
+    def test_exports_point_to_defining_module(self, package):
+        """测试映射表中的子模块确实提供对应名称"""
+        for module, names in package._EXPORTS.items():
+            submodule = importlib.import_module(module, package.__name__)
+            for name in names:
+                assert getattr(submodule, name) is getattr(package, name)
+
+
+class TestLazyImport:
+    """测试按需导入的行为"""
+
+    def test_import_package_loads_nothing(self):
+        """测试仅导入包时不加载任何模型子模块"""
+        output = run_lazy(
+            """
+            import sys
+            import seerapi_models
+            print(
+                'seerapi_models.pet' in sys.modules,
+                'seerapi_models.skill' in sys.modules,
+            )
+            """
+        )
+        assert output == 'False False'
+
+    def test_access_loads_only_needed_module(self):
+        """测试访问名称时只导入其所在子模块"""
+        output = run_lazy(
+            """
+            import sys
+            from seerapi_models import Nature
+            print(Nature.__module__, 'seerapi_models.pet' in sys.modules)
+            """
+        )
+        assert output == 'seerapi_models.nature False'
+
+    def test_access_loads_shared_dependencies(self):
+        """测试访问名称时只额外导入其依赖的 common 模块"""
+        output = run_lazy(
+            """
+            import sys
+            from seerapi_models import Nature
+            print(*sorted(
+                name
+                for name in sys.modules
+                if name.startswith('seerapi_models.')
+                and not name.rpartition('.')[2].startswith('_')
+                and name != 'seerapi_models.build_model'
+            ))
+            """
+        )
+        assert output == 'seerapi_models.common seerapi_models.nature'
+
+    def test_skill_effect_in_use_on_access(self):
+        """测试访问引用 SkillEffectInUse 的模型时可以直接校验"""
+        output = run_lazy(
+            """
+            from seerapi_models import SkillStoneEffect
+            effect = SkillStoneEffect(
+                inner_id=1,
+                prob=0.5,
+                effect=[{
+                    'info': 'i',
+                    'analyze_info': 'a',
+                    'args': [1],
+                    'effect': {'id': 1, 'url': 'u'},
+                }],
+            )
+            print(effect.effect[0].effect.id)
+            """
+        )
+        assert output == '1'
+
+    def test_direct_submodule_import(self):
+        """测试不经过包直接导入子模块时模型可以使用"""
+        output = run_lazy(
+            """
+            from seerapi_models.skill import Skill
+            from seerapi_models.common import SkillEffectInUse
+            effect = SkillEffectInUse(
+                info='i',
+                analyze_info='a',
+                args=[1],
+                effect={'id': 1, 'url': 'u'},
+            )
+            print(effect.effect.id, Skill.__pydantic_complete__)
+            """
+        )
+        assert output == '1 True'
+
+    @pytest.mark.parametrize(
+        'module',
+        ['seerapi_models.common', 'seerapi_models.items.skill_stone'],
+    )
+    def test_direct_import_complete(self, module):
+        """测试无论先导入哪个子模块，SkillEffectInUse 都已完整定义"""
+        output = run_lazy(
+            f"""
+            import {module}
+            from seerapi_models.common import SkillEffectInUse
+            print(SkillEffectInUse.__pydantic_complete__)
+            """
+        )
+        assert output == 'True'
+
+    def test_direct_submodule_to_orm(self):
+        """测试直接导入子模块时 to_orm 也能完成映射配置"""
+        output = run_lazy(
+            """
+            from seerapi_models.nature import Nature
+            nature = Nature(
+                id=1,
+                name='n',
+                des='d',
+                des2='d2',
+                attributes={
+                    'atk': 1, 'def': 1, 'sp_atk': 1, 'sp_def': 1, 'spd': 1, 'hp': 1,
+                },
+            )
+            print(type(nature.to_orm().attributes).__name__)
+            """
+        )
+        assert output == 'NatureAttrORM'
+
+    def test_orm_access_registers_all_tables(self):
+        """测试访问 ORM 模型时注册全部表"""
+        output = run_lazy(
+            """
+            from sqlmodel import SQLModel
+            from seerapi_models import NatureORM
+            print(len(SQLModel.metadata.tables))
+            """
+        )
+        assert int(output) == len(SQLModel.metadata.tables)
+
+    def test_public_load_all(self):
+        """测试未访问 ORM 模型时可以通过 load_all 注册全部表"""
+        output = run_lazy(
+            """
+            import seerapi_models
+            from sqlmodel import SQLModel
+            before = len(SQLModel.metadata.tables)
+            seerapi_models.load_all()
+            print(before, len(SQLModel.metadata.tables))
+            """
+        )
+        before, after = map(int, output.split())
+        assert before == 0
+        assert after == len(SQLModel.metadata.tables)
+
+    def test_to_orm_without_orm_access(self):
+        """测试未访问 ORM 模型时 to_orm 也能完成映射配置"""
+        output = run_lazy(
+            """
+            from seerapi_models import Nature
+            nature = Nature(
+                id=1,
+                name='n',
+                des='d',
+                des2='d2',
+                attributes={
+                    'atk': 1, 'def': 1, 'sp_atk': 1, 'sp_def': 1, 'spd': 1, 'hp': 1,
+                },
+            )
+            print(type(nature.to_orm().attributes).__name__)
+            """
+        )
+        assert output == 'NatureAttrORM'
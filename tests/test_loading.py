@@ -0,0 +1,186 @@
+"""测试由 ORM 模型还原 API 模型"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from pydantic import BaseModel
+import pytest
+from sqlalchemy import Engine, event
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from seerapi_models import Gem, Mintmark, MintmarkTypeCategory, Pet, PetORM, Skill
+from seerapi_models.build_model import ConvertToModel
+from seerapi_models.bulk import bulk_load
+from seerapi_models.common import ResourceRef
+from seerapi_models.loading import api_model_of, from_orm, load_models, loader_options
+from seerapi_models.mintmark import SkillMintmarkEffect
+
+from .factories import CONVERTIBLE_MODELS, fake
+
+# fake 会填充全部可选字段，这里去掉按类型只保存一部分的字段
+OVERRIDES: dict[type, dict[str, Any]] = {
+    # 全能刻印（类型为 3）不保存技能刻印的字段
+    Mintmark: {'type': {'id': 3, 'url': 'https://example.com/resource/3'}},
+    MintmarkTypeCategory: {'id': 3},
+    # 1 代宝石不保存 2 代宝石的升级花费
+    Gem: {'upgrade_cost': None},
+}
+
+
+def normalize(value: Any) -> Any:
+    """引用只比较ID，URL 中的资源名称与服务地址由还原时生成"""
+    if isinstance(value, dict):
+        if value.keys() == {'id', 'url'}:
+            return ('ref', value['id'])
+        return {key: normalize(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [normalize(item) for item in value]
+    return value
+
+
+def make_models() -> list[Any]:
+    models = []
+    for model in CONVERTIBLE_MODELS:
+        instance = fake(model, 1, **OVERRIDES.get(model, {}))
+        if isinstance(instance, Mintmark):
+            instance.effect = None
+            instance.skill = None
+        models.append(instance)
+    return models
+
+
+@pytest.fixture(scope='module')
+def engine() -> Iterator[Engine]:
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        bulk_load(session, make_models())
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@pytest.mark.parametrize('model', CONVERTIBLE_MODELS, ids=lambda m: m.__name__)
+def test_round_trip(engine: Engine, model: type[BaseModel]):
+    expected = next(item for item in make_models() if type(item) is model)
+    with Session(engine) as session:
+        (loaded,) = load_models(session, model)
+    assert type(loaded) is model
+    assert normalize(loaded.model_dump()) == normalize(expected.model_dump())
+
+
+@pytest.mark.parametrize('model', CONVERTIBLE_MODELS, ids=lambda m: m.__name__)
+def test_to_model(engine: Engine, model: type[Any]):
+    with Session(engine) as session:
+        row = session.exec(select(model.get_orm_model())).one()
+        loaded = row.to_model()
+        assert loaded == load_models(session, model)[0]
+    # 与校验创建的实例完全相同
+    validated = model.model_validate(dict(loaded))
+    assert loaded.__dict__ == validated.__dict__
+    assert loaded.model_fields_set == validated.model_fields_set
+    assert loaded.model_dump_json() == validated.model_dump_json()
+
+
+@pytest.mark.parametrize('model', CONVERTIBLE_MODELS, ids=lambda m: m.__name__)
+def test_to_model_only_on_orm_model(model: type[Any]):
+    orm_model = model.get_orm_model()
+    assert issubclass(orm_model, ConvertToModel)
+    assert api_model_of(orm_model) is model
+    assert not hasattr(model, 'to_model')
+
+
+def test_refs_follow_base_data_url(engine: Engine):
+    with Session(engine) as session:
+        (pet,) = load_models(session, Pet)
+        with ResourceRef.bind_base_data_url('https://mirror.example.com'):
+            (mirrored,) = load_models(session, Pet)
+        (again,) = load_models(session, Pet)
+    assert mirrored.type.url.startswith('https://mirror.example.com/')
+    assert again.type is pet.type
+    assert pet.type is type(pet.type).from_res_name(1, 'element_type_combination')
+
+
+def test_refs_use_resource_urls(engine: Engine):
+    with Session(engine) as session:
+        (pet,) = load_models(session, Pet)
+    assert pet.type.url == ResourceRef.from_res_name(1, 'element_type_combination').url
+    assert pet.skill[0].skill.url.endswith('/skill/1')
+    assert pet.encyclopedia_entry is not None
+    assert pet.encyclopedia_entry.url.endswith('/pet_encyclopedia_entry/1')
+
+
+def test_mintmark_parts():
+    ability = fake(Mintmark, 1, type={'id': 0, 'url': 'x'}, pet=None)
+    skill = fake(Mintmark, 2, type={'id': 1, 'url': 'x'})
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        # 多对多关系只能加载到存在的行
+        bulk_load(session, [ability, skill, fake(Skill, 2)])
+        session.commit()
+        loaded = load_models(session, Mintmark)
+    assert loaded[0].max_attr_value is not None
+    assert ability.max_attr_value is not None
+    assert loaded[0].max_attr_value.model_dump() == ability.max_attr_value.model_dump()
+    assert loaded[0].base_attr_value is None
+    assert loaded[0].pet is None
+    assert loaded[1].effect == SkillMintmarkEffect(effect=2, arg=2)
+    assert loaded[1].max_attr_value is None
+    assert [ref.id for ref in loaded[1].skill or []] == [2]
+
+
+@pytest.mark.parametrize('count', [10, 100])
+def test_query_count_independent_of_rows(count: int):
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        bulk_load(session, [fake(Pet, seed) for seed in range(1, count + 1)])
+        session.commit()
+
+    with count_queries(engine) as statements, Session(engine) as session:
+        pets = load_models(session, Pet)
+    assert len(pets) == count
+    # 主查询（并入一对一关系）+ 技能 + 魂印
+    assert len(statements) == 3
+
+
+def test_from_orm_with_loader_options(engine: Engine):
+    with count_queries(engine) as statements, Session(engine) as session:
+        rows = session.exec(select(PetORM).options(*loader_options(Pet))).all()
+        before = len(statements)
+        pets = [from_orm(row) for row in rows]
+        assert len(statements) == before
+        assert pets == load_models(session, Pet)
+
+
+def test_load_models_by_id():
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        bulk_load(session, [fake(Pet, seed) for seed in range(1, 6)])
+        session.commit()
+        assert [pet.id for pet in load_models(session, Pet, [4, 2, 9])] == [2, 4]
+
+
+def test_api_model_of():
+    assert api_model_of(PetORM) is Pet
+    with pytest.raises(KeyError):
+        api_model_of(SQLModel)
+    with pytest.raises(TypeError):
+        loader_options(SkillMintmarkEffect)
@@ -0,0 +1,105 @@
+"""测试刻印组合搜索"""
+
+from itertools import combinations
+import random
+
+import pytest
+
+from seerapi_models import AbilityMintmark, SkillMintmark, UniversalMintmark
+from seerapi_models.common import ResourceRef, SixAttributes
+from seerapi_models.mintmark_search import MintmarkSearch
+
+from .factories import fake
+
+PET_ID = 7
+
+
+def _attributes(rng: random.Random) -> SixAttributes:
+    return SixAttributes.from_list([rng.randint(0, 40) for _ in range(6)])
+
+
+def _mintmarks() -> list[UniversalMintmark]:
+    rng = random.Random(0)
+    return [
+        fake(
+            UniversalMintmark,
+            id,
+            max_attr_value=_attributes(rng),
+            extra_attr_value=_attributes(rng) if id % 3 == 0 else None,
+            mintmark_class=ResourceRef.from_res_name(id % 4, 'mintmark_class')
+            if id % 5
+            else None,
+            pet=[ResourceRef.from_res_name(PET_ID if id % 4 == 0 else 8, 'pet')]
+            if id % 6 == 0
+            else None,
+        )
+        for id in range(1, 31)
+    ]
+
+
+def _value(mintmark: UniversalMintmark, field: str) -> int:
+    extra = mintmark.extra_attr_value
+    return getattr(mintmark.max_attr_value, field) + (
+        getattr(extra, field) if extra else 0
+    )
+
+
+def _brute_force(mintmarks, weights, pet_id, k, slots, unique_class):
+    eligible = [
+        m for m in mintmarks if m.pet is None or pet_id in {ref.id for ref in m.pet}
+    ]
+    scored = []
+    for combo in combinations(eligible, slots):
+        classes = [m.mintmark_class.id for m in combo if m.mintmark_class]
+        if unique_class and len(classes) != len(set(classes)):
+            continue
+        score = sum(_value(m, f) * w for m in combo for f, w in weights.items())
+        scored.append(score)
+    return sorted(scored, reverse=True)[:k]
+
+
+@pytest.mark.parametrize('unique_class', [False, True])
+@pytest.mark.parametrize('pet_id', [None, PET_ID])
+def test_matches_brute_force(pet_id, unique_class):
+    mintmarks = _mintmarks()
+    weights = {'spd': 1, 'atk': 1.5}
+    search = MintmarkSearch(mintmarks)
+    builds = search.top_k(weights, pet_id=pet_id, k=15, unique_class=unique_class)
+    assert [build.score for build in builds] == _brute_force(
+        mintmarks, weights, pet_id, 15, 3, unique_class
+    )
+    by_id = {m.id: m for m in mintmarks}
+    allowed = set(search.eligible(pet_id))
+    for build in builds:
+        assert len(set(build.mintmark_ids)) == 3
+        assert allowed.issuperset(build.mintmark_ids)
+        assert build.attributes[:6] == tuple(
+            sum(_value(by_id[id], field) for id in build.mintmark_ids)
+            for field in ('atk', 'def_', 'sp_atk', 'sp_def', 'spd', 'hp')
+        )
+        if unique_class:
+            refs = [by_id[id].mintmark_class for id in build.mintmark_ids]
+            classes = [ref.id for ref in refs if ref is not None]
+            assert len(classes) == len(set(classes))
+
+
+def test_eligible():
+    search = MintmarkSearch(_mintmarks())
+    assert 6 not in search.eligible()
+    assert 6 not in search.eligible(PET_ID)
+    assert 12 not in search.eligible()
+    assert 12 in search.eligible(PET_ID)
+    assert len(search.eligible(PET_ID)) == len(search.eligible()) + 2
+
+
+def test_skips_skill_mintmarks_and_extra():
+    ability = fake(AbilityMintmark, 1, pet=None)
+    search = MintmarkSearch([ability, fake(SkillMintmark, 2, pet=None)], extra=False)
+    assert len(search) == 1
+    assert search.top_k({'hp': 1}, slots=1)[0].mintmark_ids == (1,)
+    assert search.top_k({'hp': 1}, slots=2) == []
+
+
+def test_invalid_stat():
+    with pytest.raises(ValueError, match='无效的属性名'):
+        MintmarkSearch(_mintmarks()).top_k({'speed': 1})
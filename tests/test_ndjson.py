@@ -0,0 +1,187 @@
+"""测试 NDJSON 逐行导出与导入"""
+
+import io
+
+import pytest
+from sqlmodel import Session
+
+from seerapi_models import Nature, NatureORM, Pet, PetORM, Skill
+from seerapi_models.bulk import bulk_load
+from seerapi_models.common import NamedData, ResourceRef, SkillEffectInUse
+from seerapi_models.ndjson import (
+    export_ndjson,
+    import_ndjson,
+    import_ndjson_parallel,
+    iter_ndjson,
+    iter_ndjson_parallel,
+    ndjson_path,
+    write_ndjson,
+)
+
+from .factories import FAKE_BASE_DATA_URL, fake, fake_data
+from .test_bulk import count, dump_tables, new_engine
+
+
+def fake_models():
+    """多种资源类型交替出现的生成器"""
+    for seed in range(1, 4):
+        yield fake(Pet, seed)
+        yield fake(Skill, seed)
+    yield fake(Nature)
+
+
+class TestRoundTrip:
+    """测试导出后再导入得到相同的模型"""
+
+    def test_export_and_import(self, tmp_path):
+        counts = export_ndjson(tmp_path, fake_models())
+        assert counts == {'pet': 3, 'skill': 3, 'nature': 1}
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            'nature.ndjson',
+            'pet.ndjson',
+            'skill.ndjson',
+        ]
+
+        order = [Pet, Skill, Nature]
+        expected = sorted(fake_models(), key=lambda model: order.index(type(model)))
+        imported = import_ndjson(tmp_path, order)
+        assert [model.model_dump_json() for model in imported] == [
+            model.model_dump_json() for model in expected
+        ]
+
+    def test_lines_match_named_data(self, tmp_path):
+        """测试每一行与 NamedData 导出的对应模型一致"""
+        pets = [fake(Pet, seed) for seed in range(1, 4)]
+        export_ndjson(tmp_path, pets)
+        named = NamedData[Pet](data={pet.id: pet for pet in pets})
+        lines = ndjson_path(tmp_path, Pet).read_bytes().splitlines()
+        assert lines == [
+            pet.model_dump_json(by_alias=True).encode() for pet in named.data.values()
+        ]
+
+    def test_compact_ref_encoding(self, tmp_path):
+        """测试以 'pair' 编码导出的引用在导入时还原"""
+        with ResourceRef.bind_base_data_url(FAKE_BASE_DATA_URL):
+            pets = [fake(Pet, seed) for seed in range(1, 4)]
+            export_ndjson(tmp_path, pets, ref_encoding='pair')
+            assert b'"url"' not in ndjson_path(tmp_path, Pet).read_bytes()
+            imported = import_ndjson(tmp_path, [Pet])
+            assert [pet.model_dump_json() for pet in imported] == [
+                pet.model_dump_json() for pet in pets
+            ]
+
+    def test_missing_file_skipped(self, tmp_path):
+        export_ndjson(tmp_path, [fake(Nature)])
+        assert [type(model) for model in import_ndjson(tmp_path, [Pet, Nature])] == [
+            Nature
+        ]
+
+    def test_import_is_lazy(self, tmp_path):
+        """测试导入在迭代时才读取文件"""
+        models = import_ndjson(tmp_path, [Pet])
+        export_ndjson(tmp_path, [fake(Pet)])
+        assert len(list(models)) == 1
+
+
+class TestIterNdjson:
+    """测试逐行校验"""
+
+    def test_blank_lines_skipped(self):
+        buffer = io.BytesIO()
+        write_ndjson(buffer, [fake(Nature, 1), fake(Nature, 2)])
+        buffer = io.BytesIO(buffer.getvalue().replace(b'\n', b'\n\n'))
+        assert [nature.id for nature in iter_ndjson(buffer, Nature)] == [1, 2]
+
+    def test_invalid_line(self):
+        buffer = io.BytesIO()
+        write_ndjson(buffer, [fake(Nature)])
+        buffer.write(b'{"id": 2}\n')
+        buffer.seek(0)
+        models = iter_ndjson(buffer, Nature)
+        assert next(models).id == 1
+        with pytest.raises(ValueError, match='第 2 行'):
+            next(models)
+
+
+class TestImportParallel:
+    """测试多进程并行导入"""
+
+    @staticmethod
+    def export(directory) -> None:
+        # 相同的效果分布在不同的技能与分片中，合并时需要按内容对应到同一行
+        effect = fake_data(SkillEffectInUse, 5)
+        skills = [
+            fake(Skill, 4, skill_effect=[effect, effect], friend_skill_effect=[]),
+            fake(Skill, 5, skill_effect=[effect], friend_skill_effect=[effect]),
+        ]
+        export_ndjson(
+            directory,
+            [*fake_models(), *skills, *(fake(Pet, n) for n in range(4, 9))],
+        )
+
+    @pytest.mark.parametrize('shard_size', [1, 100, 1 << 20])
+    def test_same_as_bulk_load(self, tmp_path, shard_size):
+        """测试分片边界位于行中或行首时，写入的行都与单进程导入相同"""
+        self.export(tmp_path)
+        order = [Pet, Skill, Nature]
+        expected = new_engine()
+        with Session(expected) as session:
+            expected_counts = bulk_load(session, import_ndjson(tmp_path, order))
+            session.commit()
+        engine = new_engine()
+        with Session(engine) as session:
+            counts = import_ndjson_parallel(
+                session, tmp_path, order, max_workers=2, shard_size=shard_size
+            )
+            session.commit()
+        assert counts == expected_counts
+        assert dump_tables(engine) == dump_tables(expected)
+
+    @pytest.mark.parametrize('shard_size', [1, 100, 1 << 20])
+    def test_iter_same_as_import_ndjson(self, tmp_path, shard_size):
+        """测试产出的数据与顺序都与单进程导入相同，并可以还原为相同的模型"""
+        self.export(tmp_path)
+        order = [Pet, Skill, Nature]
+        expected = list(import_ndjson(tmp_path, order))
+        imported = list(
+            iter_ndjson_parallel(tmp_path, order, max_workers=2, shard_size=shard_size)
+        )
+        assert imported == [
+            (type(item), item.model_dump(mode='json', by_alias=True))
+            for item in expected
+        ]
+        assert [model.model_validate(data) for model, data in imported] == expected
+
+    def test_blank_lines_and_missing_file(self, tmp_path):
+        export_ndjson(tmp_path, [fake(Nature, 1), fake(Nature, 2)])
+        path = ndjson_path(tmp_path, Nature)
+        path.write_bytes(path.read_bytes().replace(b'\n', b'\n\n'))
+        with Session(new_engine()) as session:
+            counts = import_ndjson_parallel(
+                session, tmp_path, [Pet, Nature], shard_size=10
+            )
+            assert counts['nature'] == 2
+            assert count(session, NatureORM) == 2
+
+    def test_invalid_line(self, tmp_path):
+        export_ndjson(tmp_path, [fake(Nature, 1), fake(Nature, 2)])
+        with ndjson_path(tmp_path, Nature).open('ab') as file:
+            file.write(b'{"id": 3}\n')
+        with (
+            Session(new_engine()) as session,
+            pytest.raises(ValueError, match=r'nature\.ndjson 第 3 行'),
+        ):
+            import_ndjson_parallel(session, tmp_path, [Nature], max_workers=1)
+        with pytest.raises(ValueError, match=r'nature\.ndjson 第 3 行'):
+            list(iter_ndjson_parallel(tmp_path, [Nature], max_workers=1))
+
+
+def test_feeds_bulk_load(tmp_path):
+    """测试导入的模型可以直接交给 bulk_load"""
+    export_ndjson(tmp_path, (fake(Pet, seed) for seed in range(1, 4)))
+    engine = new_engine()
+    with Session(engine) as session:
+        counts = bulk_load(session, import_ndjson(tmp_path, [Pet]))
+        session.commit()
+        assert counts['pet'] == 3
+        assert count(session, PetORM) == 3
@@ -0,0 +1,178 @@
+"""测试 ResourceRef 的紧凑编码"""
+
+from pydantic import TypeAdapter
+import pytest
+
+from seerapi_models import Pet
+from seerapi_models.common import (
+    BASE_DATA_URL,
+    NamedResourceRef,
+    ResourceRef,
+    _parse_ref_pair,
+    _ref_pair,
+    expand_ref,
+    ref_encoding_context,
+    ref_resource_name,
+)
+import seerapi_models_api as api
+from tests.factories import FAKE_BASE_DATA_URL, fake
+
+
+class TestExpandRef:
+    """测试将紧凑编码还原为 ResourceRef"""
+
+    def test_id(self):
+        ref = expand_ref(1, 'pet')
+        assert ref is ResourceRef.from_res_name(1, 'pet')
+
+    def test_id_requires_resource_name(self):
+        with pytest.raises(ValueError, match='resource_name'):
+            expand_ref(1)
+
+    def test_id_resource_name_from_type_param(self):
+        ref = expand_ref(1, ref_type=ResourceRef['Pet'])
+        assert ref.url == f'{BASE_DATA_URL}/pet/1'
+        assert type(ref) is ResourceRef['Pet']
+
+    def test_ref_resource_name(self):
+        assert ref_resource_name(ResourceRef['Pet']) == 'pet'
+        assert ref_resource_name(ResourceRef[Pet]) == 'pet'
+        assert ref_resource_name(ResourceRef) is None
+
+    @pytest.mark.parametrize(
+        ('value', 'expected'),
+        [
+            (('pet', 1), f'{BASE_DATA_URL}/pet/1'),
+            (['pet', 1], f'{BASE_DATA_URL}/pet/1'),
+            (('pet', 1, 'detail'), f'{BASE_DATA_URL}/pet/1/detail'),
+        ],
+    )
+    def test_pair(self, value, expected):
+        assert expand_ref(value).url == expected
+
+    def test_ref_type(self):
+        ref = expand_ref(('pet', 1), ref_type=NamedResourceRef)
+        assert isinstance(ref, NamedResourceRef)
+
+
+class TestParsePair:
+    """测试从 URL 中解析 'pair' 编码"""
+
+    @pytest.mark.parametrize(
+        ('url', 'expected'),
+        [
+            (f'{BASE_DATA_URL}/pet/1', ('pet', 1)),
+            (f'{BASE_DATA_URL}/pet/1/detail', ('pet', 1, 'detail')),
+            # 子路径中含有与ID相同的数字
+            (f'{BASE_DATA_URL}/pet/1/skill/1', ('pet', 1, 'skill/1')),
+            ('https://api.example.com/pet/1', ('pet', 1)),
+            ('https://api.example.com/v1/1/pet/1', ('pet', 1)),
+            ('https://api.example.com/pet/1?lang=zh', ('pet', 1)),
+        ],
+    )
+    def test_parse(self, url, expected):
+        assert _parse_ref_pair(url, 1) == expected
+
+    def test_bound_base_data_url(self):
+        """测试按当前服务地址解析，服务地址中可以含有 / 与数字"""
+        with ResourceRef.bind_base_data_url('https://api.example.com/v1/1/'):
+            url = 'https://api.example.com/v1/1/pet/1/skill/1'
+            assert _parse_ref_pair(url, 1) == ('pet', 1, 'skill/1')
+
+    @pytest.mark.parametrize(
+        'url',
+        [
+            f'{BASE_DATA_URL}/pet/2',
+            'https://api.example.com/pet/2',
+            'https://api.example.com/pet/1/detail',
+        ],
+    )
+    def test_unparsable(self, url):
+        with pytest.raises(ValueError, match='无法从 URL'):
+            _parse_ref_pair(url, 1)
+
+    def test_created_ref_uses_structured_pair(self):
+        """测试通过 from_res_name 创建的引用直接使用创建时的编码"""
+        with ResourceRef.bind_base_data_url('https://api.example.com/1'):
+            ref = ResourceRef.from_res_name(1, 'pet', '1/detail')
+        assert _ref_pair(ref.url, ref.id) == ('pet', 1, '1/detail')
+
+
+class TestCompactEncoding:
+    """测试通过 ref_encoding_context 选择编码"""
+
+    @pytest.fixture
+    def refs(self) -> list[ResourceRef]:
+        return [
+            ResourceRef.from_res_name(1, 'pet'),
+            ResourceRef.from_res_name(2, 'skill', 'detail'),
+        ]
+
+    adapter = TypeAdapter(list[ResourceRef])
+
+    def test_full_by_default(self, refs):
+        full = [{'id': 1, 'url': refs[0].url}, {'id': 2, 'url': refs[1].url}]
+        assert self.adapter.dump_python(refs) == full
+        assert self.adapter.dump_python(refs, context={'other': 1}) == full
+
+    def test_id(self, refs):
+        context = ref_encoding_context('id')
+        assert self.adapter.dump_python(refs, context=context) == [1, 2]
+
+    def test_pair_round_trip(self, refs):
+        pair = self.adapter.dump_json(refs, context=ref_encoding_context('pair'))
+        assert pair == b'[["pet",1],["skill",2,"detail"]]'
+        assert self.adapter.validate_json(pair) == refs
+
+    def test_context_merged(self):
+        context = ref_encoding_context('id', {'other': 1})
+        assert context == {'other': 1, 'ref_encoding': 'id'}
+
+    def test_unknown_encoding(self):
+        with pytest.raises(ValueError, match='unknown'):
+            ref_encoding_context('unknown')  # type: ignore[arg-type]
+
+    def test_nested_in_model(self):
+        with ResourceRef.bind_base_data_url(FAKE_BASE_DATA_URL):
+            pet = fake(Pet)
+            full = pet.model_dump_json()
+            data = pet.model_dump_json(context=ref_encoding_context('pair'))
+            assert '"url"' not in data
+            restored = Pet.model_validate_json(data)
+            assert restored.model_dump_json() == full
+        context = ref_encoding_context('id')
+        assert pet.model_dump(context=context)['type'] == pet.type.id
+        # 模型默认的序列化不受影响
+        assert '"url"' in pet.model_dump_json()
+
+    def test_id_round_trip(self):
+        """测试 'id' 编码的引用按字段的类型参数还原"""
+        context = ref_encoding_context('id')
+        data = fake(Pet).model_dump_json(context=context)
+        pet = Pet.model_validate_json(data)
+        assert pet.type.url == f'{BASE_DATA_URL}/element_type_combination/{pet.type.id}'
+        assert pet.model_dump_json(context=context) == data
+        assert Pet.model_validate_json(pet.model_dump_json()) == pet
+
+    def test_id_without_type_param(self):
+        with pytest.raises(ValueError, match='resource_name'):
+            ResourceRef.model_validate(1)
+
+    def test_options_respected(self):
+        named = NamedResourceRef.from_res_name(1, 'pet')
+        assert named.model_dump(exclude_none=True) == {'id': 1, 'url': named.url}
+        assert named.model_dump(include={'id'}) == {'id': 1}
+        assert named.model_dump(exclude={'url'}) == {'id': 1, 'name': None}
+
+    def test_named_ref_always_full(self):
+        named = NamedResourceRef.from_res_name(1, 'pet', name='精灵')
+        full = named.model_dump()
+        assert full == {'id': 1, 'url': named.url, 'name': '精灵'}
+        assert named.model_dump(context=ref_encoding_context('id')) == full
+
+    def test_api_model(self):
+        """测试生成的 API 模型同样支持"""
+        api_ref = api.ResourceRef.model_validate(['pet', 1])
+        assert api_ref.url == f'{api.BASE_DATA_URL}/pet/1'
+        context = api.ref_encoding_context('id')
+        assert api_ref.model_dump(context=context) == 1
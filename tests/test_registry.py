@@ -0,0 +1,145 @@
+"""测试内存资源注册表"""
+
+import pytest
+
+import seerapi_models
+from seerapi_models import Nature, Pet, Skill, SkillCategory
+from seerapi_models import registry as registry_module
+from seerapi_models.build_model import BaseResModel
+from seerapi_models.common import NamedResourceRef, ResourceRef
+from seerapi_models.registry import ResourceRegistry, collect_refs
+
+from .factories import FAKE_BASE_DATA_URL, fake
+
+
+@pytest.fixture
+def registry():
+    return ResourceRegistry(
+        [fake(Skill, 1), fake(Skill, 2), fake(Nature, 1), fake(Pet, 1)]
+    )
+
+
+class TestResolve:
+    """测试由引用解析模型"""
+
+    def test_resolve(self, registry):
+        assert registry.resolve(ResourceRef.from_res_name(2, 'skill')).id == 2
+        nature = registry.resolve(NamedResourceRef.from_model(Nature, id=1))
+        assert isinstance(nature, Nature)
+
+    def test_independent_of_base_data_url(self, registry):
+        with ResourceRef.bind_base_data_url('https://api.example.com/v1'):
+            ref = ResourceRef.from_res_name(1, 'skill')
+        assert registry.resolve(ref) is registry.get(Skill, 1)
+
+    def test_missing(self, registry):
+        ref = ResourceRef.from_res_name(3, 'skill')
+        assert ref not in registry
+        with pytest.raises(KeyError, match='skill/3'):
+            registry.resolve(ref)
+        with pytest.raises(KeyError, match='nature/2'):
+            registry.resolve_many(
+                [
+                    ResourceRef.from_res_name(1, 'skill'),
+                    ResourceRef.from_res_name(2, 'nature'),
+                ]
+            )
+
+    def test_resolve_many(self, registry):
+        refs = [
+            ResourceRef.from_res_name(2, 'skill'),
+            ResourceRef.from_res_name(1, 'nature'),
+            ResourceRef.from_res_name(2, 'skill'),
+        ]
+        resolved = registry.resolve_many(refs)
+        assert resolved == [registry.resolve(ref) for ref in refs]
+        assert resolved[0] is resolved[2]
+
+    def test_parametrized_ref_skips_url(self, registry, monkeypatch):
+        """测试参数化的引用由类型参数得到资源名称，不解析 URL"""
+
+        def fail(*args):
+            raise AssertionError('不应解析 URL')
+
+        monkeypatch.setattr(registry_module, '_ref_pair', fail)
+        pet = registry.get(Pet, 1)
+        # 测试数据的 URL 中不含资源名称，只能按类型解析
+        ref = pet.skill[0].skill
+        assert ref.url.startswith(FAKE_BASE_DATA_URL)
+        assert registry.resolve(ref) is registry.get(Skill, 1)
+        assert registry.resolve_many([ref, ref]) == [registry.get(Skill, 1)] * 2
+        assert ref in registry
+
+
+class TestRegistry:
+    def test_add_replaces(self, registry):
+        skill = fake(Skill, 1)
+        registry.add(skill)
+        assert registry.get(Skill, 1) is skill
+        assert len(registry) == 4
+        assert registry.models(Skill)[0] is skill
+
+    def test_get_default(self, registry):
+        assert registry.get(Skill, 3) is None
+        assert registry.get(Pet, 2, 'missing') == 'missing'
+        assert registry.models(Nature) == [registry.get(Nature, 1)]
+        assert registry.models(Pet) != []
+
+    def test_add_all_count(self):
+        registry = ResourceRegistry()
+        assert registry.add_all(fake(Skill, seed) for seed in range(1, 4)) == 3
+        assert len(registry) == 3
+
+
+class TestFillBackRefs:
+    """测试由正向引用填充反向引用列表"""
+
+    def test_fill(self):
+        category_ref = ResourceRef.from_res_name(1, 'skill_category')
+        registry = ResourceRegistry(
+            [
+                fake(SkillCategory, 1, skill=[ResourceRef.from_res_name(9, 'skill')]),
+                fake(SkillCategory, 2),
+                fake(Skill, 1, category=category_ref),
+                fake(Skill, 2, category=ResourceRef.from_res_name(3, 'skill_category')),
+                fake(Skill, 3, category=category_ref),
+            ]
+        )
+        assert registry.fill_back_refs() == 2
+        # 可以重复调用，已有的列表会先被清空
+        assert registry.fill_back_refs() == 2
+        category = registry.get(SkillCategory, 1)
+        assert category is not None
+        assert [ref.id for ref in category.skill] == [1, 3]
+        assert registry.resolve(category.skill[1]) is registry.get(Skill, 3)
+        assert registry.models(SkillCategory)[1].skill == []
+
+    def test_declarations(self):
+        """__back_refs__ 声明的正向字段必须存在，并引用声明所在的资源"""
+        models = {}
+        for name in seerapi_models.__all__:
+            cls = getattr(seerapi_models, name)
+            if (
+                isinstance(cls, type)
+                and issubclass(cls, BaseResModel)
+                and not hasattr(cls, '__table__')
+            ):
+                models[cls.resource_name()] = cls
+        declared = [cls for cls in models.values() if cls.__back_refs__]
+        assert SkillCategory in declared
+        for cls in declared:
+            for field, (forward_name, forward_field) in cls.__back_refs__.items():
+                assert field in cls.model_fields
+                annotation = models[forward_name].model_fields[forward_field].annotation
+                assert f'ResourceRef[{cls.__name__}]' in str(annotation)
+
+
+def test_collect_refs():
+    """测试按字段顺序收集嵌套模型与列表中的引用"""
+    pet = fake(Pet)
+    refs = collect_refs(pet)
+    assert refs[:2] == [pet.type, pet.gender]
+    assert pet.skill[0].skill in refs
+    assert pet.soulmark is not None
+    assert pet.soulmark[0] in refs
+    assert all(isinstance(ref, ResourceRef) for ref in refs)
@@ -0,0 +1,183 @@
+"""测试 ResourceRef 的实例缓存与 URL 序列化"""
+
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+
+from pydantic import TypeAdapter, ValidationError
+import pytest
+
+from seerapi_models import Pet, Skill
+from seerapi_models.common import BASE_DATA_URL, NamedResourceRef, ResourceRef
+import seerapi_models_api as api
+
+from .factories import fake
+
+
+@pytest.fixture(autouse=True)
+def _restore_base_data_url(monkeypatch):
+    """测试结束后恢复 base_data_url 并清空缓存"""
+    monkeypatch.setattr(ResourceRef, 'base_data_url', BASE_DATA_URL)
+    yield
+    ResourceRef.clear_cache()
+
+
+class TestInstanceCache:
+    """测试 from_res_name 与 from_model 返回缓存的实例"""
+
+    def test_same_arguments_share_instance(self):
+        ref = ResourceRef.from_res_name(1, 'pet')
+        assert ResourceRef.from_res_name(1, 'pet') is ref
+        assert ResourceRef.from_model(Pet, id=1) is ref
+        assert ref.url == f'{BASE_DATA_URL}/pet/1'
+
+    @pytest.mark.parametrize(
+        'other',
+        [
+            lambda: ResourceRef.from_res_name(2, 'pet'),
+            lambda: ResourceRef.from_res_name(1, 'skill'),
+            lambda: ResourceRef.from_res_name(1, 'pet', 'detail'),
+            lambda: NamedResourceRef.from_res_name(1, 'pet'),
+            lambda: ResourceRef[Pet].from_res_name(1, 'pet'),
+        ],
+    )
+    def test_different_arguments(self, other):
+        assert other() is not ResourceRef.from_res_name(1, 'pet')
+
+    def test_named_ref_keyed_by_name(self):
+        ref = NamedResourceRef.from_res_name(1, 'skill', name='技能')
+        assert NamedResourceRef.from_res_name(1, 'skill', name='技能') is ref
+        assert NamedResourceRef.from_res_name(1, 'skill', name='其他').name == '其他'
+        assert NamedResourceRef.from_model(Skill, id=1, name='技能') is ref
+
+    @pytest.mark.parametrize('ref_type', [ResourceRef, NamedResourceRef])
+    def test_cached_instance_frozen(self, ref_type):
+        """测试共用的实例不可修改，修改不会影响其他持有者"""
+        ref = ref_type.from_res_name(1, 'pet')
+        with pytest.raises(ValidationError, match='frozen'):
+            ref.id = 2
+        copied = ref.model_copy(update={'id': 2})
+        assert copied.id == 2
+        assert ref_type.from_res_name(1, 'pet').id == 1
+
+    def test_base_data_url_assignment(self):
+        """测试直接修改 base_data_url 后不会返回旧地址的实例"""
+        old = ResourceRef.from_res_name(1, 'pet')
+        ResourceRef.base_data_url = 'https://api.example.com'
+        new = ResourceRef.from_res_name(1, 'pet')
+        assert new is not old
+        assert new.url == 'https://api.example.com/pet/1'
+
+    def test_set_base_data_url_clears_cache(self):
+        ResourceRef.from_res_name(1, 'pet')
+        ResourceRef.set_base_data_url('https://api.example.com')
+        assert ResourceRef.base_data_url == 'https://api.example.com'
+        assert ResourceRef.from_res_name(1, 'pet').url == (
+            'https://api.example.com/pet/1'
+        )
+
+
+class TestSerializeUrl:
+    """测试序列化时替换 URL 中的占位地址"""
+
+    def test_placeholder_kept_by_default(self):
+        ref = ResourceRef.from_res_name(1, 'pet')
+        assert ref.model_dump()['url'] == f'{BASE_DATA_URL}/pet/1'
+
+    @pytest.mark.parametrize(
+        'base_data_url', ['https://api.example.com', 'https://api.example.com/']
+    )
+    def test_placeholder_replaced(self, base_data_url):
+        refs = [ResourceRef.from_res_name(i, 'pet') for i in (1, 2, 1)]
+        ResourceRef.set_base_data_url(base_data_url)
+        adapter = TypeAdapter(list[ResourceRef])
+        assert [item['url'] for item in adapter.dump_python(refs)] == [
+            'https://api.example.com/pet/1',
+            'https://api.example.com/pet/2',
+            'https://api.example.com/pet/1',
+        ]
+        ref = refs[0]
+        # 修改后再次序列化得到新的地址，而不是缓存的旧结果
+        ResourceRef.set_base_data_url('https://cdn.example.com')
+        assert ref.model_dump()['url'] == 'https://cdn.example.com/pet/1'
+
+    def test_only_prefix_replaced(self):
+        """测试只替换开头的占位地址，其他 URL 原样输出"""
+        ResourceRef.set_base_data_url('https://api.example.com')
+        url = f'https://mirror.example.com/{BASE_DATA_URL}/pet/1'
+        assert ResourceRef(id=1, url=url).model_dump()['url'] == url
+
+
+class TestBindBaseDataUrl:
+    """测试在上下文中绑定服务地址"""
+
+    def test_urls_created_final(self):
+        with ResourceRef.bind_base_data_url('https://mirror.example.com/'):
+            ref = ResourceRef.from_res_name(1, 'pet')
+            named = NamedResourceRef.from_model(Pet, id=1, name='精灵')
+            assert ResourceRef.current_base_data_url() == 'https://mirror.example.com'
+        assert ref.url == 'https://mirror.example.com/pet/1'
+        assert named.url == 'https://mirror.example.com/pet/1'
+        # 离开上下文后按原地址创建，序列化时也不会再替换
+        assert ResourceRef.from_res_name(1, 'pet').url == f'{BASE_DATA_URL}/pet/1'
+        assert ref.model_dump()['url'] == 'https://mirror.example.com/pet/1'
+
+    def test_placeholder_replaced_in_context(self):
+        """测试以占位地址创建的引用在不同上下文中序列化为不同镜像的地址"""
+        ref = ResourceRef.from_res_name(1, 'pet')
+        for mirror in ('https://a.example.com', 'https://b.example.com'):
+            with ResourceRef.bind_base_data_url(mirror):
+                assert ref.model_dump()['url'] == f'{mirror}/pet/1'
+        assert ref.model_dump()['url'] == f'{BASE_DATA_URL}/pet/1'
+
+    def test_overrides_class_attribute(self):
+        ResourceRef.base_data_url = 'https://api.example.com'
+        with ResourceRef.bind_base_data_url('https://mirror.example.com'):
+            assert ResourceRef.from_res_name(1, 'pet').url == (
+                'https://mirror.example.com/pet/1'
+            )
+        assert ResourceRef.from_res_name(1, 'pet').url == (
+            'https://api.example.com/pet/1'
+        )
+
+    def test_nested(self):
+        with ResourceRef.bind_base_data_url('https://a.example.com'):
+            with ResourceRef.bind_base_data_url('https://b.example.com'):
+                assert ResourceRef.current_base_data_url() == 'https://b.example.com'
+            assert ResourceRef.current_base_data_url() == 'https://a.example.com'
+        assert ResourceRef.current_base_data_url() == BASE_DATA_URL
+
+    def test_not_visible_in_other_threads(self):
+        with (
+            ResourceRef.bind_base_data_url('https://mirror.example.com'),
+            ThreadPoolExecutor(1) as executor,
+        ):
+            url = executor.submit(ResourceRef.current_base_data_url).result()
+        assert url == BASE_DATA_URL
+
+
+class TestPickle:
+    """测试参数化的 ResourceRef 可以 pickle，还原后仍是原来的类"""
+
+    @pytest.mark.parametrize(
+        'ref_type',
+        [
+            ResourceRef,
+            ResourceRef[Pet],
+            ResourceRef['Pet'],
+            NamedResourceRef['Skill'],
+            api.ResourceRef[api.Pet],
+        ],
+    )
+    def test_ref(self, ref_type):
+        ref = ref_type.from_res_name(1, 'pet')
+        restored = pickle.loads(pickle.dumps(ref))
+        assert type(restored) is ref_type
+        assert restored == ref
+
+    def test_nested_in_model(self):
+        """测试 ResourceRef[X] 与 ResourceRef['X'] 同名时各自还原为原来的类"""
+        pet = fake(Pet)
+        restored = pickle.loads(pickle.dumps(pet))
+        assert restored == pet
+        assert type(restored.type) is type(pet.type)
+        assert restored.model_dump_json() == pet.model_dump_json()
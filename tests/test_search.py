@@ -0,0 +1,163 @@
+"""测试全文搜索"""
+
+import random
+
+import pytest
+from sqlalchemy import Engine, inspect
+from sqlmodel import Session, SQLModel, create_engine
+
+from seerapi_models import Item, Mintmark, Pet, Skill, Soulmark
+from seerapi_models.bulk import bulk_load
+from seerapi_models.search import (
+    SEARCH_TABLE,
+    SearchIndex,
+    rebuild_search_index,
+    search,
+)
+from seerapi_models.snapshot import build_snapshot, open_snapshot
+
+from .factories import fake
+
+MODELS = [
+    fake(Skill, 1, name='火焰冲击', info='造成火焰伤害'),
+    fake(Skill, 2, name='水流冲击', info='100%概率令对手烧伤，附加火焰冲击的效果'),
+    fake(Skill, 3, name='草木', info='恢复体力'),
+    fake(Pet, 1, name='火焰精灵'),
+    fake(Soulmark, 1, desc='免疫火焰冲击造成的伤害'),
+    fake(Item, 1, name='"引号"道具', desc='Fire 伤害'),
+]
+
+
+@pytest.fixture
+def engine() -> Engine:
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        bulk_load(session, MODELS)
+        session.commit()
+    return engine
+
+
+def _pairs(refs) -> list[tuple[str, int]]:
+    return [(ref.url.split('/')[-2], ref.id) for ref in refs]
+
+
+def test_search(engine):
+    with Session(engine) as session:
+        counts = rebuild_search_index(session)
+        assert counts['skill'] == 3
+        assert counts['soulmark'] == 1
+        # 重复重建不会产生重复的行
+        assert rebuild_search_index(session) == counts
+
+        refs = search(session, '火焰冲击')
+        assert _pairs(refs)[0] == ('skill', 1)
+        assert set(_pairs(refs)) == {
+            ('skill', 1),
+            ('skill', 2),
+            ('soulmark', 1),
+        }
+        assert refs[0].name == '火焰冲击'
+        assert _pairs(search(session, '火焰冲击', Soulmark)) == [('soulmark', 1)]
+        assert _pairs(search(session, '冲击 火焰', Skill, limit=1)) == [('skill', 1)]
+        assert search(session, '冰雪冲击') == []
+        assert search(session, '  ') == []
+
+        # 少于三个字的词按子串过滤，名称匹配的排在前面
+        assert _pairs(search(session, '火焰')) == [
+            ('pet', 1),
+            ('skill', 1),
+            ('skill', 2),
+            ('soulmark', 1),
+        ]
+        assert _pairs(search(session, '水流 烧伤')) == [('skill', 2)]
+        assert _pairs(search(session, '0%')) == [('skill', 2)]
+        assert _pairs(search(session, '"引号"')) == [('item', 1)]
+        assert _pairs(search(session, 'fire')) == [('item', 1)]
+
+        with pytest.raises(ValueError, match='不支持全文搜索'):
+            search(session, '火焰', Mintmark)
+
+
+def _random_models() -> list:
+    rng = random.Random(0)
+    chars = '火焰水流草木光暗电龙神圣冰雪风'
+
+    def text(low: int, high: int) -> str:
+        return ''.join(rng.choice(chars) for _ in range(rng.randint(low, high)))
+
+    return [
+        *(fake(Skill, i, name=text(2, 5), info=text(5, 30)) for i in range(10, 200)),
+        *(fake(Pet, i, name=text(2, 6)) for i in range(10, 100)),
+    ]
+
+
+@pytest.mark.parametrize('model', [None, Skill, Pet])
+def test_search_index_matches_sqlite(engine, model):
+    models = _random_models()
+    with Session(engine) as session:
+        bulk_load(session, models)
+        rebuild_search_index(session)
+        index = SearchIndex.from_session(session)
+        assert len(index) == len(MODELS) + len(models)
+        for query in ('火焰', '火焰水', '龙神 火', '光暗电', '神圣冰 雪风', '冲击'):
+            expected = search(session, query, model, limit=1000)
+            assert index.search(query, model, limit=1000) == expected
+
+
+def test_search_index_from_models():
+    index = SearchIndex([*MODELS, fake(Mintmark, 1)])
+    assert len(index) == len(MODELS)
+    assert _pairs(index.search('火焰冲击', Skill)) == [('skill', 1), ('skill', 2)]
+    assert index.search('火焰冲击', limit=1)[0].name == '火焰冲击'
+    with pytest.raises(ValueError, match='不支持全文搜索'):
+        index.search('火焰', Mintmark)
+
+
+def test_search_empty_index():
+    index = SearchIndex()
+    assert len(index) == 0
+    assert index.search('火焰冲击') == []
+    assert index.search('火', Skill) == []
+    with pytest.raises(ValueError, match='不支持全文搜索'):
+        index.search('火焰', Mintmark)
+    # 名称与描述都短于三个字时没有三字组
+    assert SearchIndex([fake(Pet, 1, name='火')]).search('火焰冲击') == []
+
+
+def test_bulk_load_fills_search_index(engine):
+    """测试 bulk_load 默认填充全文搜索索引，再次写入后同样更新"""
+    with Session(engine) as session:
+        assert _pairs(search(session, '火焰冲击', Skill)) == [
+            ('skill', 1),
+            ('skill', 2),
+        ]
+        bulk_load(session, [fake(Skill, 4, name='火焰冲击改')])
+        assert ('skill', 4) in _pairs(search(session, '火焰冲击', Skill))
+
+
+def test_bulk_load_without_search_index():
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        bulk_load(session, MODELS, search_index=False)
+        assert not inspect(session.connection()).has_table(SEARCH_TABLE)
+
+
+@pytest.mark.parametrize('search_index', [True, False])
+def test_snapshot_search_index(tmp_path, search_index):
+    """测试快照默认创建全文搜索索引"""
+    path = tmp_path / 'snapshot.db'
+    if search_index:
+        build_snapshot(path, MODELS)
+    else:
+        build_snapshot(path, MODELS, search_index=False)
+    engine = open_snapshot(path)
+    with Session(engine) as session:
+        assert inspect(session.connection()).has_table(SEARCH_TABLE) is search_index
+        if search_index:
+            assert _pairs(search(session, '火焰冲击', Skill)) == [
+                ('skill', 1),
+                ('skill', 2),
+            ]
+    engine.dispose()
@@ -1,8 +1,16 @@
 """测试 SixAttributesBase 类的方法"""
 
+from decimal import Decimal
+import itertools
+import sys
+import timeit
+from typing import Any
+
+from pydantic import BaseModel
 import pytest
 
-from seerapi_models.common import SixAttributes
+from seerapi_models.common import CompactSixAttributes, SixAttributes
+from seerapi_models.nature import NatureAttrORM
 
 
 class TestFromString:
@@ -803,3 +811,245 @@ class TestIntegration:
 
         # 验证速度: 102 + 0 + 31 = 133 (无性格影响)
         assert result.spd == 133
+
+
+class _CompactHolder(BaseModel):
+    attributes: CompactSixAttributes
+    optional: CompactSixAttributes | None = None
+
+
+class _ModelHolder(BaseModel):
+    attributes: SixAttributes
+    optional: SixAttributes | None = None
+
+
+class TestCompact:
+    """测试 CompactSixAttributes 紧凑表示"""
+
+    def test_round_trip_keeps_value_types(self):
+        """测试与 SixAttributes 之间无损转换，int 与 float 不会互相转换"""
+        model = SixAttributes(
+            atk=95, def_=88.5, sp_atk=120, sp_def=0.25, spd=102, hp=105, percent=True
+        )
+        compact = CompactSixAttributes.from_model(model)
+        restored = compact.to_model()
+        assert restored == model
+        assert [type(value) for value in compact[:6]] == [
+            int,
+            float,
+            int,
+            float,
+            int,
+            int,
+        ]
+        assert compact.total == model.total
+        assert compact.percent is True
+
+    def test_smaller_than_model(self):
+        """测试紧凑表示占用的内存小于模型实例"""
+        model = SixAttributes(atk=1, def_=2, sp_atk=3, sp_def=4, spd=5, hp=6)
+        compact = CompactSixAttributes.from_model(model)
+        model_size = sys.getsizeof(model) + sys.getsizeof(model.__dict__)
+        assert sys.getsizeof(compact) < model_size
+
+    @pytest.mark.parametrize(
+        'value',
+        [
+            {'atk': 1, 'def': 2, 'sp_atk': 3, 'sp_def': 4, 'spd': 5, 'hp': 6},
+            SixAttributes(atk=1, def_=2, sp_atk=3, sp_def=4, spd=5, hp=6),
+            CompactSixAttributes(1, 2, 3, 4, 5, 6),
+        ],
+    )
+    def test_validate_as_field(self, value):
+        """测试作为字段类型时接受字典、模型与紧凑表示"""
+        holder = _CompactHolder(attributes=value)
+        assert holder.attributes == CompactSixAttributes(1, 2, 3, 4, 5, 6)
+
+    def test_instance_kept_as_is(self):
+        """测试传入紧凑表示时不会重新创建对象"""
+        compact = CompactSixAttributes(1, 2, 3, 4, 5, 6)
+        assert _CompactHolder(attributes=compact).attributes is compact
+
+    def test_invalid_data_rejected(self):
+        """测试缺少属性的数据无法通过校验"""
+        with pytest.raises(ValueError, match='hp'):
+            _CompactHolder.model_validate(
+                {'attributes': {'atk': 1, 'def': 2, 'sp_atk': 3, 'sp_def': 4}}
+            )
+
+    @pytest.mark.parametrize(
+        'kwargs', [{}, {'by_alias': True}, {'mode': 'json'}, {'exclude_none': True}]
+    )
+    def test_dump_matches_model(self, kwargs):
+        """测试序列化结果与 SixAttributes 一致"""
+        data = {
+            'attributes': {
+                'atk': 1,
+                'def': 2.5,
+                'sp_atk': 3,
+                'sp_def': 4,
+                'spd': 5,
+                'hp': 6,
+                'percent': True,
+            },
+        }
+        compact = _CompactHolder.model_validate(data)
+        model = _ModelHolder.model_validate(data)
+        assert compact.model_dump(**kwargs) == model.model_dump(**kwargs)
+        assert compact.model_dump_json(by_alias=True) == model.model_dump_json(
+            by_alias=True
+        )
+
+    def test_json_round_trip(self):
+        """测试 JSON 序列化后可以重新校验"""
+        holder = _CompactHolder(attributes=CompactSixAttributes(1, 2, 3, 4, 5.5, 6))
+        restored = _CompactHolder.model_validate_json(
+            holder.model_dump_json(by_alias=True)
+        )
+        assert restored == holder
+
+    def test_json_schema_matches_model(self):
+        """测试 JSON Schema 与 SixAttributes 一致"""
+        schema = _CompactHolder.model_json_schema()
+        expected = _ModelHolder.model_json_schema()
+        assert schema['$defs'] == expected['$defs']
+        # Pydantic 只为非模型类型的字段生成 title，这里忽略
+        for name, field in schema['properties'].items():
+            field.pop('title')
+            assert field == expected['properties'][name]
+
+    @pytest.mark.parametrize('percent', [False, True])
+    def test_arithmetic_matches_model(self, percent):
+        """测试加减运算结果与 SixAttributes 一致，而不是元组拼接"""
+        left = SixAttributes(atk=95, def_=88, sp_atk=120, sp_def=75, spd=102, hp=105)
+        right = SixAttributes(
+            atk=10, def_=0, sp_atk=-10, sp_def=0, spd=5, hp=0, percent=percent
+        )
+        compact = CompactSixAttributes.from_model(left)
+        for other in (right, CompactSixAttributes.from_model(right)):
+            for result, expected in (
+                (compact + other, left + right),
+                (compact - other, left - right),
+                (CompactSixAttributes.from_model(right) + compact, right + left),
+            ):
+                assert result == CompactSixAttributes.from_model(expected)
+                assert list(map(type, result)) == list(
+                    map(type, CompactSixAttributes.from_model(expected))
+                )
+
+    def test_arithmetic_skips_models(self, monkeypatch):
+        """测试两个紧凑表示之间的运算不创建 SixAttributes 实例"""
+
+        def fail(*args, **kwargs):
+            raise AssertionError('不应创建 SixAttributes')
+
+        monkeypatch.setattr(SixAttributes, '__init__', fail)
+        monkeypatch.setattr(SixAttributes, '_from_values', fail)
+        left = CompactSixAttributes(95, 88, 120, 75, 102, 105)
+        right = CompactSixAttributes(10, 0, -10, 0, 5, 0, percent=True)
+        assert left + right == CompactSixAttributes(
+            *(a * (1 + b / 100) for a, b in zip(left[:6], right[:6]))
+        )
+        assert right - right == (0, 0, 0, 0, 0, 0, True)
+
+    def test_arithmetic_rejects_other_types(self):
+        compact = CompactSixAttributes(1, 2, 3, 4, 5, 6)
+        with pytest.raises(TypeError, match='Cannot add'):
+            compact + (1, 2, 3, 4, 5, 6)  # noqa: RUF005
+        with pytest.raises(TypeError, match='Cannot sub'):
+            compact - 1
+
+
+def _validated(model: SixAttributes) -> SixAttributes:
+    """以完整校验的方式重新创建实例，用于对比"""
+    return SixAttributes(**model.model_dump(exclude_unset=True))
+
+
+class TestTrustedConstruction:
+    """测试运算结果跳过校验创建时与校验创建的实例完全相同"""
+
+    @pytest.mark.parametrize(
+        ('left_percent', 'right_percent'),
+        list(itertools.product([False, True], repeat=2)),
+    )
+    def test_matches_validated(self, left_percent, right_percent):
+        """测试加减与取整结果的字段、已设置字段与序列化结果都与校验创建的实例一致"""
+        left = SixAttributes(
+            atk=95, def_=88.5, sp_atk=120, sp_def=75, spd=102, hp=105,
+            percent=left_percent,
+        )  # fmt: skip
+        right = SixAttributes(
+            atk=10, def_=0, sp_atk=-10, sp_def=2.5, spd=5, hp=0,
+            percent=right_percent,
+        )  # fmt: skip
+        for result in (left + right, left - right, (left + right).round(1)):
+            expected = _validated(result)
+            assert result.__dict__ == expected.__dict__
+            assert [type(value) for value in result.__dict__.values()] == [
+                type(value) for value in expected.__dict__.values()
+            ]
+            assert result.model_fields_set == expected.model_fields_set
+            assert result.model_dump_json(by_alias=True) == (
+                expected.model_dump_json(by_alias=True)
+            )
+
+    @pytest.mark.parametrize('percent', [None, True])
+    def test_sets_all_instance_state(self, percent):
+        """测试直接构造时设置了 BaseModel 的全部实例属性，与 model_construct 一致"""
+        result = SixAttributes._from_values([1, 2, 3, 4, 5, 6.5], percent)
+        data: dict[str, Any] = {'atk': 1, 'def_': 2, 'sp_atk': 3, 'sp_def': 4}
+        data.update(spd=5, hp=6.5)
+        if percent is not None:
+            data['percent'] = percent
+        expected = SixAttributes.model_construct(**data)
+        for name in BaseModel.__slots__:
+            assert getattr(result, name) == getattr(expected, name), name
+
+    def test_orm_operand_validated(self):
+        """测试与 ORM 对象运算时，Decimal 结果经过校验转换为数值"""
+        model = SixAttributes(atk=1, def_=2, sp_atk=3, sp_def=4, spd=5, hp=6)
+        # 数据库中 Numeric 列读出的值为 Decimal
+        values: dict[str, Any] = {'atk': Decimal('10'), 'def_': Decimal('1.5')}
+        orm = NatureAttrORM(**values, sp_atk=1, sp_def=1, spd=1, hp=1)
+        result = model + orm
+        assert result.atk == 11
+        assert result.def_ == 3.5
+        assert not any(isinstance(value, Decimal) for value in result.__dict__.values())
+
+
+@pytest.mark.benchmark
+def test_trusted_construction_faster(monkeypatch):
+    """测试跳过校验创建结果时，加减与取整的每秒运算次数高于强制校验
+
+    只比较快慢而不要求具体倍数（实测约 1.5 倍），
+    两种实现交替测量五轮并取最好的结果，减少机器负载波动的影响。
+    使用 pytest --run-benchmark 运行，完整数据见
+    benchmarks/bench_six_attributes_ops.py。
+    """
+    left = SixAttributes(atk=95, def_=88, sp_atk=120, sp_def=75, spd=102, hp=105)
+    right = SixAttributes(
+        atk=10, def_=0, sp_atk=-10, sp_def=0, spd=0, hp=0, percent=True
+    )
+    operations = {
+        'add': lambda: left + right,
+        'sub': lambda: left - right,
+        'round': lambda: left.round(1),
+    }
+    trusted = SixAttributes.__dict__['_from_values']
+    validated = classmethod(
+        lambda cls, values, percent=None, *, validate=False: trusted.__func__(
+            cls, values, percent, validate=True
+        )
+    )
+
+    best: dict[tuple[bool, str], float] = {}
+    for _ in range(5):
+        for is_trusted, from_values in ((True, trusted), (False, validated)):
+            monkeypatch.setattr(SixAttributes, '_from_values', from_values)
+            for name, func in operations.items():
+                seconds = min(timeit.repeat(func, number=1000, repeat=3))
+                key = (is_trusted, name)
+                best[key] = min(best.get(key, seconds), seconds)
+
+    for name in operations:
+        assert best[True, name] < best[False, name], name
@@ -0,0 +1,86 @@
+"""测试 SQLite 快照"""
+
+import stat
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, SQLModel, select
+
+from seerapi_models import Pet, PetORM, SkillInPetORM
+from seerapi_models.snapshot import (
+    SNAPSHOT_INDEXES,
+    build_snapshot,
+    open_snapshot,
+    snapshot_indexes,
+)
+
+from .factories import CONVERTIBLE_MODELS, fake
+
+
+@pytest.fixture(scope='module')
+def models() -> list:
+    return [fake(model, seed) for model in CONVERTIBLE_MODELS for seed in (1, 2)]
+
+
+def test_every_foreign_key_is_indexed():
+    indexes = snapshot_indexes()
+    leading = {(table, columns[0]) for table, columns in indexes}
+    for table in SQLModel.metadata.tables.values():
+        covered = {index.columns[0].name for index in table.indexes}
+        covered.add(next(iter(table.primary_key)).name)
+        for column in table.columns:
+            if column.foreign_keys and column.name not in covered:
+                assert (table.name, column.name) in leading, (table.name, column.name)
+    assert set(SNAPSHOT_INDEXES) <= set(indexes)
+    assert len(set(indexes)) == len(indexes)
+
+
+def test_build_snapshot(tmp_path, models):
+    path = tmp_path / 'snapshot.db'
+    counts = build_snapshot(path, models)
+    assert counts['pet'] == 2
+    assert stat.S_IMODE(path.stat().st_mode) == 0o444
+    assert not (tmp_path / 'snapshot.db.tmp').exists()
+
+    engine = open_snapshot(path)
+    with Session(engine) as session:
+        assert len(session.exec(select(PetORM)).all()) == 2
+        connection = session.connection()
+        names = {
+            row[0]
+            for row in connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert 'ix_snapshot_skillinpetorm_pet_id_learning_level_skill_id' in names
+        assert connection.exec_driver_sql('SELECT count(*) FROM sqlite_stat1').scalar()
+        plan = connection.exec_driver_sql(
+            'EXPLAIN QUERY PLAN '
+            f'{select(SkillInPetORM.skill_id).where(SkillInPetORM.pet_id == 1)}',
+            (1,),
+        ).all()
+        assert 'COVERING INDEX' in plan[0][3]
+        with pytest.raises(OperationalError, match='readonly'):
+            connection.exec_driver_sql('DELETE FROM pet')
+    engine.dispose()
+
+    # 再次构建时替换已有的只读快照
+    pets = [model for model in models if isinstance(model, Pet)]
+    assert build_snapshot(path, pets[:1])['pet'] == 1
+
+
+def test_failed_build_keeps_old_snapshot(tmp_path, models):
+    path = tmp_path / 'snapshot.db'
+    build_snapshot(path, models)
+
+    def broken():
+        yield from models
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        build_snapshot(path, broken())
+    assert not (tmp_path / 'snapshot.db.tmp').exists()
+    engine = open_snapshot(path)
+    with Session(engine) as session:
+        assert len(session.exec(select(PetORM)).all()) == 2
+    engine.dispose()
@@ -0,0 +1,68 @@
+"""测试精灵能力值计算"""
+
+import pytest
+
+from seerapi_models import Nature
+from seerapi_models.common import CompactSixAttributes, SixAttributes
+from seerapi_models.stats import StatBuild, calc_stats, calc_stats_many, level_stats
+
+from .factories import fake
+
+BASE = SixAttributes(atk=120, def_=95, sp_atk=80, sp_def=100, spd=117, hp=105)
+EV = CompactSixAttributes(255, 0, 0, 0, 255, 2)
+NATURE = fake(
+    Nature,
+    1,
+    attributes=SixAttributes(
+        atk=10, def_=0, sp_atk=-10, sp_def=0, spd=0, hp=0, percent=True
+    ),
+)
+BONUSES = (
+    SixAttributes(atk=30, def_=12, sp_atk=0, sp_def=12, spd=7, hp=10),
+    CompactSixAttributes(5, 5, 5, 5, 5, 5, percent=True),
+    SixAttributes(atk=0, def_=0, sp_atk=0, sp_def=0, spd=0, hp=50),
+)
+
+
+def test_level_stats():
+    stats = level_stats(BASE, level=100, iv=31, ev=EV)
+    assert stats == CompactSixAttributes(339, 226, 196, 236, 333, 351)
+    assert level_stats(BASE, level=50, iv=0) == (125, 100, 85, 105, 122, 165, False)
+
+
+@pytest.mark.parametrize('level', [1, 50, 100])
+def test_matches_six_attributes(level):
+    """测试结果与逐个使用 SixAttributes 相加完全一致"""
+    build = StatBuild(level=level, iv=15, ev=EV, bonuses=BONUSES)
+    expected = level_stats(BASE, level=level, iv=15, ev=EV).to_model()
+    expected += NATURE.attributes
+    for bonus in BONUSES:
+        expected += bonus.to_model() if isinstance(bonus, tuple) else bonus
+    result = calc_stats(BASE, NATURE, build)
+    assert result == CompactSixAttributes.from_model(expected)
+    assert calc_stats(BASE, NATURE.attributes, build) == result
+
+
+def test_diy_stats():
+    diy = CompactSixAttributes(100, 100, 100, 100, 100, 100)
+    build = StatBuild(diy_stats=diy)
+    assert calc_stats(BASE, None, build) == level_stats(diy)
+
+
+def test_many():
+    builds = [StatBuild(), StatBuild(level=60, ev=EV, bonuses=BONUSES)]
+    combinations = [
+        (base, nature, build)
+        for base in (BASE, BASE.model_copy(update={'atk': 130}))
+        for nature in (None, NATURE)
+        for build in builds
+    ]
+    assert calc_stats_many(combinations) == [calc_stats(*item) for item in combinations]
+
+
+def test_percent_base_rejected():
+    percent = BASE.model_copy(update={'percent': True})
+    with pytest.raises(ValueError, match='种族值'):
+        calc_stats(percent)
+    with pytest.raises(ValueError, match='学习力'):
+        calc_stats_many([(BASE, None, StatBuild(ev=percent))])
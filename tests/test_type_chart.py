@@ -0,0 +1,81 @@
+"""测试属性克制矩阵"""
+
+import pickle
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from seerapi_models import TypeCombination
+from seerapi_models.bulk import bulk_load
+from seerapi_models.common import ResourceRef
+from seerapi_models.type_chart import TypeEffectivenessMatrix, combine_multipliers
+
+from .factories import fake
+
+
+def combination(id: int, *parts: int) -> TypeCombination:
+    primary, *secondary = (
+        ResourceRef.from_res_name(part, 'element_type') for part in parts
+    )
+    return fake(
+        TypeCombination,
+        id,
+        primary=primary,
+        secondary=secondary[0] if secondary else None,
+    )
+
+
+# 属性 1 克制 2，对 3 无效；属性 2 被 3 克制，也克制 3
+CHART = {(1, 2): 2.0, (1, 3): 0.0, (3, 2): 2.0, (2, 3): 2.0}
+
+
+@pytest.fixture
+def matrix() -> TypeEffectivenessMatrix:
+    combinations = [
+        combination(1, 1),
+        combination(2, 2),
+        combination(3, 3),
+        combination(12, 1, 2),
+        combination(23, 2, 3),
+    ]
+    return TypeEffectivenessMatrix.from_chart(combinations, CHART)
+
+
+@pytest.mark.parametrize(
+    ('first', 'second', 'expected'),
+    [(2, 2, 4), (2, 0, 0.5), (0, 0, 0), (2, 1, 1.5), (0.5, 1, 0.75)],
+)
+def test_combine_multipliers(first, second, expected):
+    assert combine_multipliers(first, second) == expected
+
+
+def test_multiplier(matrix):
+    assert matrix.multiplier(1, 2) == 2
+    assert matrix.multiplier(2, 1) == 1
+    assert matrix.multiplier(3, 23) == 1.5
+    assert matrix.multiplier(1, 23) == 0.5
+    # 双属性攻击方：1 对 23 为 0.5，2 对 23 为 1.5
+    assert matrix.multiplier(12, 23) == 1
+    assert matrix.multipliers([1, 3, 12], [2, 23, 23]) == [2, 1.5, 1]
+    assert matrix.row(1) == {1: 1, 2: 2, 3: 0, 12: 1.5, 23: 0.5}
+    with pytest.raises(KeyError):
+        matrix.multiplier(1, 4)
+    with pytest.raises(ValueError, match='克制系数的数量'):
+        TypeEffectivenessMatrix([1, 2], [1.0])
+
+
+def test_models(matrix):
+    models = matrix.to_models()
+    assert [model.id for model in models] == list(matrix.ids)
+    # 系数为 1 的组合被省略
+    assert models[1].multipliers == {3: 2, 23: 1.5}
+    assert TypeEffectivenessMatrix.from_models(models) == matrix
+    assert pickle.loads(pickle.dumps(matrix)) == matrix
+
+
+def test_from_session(matrix):
+    engine = create_engine('sqlite://')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        bulk_load(session, matrix.to_models())
+        assert TypeEffectivenessMatrix.from_session(session) == matrix